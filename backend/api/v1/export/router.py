@@ -0,0 +1,80 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPBearer
+
+from app.service.export_service import (
+    EXPORT_FORMAT_PARQUET,
+    EXPORT_SOURCE_NAMES,
+    ExportCursor,
+    UserExportService,
+)
+from app.service.partition_archive_service import import_pyarrow
+from core.db import create_read_session
+
+router = APIRouter(prefix="/export", tags=["데이터 내보내기"])
+security = HTTPBearer()
+
+
+def _stream_export(user_id: int, export_format: str, cursor: Optional[ExportCursor]):
+    """복제본 세션으로 내보내기 스트림 생성 (스트림이 끝나면 세션 종료)"""
+    session = create_read_session()
+    try:
+        service = UserExportService(session, user_id)
+        if export_format == EXPORT_FORMAT_PARQUET:
+            yield from service.iter_parquet_page(cursor)
+        else:
+            yield from service.iter_ndjson(cursor)
+    finally:
+        session.rollback()
+        session.close()
+
+
+@router.get(
+    "",
+    summary="사용자 전체 데이터 내보내기",
+    description=(
+        "저장된 일일 요약과 시계열 데이터를 스트리밍으로 내보냅니다. "
+        "ndjson은 모든 테이블을 한 번에, 청크마다 재개용 cursor 줄을 포함합니다. "
+        "parquet은 테이블 하나의 한 페이지이며 다음 페이지 커서는 파일 메타데이터"
+        "(export_next_cursor)에 있습니다."
+    ),
+    dependencies=[Depends(security)],
+)
+def export_user_data(
+    request: Request,
+    format: Literal["ndjson", "parquet"] = Query("ndjson", description="출력 형식"),
+    cursor: Optional[str] = Query(None, description="이어서 받을 위치 (재개 토큰)"),
+):
+    """사용자 전체 데이터 내보내기"""
+    user_info = getattr(request.user, "user_info", None)
+    if not user_info:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="인증이 필요합니다"
+        )
+
+    try:
+        export_cursor = ExportCursor.decode(cursor) if cursor else None
+        if format == EXPORT_FORMAT_PARQUET:
+            import_pyarrow()
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e)
+        )
+
+    user_id = int(user_info["userId"])
+    if format == EXPORT_FORMAT_PARQUET:
+        table = export_cursor.source if export_cursor else EXPORT_SOURCE_NAMES[0]
+        media_type = "application/vnd.apache.parquet"
+        filename = f"garmin_{user_id}_{table}.parquet"
+    else:
+        media_type = "application/x-ndjson"
+        filename = f"garmin_{user_id}.ndjson"
+    return StreamingResponse(
+        _stream_export(user_id, format, export_cursor),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
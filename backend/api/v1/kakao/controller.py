@@ -19,11 +19,13 @@ from api.common.schema.date_parser import DateParserRequest, DateParserResponse
 from app.model import User
 from app.service import DateParserService, TokenService
 from core.config import FRONTEND_URL
+from core.util.garmin_rate_limit import connectapi
 from core.util.redis import (
     format_remaining_time,
     get_task_result_ttl,
     is_duplicate_request,
 )
+from core.util.sync_timestamp_cache import sync_timestamp_cache
 from core.util.task_id import generate_celery_task_id, generate_task_id, task_id_to_path
 from task import analysis_health_query, collect_fit_data
 
@@ -299,8 +301,11 @@ class KakaoController:
                 full_name = profile.get("fullName", "")
                 email = profile.get("userName", "")
 
-                connect_last_sync_info = garmin_client.connectapi(
-                    "/wellness-service/wellness/syncTimestamp"
+                connect_last_sync_info = sync_timestamp_cache.get_or_fetch(
+                    profile.get("displayName"),
+                    lambda: connectapi(
+                        garmin_client, "/wellness-service/wellness/syncTimestamp"
+                    ),
                 )
                 user_timezone = request.userRequest.timezone or "Asia/Seoul"
                 tz = pytz.timezone(user_timezone)
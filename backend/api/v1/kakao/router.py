@@ -4,7 +4,7 @@ from api.common.schema import KakaoRequest, KakaoResponse
 from api.common.schema.date_parser import DateParserRequest, DateParserResponse
 from api.v1.kakao.controller import KakaoController
 from app.service import DateParserService, TokenService
-from core.db import AsyncSession, get_session
+from core.db import AsyncSession, get_read_session, get_session
 
 router = APIRouter(prefix="/kakao", tags=["카카오 챗봇"])
 
@@ -25,6 +25,15 @@ def get_kakao_controller(
     return KakaoController(session, token_service, date_parser_service)
 
 
+def get_read_kakao_controller(
+    session: AsyncSession = Depends(get_read_session),
+    token_service: TokenService = Depends(get_token_service),
+    date_parser_service: DateParserService = Depends(get_date_parser_service),
+) -> KakaoController:
+    """조회만 하는 요청용 (복제본 세션)"""
+    return KakaoController(session, token_service, date_parser_service)
+
+
 @router.post("/fit/collection", response_model=KakaoResponse)
 async def request_data_collection(
     request: KakaoRequest,
@@ -50,7 +59,7 @@ async def request_health_analysis(
 @router.post("/profile", response_model=KakaoResponse)
 async def get_garmin_profile(
     request: KakaoRequest,
-    controller: KakaoController = Depends(get_kakao_controller),
+    controller: KakaoController = Depends(get_read_kakao_controller),
 ):
     """
     카카오 챗봇에서 연결된 가민 프로필 정보 조회
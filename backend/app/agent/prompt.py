@@ -78,6 +78,11 @@ def create_planner_prompt():
         📊 **사용 가능한 분석 도구 유형:**
         - **요약(Summary) 도구:** 특정 기간 동안의 일별 요약 데이터 (평균, 최대, 최소, 총합 등) 제공 (예: `heart_rate_summary`, `steps_summary`)
         - **시계열(Time-Series) 도구:** 특정 날짜의 시간대별 상세 데이터 제공 (예: `heart_rate_timeseries`, `stress_timeseries`)
+        - **구간 집계(Rollup) 도구:** 여러 날에 걸친 심박수/스트레스/걸음 수의
+          15분 또는 1시간 구간별 최소/최대/평균 제공 (`metric_rollup`)
+        - **기간 집계(Period) 도구:** 수 주~수개월 기간의 주간/월간 평균, 백분위수,
+          추세, 목표 달성률 제공 (`period_summary`).
+          한 달 이상의 긴 기간은 일별 요약 대신 이 도구를 우선 사용
 
         🔍 **작업 목표**
 
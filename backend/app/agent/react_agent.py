@@ -34,6 +34,8 @@ from app.agent.tool import (
     ActivitySummaryTool,
     HeartRateSummaryTool,
     HeartRateTimeSeriesTool,
+    MetricRollupTool,
+    PeriodSummaryTool,
     SleepSummaryTool,
     SleepTimeSeriesTool,
     StepsSummaryTool,
@@ -68,6 +70,10 @@ class HealthAnalysisAgent:
             SleepTimeSeriesTool(),
             # 활동 도구
             ActivitySummaryTool(),
+            # 여러 날에 걸친 시간대별 집계 도구
+            MetricRollupTool(),
+            # 주간/월간 집계 도구
+            PeriodSummaryTool(),
         ]
 
     def _extract_tool_metadata(self):
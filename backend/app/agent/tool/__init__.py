@@ -1,7 +1,9 @@
 from .base_tool import BaseDBTool
+from .rollup_rdb import MetricRollupTool
 from .summary_rdb import (
     ActivitySummaryTool,
     HeartRateSummaryTool,
+    PeriodSummaryTool,
     SleepSummaryTool,
     StepsSummaryTool,
     StressSummaryTool,
@@ -20,8 +22,10 @@ __all__ = [
     "SleepSummaryTool",
     "StepsSummaryTool",
     "StressSummaryTool",
+    "PeriodSummaryTool",
     "HeartRateTimeSeriesTool",
     "SleepTimeSeriesTool",
     "StepsTimeSeriesTool",
     "StressTimeSeriesTool",
+    "MetricRollupTool",
 ]
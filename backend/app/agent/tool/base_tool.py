@@ -2,9 +2,11 @@ from typing import Type
 
 from langchain_core.tools import StructuredTool
 from pydantic import BaseModel
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
-from core.db import SessionFactory
+from core.db import SessionFactory, create_read_session, use_user_shard
+from core.db.celery_session import replica_engine, replica_guard
 
 
 class BaseDBTool(StructuredTool):
@@ -18,8 +20,22 @@ class BaseDBTool(StructuredTool):
         super().__init__()
 
     def _run(self, *args, **kwargs):
-        """도구 실행 시 새로운 세션 사용"""
-        session = SessionFactory()
+        """
+        도구 실행 시 새로운 조회 전용 세션 사용 (복제본 우선)
+        - 복제본 연결 오류면 primary 세션으로 한 번 더 실행
+        """
+        session = create_read_session()
+        try:
+            return self._run_with_session(session, *args, **kwargs)
+        except OperationalError:
+            if replica_engine is None or session.get_bind() is not replica_engine:
+                raise
+            replica_guard.mark_failed()
+            return self._run_with_session(SessionFactory(), *args, **kwargs)
+
+    def _run_with_session(self, session: Session, *args, **kwargs):
+        if kwargs.get("user_id") is not None:
+            use_user_shard(session, kwargs["user_id"])
         try:
             result = self._execute(session, *args, **kwargs)
             session.commit()
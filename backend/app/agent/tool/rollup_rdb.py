@@ -0,0 +1,61 @@
+"""RDB 조회를 위한 도구들"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Literal, Type
+
+from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
+
+from app.agent.tool import BaseDBTool
+from app.service.rollup_service import MetricRollupService
+
+
+class RollupInput(BaseModel):
+    """시계열 집계 조회 입력"""
+
+    user_id: int = Field(..., description="가민 사용자 ID")
+    metric: Literal["heart_rate", "stress", "steps"] = Field(
+        ..., description="조회할 지표 (heart_rate, stress, steps)"
+    )
+    start_date: date = Field(..., description="조회 시작 날짜 (YYYY-MM-DD)")
+    end_date: date = Field(..., description="조회 종료 날짜 (YYYY-MM-DD)")
+    max_points: int = Field(
+        200, description="반환할 최대 구간 수 (범위에 맞춰 15분/1시간 구간 선택)"
+    )
+
+
+class MetricRollupTool(BaseDBTool):
+    """심박수/스트레스/걸음수 구간 집계 조회 도구"""
+
+    name: str = "metric_rollup"
+    description: str = (
+        "특정 기간의 심박수, 스트레스, 걸음수를 15분 또는 1시간 구간별 "
+        "최소/최대/평균(걸음수는 합계 포함)으로 조회합니다."
+    )
+    args_schema: Type[BaseModel] = RollupInput
+
+    def _execute(
+        self,
+        session: Session,
+        user_id: int,
+        metric: str,
+        start_date: date,
+        end_date: date,
+        max_points: int = 200,
+    ) -> Dict[str, Any]:
+        start = datetime.combine(start_date, time.min)
+        end = datetime.combine(end_date + timedelta(days=1), time.min)
+        rollup = MetricRollupService(session).query(
+            user_id, metric, start, end, max_points
+        )
+
+        return {
+            "start_date": start_date,
+            "end_date": end_date,
+            "user_id": user_id,
+            "metric": metric,
+            "description": self.description,
+            "type": "metric_rollup",
+            "resolution_seconds": rollup["resolution_seconds"],
+            "points": rollup["points"],
+        }
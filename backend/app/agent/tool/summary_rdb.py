@@ -1,12 +1,11 @@
 """RDB 조회를 위한 도구들"""
 
-from datetime import date
-from typing import Any, Dict, Type
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Literal, Optional, Type
 
 from pydantic import BaseModel, Field
 from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
-from sqlalchemy.sql import func
 
 from app.agent.tool import BaseDBTool
 from app.model import (
@@ -16,6 +15,7 @@ from app.model import (
     StepsDaily,
     StressDaily,
 )
+from app.service.period_aggregate_service import PERIOD_METRICS, PeriodAggregateService
 
 
 class DateRangeInput(BaseModel):
@@ -26,6 +26,14 @@ class DateRangeInput(BaseModel):
     end_date: date = Field(..., description="조회 종료 날짜 (YYYY-MM-DD)")
 
 
+class PeriodRangeInput(DateRangeInput):
+    """주간/월간 집계 조회 입력"""
+
+    period: Optional[Literal["week", "month"]] = Field(
+        None, description="집계 주기 (week, month), 없으면 기간 길이에 맞춰 선택"
+    )
+
+
 # 심박수 도구들
 class HeartRateSummaryTool(BaseDBTool):
     """심박수 요약 데이터 조회 도구"""
@@ -239,14 +247,17 @@ class ActivitySummaryTool(BaseDBTool):
         self, session: Session, user_id: int, start_date: date, end_date: date
     ) -> Dict[str, Any]:
         # 시작 날짜와 종료 날짜를 기준으로 활동 데이터 조회
+        # (user_id, start_time_local) 인덱스를 쓰도록 함수 없이 컬럼 범위로 조회
+        range_start = datetime.combine(start_date, time.min)
+        range_end = datetime.combine(end_date + timedelta(days=1), time.min)
         activities = (
             session.execute(
                 select(Activity)
                 .where(
                     and_(
                         Activity.user_id == user_id,
-                        func.date(Activity.start_time_local) >= start_date,
-                        func.date(Activity.start_time_local) <= end_date,
+                        Activity.start_time_local >= range_start,
+                        Activity.start_time_local < range_end,
                     )
                 )
                 .order_by(Activity.start_time_local)
@@ -281,3 +292,37 @@ class ActivitySummaryTool(BaseDBTool):
                 for activity in activities
             ],
         }
+
+
+class PeriodSummaryTool(BaseDBTool):
+    """주간/월간 집계 조회 도구"""
+
+    name: str = "period_summary"
+    description: str = (
+        "긴 기간(수 주~수개월)의 안정시 심박수, 평균 심박수, 걸음 수, 활동 시간, "
+        "스트레스, 수면 시간, 수면 HRV를 주간 또는 월간 단위 평균/백분위수/추세/"
+        "목표 달성률로 조회합니다."
+    )
+    args_schema: Type[BaseModel] = PeriodRangeInput
+
+    def _execute(
+        self,
+        session: Session,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        period: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        aggregates = PeriodAggregateService(session).query(
+            user_id, start_date, end_date, period=period
+        )
+
+        return {
+            "period": {"start_date": start_date, "end_date": end_date},
+            "type": "period_summary",
+            "user_id": user_id,
+            "description": self.description,
+            "aggregation": aggregates["period"],
+            "metrics": list(PERIOD_METRICS),
+            "data": aggregates["data"],
+        }
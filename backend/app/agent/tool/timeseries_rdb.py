@@ -1,7 +1,8 @@
 """RDB 조회를 위한 도구들"""
 
-from datetime import date
-from typing import Any, Dict, Optional, Type
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from pydantic import BaseModel, Field
 from sqlalchemy import and_, select
@@ -19,6 +20,55 @@ from app.model import (
     StressDaily,
     StressReading,
 )
+from app.service.packed_series import unpack_series
+from app.service.partition_archive_service import ArchivedReadingStore
+from core.config import PARTITION_ARCHIVE_READ_THROUGH
+
+
+def local_day_range(
+    target_date: date, days_before: int = 0
+) -> Tuple[datetime, datetime]:
+    """
+    측정값 start_time_local 조회 범위 [시작, 끝)
+    - 측정값 테이블은 start_time_local 기준 파티션이므로
+      범위 조건을 함께 줘야 파티션 프루닝이 됨
+    """
+    start = datetime.combine(target_date - timedelta(days=days_before), time.min)
+    return start, datetime.combine(target_date + timedelta(days=1), time.min)
+
+
+def load_readings(
+    session: Session,
+    model: Any,
+    parent_column: str,
+    parent_id: int,
+    day_start: datetime,
+    day_end: datetime,
+) -> Sequence[Any]:
+    """
+    부모 행의 [day_start, day_end) 측정값 (start_time_local 순)
+    - DB에 없으면 보관 파일에서 조회 (오래된 파티션은 Parquet 파일로 옮겨져 있음)
+    """
+    readings = (
+        session.execute(
+            select(model)
+            .where(
+                getattr(model, parent_column) == parent_id,
+                model.start_time_local >= day_start,
+                model.start_time_local < day_end,
+            )
+            .order_by(model.start_time_local)
+        )
+        .scalars()
+        .all()
+    )
+    if readings or not PARTITION_ARCHIVE_READ_THROUGH:
+        return readings
+
+    archived = ArchivedReadingStore(session).load(
+        model.__tablename__, parent_id, day_start, day_end
+    )
+    return [SimpleNamespace(**reading) for reading in archived]
 
 
 class TimeSeriesInput(BaseModel):
@@ -50,25 +100,41 @@ class HeartRateTimeSeriesTool(BaseDBTool):
         if not daily:
             return None
 
-        readings = (
-            session.execute(
-                select(HeartRateReading)
-                .where(HeartRateReading.daily_summary_id == daily.id)
-                .order_by(HeartRateReading.start_time_local)
+        # 압축 저장된 경우 일일 행 하나로 조회 끝
+        packed = unpack_series(daily)
+        if packed is not None:
+            return self._build_result(
+                target_date,
+                user_id,
+                [
+                    {"time": reading["start_time_local"], "value": reading["value"]}
+                    for reading in packed
+                ],
             )
-            .scalars()
-            .all()
+
+        day_start, day_end = local_day_range(target_date)
+        readings = load_readings(
+            session, HeartRateReading, "daily_summary_id", daily.id, day_start, day_end
         )
 
+        return self._build_result(
+            target_date,
+            user_id,
+            [
+                {"time": reading.start_time_local, "value": reading.heart_rate}
+                for reading in readings
+            ],
+        )
+
+    def _build_result(
+        self, target_date: date, user_id: int, readings: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         return {
             "date": target_date,
             "user_id": user_id,
             "description": self.description,
             "type": "heart_rate_timeseries",
-            "readings": [
-                {"time": reading.start_time_local, "value": reading.heart_rate}
-                for reading in readings
-            ],
+            "readings": readings,
         }
 
 
@@ -91,14 +157,9 @@ class StepsTimeSeriesTool(BaseDBTool):
         if not daily:
             return None
 
-        readings = (
-            session.execute(
-                select(StepsIntraday)
-                .where(StepsIntraday.daily_summary_id == daily.id)
-                .order_by(StepsIntraday.start_time_local)
-            )
-            .scalars()
-            .all()
+        day_start, day_end = local_day_range(target_date)
+        readings = load_readings(
+            session, StepsIntraday, "daily_summary_id", daily.id, day_start, day_end
         )
 
         return {
@@ -137,25 +198,41 @@ class StressTimeSeriesTool(BaseDBTool):
         if not daily:
             return None
 
-        readings = (
-            session.execute(
-                select(StressReading)
-                .where(StressReading.daily_summary_id == daily.id)
-                .order_by(StressReading.start_time_local)
+        # 압축 저장된 경우 일일 행 하나로 조회 끝
+        packed = unpack_series(daily)
+        if packed is not None:
+            return self._build_result(
+                target_date,
+                user_id,
+                [
+                    {"time": reading["start_time_local"], "level": reading["value"]}
+                    for reading in packed
+                ],
             )
-            .scalars()
-            .all()
+
+        day_start, day_end = local_day_range(target_date)
+        readings = load_readings(
+            session, StressReading, "daily_summary_id", daily.id, day_start, day_end
         )
 
+        return self._build_result(
+            target_date,
+            user_id,
+            [
+                {"time": reading.start_time_local, "level": reading.stress_level}
+                for reading in readings
+            ],
+        )
+
+    def _build_result(
+        self, target_date: date, user_id: int, readings: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
         return {
             "date": target_date,
             "user_id": user_id,
             "description": self.description,
             "type": "stress_timeseries",
-            "readings": [
-                {"time": reading.start_time_local, "level": reading.stress_level}
-                for reading in readings
-            ],
+            "readings": readings,
         }
 
 
@@ -178,26 +255,27 @@ class SleepTimeSeriesTool(BaseDBTool):
         if not sleep_session:
             return None
 
+        # 수면은 전날 저녁에 시작하므로 전날부터 조회
+        day_start, day_end = local_day_range(target_date, days_before=1)
+
         # 수면 단계 데이터 조회 (1분 단위)
-        movements = (
-            session.execute(
-                select(SleepMovement)
-                .where(SleepMovement.sleep_session_id == sleep_session.id)
-                .order_by(SleepMovement.start_time_local)
-            )
-            .scalars()
-            .all()
+        movements = load_readings(
+            session,
+            SleepMovement,
+            "sleep_session_id",
+            sleep_session.id,
+            day_start,
+            day_end,
         )
 
         # HRV 데이터 조회 (5분 단위)
-        hrv_readings = (
-            session.execute(
-                select(SleepHRVReading)
-                .where(SleepHRVReading.sleep_session_id == sleep_session.id)
-                .order_by(SleepHRVReading.start_time_local)
-            )
-            .scalars()
-            .all()
+        hrv_readings = load_readings(
+            session,
+            SleepHRVReading,
+            "sleep_session_id",
+            sleep_session.id,
+            day_start,
+            day_end,
         )
 
         sleep_analysis = []
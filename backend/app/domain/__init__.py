@@ -2,6 +2,7 @@ from .activity import Activity
 from .daily_summary import DailySummary
 from .heart_rate import HeartRate, HeartRateValue
 from .hrv import Baseline, HRVReading, HRVSummary, SleepHRV
+from .sleep import Sleep
 from .steps import StepsValue
 from .stress import Stress, StressValue
 
@@ -9,6 +10,7 @@ __all__ = [
     "Activity",
     "DailySummary",
     "HeartRate",
+    "Sleep",
     "SleepHRV",
     "Stress",
     "StepsValue",
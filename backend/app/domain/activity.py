@@ -1,11 +1,14 @@
 import logging
-from datetime import datetime, timezone
-from typing import List, Optional
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from typing import Dict, List, Optional
 
 from garth.data._base import Data
 from garth.utils import camel_to_snake_dict
 from pydantic.dataclasses import dataclass
 
+from core.util.garmin_rate_limit import connectapi
+
 logger = logging.getLogger(__name__)
 
 
@@ -194,10 +197,22 @@ class Activity(Data):
         path = "/activitylist-service/activities/search/activities"
         params = {"limit": limit, "start": start}
 
-        raw_data = client.connectapi(path, params=params)
+        raw_data = connectapi(client, path, params=params)
+        if not raw_data:
+            return []
+
+        return cls._parse_list(raw_data)
+
+    @classmethod
+    def from_raw(cls, raw_data: Optional[List[dict]]) -> List["Activity"]:
+        """원본 활동 목록 응답을 활동 목록으로 변환"""
         if not raw_data:
             return []
+        return cls._parse_list(raw_data)
 
+    @classmethod
+    def _parse_list(cls, raw_data: List[dict]) -> List["Activity"]:
+        """활동 목록 응답 파싱 (처리할 수 없는 항목은 건너뜀)"""
         activities = []
         for activity_data in raw_data:
             try:
@@ -208,3 +223,48 @@ class Activity(Data):
                 continue
 
         return activities
+
+    @classmethod
+    def fetch_raw_window(
+        cls,
+        start_date: date,
+        end_date: date,
+        page_size: int = 50,
+        max_pages: int = 100,
+        *,
+        client=None,
+    ) -> Dict[str, List[dict]]:
+        """
+        기간 내 활동 원본 응답을 로컬 날짜(YYYY-MM-DD)별로 조회
+        - 활동 목록은 최신순이므로 가장 오래된 요청 날짜를 지날 때까지 페이지 조회
+        - 페이지가 page_size보다 작으면 마지막 페이지로 판단
+        - 처리할 수 없는 항목은 날짜를 알 수 없으므로 제외
+        """
+        path = "/activitylist-service/activities/search/activities"
+        index: Dict[str, List[dict]] = defaultdict(list)
+
+        for page in range(max_pages):
+            params = {"limit": page_size, "start": page * page_size}
+            raw_data = connectapi(client, path, params=params)
+            if not raw_data:
+                break
+
+            oldest_date = None
+            for activity_data in raw_data:
+                activities = cls._parse_list([activity_data])
+                if not activities:
+                    continue
+                oldest_date = activities[0].start_time_local.date()
+                if start_date <= oldest_date <= end_date:
+                    index[oldest_date.isoformat()].append(activity_data)
+
+            if len(raw_data) < page_size:
+                break
+            if oldest_date is not None and oldest_date < start_date:
+                break
+        else:
+            logger.warning(
+                f"활동 목록 최대 페이지({max_pages}) 도달: {start_date} ~ {end_date}"
+            )
+
+        return dict(index)
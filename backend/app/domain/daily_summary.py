@@ -6,6 +6,8 @@ from garth.data._base import Data
 from garth.utils import camel_to_snake_dict
 from pydantic.dataclasses import dataclass
 
+from core.util.garmin_rate_limit import connectapi
+
 logger = logging.getLogger(__name__)
 
 
@@ -194,13 +196,20 @@ class DailySummary(Data):
         ).total_seconds()
 
     @classmethod
-    def get(cls, date: str, *, client=None) -> Optional["DailySummary"]:
-        """일일 활동 요약 조회"""
-        client = client
+    def fetch_raw(cls, date: str, *, client=None) -> Optional[dict]:
+        """일일 활동 요약 원본 응답 조회"""
         path = "/usersummary-service/usersummary/daily"
         params = {"calendarDate": date}
+        return connectapi(client, path, params=params)
+
+    @classmethod
+    def get(cls, date: str, *, client=None) -> Optional["DailySummary"]:
+        """일일 활동 요약 조회"""
+        return cls.from_raw(cls.fetch_raw(date, client=client))
 
-        raw_data = client.connectapi(path, params=params)
+    @classmethod
+    def from_raw(cls, raw_data: Optional[dict]) -> Optional["DailySummary"]:
+        """원본 응답을 일일 활동 요약으로 변환"""
         if not raw_data:
             return None
 
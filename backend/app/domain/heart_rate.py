@@ -6,6 +6,8 @@ from garth.data._base import Data
 from garth.utils import camel_to_snake_dict
 from pydantic.dataclasses import dataclass
 
+from core.util.garmin_rate_limit import connectapi
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,13 +62,20 @@ class HeartRate(Data):
         return (self.start_timestamp_local - self.start_timestamp_gmt).total_seconds()
 
     @classmethod
-    def get(cls, date: str, *, client=None) -> Optional["HeartRate"]:
-        """심박수 시계열 데이터 조회"""
-        client = client
+    def fetch_raw(cls, date: str, *, client=None) -> Optional[dict]:
+        """심박수 시계열 원본 응답 조회"""
         path = "/wellness-service/wellness/dailyHeartRate"
         params = {"date": date}
+        return connectapi(client, path, params=params)
+
+    @classmethod
+    def get(cls, date: str, *, client=None) -> Optional["HeartRate"]:
+        """심박수 시계열 데이터 조회"""
+        return cls.from_raw(cls.fetch_raw(date, client=client))
 
-        raw_data = client.connectapi(path, params=params)
+    @classmethod
+    def from_raw(cls, raw_data: Optional[dict]) -> Optional["HeartRate"]:
+        """원본 응답을 심박수 시계열 데이터로 변환"""
         if not raw_data:
             return None
         try:
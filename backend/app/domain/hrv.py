@@ -6,6 +6,8 @@ from garth.data._base import Data
 from garth.utils import camel_to_snake_dict
 from pydantic.dataclasses import dataclass
 
+from core.util.garmin_rate_limit import connectapi
+
 logger = logging.getLogger(__name__)
 
 
@@ -63,13 +65,30 @@ class SleepHRV(Data):
     # [HRV 요약]
     hrv_summary: Optional[HRVSummary] = None
 
+    @classmethod
+    def fetch_raw(cls, date: str, *, client=None) -> Optional[dict]:
+        """수면 HRV 원본 응답 조회"""
+        path = f"/hrv-service/hrv/{date}"
+        return connectapi(client, path)
+
     @classmethod
     def get(cls, date: str, *, client=None) -> Optional["SleepHRV"]:
         """수면 HRV 데이터 조회"""
-        client = client
-        path = f"/hrv-service/hrv/{date}"
+        return cls.from_raw(cls.fetch_raw(date, client=client))
+
+    @classmethod
+    def get_summary(cls, date: str, *, client=None) -> Optional["SleepHRV"]:
+        """수면 HRV 요약 데이터만 조회 (readings 제외)"""
+        return cls.summary_from_raw(cls.fetch_raw(date, client=client))
+
+    @classmethod
+    def get_readings(cls, date: str, *, client=None) -> Optional["SleepHRV"]:
+        """수면 HRV 측정값 데이터만 조회 (summary 제외)"""
+        return cls.readings_from_raw(cls.fetch_raw(date, client=client))
 
-        raw_data = client.connectapi(path)
+    @classmethod
+    def from_raw(cls, raw_data: Optional[dict]) -> Optional["SleepHRV"]:
+        """원본 응답을 수면 HRV 데이터로 변환"""
         if not raw_data:
             return None
 
@@ -81,12 +100,8 @@ class SleepHRV(Data):
             return None
 
     @classmethod
-    def get_summary(cls, date: str, *, client=None) -> Optional["SleepHRV"]:
-        """수면 HRV 요약 데이터만 조회 (readings 제외)"""
-        client = client
-        path = f"/hrv-service/hrv/{date}"
-
-        raw_data = client.connectapi(path)
+    def summary_from_raw(cls, raw_data: Optional[dict]) -> Optional["SleepHRV"]:
+        """원본 응답을 수면 HRV 요약 데이터로 변환 (readings 제외)"""
         if not raw_data:
             return None
 
@@ -99,12 +114,8 @@ class SleepHRV(Data):
             return None
 
     @classmethod
-    def get_readings(cls, date: str, *, client=None) -> Optional["SleepHRV"]:
-        """수면 HRV 측정값 데이터만 조회 (summary 제외)"""
-        client = client
-        path = f"/hrv-service/hrv/{date}"
-
-        raw_data = client.connectapi(path)
+    def readings_from_raw(cls, raw_data: Optional[dict]) -> Optional["SleepHRV"]:
+        """원본 응답을 수면 HRV 측정값 데이터로 변환 (summary 제외)"""
         if not raw_data:
             return None
 
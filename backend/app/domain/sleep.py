@@ -0,0 +1,45 @@
+import logging
+from typing import Optional
+
+from garth import SleepData
+from garth.utils import camel_to_snake_dict
+
+from core.util.garmin_rate_limit import connectapi
+
+logger = logging.getLogger(__name__)
+
+
+class Sleep:
+    """
+    수면 데이터 조회 (garth SleepData를 원본 조회와 변환 단계로 분리)
+    - 원본 응답을 보관했다가 네트워크 없이 다시 변환할 수 있도록 사용
+    """
+
+    @classmethod
+    def fetch_raw(
+        cls, date: str, *, buffer_minutes: int = 60, client=None
+    ) -> Optional[dict]:
+        """수면 원본 응답 조회"""
+        path = f"/wellness-service/wellness/dailySleepData/{client.username}"
+        params = {"nonSleepBufferMinutes": buffer_minutes, "date": date}
+        return connectapi(client, path, params=params)
+
+    @classmethod
+    def get(cls, date: str, *, client=None) -> Optional[SleepData]:
+        """수면 데이터 조회"""
+        return cls.from_raw(cls.fetch_raw(date, client=client))
+
+    @classmethod
+    def from_raw(cls, raw_data: Optional[dict]) -> Optional[SleepData]:
+        """원본 응답을 수면 데이터로 변환 (수면 기록이 없으면 None)"""
+        if not raw_data:
+            return None
+
+        try:
+            data = camel_to_snake_dict(raw_data)
+            if not (data.get("daily_sleep_dto") or {}).get("id"):
+                return None
+            return SleepData(**data)
+        except Exception as e:
+            logger.warning(f"수면 데이터 처리 중 오류 발생: {str(e)}")
+            return None
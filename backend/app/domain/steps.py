@@ -5,6 +5,8 @@ from typing import List, Optional
 from garth.utils import camel_to_snake_dict
 from pydantic.dataclasses import dataclass
 
+from core.util.garmin_rate_limit import connectapi
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,13 +34,20 @@ class StepsValue:
         return self.end_gmt.replace(tzinfo=timezone.utc)
 
     @classmethod
-    def get_readings(cls, date: str, *, client=None) -> Optional[List["StepsValue"]]:
-        """걸음수 시계열 데이터 조회"""
-        client = client
+    def fetch_raw(cls, date: str, *, client=None) -> Optional[List[dict]]:
+        """걸음수 시계열 원본 응답 조회"""
         path = "/wellness-service/wellness/dailySummaryChart"
         params = {"date": date}
+        return connectapi(client, path, params=params)
+
+    @classmethod
+    def get_readings(cls, date: str, *, client=None) -> Optional[List["StepsValue"]]:
+        """걸음수 시계열 데이터 조회"""
+        return cls.from_raw(cls.fetch_raw(date, client=client))
 
-        raw_data = client.connectapi(path, params=params)
+    @classmethod
+    def from_raw(cls, raw_data: Optional[List[dict]]) -> Optional[List["StepsValue"]]:
+        """원본 응답을 걸음수 시계열 데이터로 변환"""
         if not raw_data:
             return None
 
@@ -6,6 +6,8 @@ from garth.data._base import Data
 from garth.utils import camel_to_snake_dict
 from pydantic.dataclasses import dataclass
 
+from core.util.garmin_rate_limit import connectapi
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,13 +54,20 @@ class Stress(Data):
     def local_offset(self) -> int:
         return (self.start_timestamp_local - self.start_timestamp_gmt).total_seconds()
 
+    @classmethod
+    def fetch_raw(cls, date: str, *, client=None) -> Optional[dict]:
+        """스트레스 시계열 원본 응답 조회"""
+        path = f"/wellness-service/wellness/dailyStress/{date}"
+        return connectapi(client, path)
+
     @classmethod
     def get(cls, date: str, *, client=None) -> Optional["Stress"]:
         """스트레스 시계열 데이터 조회"""
-        client = client
-        path = f"/wellness-service/wellness/dailyStress/{date}"
+        return cls.from_raw(cls.fetch_raw(date, client=client))
 
-        raw_data = client.connectapi(path)
+    @classmethod
+    def from_raw(cls, raw_data: Optional[dict]) -> Optional["Stress"]:
+        """원본 응답을 스트레스 시계열 데이터로 변환"""
         if not raw_data:
             return None
 
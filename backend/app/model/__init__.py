@@ -1,7 +1,12 @@
 from core.db.base_model import Base
 
 from .activity import Activity
+from .archived_partition import ArchivedPartition
+from .collection_watermark import CollectionWatermark
 from .heart_rate import HeartRateDaily, HeartRateReading
+from .metric_rollup import MetricRollup
+from .period_aggregate import PeriodAggregate
+from .raw_payload import RawPayload
 from .sleep import SleepHRVReading, SleepMovement, SleepSession
 from .steps import StepsDaily, StepsIntraday
 from .stress import StressDaily, StressReading
@@ -22,4 +27,9 @@ __all__ = [
     "StepsDaily",
     "StepsIntraday",
     "TempClientToken",
+    "CollectionWatermark",
+    "RawPayload",
+    "MetricRollup",
+    "PeriodAggregate",
+    "ArchivedPartition",
 ]
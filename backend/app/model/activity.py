@@ -1,4 +1,13 @@
-from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy.orm import relationship
 
 from core.db import Base, TimeStampMixin
@@ -6,6 +15,10 @@ from core.db import Base, TimeStampMixin
 
 class Activity(Base, TimeStampMixin):
     __tablename__ = "activities"
+    __table_args__ = (
+        # 사용자별 로컬 날짜 범위 조회/삭제용
+        Index("ix_activities_user_id_start_time_local", "user_id", "start_time_local"),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(
@@ -0,0 +1,24 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, String, Text
+
+from core.db import Base, TimeStampMixin
+
+
+class ArchivedPartition(Base, TimeStampMixin):
+    """Parquet 파일로 옮긴 측정값 파티션 목록 (보관 파일 조회용)"""
+
+    __tablename__ = "archived_partitions"
+    __table_args__ = (
+        Index(
+            "ix_archived_partitions_parent_table_range", "parent_table", "range_start"
+        ),
+    )
+
+    partition_name = Column(String(100), primary_key=True)
+    parent_table = Column(String(50), nullable=False)  # heart_rate_readings, ...
+    # 파티션의 start_time_local 범위 [range_start, range_end)
+    range_start = Column(DateTime(timezone=False), nullable=False)
+    range_end = Column(DateTime(timezone=False), nullable=False)
+    uri = Column(Text, nullable=False)
+    row_count = Column(BigInteger, nullable=False)
+    size_bytes = Column(BigInteger, nullable=False)
+    sha256 = Column(String(64), nullable=False)
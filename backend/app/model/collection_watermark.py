@@ -0,0 +1,18 @@
+from sqlalchemy import BigInteger, Column, Date, DateTime, ForeignKey, String
+
+from core.db import Base, TimeStampMixin
+
+
+class CollectionWatermark(Base, TimeStampMixin):
+    """사용자/지표/날짜별로 마지막으로 저장한 측정값 시각 (증분 수집용)"""
+
+    __tablename__ = "collection_watermarks"
+
+    user_id = Column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    metric = Column(String(50), primary_key=True)  # heart_rate, stress, steps
+    date = Column(Date, primary_key=True)
+    last_start_time_gmt = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,31 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+)
+
+from core.db import Base, TimeStampMixin
+
+
+class MetricRollup(Base, TimeStampMixin):
+    """시계열 측정값의 구간별 집계 (15분/1시간, 로컬 시각 기준)"""
+
+    __tablename__ = "metric_rollups"
+
+    user_id = Column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    metric = Column(String(50), primary_key=True)  # heart_rate, stress, steps
+    resolution_seconds = Column(Integer, primary_key=True)  # 900, 3600
+    bucket_start_local = Column(DateTime(timezone=False), primary_key=True)
+    min_value = Column(Integer)
+    max_value = Column(Integer)
+    avg_value = Column(Float)
+    sum_value = Column(BigInteger)  # 걸음수처럼 합계가 의미 있는 지표만
+    sample_count = Column(Integer, nullable=False)
@@ -0,0 +1,37 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+)
+
+from core.db import Base, TimeStampMixin
+
+
+class PeriodAggregate(Base, TimeStampMixin):
+    """일일 요약 지표의 주간/월간 집계 (주는 월요일 시작)"""
+
+    __tablename__ = "period_aggregates"
+
+    user_id = Column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    period = Column(String(10), primary_key=True)  # week, month
+    period_start = Column(Date, primary_key=True)
+    metric = Column(String(50), primary_key=True)  # total_steps, resting_hr, ...
+    period_end = Column(Date, nullable=False)
+    day_count = Column(Integer, nullable=False)  # 값이 있는 일수
+    mean = Column(Float)
+    min_value = Column(Float)
+    max_value = Column(Float)
+    p10 = Column(Float)
+    p50 = Column(Float)
+    p90 = Column(Float)
+    trend_slope = Column(Float)  # 하루당 변화량 (최소제곱 기울기)
+    goal_days = Column(Integer)  # 목표가 있는 지표만
+    goal_hit_rate = Column(Float)
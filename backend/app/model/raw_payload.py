@@ -0,0 +1,29 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+)
+
+from core.db import Base, TimeStampMixin
+
+
+class RawPayload(Base, TimeStampMixin):
+    """Garmin 원본 응답 보관 (zstd 압축 JSON, 매퍼 변경 시 재처리용)"""
+
+    __tablename__ = "raw_payloads"
+
+    user_id = Column(
+        BigInteger,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # daily_summary, heart_rate, stress, steps_data, sleep_data, sleep_hrv, activities
+    endpoint = Column(String(50), primary_key=True)
+    date = Column(Date, primary_key=True)
+    payload = Column(LargeBinary, nullable=False)
+    payload_sha256 = Column(String(64), nullable=False)  # 변경 여부 확인용 (압축 전)
+    raw_size = Column(Integer, nullable=False)  # 압축 전 JSON 크기 (bytes)
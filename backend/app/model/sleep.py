@@ -5,6 +5,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     PrimaryKeyConstraint,
     String,
@@ -16,6 +17,16 @@ from core.db import Base, TimeStampMixin
 
 class SleepSession(Base, TimeStampMixin):
     __tablename__ = "sleep_sessions"
+    __table_args__ = (
+        # (user_id, date) 조회에서 id까지 인덱스만으로 읽도록 INCLUDE (upsert 키 겸용)
+        Index(
+            "uq_sleep_sessions_user_id_date",
+            "user_id",
+            "date",
+            unique=True,
+            postgresql_include=["id"],
+        ),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(
@@ -72,8 +83,8 @@ class SleepSession(Base, TimeStampMixin):
 class SleepMovement(Base, TimeStampMixin):
     __tablename__ = "sleep_movement"
     __table_args__ = (
-        PrimaryKeyConstraint("sleep_session_id", "created_at", "start_time_local"),
-        {"postgresql_partition_by": "RANGE (created_at)"},
+        PrimaryKeyConstraint("sleep_session_id", "start_time_local"),
+        {"postgresql_partition_by": "RANGE (start_time_local)"},
     )
 
     sleep_session_id = Column(
@@ -92,8 +103,8 @@ class SleepHRVReading(Base, TimeStampMixin):
 
     __tablename__ = "sleep_hrv_readings"
     __table_args__ = (
-        PrimaryKeyConstraint("sleep_session_id", "created_at", "start_time_local"),
-        {"postgresql_partition_by": "RANGE (created_at)"},
+        PrimaryKeyConstraint("sleep_session_id", "start_time_local"),
+        {"postgresql_partition_by": "RANGE (start_time_local)"},
     )
 
     sleep_session_id = Column(
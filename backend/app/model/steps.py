@@ -5,6 +5,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     PrimaryKeyConstraint,
     String,
@@ -16,6 +17,16 @@ from core.db import Base, TimeStampMixin
 
 class StepsDaily(Base, TimeStampMixin):
     __tablename__ = "steps_daily"
+    __table_args__ = (
+        # (user_id, date) 조회에서 id까지 인덱스만으로 읽도록 INCLUDE (upsert 키 겸용)
+        Index(
+            "uq_steps_daily_user_id_date",
+            "user_id",
+            "date",
+            unique=True,
+            postgresql_include=["id"],
+        ),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(
@@ -43,8 +54,8 @@ class StepsDaily(Base, TimeStampMixin):
 class StepsIntraday(Base, TimeStampMixin):
     __tablename__ = "steps_intraday"
     __table_args__ = (
-        PrimaryKeyConstraint("daily_summary_id", "created_at", "start_time_local"),
-        {"postgresql_partition_by": "RANGE (created_at)"},
+        PrimaryKeyConstraint("daily_summary_id", "start_time_local"),
+        {"postgresql_partition_by": "RANGE (start_time_local)"},
     )
 
     daily_summary_id = Column(
@@ -4,9 +4,12 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     PrimaryKeyConstraint,
+    SmallInteger,
 )
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 
 from core.db import Base, TimeStampMixin
@@ -14,6 +17,16 @@ from core.db import Base, TimeStampMixin
 
 class StressDaily(Base, TimeStampMixin):
     __tablename__ = "stress_daily"
+    __table_args__ = (
+        # (user_id, date) 조회에서 id까지 인덱스만으로 읽도록 INCLUDE (upsert 키 겸용)
+        Index(
+            "uq_stress_daily_user_id_date",
+            "user_id",
+            "date",
+            unique=True,
+            postgresql_include=["id"],
+        ),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
     user_id = Column(
@@ -25,6 +38,13 @@ class StressDaily(Base, TimeStampMixin):
     stress_duration_seconds = Column(Integer)
     rest_duration_seconds = Column(Integer)
 
+    # 압축 저장된 하루 시계열 (고정 간격 시작 시각 + int2 배열)
+    # 값이 없으면 측정값 테이블 사용
+    series_start_gmt = Column(DateTime(timezone=True))
+    series_start_local = Column(DateTime(timezone=False))
+    series_interval_seconds = Column(Integer)
+    series_values = Column(ARRAY(SmallInteger))
+
     # 해당 일자의 상세 측정값들과 관계 설정
     readings = relationship(
         "StressReading",
@@ -39,8 +59,8 @@ class StressDaily(Base, TimeStampMixin):
 class StressReading(Base, TimeStampMixin):
     __tablename__ = "stress_readings"
     __table_args__ = (
-        PrimaryKeyConstraint("daily_summary_id", "created_at", "start_time_local"),
-        {"postgresql_partition_by": "RANGE (created_at)"},
+        PrimaryKeyConstraint("daily_summary_id", "start_time_local"),
+        {"postgresql_partition_by": "RANGE (start_time_local)"},
     )
 
     daily_summary_id = Column(
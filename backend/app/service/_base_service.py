@@ -1,26 +1,56 @@
 import logging
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from garth import Client as GarthClient
 
+from core.util.garmin_rate_limit import connectapi
+from core.util.payload_cache import payload_cache
+
 logger = logging.getLogger(__name__)
 
 
 class BaseGarminService:
     """Garmin 서비스 공통 기능"""
 
-    def __init__(self, client: GarthClient):
+    def __init__(self, client: Optional[GarthClient]):
+        # client가 없으면 (보관된 원본 응답 재처리 등) API를 호출하지 않는 용도
         self.client = client
-        self.display_name = client.profile["displayName"]
+        self.display_name = client.profile["displayName"] if client else None
 
     def _make_request(self, endpoint: str, **kwargs):
         """API 요청 공통 처리"""
         try:
-            return self.client.connectapi(endpoint, **kwargs)
+            return connectapi(self.client, endpoint, **kwargs)
         except Exception as e:
             logger.error("API 요청 실패 - Endpoint: %s, Error: %s", endpoint, str(e))
             raise
 
+    def _fetch_raw_cached(
+        self, endpoint: str, date: str, fetch_raw: Callable[..., Any]
+    ) -> Any:
+        """원본 응답 캐시(엔드포인트/사용자/날짜)를 거쳐 날짜별 원본 응답 조회"""
+        return payload_cache.get_or_fetch(
+            endpoint,
+            self.display_name,
+            date,
+            lambda: fetch_raw(date, client=self.client),
+        )
+
+    def _fetch_cached(
+        self,
+        endpoint: str,
+        date: str,
+        source: Any,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        원본 응답 캐시를 거쳐 조회한 뒤 도메인 모델로 변환
+        - source: fetch_raw(date, client=...)와 from_raw(raw)를 제공하는 도메인 클래스
+        - parse를 지정하지 않으면 source.from_raw 사용
+        """
+        raw_data = self._fetch_raw_cached(endpoint, date, source.fetch_raw)
+        return (parse or source.from_raw)(raw_data)
+
     def _format_response(
         self,
         data: List[Dict[str, Any]] | Dict[str, Any] | None,
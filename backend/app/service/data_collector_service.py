@@ -1,12 +1,29 @@
 import logging
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, Generic, List, Optional, TypeAlias, TypeVar, Union
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeAlias,
+    TypeVar,
+    Union,
+)
 
 from garth import DailyHRV, SleepData
 from garth.data.sleep import SleepMovement
-from sqlalchemy import delete, func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, literal, select, update
+from sqlalchemy.orm import Session, SessionTransaction
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.domain import (
     Activity,
@@ -14,6 +31,7 @@ from app.domain import (
     HeartRate,
     HeartRateValue,
     HRVReading,
+    Sleep,
     SleepHRV,
     StepsValue,
     Stress,
@@ -34,6 +52,29 @@ from app.model import (
     StressReading,
 )
 from app.service._base_service import BaseGarminService
+from app.service.packed_series import pack_readings
+from app.service.period_aggregate_service import PeriodAggregateService
+from app.service.raw_payload_service import RawPayloadArchive
+from app.service.reading_writer import (
+    BULK_WRITE_MODES,
+    WRITE_MODE_EXECUTEMANY,
+    WRITE_MODE_UPSERT,
+    ReadingBulkWriter,
+)
+from app.service.rollup_service import MetricRollupService, RollupSpec
+from app.service.shard_service import ShardService
+from app.service.watermark_service import CollectionWatermarkService, as_utc
+from core.config import (
+    COLLECT_DAILY_SNAPSHOT,
+    COLLECT_INCREMENTAL,
+    COLLECT_PACKED_SERIES,
+    COLLECT_RANGE_BATCH_DAYS,
+    COLLECTOR_WRITE_MODE,
+    GARMIN_PREFETCH_WORKERS,
+    METRIC_ROLLUP_ENABLED,
+    PERIOD_AGGREGATE_ENABLED,
+    RAW_PAYLOAD_ARCHIVE_ENABLED,
+)
 from core.util.safe_access import (
     log_exception,
     safe_float,
@@ -41,6 +82,7 @@ from core.util.safe_access import (
     safe_get_item,
     safe_list,
 )
+from core.util.sync_timestamp_cache import sync_timestamp_cache
 
 logger = logging.getLogger(__name__)
 
@@ -61,10 +103,38 @@ CacheData: TypeAlias = Union[
     Stress,
 ]
 
+# 컬렉터별 프리페치 작업 (팬아웃 서브태스크는 자기 컬렉터가 읽는 엔드포인트만 조회)
+COLLECTOR_PREFETCH_JOBS: Dict[str, Tuple[str, ...]] = {
+    "HeartRateCollector": ("heart_rate",),
+    "StressCollector": ("daily_summary", "stress"),
+    "StepsCollector": ("daily_summary", "steps_data"),
+    "SleepCollector": ("sleep_data",),
+    "ActivityCollector": ("activities",),
+}
+
+# 원본 응답 엔드포인트별 변환기 (fetch_raw/from_raw를 제공하는 도메인 클래스)
+RAW_PAYLOAD_SOURCES: Dict[str, Any] = {
+    "daily_summary": DailySummary,
+    "heart_rate": HeartRate,
+    "stress": Stress,
+    "steps_data": StepsValue,
+    "sleep_data": Sleep,
+    "sleep_hrv": SleepHRV,
+    "activities": Activity,
+}
+
 
 class BaseDataCollector(Generic[D, M]):
     """데이터 수집을 위한 기본 클래스"""
 
+    # 증분 수집 지표 이름과 측정값 모델 (None이면 항상 하루 전체를 다시 저장)
+    watermark_metric: Optional[str] = None
+    reading_model: Optional[type] = None
+    # 압축 저장할 측정값 속성 (None이면 압축 저장 미지원)
+    packed_value_attr: Optional[str] = None
+    # 15분/1시간 집계 방식 (None이면 집계하지 않음)
+    rollup_spec: Optional[RollupSpec] = None
+
     def __init__(self, client, data_cache: Dict[str, CacheData], session: Session):
         self.client = client
         self.data_cache = data_cache
@@ -100,18 +170,25 @@ class BaseDataCollector(Generic[D, M]):
     def safe_session_execute(
         self, query, error_msg: str = "데이터베이스 쿼리 실행 실패"
     ) -> Any:
-        """안전하게 세션 쿼리 실행"""
+        """
+        안전하게 세션 쿼리 실행
+        - 롤백은 트랜잭션(또는 세이브포인트)을 관리하는 서비스에서 처리
+        """
         try:
             return self.session.execute(query)
         except Exception as e:
             self.logger.error(f"{error_msg}: {str(e)}")
-            self.session.rollback()
             raise
 
 
 class HeartRateCollector(BaseDataCollector):
     """심박수 데이터 수집기"""
 
+    watermark_metric = "heart_rate"
+    reading_model = HeartRateReading
+    packed_value_attr = "heart_rate"
+    rollup_spec = RollupSpec("heart_rate", "heart_rate")
+
     def fetch_data(
         self, date_str: str
     ) -> Optional[Dict[str, Union[HeartRate, SleepHRV, DailyHRV]]]:
@@ -236,20 +313,30 @@ class HeartRateCollector(BaseDataCollector):
                     delete(HeartRateReading).where(
                         HeartRateReading.daily_summary_id == daily_summary.id,
                     ),
-                    error_msg=f"심박수 상세 데이터 삭제 실패 - Summary ID: {daily_summary.id}",
+                    error_msg=(
+                        f"심박수 상세 데이터 삭제 실패 - Summary ID: {daily_summary.id}"
+                    ),
                 )
                 self.session.delete(daily_summary)
+                # (user_id, date) 유니크이므로 새 일일 행 INSERT보다 먼저 DELETE가
+                # 나가도록 바로 반영
+                self.session.flush()
         except Exception as e:
             self.logger.error(
                 f"심박수 데이터 삭제 실패 - User: {user_id}, Date: {target_date}, Error: {str(e)}"
             )
-            self.session.rollback()
             raise
 
 
 class StressCollector(BaseDataCollector):
     """스트레스 데이터 수집기"""
 
+    watermark_metric = "stress"
+    reading_model = StressReading
+    packed_value_attr = "stress_level"
+    # -1, -2는 측정 불가/활동 중 구간
+    rollup_spec = RollupSpec("stress", "stress_level", min_value=0)
+
     def fetch_data(
         self, date_str: str
     ) -> Optional[Dict[str, Union[Stress, DailySummary]]]:
@@ -369,20 +456,29 @@ class StressCollector(BaseDataCollector):
                     delete(StressReading).where(
                         StressReading.daily_summary_id == daily_summary.id,
                     ),
-                    error_msg=f"스트레스 상세 데이터 삭제 실패 - Summary ID: {daily_summary.id}",
+                    error_msg=(
+                        "스트레스 상세 데이터 삭제 실패 - Summary ID: "
+                        f"{daily_summary.id}"
+                    ),
                 )
                 self.session.delete(daily_summary)
+                # (user_id, date) 유니크이므로 새 일일 행 INSERT보다 먼저 DELETE가
+                # 나가도록 바로 반영
+                self.session.flush()
         except Exception as e:
             self.logger.error(
                 f"스트레스 데이터 삭제 실패 - User: {user_id}, Date: {target_date}, Error: {str(e)}"
             )
-            self.session.rollback()
             raise
 
 
 class StepsCollector(BaseDataCollector):
     """걸음수 데이터 수집기"""
 
+    watermark_metric = "steps"
+    reading_model = StepsIntraday
+    rollup_spec = RollupSpec("steps", "steps", with_sum=True)
+
     def fetch_data(
         self, date_str: str
     ) -> Optional[Dict[str, Union[DailySummary, List[StepsValue]]]]:
@@ -407,7 +503,8 @@ class StepsCollector(BaseDataCollector):
 
             if not self.validate_data(daily_summary_data):
                 self.logger.info(
-                    f"일일 요약 데이터가 없습니다. 사용자: {user_id}, 날짜: {target_date}"
+                    f"일일 요약 데이터가 없습니다. 사용자: {user_id}, 날짜: "
+                    f"{target_date}"
                 )
                 return None
 
@@ -526,14 +623,18 @@ class StepsCollector(BaseDataCollector):
                     delete(StepsIntraday).where(
                         StepsIntraday.daily_summary_id == daily_summary.id,
                     ),
-                    error_msg=f"걸음수 상세 데이터 삭제 실패 - Summary ID: {daily_summary.id}",
+                    error_msg=(
+                        f"걸음수 상세 데이터 삭제 실패 - Summary ID: {daily_summary.id}"
+                    ),
                 )
                 self.session.delete(daily_summary)
+                # (user_id, date) 유니크이므로 새 일일 행 INSERT보다 먼저 DELETE가
+                # 나가도록 바로 반영
+                self.session.flush()
         except Exception as e:
             self.logger.error(
                 f"걸음수 데이터 삭제 실패 - User: {user_id}, Date: {target_date}, Error: {str(e)}"
             )
-            self.session.rollback()
             raise
 
 
@@ -582,7 +683,8 @@ class SleepCollector(BaseDataCollector):
             daily_sleep_dto = sleep_data.daily_sleep_dto
             if not self.validate_data(daily_sleep_dto):
                 self.logger.info(
-                    f"수면 세션 데이터가 유효하지 않습니다: 사용자 {user_id}, 날짜 {target_date}"
+                    f"수면 세션 데이터가 유효하지 않습니다: 사용자 {user_id}, 날짜 "
+                    f"{target_date}"
                 )
                 return None
 
@@ -736,7 +838,9 @@ class SleepCollector(BaseDataCollector):
                     SleepSession.user_id == user_id,
                     SleepSession.date == target_date,
                 ),
-                error_msg=f"수면 데이터 검색 실패 - User: {user_id}, Date: {target_date}",
+                error_msg=(
+                    f"수면 데이터 검색 실패 - User: {user_id}, Date: {target_date}"
+                ),
             )
             sleep_session = result.scalar_one_or_none()
 
@@ -745,7 +849,9 @@ class SleepCollector(BaseDataCollector):
                     delete(SleepMovementModel).where(
                         SleepMovementModel.sleep_session_id == sleep_session.id
                     ),
-                    error_msg=f"수면 움직임 데이터 삭제 실패 - Session ID: {sleep_session.id}",
+                    error_msg=(
+                        f"수면 움직임 데이터 삭제 실패 - Session ID: {sleep_session.id}"
+                    ),
                 )
 
                 self.safe_session_execute(
@@ -756,9 +862,13 @@ class SleepCollector(BaseDataCollector):
                 )
 
                 self.session.delete(sleep_session)
+                # (user_id, date) 유니크이므로 새 일일 행 INSERT보다 먼저 DELETE가
+                # 나가도록 바로 반영
+                self.session.flush()
         except Exception as e:
             self.logger.error(
-                f"수면 데이터 삭제 실패 - User: {user_id}, Date: {target_date}, Error: {str(e)}"
+                f"수면 데이터 삭제 실패 - User: {user_id}, Date: {target_date}, Error: "
+                f"{str(e)}"
             )
             raise
 
@@ -767,28 +877,21 @@ class ActivityCollector(BaseDataCollector):
     """활동 데이터 수집기"""
 
     def fetch_data(self, date_str: str) -> Optional[List[Activity]]:
-        all_activities = self.safe_get_cache(f"activities:{date_str}")
-        if not self.validate_data(all_activities):
-            self.logger.info(f"활동 데이터가 없습니다: {date_str}")
+        """
+        해당 날짜의 활동 조회
+        - 캐시에는 로컬 날짜 기준으로 분류된 해당 날짜의 활동만 저장됨
+        """
+        day_activities = self.safe_get_cache(f"activities:{date_str}")
+        if not self.validate_data(day_activities):
+            self.logger.info(f"해당 날짜({date_str})의 활동이 없습니다.")
             return None
 
         try:
-            target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            target_date_start = datetime.combine(target_date, datetime.min.time())
-            target_date_end = datetime.combine(target_date, datetime.max.time())
-            all_activities: List[Activity] = safe_list(all_activities)
-
-            activities = []
-
-            for activity in all_activities:
-                if activity is None or not activity.start_time_local:
-                    continue
-                start_time_local = activity.start_time_local
-                if (
-                    start_time_local
-                    and target_date_start <= start_time_local <= target_date_end
-                ):
-                    activities.append(activity)
+            activities = [
+                activity
+                for activity in safe_list(day_activities)
+                if activity is not None and activity.start_time_local
+            ]
 
             if not activities:
                 self.logger.info(f"해당 날짜({date_str})의 활동이 없습니다.")
@@ -880,20 +983,23 @@ class ActivityCollector(BaseDataCollector):
 
     def delete_existing_data(self, user_id: int, target_date: date) -> None:
         """활동 데이터 삭제"""
+        day_start = datetime.combine(target_date, datetime.min.time())
         try:
             self.safe_session_execute(
                 delete(ActivityModel).where(
-                    func.date(ActivityModel.start_time_local) == target_date,
                     ActivityModel.user_id == user_id,
+                    ActivityModel.start_time_local >= day_start,
+                    ActivityModel.start_time_local < day_start + timedelta(days=1),
+                ),
+                error_msg=(
+                    f"활동 데이터 삭제 실패 - User: {user_id}, Date: {target_date}"
                 ),
-                error_msg=f"활동 데이터 삭제 실패 - User: {user_id}, Date: {target_date}",
             )
-            self.session.commit()
         except Exception as e:
             self.logger.error(
-                f"활동 데이터 삭제 실패 - User: {user_id}, Date: {target_date}, Error: {str(e)}"
+                f"활동 데이터 삭제 실패 - User: {user_id}, Date: {target_date}, Error: "
+                f"{str(e)}"
             )
-            self.session.rollback()
             raise
 
 
@@ -943,29 +1049,112 @@ class GarminDataCollectorService(BaseGarminService):
     - 배치 작업으로 실행
     """
 
-    def __init__(self, client, session: Session):
+    def __init__(
+        self,
+        client,
+        session: Session,
+        max_workers: int = GARMIN_PREFETCH_WORKERS,
+        write_mode: str = COLLECTOR_WRITE_MODE,
+        daily_snapshot: bool = COLLECT_DAILY_SNAPSHOT,
+        incremental: bool = COLLECT_INCREMENTAL,
+        archive_raw: bool = RAW_PAYLOAD_ARCHIVE_ENABLED,
+        packed_series: bool = COLLECT_PACKED_SERIES,
+        rollups: bool = METRIC_ROLLUP_ENABLED,
+        period_aggregates: bool = PERIOD_AGGREGATE_ENABLED,
+    ):
         super().__init__(client)
         self.session = session
+        self.max_workers = max_workers
+        self.write_mode = write_mode
+        self.daily_snapshot = daily_snapshot
+        self.incremental = incremental
+        self.archive_raw = archive_raw
+        self.packed_series = packed_series
+        self.rollups = rollups
+        self.period_aggregates = period_aggregates
+        self.watermarks = CollectionWatermarkService(session)
+        self.raw_archive = RawPayloadArchive(session)
+        self.rollup_service = MetricRollupService(session)
+        self.period_aggregate_service = PeriodAggregateService(session)
+        self.shards = ShardService(session)
+        self._bulk_writer = (
+            ReadingBulkWriter(session, write_mode)
+            if write_mode in BULK_WRITE_MODES
+            else None
+        )
+        # 증분 수집 시 측정값 추가용 (ORM 방식이어도 대량 INSERT 사용)
+        self._append_writer = self._bulk_writer or ReadingBulkWriter(
+            session, WRITE_MODE_EXECUTEMANY
+        )
         self._data_cache: Dict[str, CacheData] = {}
+        # 캐시 키별 실제 API 호출 소요 시간 (초)
+        self.fetch_latencies: Dict[str, float] = {}
+        # 로컬 날짜별 활동 원본 응답 인덱스와 인덱스가 포함하는 기간
+        self._activity_index: Dict[str, List[dict]] = {}
+        self._activity_window: Optional[Tuple[date, date]] = None
+        # 날짜별 보관 대기 원본 응답 (프리페치 스레드가 채우고 저장은 메인 스레드)
+        self._raw_payloads: Dict[str, Dict[str, Any]] = {}
+        self._raw_payloads_lock = threading.Lock()
+
+    def _observe_sync_time(self, heart_rate: HeartRate) -> None:
+        """
+        마지막 심박수 측정 시각이 캐시된 동기화 시간보다 새로우면 동기화 시간 캐시 삭제
+        (캐시 이후 기기가 다시 동기화됨)
+        """
+        values = heart_rate.heart_rate_values
+        if not values:
+            return
+        latest = max(value.timestamp for value in values)
+        sync_timestamp_cache.observe(
+            self.display_name, datetime.fromtimestamp(latest / 1000, timezone.utc)
+        )
 
     def _get_cache_key(self, endpoint: str, date_str: str) -> str:
         """캐시 키 생성"""
         return f"{endpoint}:{date_str}"
 
-    def _fetch_with_cache(self, endpoint: str, date_str: str, fetch_func) -> Any:
+    def _keep_raw_payload(self, endpoint: str, date_str: str, raw_data: Any) -> None:
+        """보관할 원본 응답 기록 (빈 응답은 제외)"""
+        if not self.archive_raw or not raw_data:
+            return
+        with self._raw_payloads_lock:
+            self._raw_payloads.setdefault(date_str, {})[endpoint] = raw_data
+
+    def _fetch_with_cache(
+        self,
+        endpoint: str,
+        date_str: str,
+        source: Any,
+        shared: bool = True,
+        fetch_raw: Optional[Callable[..., Any]] = None,
+    ) -> Any:
         """
-        새로운 데이터를 가져와서 캐시에 저장
+        원본 응답을 가져와서 변환한 뒤 캐시에 저장
+        - source: fetch_raw(date, client=...)와 from_raw(raw)를 제공하는 도메인 클래스
+        - shared=True: 태스크/API 요청이 공유하는 원본 응답 캐시를 먼저 조회
+        - fetch_raw를 지정하면 source.fetch_raw 대신 사용
+        - 원본 응답은 보관용으로 함께 기록
         """
         cache_key = self._get_cache_key(endpoint, date_str)
         if cache_key in self._data_cache:
             logger.debug(f"캐시된 데이터 사용: {cache_key}")
             return self._data_cache[cache_key]
 
+        started_at = time.perf_counter()
         try:
-            data = fetch_func(date_str, client=self.client)
+            fetch_raw = fetch_raw or source.fetch_raw
+            if shared:
+                raw_data = self._fetch_raw_cached(endpoint, date_str, fetch_raw)
+            else:
+                raw_data = fetch_raw(date_str, client=self.client)
+            self._keep_raw_payload(endpoint, date_str, raw_data)
+
+            data = source.from_raw(raw_data)
             if data:
                 self._data_cache[cache_key] = data
                 logger.info(f"데이터 가져오기 성공: {cache_key}")
+                if endpoint == "heart_rate":
+                    self._observe_sync_time(data)
             else:
                 logger.info(f"가져온 데이터가 없음: {cache_key}")
             return data
@@ -992,61 +1181,128 @@ class GarminDataCollectorService(BaseGarminService):
                     "error_message": str(e),
                 },
             )
+        finally:
+            self.fetch_latencies[cache_key] = time.perf_counter() - started_at
 
-    def _prefetch_data(self, date_str: str) -> None:
+    def load_activity_window(self, start_date: date, end_date: date) -> None:
         """
-        필요한 데이터를 미리 가져와서 캐시
+        기간 내 활동 원본 응답을 한 번에 조회해서 날짜별 인덱스 구성
+        - 이후 해당 기간의 날짜는 활동 목록을 다시 조회하지 않음
         """
+        window_key = self._get_cache_key(
+            "activities", f"{start_date.isoformat()}~{end_date.isoformat()}"
+        )
+        started_at = time.perf_counter()
         try:
-            # 일일 요약 데이터
-            self._fetch_with_cache(
-                "daily_summary",
-                date_str,
-                lambda date_str, client: DailySummary.get(date_str, client=client),
+            self._activity_index = Activity.fetch_raw_window(
+                start_date, end_date, client=self.client
             )
-
-            # 심박수 데이터
-            self._fetch_with_cache(
+            self._activity_window = (start_date, end_date)
+        finally:
+            self.fetch_latencies[window_key] = time.perf_counter() - started_at
+
+        logger.info(
+            f"활동 목록 조회 완료 ({start_date} ~ {end_date}): "
+            f"{sum(len(activities) for activities in self._activity_index.values())}개"
+        )
+
+    def _get_raw_activities_for_date(
+        self, date_str: str, client=None
+    ) -> Optional[List[dict]]:
+        """활동 인덱스에서 해당 날짜 활동 조회, 인덱스 기간 밖이면 해당 날짜만 조회"""
+        target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        window = self._activity_window
+        if window is None or not window[0] <= target_date <= window[1]:
+            self.load_activity_window(target_date, target_date)
+        return self._activity_index.get(date_str)
+
+    def _prefetch_sleep(self, date_str: str) -> None:
+        """수면 데이터 조회 후, 수면 데이터가 있을 때만 수면 HRV 조회"""
+        sleep_data = self._fetch_with_cache("sleep_data", date_str, Sleep)
+        if sleep_data:
+            self._fetch_with_cache("sleep_hrv", date_str, SleepHRV)
+
+    def _get_prefetch_jobs(self) -> List[Tuple[str, Callable[[str], Any]]]:
+        """
+        프리페치 작업 목록
+        - 서로 독립적인 엔드포인트 단위로 구성
+        - sleep_hrv는 sleep_data에 의존하므로 같은 작업에서 순차 조회
+        """
+        return [
+            (
+                "daily_summary",
+                lambda date_str: self._fetch_with_cache(
+                    "daily_summary", date_str, DailySummary
+                ),
+            ),
+            (
                 "heart_rate",
-                date_str,
-                lambda date_str, client: HeartRate.get(date_str, client=client),
-            )
-
-            # 스트레스 데이터
-            self._fetch_with_cache(
+                lambda date_str: self._fetch_with_cache(
+                    "heart_rate", date_str, HeartRate
+                ),
+            ),
+            (
                 "stress",
-                date_str,
-                lambda date_str, client: Stress.get(date_str, client=client),
-            )
-
-            # 걸음수 데이터
-            self._fetch_with_cache(
+                lambda date_str: self._fetch_with_cache("stress", date_str, Stress),
+            ),
+            (
                 "steps_data",
-                date_str,
-                lambda date_str, client: StepsValue.get_readings(
-                    date_str, client=client
+                lambda date_str: self._fetch_with_cache(
+                    "steps_data", date_str, StepsValue
                 ),
-            )
-
-            # 수면 데이터
-            sleep_data = self._fetch_with_cache(
-                "sleep_data",
-                date_str,
-                lambda date_str, client: SleepData.get(date_str, client=client),
-            )
-            if sleep_data:
-                self._fetch_with_cache(
-                    "sleep_hrv",
+            ),
+            ("sleep_data", self._prefetch_sleep),
+            (
+                "activities",
+                lambda date_str: self._fetch_with_cache(
+                    "activities",
                     date_str,
-                    lambda date_str, client: SleepHRV.get(date_str, client=client),
-                )
+                    Activity,
+                    shared=False,
+                    fetch_raw=self._get_raw_activities_for_date,
+                ),
+            ),
+        ]
 
-            # 활동 데이터
-            self._fetch_with_cache(
-                "activities",
-                date_str,
-                lambda date_str, client: Activity.list(50, 0, client=client),
-            )
+    def _run_prefetch_jobs_concurrently(
+        self, jobs: List[Tuple[str, Callable[[str], Any]]], date_str: str
+    ) -> None:
+        """
+        스레드 풀에서 프리페치 작업 병렬 실행
+        - 모든 작업이 끝날 때까지 대기한 뒤, 작업 순서상 첫 번째 오류를 전달
+        """
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(jobs)),
+            thread_name_prefix="garmin-prefetch",
+        ) as executor:
+            futures = [(name, executor.submit(job, date_str)) for name, job in jobs]
+
+        for name, future in futures:
+            error = future.exception()
+            if error is not None:
+                logger.error(f"{name} 프리페치 작업 실패: {str(error)}")
+                raise error
+
+    def _prefetch_data(
+        self, date_str: str, job_names: Optional[Sequence[str]] = None
+    ) -> None:
+        """
+        필요한 데이터를 미리 가져와서 캐시
+        - max_workers가 1보다 크면 독립적인 엔드포인트를 병렬 조회
+        - job_names를 지정하면 해당 프리페치 작업만 실행
+        """
+        jobs = [
+            (name, job)
+            for name, job in self._get_prefetch_jobs()
+            if job_names is None or name in job_names
+        ]
+        started_at = time.perf_counter()
+        try:
+            if self.max_workers > 1:
+                self._run_prefetch_jobs_concurrently(jobs, date_str)
+            else:
+                for _, job in jobs:
+                    job(date_str)
 
         except DataFetchError as e:
             logger.error(f"데이터 프리페치 실패: {str(e)}")
@@ -1063,15 +1319,204 @@ class GarminDataCollectorService(BaseGarminService):
                 details={"date": date_str, "error_type": type(e).__name__},
             )
 
+        latencies = ", ".join(
+            f"{key}={latency:.2f}s"
+            for key, latency in list(self.fetch_latencies.items())
+            if key.endswith(f":{date_str}")
+        )
+        logger.info(
+            f"데이터 프리페치 완료 ({date_str}): 총 "
+            f"{time.perf_counter() - started_at:.2f}s [{latencies}]"
+        )
+
+    def _rollback(self, savepoint: Optional[SessionTransaction] = None) -> None:
+        """세이브포인트가 있으면 세이브포인트만, 없으면 전체 트랜잭션 롤백"""
+        if savepoint is not None:
+            if savepoint.is_active:
+                savepoint.rollback()
+        else:
+            self.session.rollback()
+
+    def _store_mapped_data(self, mapped_data: Any) -> None:
+        """
+        매핑된 모델을 세션에 추가
+        - 대량 저장 방식이면 일일 요약만 ORM으로 저장하고
+          측정값은 COPY/executemany로 저장
+        - upsert 방식이면 일일 요약, 측정값, 활동 모두 기존 행을 갱신
+        """
+        if isinstance(mapped_data, dict):
+            if self._bulk_writer is not None and "daily_summary" in mapped_data:
+                reading_groups = {
+                    key: safe_list(model)
+                    for key, model in mapped_data.items()
+                    if key != "daily_summary"
+                }
+                self._bulk_writer.write(mapped_data["daily_summary"], reading_groups)
+            elif "activities" in mapped_data:
+                activities = safe_list(safe_get_item(mapped_data, "activities", []))
+                if self.write_mode == WRITE_MODE_UPSERT:
+                    self._bulk_writer.upsert_rows(activities, ("id",))
+                    return
+                for activity in activities:
+                    if activity:
+                        self.session.add(activity)
+            else:
+                for key, model in mapped_data.items():
+                    if isinstance(model, list):
+                        for item in safe_list(model):
+                            if item:
+                                self.session.add(item)
+                    elif model:
+                        self.session.add(model)
+        elif mapped_data:
+            self.session.add(mapped_data)
+
+    def _pack_series(
+        self, collector: BaseDataCollector, mapped_data: Dict[str, Any]
+    ) -> bool:
+        """
+        측정값을 일일 행의 고정 간격 배열로 옮김 (측정값 테이블에는 저장하지 않음)
+        - 고정 간격으로 표현할 수 없으면 측정값 테이블에 그대로 저장
+
+        returns:
+            압축 저장 여부
+        """
+        value_attr = collector.packed_value_attr
+        if not self.packed_series or value_attr is None:
+            return False
+
+        series = pack_readings(safe_list(mapped_data.get("readings")), value_attr)
+        if series is None:
+            return False
+
+        daily_summary = mapped_data["daily_summary"]
+        daily_summary.series_start_gmt = series.start_gmt
+        daily_summary.series_start_local = series.start_local
+        daily_summary.series_interval_seconds = series.interval_seconds
+        daily_summary.series_values = series.values
+        # ORM cascade로 측정값이 함께 저장되지 않도록 부모 컬렉션에서 분리
+        set_committed_value(daily_summary, "readings", [])
+        mapped_data["readings"] = []
+        return True
+
+    def _update_rollups(
+        self,
+        collector: BaseDataCollector,
+        user_id: int,
+        target_date: date,
+        readings: List[Any],
+    ) -> None:
+        """하루 전체 측정값으로 15분/1시간 집계 교체 (측정값 저장과 같은 트랜잭션)"""
+        spec = collector.rollup_spec
+        if not self.rollups or spec is None:
+            return
+        self.rollup_service.replace_day(user_id, spec, target_date, readings)
+
+    def _append_incremental(
+        self,
+        collector: BaseDataCollector,
+        user_id: int,
+        target_date: date,
+        mapped_data: Dict[str, Any],
+    ) -> Optional[int]:
+        """
+        워터마크 이후 측정값만 추가하고 일일 집계는 제자리 갱신
+        - 워터마크 시각의 측정값은 진행 중인 구간일 수 있어 다시 저장
+        - 증분 수집 대상이 아니거나 기존 데이터가 없으면 None (전체 저장)
+        - 기존 일일 행이 압축 저장이면 측정값 테이블이 비어 있으므로 None (전체 저장)
+
+        returns:
+            추가한 측정값 수
+        """
+        metric = collector.watermark_metric
+        if not self.incremental or metric is None:
+            return None
+
+        watermark = self.watermarks.get(user_id, metric, target_date)
+        if watermark is None:
+            return None
+
+        daily_summary = mapped_data["daily_summary"]
+        daily_model = type(daily_summary)
+        series_values = getattr(daily_model, "series_values", None)
+        stored = self.session.execute(
+            select(
+                daily_model.id,
+                (
+                    series_values.is_not(None)
+                    if series_values is not None
+                    else literal(False)
+                ),
+            ).where(
+                daily_model.user_id == user_id,
+                daily_model.date == target_date,
+            )
+        ).one_or_none()
+        if stored is None:
+            return None
+
+        # 압축 저장 후 압축을 끈 경우: 워터마크 이후만 추가하면 그 전 측정값이 사라짐
+        daily_id, stored_packed = stored
+        if stored_packed:
+            return None
+
+        aggregates = {
+            column.name: getattr(daily_summary, column.name)
+            for column in daily_model.__table__.columns
+            if column.name not in ("id", "user_id", "date", "created_at")
+        }
+        aggregates["updated_at"] = datetime.now(timezone.utc)
+        self.session.execute(
+            update(daily_model).where(daily_model.id == daily_id).values(**aggregates)
+        )
+
+        reading_model = collector.reading_model
+        self.session.execute(
+            delete(reading_model).where(
+                reading_model.daily_summary_id == daily_id,
+                reading_model.start_time_gmt >= watermark,
+            )
+        )
+
+        readings = [
+            reading
+            for reading in safe_list(mapped_data.get("readings"))
+            if reading is not None and as_utc(reading.start_time_gmt) >= watermark
+        ]
+        return self._append_writer.append(daily_model, daily_id, readings)
+
+    def _advance_watermark(
+        self,
+        collector: BaseDataCollector,
+        user_id: int,
+        target_date: date,
+        mapped_data: Dict[str, Any],
+    ) -> None:
+        """저장한 측정값 중 가장 늦은 start_time_gmt로 워터마크 갱신"""
+        metric = collector.watermark_metric
+        if not self.incremental or metric is None or not isinstance(mapped_data, dict):
+            return
+
+        start_times = [
+            as_utc(reading.start_time_gmt)
+            for reading in safe_list(mapped_data.get("readings"))
+            if reading is not None and reading.start_time_gmt is not None
+        ]
+        if start_times:
+            self.watermarks.advance(user_id, metric, target_date, max(start_times))
+
     def _collect_with_collector(
         self,
         collector: BaseDataCollector,
         user_id: int,
         target_date: date,
         date_str: str,
+        commit: bool = True,
     ) -> Optional[Any]:
         """
         컬렉터를 사용하여 데이터 수집
+        - commit=True: 컬렉터 단위로 커밋
+        - commit=False: 세이브포인트 안에서 저장하고 커밋은 호출자에게 위임
         """
         collector_name = collector.__class__.__name__
         try:
@@ -1092,12 +1537,46 @@ class GarminDataCollectorService(BaseGarminService):
                     },
                 )
 
-            # 기존 데이터 삭제
+            # 집계는 하루 전체 측정값 기준 (압축/증분 저장 전에 확보)
+            readings = (
+                safe_list(mapped_data.get("readings"))
+                if isinstance(mapped_data, dict)
+                else []
+            )
+
+            # 압축 저장이면 일일 행 하나만 다시 쓰므로 증분 수집 대상이 아님
+            packed = self._pack_series(collector, mapped_data)
+
+            # DB 작업 직전에 세이브포인트 시작 (위 단계가 실패해도 열린 채 남지 않도록)
+            savepoint = None if commit else self.session.begin_nested()
+
+            # 증분 수집 (기존 일일 행과 워터마크가 있으면 새 측정값만 추가)
+            try:
+                appended = (
+                    None
+                    if packed
+                    else self._append_incremental(
+                        collector, user_id, target_date, mapped_data
+                    )
+                )
+            except Exception as e:
+                logger.error(f"{collector_name} 증분 저장 실패: {str(e)}")
+                self._rollback(savepoint)
+                raise DataStorageError(
+                    f"{collector_name} 증분 저장 실패: {str(e)}",
+                    details={
+                        "collector": collector_name,
+                        "date": date_str,
+                    },
+                )
+
+            # 기존 데이터 삭제 (upsert 방식은 삭제 없이 갱신)
             try:
-                collector.delete_existing_data(user_id, target_date)
+                if appended is None and self.write_mode != WRITE_MODE_UPSERT:
+                    collector.delete_existing_data(user_id, target_date)
             except Exception as e:
                 logger.error(f"{collector_name} 기존 데이터 삭제 실패: {str(e)}")
-                self.session.rollback()
+                self._rollback(savepoint)
                 raise DataStorageError(
                     f"{collector_name} 기존 데이터 삭제 실패: {str(e)}",
                     details={
@@ -1108,29 +1587,20 @@ class GarminDataCollectorService(BaseGarminService):
 
             # 데이터 저장
             try:
-                if isinstance(mapped_data, dict):
-                    if "activities" in mapped_data:
-                        activities = safe_list(
-                            safe_get_item(mapped_data, "activities", [])
-                        )
-                        for activity in activities:
-                            if activity:
-                                self.session.add(activity)
-                    else:
-                        for key, model in mapped_data.items():
-                            if isinstance(model, list):
-                                for item in safe_list(model):
-                                    if item:
-                                        self.session.add(item)
-                            elif model:
-                                self.session.add(model)
-                elif mapped_data:
-                    self.session.add(mapped_data)
-
-                self.session.commit()
+                if appended is None:
+                    self._store_mapped_data(mapped_data)
+                self._advance_watermark(collector, user_id, target_date, mapped_data)
+                self._update_rollups(collector, user_id, target_date, readings)
+
+                if savepoint is None:
+                    self.session.commit()
+                else:
+                    savepoint.commit()
+                if appended is not None:
+                    return f"{collector_name} 데이터 증분 저장 성공 ({appended}건 추가)"
                 return f"{collector_name} 데이터 저장 성공"
             except Exception as e:
-                self.session.rollback()
+                self._rollback(savepoint)
                 raise DataStorageError(
                     f"{collector_name} 데이터 저장 실패: {str(e)}",
                     details={
@@ -1148,70 +1618,165 @@ class GarminDataCollectorService(BaseGarminService):
                 details={"collector": collector_name, "date": date_str},
             )
 
+    def _archive_raw_payloads(
+        self, user_id: int, target_date: date, date_str: str
+    ) -> None:
+        """
+        프리페치에서 기록한 원본 응답을 보관 테이블에 저장
+        - 수집과 같은 트랜잭션에서 세이브포인트로 실행 (보관 실패는 수집에 영향 없음)
+        """
+        with self._raw_payloads_lock:
+            payloads = self._raw_payloads.pop(date_str, None)
+        if not payloads:
+            return
+
+        savepoint = self.session.begin_nested()
+        try:
+            saved = self.raw_archive.save_many(user_id, target_date, payloads)
+            savepoint.commit()
+            logger.info(f"원본 응답 보관 완료 ({date_str}): {saved}개")
+        except Exception as e:
+            self._rollback(savepoint)
+            logger.warning(f"원본 응답 보관 실패 ({date_str}): {str(e)}")
+
+    def _refresh_period_aggregates(
+        self, user_id: int, target_date: date, commit: bool
+    ) -> None:
+        """
+        수집한 날짜가 속한 주/월 집계 갱신
+        - 세이브포인트로 실행 (집계 실패는 수집에 영향 없음)
+        """
+        if not self.period_aggregates:
+            return
+
+        savepoint = self.session.begin_nested()
+        try:
+            saved = self.period_aggregate_service.refresh_day(user_id, target_date)
+            savepoint.commit()
+            if commit:
+                self.session.commit()
+            logger.debug(f"기간 집계 갱신 완료 ({target_date}): {saved}개")
+        except Exception as e:
+            # 커밋 단계에서 실패하면 세이브포인트는 이미 닫혀 있으므로 전체 롤백
+            self._rollback(savepoint if savepoint.is_active else None)
+            logger.warning(f"기간 집계 갱신 실패 ({target_date}): {str(e)}")
+
+    def _create_collectors(self) -> List[BaseDataCollector]:
+        """수집에 사용할 컬렉터 목록"""
+        return [
+            HeartRateCollector(self.client, self._data_cache, self.session),
+            StressCollector(self.client, self._data_cache, self.session),
+            StepsCollector(self.client, self._data_cache, self.session),
+            SleepCollector(self.client, self._data_cache, self.session),
+            ActivityCollector(self.client, self._data_cache, self.session),
+        ]
+
+    def _run_collectors(
+        self,
+        user_id: int,
+        target_date: date,
+        date_str: str,
+        commit: bool = True,
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        모든 컬렉터 실행
+        - 에러가 발생해도 다른 컬렉터는 계속 실행
+        """
+        results = {}
+        errors = []
+
+        self._archive_raw_payloads(user_id, target_date, date_str)
+
+        for collector in self._create_collectors():
+            collector_name = collector.__class__.__name__
+            try:
+                result = self._collect_with_collector(
+                    collector, user_id, target_date, date_str, commit=commit
+                )
+                if result:
+                    results[collector_name] = result
+                    logger.info(f"{collector_name} 데이터 수집 완료")
+            except Exception as e:
+                logger.error(f"{collector_name} 데이터 수집 실패: {str(e)}")
+                errors.append(f"{collector_name}: {str(e)}")
+
+        if results:
+            self._refresh_period_aggregates(user_id, target_date, commit)
+
+        return results, errors
+
+    def _build_daily_result(
+        self,
+        user_id: int,
+        date_str: str,
+        results: Dict[str, Any],
+        errors: List[str],
+    ) -> Dict[str, Any]:
+        """컬렉터 실행 결과 검증 및 일일 수집 결과 생성"""
+        if not results and errors:
+            error_msg = f"모든 데이터 수집 시도 실패: {'; '.join(errors)}"
+            logger.error(error_msg)
+            raise DataCollectionError(
+                error_msg,
+                details={"user_id": user_id, "date": date_str, "errors": errors},
+            )
+        elif not results:
+            error_msg = "수집된 데이터가 없습니다"
+            logger.warning(error_msg)
+            raise DataValidationError(
+                error_msg,
+                details={"user_id": user_id, "date": date_str},
+            )
+        elif errors:
+            # 일부 성공, 일부 실패
+            logger.warning(
+                f"일부 데이터 수집 실패 ({len(errors)}개): {'; '.join(errors)}"
+            )
+            # 오류를 결과에 포함
+            results["errors"] = errors
+
+        logger.info(
+            f"사용자 {user_id}의 {date_str} 데이터 수집 완료 - 성공: "
+            f"{len(results) - ('errors' in results)}, 실패: {len(errors)}"
+        )
+        return results
+
+    def _commit_snapshot(self, user_id: int, date_str: str) -> None:
+        """일일 스냅샷 커밋 (성공한 컬렉터의 세이브포인트를 한 번에 반영)"""
+        try:
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            raise DataStorageError(
+                f"일일 스냅샷 커밋 실패: {str(e)}",
+                details={"user_id": user_id, "date": date_str},
+            )
+
     def collect_daily_data(self, user_id: int, target_date: date) -> Dict[str, Any]:
         """
         일일 데이터 수집
+        - daily_snapshot=True: 모든 컬렉터를 하나의 트랜잭션으로 저장 (커밋 1회)
+        - daily_snapshot=False: 컬렉터 단위로 커밋
         """
         date_str = target_date.strftime("%Y-%m-%d")
         logger.info(f"사용자 {user_id}의 {date_str} 데이터 수집 시작")
+        self.shards.use_user(user_id)
 
         try:
             # 미리 데이터 가져오기
             self._prefetch_data(date_str)
 
-            # 각 컬렉터로 데이터 수집
-            collectors = [
-                HeartRateCollector(self.client, self._data_cache, self.session),
-                StressCollector(self.client, self._data_cache, self.session),
-                StepsCollector(self.client, self._data_cache, self.session),
-                SleepCollector(self.client, self._data_cache, self.session),
-                ActivityCollector(self.client, self._data_cache, self.session),
-            ]
-
-            results = {}
-            errors = []
-
-            for collector in collectors:
-                collector_name = collector.__class__.__name__
-                try:
-                    result = self._collect_with_collector(
-                        collector, user_id, target_date, date_str
-                    )
-                    if result:
-                        results[collector_name] = result
-                        logger.info(f"{collector_name} 데이터 수집 완료")
-                except Exception as e:
-                    logger.error(f"{collector_name} 데이터 수집 실패: {str(e)}")
-                    errors.append(f"{collector_name}: {str(e)}")
-                    # 에러가 발생해도 다른 컬렉터는 계속 실행
+            # 각 컬렉터로 데이터 수집 (스냅샷 모드는 컬렉터별 세이브포인트 사용)
+            results, errors = self._run_collectors(
+                user_id, target_date, date_str, commit=not self.daily_snapshot
+            )
 
             # 결과 검증 및 오류 처리
-            if not results and errors:
-                error_msg = f"모든 데이터 수집 시도 실패: {'; '.join(errors)}"
-                logger.error(error_msg)
-                raise DataCollectionError(
-                    error_msg,
-                    details={"user_id": user_id, "date": date_str, "errors": errors},
-                )
-            elif not results:
-                error_msg = "수집된 데이터가 없습니다"
-                logger.warning(error_msg)
-                raise DataValidationError(
-                    error_msg,
-                    details={"user_id": user_id, "date": date_str},
-                )
-            elif errors:
-                # 일부 성공, 일부 실패
-                logger.warning(
-                    f"일부 데이터 수집 실패 ({len(errors)}개): {'; '.join(errors)}"
-                )
-                # 오류를 결과에 포함
-                results["errors"] = errors
+            daily_result = self._build_daily_result(user_id, date_str, results, errors)
 
-            logger.info(
-                f"사용자 {user_id}의 {date_str} 데이터 수집 완료 - 성공: {len(results) - ('errors' in results)}, 실패: {len(errors)}"
-            )
-            return results
+            if self.daily_snapshot:
+                self._commit_snapshot(user_id, date_str)
+            return daily_result
 
         except (
             DataFetchError,
@@ -1220,9 +1785,13 @@ class GarminDataCollectorService(BaseGarminService):
             DataValidationError,
         ) as e:
             # 이미 적절한 예외 타입이면 그대로 전달
+            if self.daily_snapshot:
+                self.session.rollback()
             raise e
         except Exception as e:
             # 예상치 못한 오류
+            if self.daily_snapshot:
+                self.session.rollback()
             error_msg = f"데이터 수집 중 예상치 못한 오류: {str(e)}"
             logger.error(f"{error_msg}\n{traceback.format_exc()}")
             raise DataCollectionError(
@@ -1233,3 +1802,269 @@ class GarminDataCollectorService(BaseGarminService):
                     "error_type": type(e).__name__,
                 },
             )
+
+    def collect_collector_data(
+        self, user_id: int, target_date: date, collector_name: str
+    ) -> Dict[str, Any]:
+        """
+        컬렉터 하나만 수집 (일일 수집 팬아웃 서브태스크용)
+        - 컬렉터가 읽는 엔드포인트만 프리페치 (다른 서브태스크와 원본 응답 캐시 공유)
+        - 컬렉터 단위로 커밋하므로 느린 컬렉터를 기다리지 않고 먼저 반영
+        - 오류는 예외 대신 결과로 반환 (chord 콜백이 항상 실행되도록)
+
+        returns:
+            {"collector": 이름, "result": 성공 메시지/None, "error": 오류/None}
+        """
+        date_str = target_date.strftime("%Y-%m-%d")
+        part = {"collector": collector_name, "result": None, "error": None}
+        collector = next(
+            (
+                collector
+                for collector in self._create_collectors()
+                if collector.__class__.__name__ == collector_name
+            ),
+            None,
+        )
+        if collector is None:
+            part["error"] = f"{collector_name}: 알 수 없는 컬렉터"
+            return part
+
+        self.shards.use_user(user_id)
+        try:
+            self._prefetch_data(date_str, COLLECTOR_PREFETCH_JOBS[collector_name])
+            self._archive_raw_payloads(user_id, target_date, date_str)
+            self.session.commit()
+            part["result"] = self._collect_with_collector(
+                collector, user_id, target_date, date_str, commit=True
+            )
+            if part["result"]:
+                logger.info(f"{collector_name} 데이터 수집 완료 ({date_str})")
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"{collector_name} 데이터 수집 실패: {str(e)}")
+            part["error"] = f"{collector_name}: {str(e)}"
+        return part
+
+    def merge_collector_results(
+        self, user_id: int, target_date: date, parts: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        팬아웃 서브태스크 결과를 collect_daily_data와 같은 형태로 합침
+        - 하나라도 성공하면 주/월 집계 갱신
+        """
+        date_str = target_date.strftime("%Y-%m-%d")
+        results: Dict[str, Any] = {}
+        errors: List[str] = []
+        for part in parts:
+            if part.get("error"):
+                errors.append(part["error"])
+            elif part.get("result"):
+                results[part["collector"]] = part["result"]
+
+        if results:
+            self.shards.use_user(user_id)
+            self._refresh_period_aggregates(user_id, target_date, commit=True)
+        return self._build_daily_result(user_id, date_str, results, errors)
+
+    def _evict_cache(self, date_str: str) -> None:
+        """수집이 끝난 날짜의 캐시 제거"""
+        for cache_key in list(self._data_cache):
+            if cache_key.endswith(f":{date_str}"):
+                self._data_cache.pop(cache_key, None)
+        self._activity_index.pop(date_str, None)
+        with self._raw_payloads_lock:
+            self._raw_payloads.pop(date_str, None)
+
+    def _commit_batch(
+        self, batch_dates: List[str], results: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """배치 단위 커밋, 실패 시 배치에 포함된 날짜를 실패로 기록"""
+        try:
+            self.session.commit()
+            logger.info(f"배치 커밋 완료: {batch_dates[0]} ~ {batch_dates[-1]}")
+        except Exception as e:
+            self.session.rollback()
+            error_msg = f"배치 커밋 실패: {str(e)}"
+            logger.error(error_msg)
+            for date_str in batch_dates:
+                results[date_str] = {"errors": [error_msg]}
+
+    def _collect_batched_day(
+        self, user_id: int, date_str: str, prepare: Callable[[], Any]
+    ) -> Dict[str, Any]:
+        """
+        배치 커밋용 하루 수집 (커밋하지 않음)
+        - prepare: 캐시를 채우는 작업 (프리페치 대기 또는 보관된 응답 로드)
+
+        returns:
+            collect_daily_data와 같은 형태의 결과, 실패하면 {"errors": [...]}
+        """
+        target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+        try:
+            prepare()
+            day_results, errors = self._run_collectors(
+                user_id, target_date, date_str, commit=False
+            )
+            return self._build_daily_result(user_id, date_str, day_results, errors)
+        except DataCollectionError as e:
+            logger.error(f"{date_str} 데이터 수집 실패: {str(e)}")
+            return {"errors": [str(e)]}
+        except Exception as e:
+            logger.error(
+                f"{date_str} 데이터 수집 중 예상치 못한 오류: "
+                f"{str(e)}\n{traceback.format_exc()}"
+            )
+            return {"errors": [str(e)]}
+        finally:
+            self._evict_cache(date_str)
+
+    def collect_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        batch_size: int = COLLECT_RANGE_BATCH_DAYS,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        기간 데이터 수집
+        - 하나의 클라이언트와 세션으로 여러 날짜 수집
+        - 다음 날짜의 프리페치를 현재 날짜 저장과 겹쳐서 실행
+        - batch_size 일 단위로 커밋 (컬렉터별 실패는 세이브포인트로 격리)
+
+        returns:
+            날짜(YYYY-MM-DD)별 collect_daily_data와 같은 형태의 결과.
+            수집에 실패한 날짜는 {"errors": [...]}
+        """
+        if start_date > end_date:
+            raise ValueError(f"시작일({start_date})이 종료일({end_date})보다 늦습니다.")
+
+        date_strs = [
+            (start_date + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        logger.info(
+            f"사용자 {user_id}의 {date_strs[0]} ~ {date_strs[-1]} 기간 데이터 수집 "
+            f"시작 ({len(date_strs)}일)"
+        )
+        self.shards.use_user(user_id)
+
+        # 기간 전체 활동을 한 번만 조회 (실패 시 날짜별 조회로 대체)
+        try:
+            self.load_activity_window(start_date, end_date)
+        except Exception as e:
+            logger.warning(f"기간 활동 목록 조회 실패, 날짜별로 조회합니다: {str(e)}")
+
+        results: Dict[str, Dict[str, Any]] = {}
+        batch_dates: List[str] = []
+
+        with ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="garmin-range-prefetch"
+        ) as pipeline:
+            next_prefetch = pipeline.submit(self._prefetch_data, date_strs[0])
+
+            for index, date_str in enumerate(date_strs):
+                prefetch = next_prefetch
+                if index + 1 < len(date_strs):
+                    next_prefetch = pipeline.submit(
+                        self._prefetch_data, date_strs[index + 1]
+                    )
+
+                results[date_str] = self._collect_batched_day(
+                    user_id, date_str, prepare=prefetch.result
+                )
+
+                batch_dates.append(date_str)
+                if len(batch_dates) >= batch_size:
+                    self._commit_batch(batch_dates, results)
+                    batch_dates = []
+
+        if batch_dates:
+            self._commit_batch(batch_dates, results)
+
+        failed_days = sum(
+            1 for result in results.values() if len(result) == 1 and "errors" in result
+        )
+        logger.info(
+            f"사용자 {user_id}의 기간 데이터 수집 완료 - 성공: "
+            f"{len(results) - failed_days}일, 실패: {failed_days}일"
+        )
+        return results
+
+    def _load_archived_payloads(self, date_str: str, payloads: Dict[str, Any]) -> None:
+        """보관된 원본 응답을 변환해서 캐시에 채움 (API 호출 없음)"""
+        for endpoint, raw_data in payloads.items():
+            source = RAW_PAYLOAD_SOURCES.get(endpoint)
+            if source is None:
+                logger.warning(f"변환기가 없는 원본 응답 건너뜀: {endpoint}:{date_str}")
+                continue
+            data = source.from_raw(raw_data)
+            if data:
+                self._data_cache[self._get_cache_key(endpoint, date_str)] = data
+
+    def replay_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        batch_size: int = COLLECT_RANGE_BATCH_DAYS,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        보관된 원본 응답으로 기간 데이터 재처리 (Garmin API 호출 없음)
+        - 매퍼 변경 후 저장된 행을 다시 만들 때 사용
+        - 증분 저장 없이 하루 전체를 다시 저장하므로
+          incremental=False로 생성한 서비스에서 실행
+        - 이미 저장된 날짜를 다시 쓰는 용도이므로 삭제 후 재저장 대신 upsert 방식만 허용
+        - batch_size 일 단위로 원본 응답을 읽고 커밋
+
+        returns:
+            날짜(YYYY-MM-DD)별 collect_range와 같은 형태의 결과
+            (보관된 응답이 없는 날짜는 제외)
+        """
+        if start_date > end_date:
+            raise ValueError(f"시작일({start_date})이 종료일({end_date})보다 늦습니다.")
+        if self.incremental:
+            raise ValueError("원본 응답 재처리는 incremental=False로 실행해야 합니다.")
+        if self.write_mode != WRITE_MODE_UPSERT:
+            raise ValueError(
+                f"원본 응답 재처리는 write_mode={WRITE_MODE_UPSERT}로 실행해야 합니다."
+            )
+
+        date_strs = [
+            (start_date + timedelta(days=offset)).strftime("%Y-%m-%d")
+            for offset in range((end_date - start_date).days + 1)
+        ]
+        logger.info(
+            f"사용자 {user_id}의 {date_strs[0]} ~ {date_strs[-1]} 원본 응답 재처리 "
+            f"시작 ({len(date_strs)}일)"
+        )
+        self.shards.use_user(user_id)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for offset in range(0, len(date_strs), batch_size):
+            batch = date_strs[offset : offset + batch_size]
+            archived = self.raw_archive.load_range(
+                user_id,
+                datetime.strptime(batch[0], "%Y-%m-%d").date(),
+                datetime.strptime(batch[-1], "%Y-%m-%d").date(),
+            )
+            batch_dates = [date_str for date_str in batch if archived.get(date_str)]
+            for date_str in batch_dates:
+                results[date_str] = self._collect_batched_day(
+                    user_id,
+                    date_str,
+                    prepare=partial(
+                        self._load_archived_payloads, date_str, archived[date_str]
+                    ),
+                )
+            if batch_dates:
+                self._commit_batch(batch_dates, results)
+
+        failed_days = sum(
+            1 for result in results.values() if len(result) == 1 and "errors" in result
+        )
+        logger.info(
+            f"사용자 {user_id}의 원본 응답 재처리 완료 - "
+            f"성공: {len(results) - failed_days}일, 실패: {failed_days}일, "
+            f"보관된 응답 없음: {len(date_strs) - len(results)}일"
+        )
+        return results
@@ -0,0 +1,494 @@
+import base64
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.model import (
+    Activity,
+    ArchivedPartition,
+    HeartRateDaily,
+    HeartRateReading,
+    SleepHRVReading,
+    SleepMovement,
+    SleepSession,
+    StepsDaily,
+    StepsIntraday,
+    StressDaily,
+    StressReading,
+)
+from app.service.partition_archive_service import (
+    ArchiveStorage,
+    arrow_schema,
+    import_pyarrow,
+)
+from core.config import EXPORT_CHUNK_SIZE, EXPORT_PARQUET_PAGE_ROWS
+from core.db.shard import use_user_shard
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMAT_NDJSON = "ndjson"
+EXPORT_FORMAT_PARQUET = "parquet"
+EXPORT_FORMATS = (EXPORT_FORMAT_NDJSON, EXPORT_FORMAT_PARQUET)
+
+# Parquet 페이지 footer 메타데이터 키
+PARQUET_TABLE_KEY = "export_table"
+PARQUET_NEXT_CURSOR_KEY = "export_next_cursor"
+# Parquet 디렉토리 내보내기 진행 상태 파일
+PARQUET_STATE_FILE = "_export_state.json"
+NDJSON_COMPLETE_LINE = b'{"complete": true}\n'
+
+
+@dataclass(frozen=True)
+class ExportSource:
+    """내보낼 테이블과 정렬 키 (사용자 조건 + 정렬 키가 인덱스 순서와 같도록)"""
+
+    model: Any
+    key_columns: Tuple[str, ...]
+    # 측정값 테이블이면 사용자 조건을 거는 부모 일일 모델과 부모 id 컬럼
+    parent_model: Any = None
+    parent_column: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        return self.model.__tablename__
+
+
+EXPORT_SOURCES: Tuple[ExportSource, ...] = (
+    ExportSource(HeartRateDaily, ("date",)),
+    ExportSource(
+        HeartRateReading,
+        ("daily_summary_id", "start_time_local"),
+        HeartRateDaily,
+        "daily_summary_id",
+    ),
+    ExportSource(StressDaily, ("date",)),
+    ExportSource(
+        StressReading,
+        ("daily_summary_id", "start_time_local"),
+        StressDaily,
+        "daily_summary_id",
+    ),
+    ExportSource(StepsDaily, ("date",)),
+    ExportSource(
+        StepsIntraday,
+        ("daily_summary_id", "start_time_local"),
+        StepsDaily,
+        "daily_summary_id",
+    ),
+    ExportSource(SleepSession, ("date",)),
+    ExportSource(
+        SleepMovement,
+        ("sleep_session_id", "start_time_local"),
+        SleepSession,
+        "sleep_session_id",
+    ),
+    ExportSource(
+        SleepHRVReading,
+        ("sleep_session_id", "start_time_local"),
+        SleepSession,
+        "sleep_session_id",
+    ),
+    ExportSource(Activity, ("start_time_local", "id")),
+)
+EXPORT_SOURCE_NAMES = tuple(source.name for source in EXPORT_SOURCES)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value)}")
+
+
+@dataclass(frozen=True)
+class ExportCursor:
+    """
+    내보내기 재개 위치
+    - key: DB 행의 마지막 정렬 키 (이후 행부터)
+    - archive_partition/archive_offset: 보관 파일 단계의 파일과 이미 내보낸 행 수
+    """
+
+    source: str
+    key: Optional[Tuple[Any, ...]] = None
+    archive_partition: Optional[str] = None
+    archive_offset: int = 0
+
+    def encode(self) -> str:
+        payload = {
+            "s": self.source,
+            "k": list(self.key) if self.key is not None else None,
+            "p": self.archive_partition,
+            "o": self.archive_offset,
+        }
+        raw = json.dumps(payload, default=_json_default, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "ExportCursor":
+        """토큰 해석 (형식이 잘못되면 ValueError)"""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            source = _source_by_name(payload["s"])
+            key = payload.get("k")
+            if key is not None:
+                if len(key) != len(source.key_columns):
+                    raise ValueError("정렬 키 길이가 맞지 않습니다")
+                columns = source.model.__table__.columns
+                key = tuple(
+                    _parse_key_value(columns[name], value)
+                    for name, value in zip(source.key_columns, key)
+                )
+            return cls(
+                source=source.name,
+                key=key,
+                archive_partition=payload.get("p"),
+                archive_offset=int(payload.get("o") or 0),
+            )
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValueError(f"잘못된 내보내기 커서: {token}") from e
+
+
+def _source_by_name(name: str) -> ExportSource:
+    for source in EXPORT_SOURCES:
+        if source.name == name:
+            return source
+    raise ValueError(f"내보낼 수 없는 테이블: {name}")
+
+
+def _parse_key_value(column, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type in (date, datetime) and isinstance(value, str):
+        return python_type.fromisoformat(value)
+    return value
+
+
+@dataclass
+class ExportChunk:
+    """한 번에 내보내는 행 묶음과 이 묶음 다음부터 이어서 받을 커서"""
+
+    source: ExportSource
+    rows: List[Dict[str, Any]]
+    next_cursor: ExportCursor
+
+
+class _ParquetStreamSink:
+    """ParquetWriter가 쓰는 바이트를 모아 두었다가 스트림으로 내보내는 파일 객체"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._buffer.extend(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class UserExportService:
+    """
+    사용자의 일일 요약/시계열 전체 내보내기
+    - 테이블마다 서버 측 커서(yield_per)로 정렬 키 순서대로 읽어 메모리 사용량 일정
+    - 청크마다 다음 커서를 함께 내보내므로 중단된 곳부터 재개 가능
+    - 측정값은 DB 행 다음에 보관(Parquet) 파티션의 행도 포함
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        user_id: int,
+        chunk_size: int = EXPORT_CHUNK_SIZE,
+        storage: Optional[ArchiveStorage] = None,
+    ):
+        self.session = session
+        self.user_id = user_id
+        self.chunk_size = chunk_size
+        self._storage = storage
+        use_user_shard(session, user_id)
+
+    @property
+    def storage(self) -> ArchiveStorage:
+        if self._storage is None:
+            self._storage = ArchiveStorage()
+        return self._storage
+
+    def _user_condition(self, source: ExportSource):
+        if source.parent_model is None:
+            return source.model.user_id == self.user_id
+        parent_ids = select(source.parent_model.id).where(
+            source.parent_model.user_id == self.user_id
+        )
+        return getattr(source.model, source.parent_column).in_(parent_ids)
+
+    def _db_chunks(
+        self, source: ExportSource, after: Optional[Tuple[Any, ...]]
+    ) -> Iterator[ExportChunk]:
+        """DB 행을 정렬 키 순서로 청크 단위 조회 (after 이후부터)"""
+        table = source.model.__table__
+        key_columns = [table.c[name] for name in source.key_columns]
+        query = select(table).where(self._user_condition(source))
+        if after is not None:
+            query = query.where(tuple_(*key_columns) > tuple_(*after))
+        query = query.order_by(*key_columns).execution_options(
+            yield_per=self.chunk_size
+        )
+
+        for rows in self.session.execute(query).mappings().partitions():
+            rows = [dict(row) for row in rows]
+            last_key = tuple(rows[-1][name] for name in source.key_columns)
+            yield ExportChunk(source, rows, ExportCursor(source.name, key=last_key))
+
+    def _archived_chunks(
+        self, source: ExportSource, cursor: Optional[ExportCursor]
+    ) -> Iterator[ExportChunk]:
+        """보관 파티션 파일의 사용자 행 (파일 순서, 파일 안 행 수 기준으로 재개)"""
+        partitions = self.session.execute(
+            select(ArchivedPartition.partition_name, ArchivedPartition.uri)
+            .where(ArchivedPartition.parent_table == source.name)
+            .order_by(ArchivedPartition.range_start, ArchivedPartition.partition_name)
+        ).all()
+        if not partitions:
+            return
+
+        names = [name for name, _ in partitions]
+        start_index, offset = 0, 0
+        if cursor is not None and cursor.archive_partition in names:
+            start_index = names.index(cursor.archive_partition)
+            offset = cursor.archive_offset
+
+        parent_ids = (
+            self.session.execute(
+                select(source.parent_model.id).where(
+                    source.parent_model.user_id == self.user_id
+                )
+            )
+            .scalars()
+            .all()
+        )
+        if not parent_ids:
+            return
+
+        _, pq = import_pyarrow()
+        for name, uri in partitions[start_index:]:
+            archived = pq.read_table(
+                self.storage.open(uri),
+                filters=[(source.parent_column, "in", parent_ids)],
+            )
+            while offset < archived.num_rows:
+                rows = archived.slice(offset, self.chunk_size).to_pylist()
+                offset += len(rows)
+                yield ExportChunk(
+                    source,
+                    rows,
+                    ExportCursor(
+                        source.name, archive_partition=name, archive_offset=offset
+                    ),
+                )
+            offset = 0
+
+    def _source_chunks(
+        self, source: ExportSource, cursor: Optional[ExportCursor]
+    ) -> Iterator[ExportChunk]:
+        in_archive = cursor is not None and cursor.archive_partition is not None
+        if not in_archive:
+            yield from self._db_chunks(source, cursor.key if cursor else None)
+        if source.parent_model is not None:
+            yield from self._archived_chunks(source, cursor if in_archive else None)
+
+    def iter_chunks(
+        self,
+        cursor: Optional[ExportCursor] = None,
+        sources: Optional[Sequence[str]] = None,
+    ) -> Iterator[ExportChunk]:
+        """
+        커서 위치부터 모든(또는 지정한) 테이블의 행을 청크 단위로 반환
+        - 커서가 없으면 처음부터
+        """
+        started = cursor is None
+        for source in EXPORT_SOURCES:
+            if sources is not None and source.name not in sources:
+                continue
+            if not started:
+                if source.name != cursor.source:
+                    continue
+                started = True
+                yield from self._source_chunks(source, cursor)
+            else:
+                yield from self._source_chunks(source, None)
+
+    def next_source_cursor(self, source_name: str) -> Optional[ExportCursor]:
+        """source_name 다음 테이블의 시작 커서 (마지막 테이블이면 None)"""
+        index = EXPORT_SOURCE_NAMES.index(source_name)
+        if index + 1 >= len(EXPORT_SOURCES):
+            return None
+        return ExportCursor(EXPORT_SOURCE_NAMES[index + 1])
+
+    @staticmethod
+    def _ndjson_chunk(chunk: ExportChunk) -> bytes:
+        lines = [
+            json.dumps(
+                {"table": chunk.source.name, "data": row},
+                default=_json_default,
+                ensure_ascii=False,
+            )
+            for row in chunk.rows
+        ]
+        lines.append(json.dumps({"cursor": chunk.next_cursor.encode()}))
+        return ("\n".join(lines) + "\n").encode()
+
+    def iter_ndjson(self, cursor: Optional[ExportCursor] = None) -> Iterator[bytes]:
+        """
+        NDJSON 스트림
+        - 행: {"table": 테이블, "data": {...}}
+        - 청크마다: {"cursor": 재개 토큰}, 마지막: {"complete": true}
+        """
+        for chunk in self.iter_chunks(cursor):
+            yield self._ndjson_chunk(chunk)
+        yield NDJSON_COMPLETE_LINE
+
+    def iter_parquet_page(
+        self,
+        cursor: Optional[ExportCursor] = None,
+        max_rows: int = EXPORT_PARQUET_PAGE_ROWS,
+    ) -> Iterator[bytes]:
+        """
+        테이블 하나의 Parquet 파일 한 페이지 스트림 (청크마다 row group 하나)
+        - 최대 max_rows 행, footer 메타데이터에 테이블 이름과 다음 페이지 커서
+          (모든 테이블을 다 내보냈으면 빈 문자열)
+        """
+        pa, pq = import_pyarrow()
+        cursor = cursor or ExportCursor(EXPORT_SOURCE_NAMES[0])
+        source = _source_by_name(cursor.source)
+        schema = arrow_schema(source.model.__table__)
+        sink = _ParquetStreamSink()
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+
+        next_cursor = self.next_source_cursor(source.name)
+        written = 0
+        try:
+            for chunk in self.iter_chunks(cursor, sources=[source.name]):
+                writer.write_table(pa.Table.from_pylist(chunk.rows, schema))
+                written += len(chunk.rows)
+                yield sink.drain()
+                if written >= max_rows:
+                    next_cursor = chunk.next_cursor
+                    break
+            writer.add_key_value_metadata(
+                {
+                    PARQUET_TABLE_KEY: source.name,
+                    PARQUET_NEXT_CURSOR_KEY: (
+                        next_cursor.encode() if next_cursor else ""
+                    ),
+                }
+            )
+        finally:
+            writer.close()
+        logger.info(
+            f"Parquet 내보내기 - User: {self.user_id}, Table: {source.name}, "
+            f"Rows: {written}"
+        )
+        yield sink.drain()
+
+    def write_ndjson_file(self, path: str) -> int:
+        """
+        NDJSON 파일로 내보내기 (파일이 있으면 마지막 cursor 줄 이후부터 이어서)
+        - 마지막 cursor 줄 뒤의 불완전한 행은 잘라내고 다시 씀
+
+        returns:
+            이번에 쓴 행 수
+        """
+        cursor, resume_at = None, 0
+        if os.path.exists(path):
+            with open(path, "rb") as existing:
+                position = 0
+                for line in existing:
+                    position += len(line)
+                    if line == NDJSON_COMPLETE_LINE:
+                        logger.info(f"이미 완료된 내보내기: {path}")
+                        return 0
+                    if line.startswith(b'{"cursor"'):
+                        cursor = ExportCursor.decode(json.loads(line)["cursor"])
+                        resume_at = position
+
+        rows = 0
+        with open(path, "ab") as output:
+            output.truncate(resume_at)
+            for chunk in self.iter_chunks(cursor):
+                output.write(self._ndjson_chunk(chunk))
+                rows += len(chunk.rows)
+            output.write(NDJSON_COMPLETE_LINE)
+        return rows
+
+    def write_parquet_directory(self, directory: str) -> int:
+        """
+        테이블별 Parquet 페이지 파일로 내보내기
+        (<directory>/<테이블>/part-00000.parquet)
+        - 페이지를 쓸 때마다 다음 커서와 페이지 번호를 상태 파일에 저장
+        - 상태 저장 전에 중단되면 같은 커서로 같은 파일을 다시 써서 중복 없음
+
+        returns:
+            이번에 쓴 페이지 수
+        """
+        _, pq = import_pyarrow()
+        state_path = os.path.join(directory, PARQUET_STATE_FILE)
+        os.makedirs(directory, exist_ok=True)
+
+        state = {"next_cursor": None, "pages": 0, "complete": False}
+        if os.path.exists(state_path):
+            with open(state_path) as state_file:
+                state = json.load(state_file)
+            if state["complete"]:
+                logger.info(f"이미 완료된 내보내기: {directory}")
+                return 0
+        cursor = (
+            ExportCursor.decode(state["next_cursor"]) if state["next_cursor"] else None
+        )
+
+        written = 0
+        while True:
+            table = cursor.source if cursor else EXPORT_SOURCE_NAMES[0]
+            table_dir = os.path.join(directory, table)
+            os.makedirs(table_dir, exist_ok=True)
+            page_path = os.path.join(table_dir, f"part-{state['pages']:05d}.parquet")
+            with open(f"{page_path}.tmp", "wb") as page_file:
+                for data in self.iter_parquet_page(cursor):
+                    page_file.write(data)
+            os.replace(f"{page_path}.tmp", page_path)
+            written += 1
+
+            metadata = pq.read_metadata(page_path).metadata or {}
+            token = metadata.get(PARQUET_NEXT_CURSOR_KEY.encode(), b"").decode()
+            state = {
+                "next_cursor": token or None,
+                "pages": state["pages"] + 1,
+                "complete": not token,
+            }
+            with open(f"{state_path}.tmp", "w") as state_file:
+                json.dump(state, state_file)
+            os.replace(f"{state_path}.tmp", state_path)
+            if not token:
+                return written
+            cursor = ExportCursor.decode(token)
@@ -0,0 +1,96 @@
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# int2 범위, 측정은 됐지만 값이 없는 경우(NULL 값 측정)를 표시하는 값
+# (배열의 NULL은 해당 간격에 측정값 자체가 없음을 의미)
+INT2_MIN = -32768
+INT2_MAX = 32767
+NULL_READING = INT2_MIN
+
+
+@dataclass(frozen=True)
+class PackedSeries:
+    """고정 간격 하루 시계열 (시작 시각 + 간격 + 값 배열)"""
+
+    start_gmt: datetime
+    start_local: datetime
+    interval_seconds: int
+    values: List[Optional[int]]
+
+
+def pack_readings(readings: Sequence[Any], value_attr: str) -> Optional[PackedSeries]:
+    """
+    측정값 목록을 고정 간격 배열로 압축
+    - 가장 흔한 측정 간격을 사용하고, 빠진 구간은 NULL로 채움
+    - 간격에 맞지 않는 측정값, 같은 구간의 중복, int2 범위를 넘는 값이 있으면 None
+    """
+    readings = sorted(
+        (reading for reading in readings if reading is not None),
+        key=lambda reading: reading.start_time_gmt,
+    )
+    if not readings:
+        return None
+
+    first = readings[0]
+    deltas = Counter(
+        int((current.start_time_gmt - previous.start_time_gmt).total_seconds())
+        for previous, current in zip(readings, readings[1:])
+    )
+    interval = deltas.most_common(1)[0][0] if deltas else 60
+    if interval <= 0:
+        return None
+
+    slots: Dict[int, int] = {}
+    for reading in readings:
+        offset = (reading.start_time_gmt - first.start_time_gmt).total_seconds()
+        slot, remainder = divmod(int(offset), interval)
+        if remainder or offset != int(offset) or slot in slots:
+            logger.debug(
+                f"고정 간격으로 압축할 수 없는 시계열: {reading.start_time_gmt}"
+            )
+            return None
+
+        value = getattr(reading, value_attr)
+        if value is None:
+            value = NULL_READING
+        elif not INT2_MIN < value <= INT2_MAX:
+            return None
+        slots[slot] = int(value)
+
+    values = [slots.get(slot) for slot in range(max(slots) + 1)]
+    return PackedSeries(
+        start_gmt=first.start_time_gmt,
+        start_local=first.start_time_local,
+        interval_seconds=interval,
+        values=values,
+    )
+
+
+def unpack_series(daily: Any) -> Optional[List[Dict[str, Any]]]:
+    """
+    일일 행에 압축 저장된 시계열을 측정값 목록으로 복원
+
+    returns:
+        [{"start_time_gmt", "start_time_local", "value"}, ...], 압축 저장이 아니면 None
+    """
+    if daily.series_values is None:
+        return None
+
+    interval = timedelta(seconds=daily.series_interval_seconds)
+    readings = []
+    for slot, value in enumerate(daily.series_values):
+        if value is None:
+            continue
+        readings.append(
+            {
+                "start_time_gmt": daily.series_start_gmt + interval * slot,
+                "start_time_local": daily.series_start_local + interval * slot,
+                "value": None if value == NULL_READING else value,
+            }
+        )
+    return readings
@@ -0,0 +1,384 @@
+import hashlib
+import logging
+import os
+import re
+import shutil
+import tempfile
+from datetime import date, datetime, time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from sqlalchemy import Table, select, text
+from sqlalchemy.orm import Session
+
+from app.model import ArchivedPartition, Base
+from core.config import PARTITION_ARCHIVE_URI, PARTITION_RETENTION_MONTHS
+
+logger = logging.getLogger(__name__)
+
+# 월 파티션을 보관하는 측정값 테이블 -> 부모 id 컬럼
+ARCHIVE_READING_TABLES = {
+    "heart_rate_readings": "daily_summary_id",
+    "stress_readings": "daily_summary_id",
+    "steps_intraday": "daily_summary_id",
+    "sleep_movement": "sleep_session_id",
+    "sleep_hrv_readings": "sleep_session_id",
+}
+
+# 분리(detach)된 뒤 보관 파일로 옮겨지기 전까지 파티션을 두는 스키마
+ARCHIVE_PENDING_SCHEMA = "archive_pending"
+
+PARTITION_BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+def import_pyarrow():
+    """pyarrow는 보관/보관 파일 조회 시에만 필요하므로 사용할 때 import"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError(
+            "파티션 보관 파일을 다루려면 pyarrow가 필요합니다 (pip install pyarrow)"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def _month_start(value: datetime) -> datetime:
+    return datetime.combine(value.date().replace(day=1), time.min)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    month_index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=month_index // 12, month=month_index % 12 + 1, day=1)
+
+
+def arrow_schema(table: Table):
+    """테이블 컬럼을 Parquet 스키마로 변환"""
+    pa, _ = import_pyarrow()
+    types = {
+        "big_integer": pa.int64(),
+        "integer": pa.int32(),
+        "small_integer": pa.int16(),
+        "float": pa.float64(),
+        "date": pa.date32(),
+    }
+    fields = []
+    for column in table.columns:
+        type_name = column.type.__visit_name__
+        if type_name == "datetime":
+            arrow_type = pa.timestamp("us", tz="UTC" if column.type.timezone else None)
+        elif type_name == "ARRAY":
+            item_type = column.type.item_type.__visit_name__
+            arrow_type = pa.list_(types.get(item_type, pa.string()))
+        else:
+            arrow_type = types.get(type_name, pa.string())
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+class ArchiveStorage:
+    """보관 파일 저장소 (로컬 디렉토리 또는 s3://bucket/prefix)"""
+
+    def __init__(self, uri: str = PARTITION_ARCHIVE_URI):
+        parsed = urlparse(uri)
+        self.is_s3 = parsed.scheme == "s3"
+        self.bucket = parsed.netloc
+        self.root = parsed.path.strip("/") if self.is_s3 else uri
+        self._s3_client = None
+
+    def _s3(self):
+        if self._s3_client is None:
+            import boto3
+
+            self._s3_client = boto3.client("s3")
+        return self._s3_client
+
+    def put(self, local_path: str, key: str) -> str:
+        """파일 저장 후 URI 반환"""
+        if self.is_s3:
+            object_key = f"{self.root}/{key}" if self.root else key
+            self._s3().upload_file(local_path, self.bucket, object_key)
+            return f"s3://{self.bucket}/{object_key}"
+
+        target = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(local_path, target)
+        return os.path.abspath(target)
+
+    def open(self, uri: str):
+        """pyarrow가 읽을 수 있는 입력 (로컬 경로 또는 메모리 버퍼)"""
+        parsed = urlparse(uri)
+        if parsed.scheme != "s3":
+            return uri
+        pa, _ = import_pyarrow()
+        body = self._s3().get_object(Bucket=parsed.netloc, Key=parsed.path.lstrip("/"))
+        return pa.BufferReader(body["Body"].read())
+
+
+class PartitionArchiver:
+    """
+    오래된 측정값 월 파티션 보관
+    1. 보관 기간이 지난 파티션을 분리해서 archive_pending 스키마로 이동
+       (pg_partman이 있으면 retention 설정으로, 없으면 직접 DETACH)
+    2. archive_pending의 테이블을 zstd Parquet 파일로 저장하고 목록에 기록한 뒤 삭제
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        storage: Optional[ArchiveStorage] = None,
+        retention_months: int = PARTITION_RETENTION_MONTHS,
+        batch_size: int = 50000,
+    ):
+        self.session = session
+        self.storage = storage or ArchiveStorage()
+        self.retention_months = retention_months
+        self.batch_size = batch_size
+
+    def cutoff(self, today: Optional[date] = None) -> datetime:
+        """이 시각 이전에 끝나는 파티션이 보관 대상"""
+        today = today or date.today()
+        month_start = datetime.combine(today.replace(day=1), time.min)
+        return _add_months(month_start, -self.retention_months)
+
+    def _get_partman_schema(self) -> Optional[str]:
+        return self.session.execute(
+            text(
+                """
+                SELECT n.nspname
+                FROM pg_extension e
+                JOIN pg_namespace n ON n.oid = e.extnamespace
+                WHERE e.extname = 'pg_partman'
+                """
+            )
+        ).scalar()
+
+    def _detach_with_partman(self, schema: str) -> None:
+        """pg_partman retention으로 오래된 파티션을 archive_pending 스키마로 이동"""
+        self.session.execute(
+            text(
+                f"""
+                UPDATE {schema}.part_config
+                SET retention = :retention,
+                    retention_schema = :retention_schema,
+                    retention_keep_table = true
+                WHERE parent_table = ANY(:parents)
+                """
+            ),
+            {
+                "retention": f"{self.retention_months} months",
+                "retention_schema": ARCHIVE_PENDING_SCHEMA,
+                "parents": [f"public.{table}" for table in ARCHIVE_READING_TABLES],
+            },
+        )
+        for table in ARCHIVE_READING_TABLES:
+            self.session.execute(
+                text(f"SELECT {schema}.run_maintenance(p_parent_table => :parent)"),
+                {"parent": f"public.{table}"},
+            )
+
+    def _detach_manually(self, cutoff: datetime) -> None:
+        """범위 상한이 cutoff 이전인 파티션을 직접 분리 (기본 파티션 제외)"""
+        for table in ARCHIVE_READING_TABLES:
+            partitions = self.session.execute(
+                text(
+                    """
+                    SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+                    FROM pg_inherits i
+                    JOIN pg_class c ON c.oid = i.inhrelid
+                    JOIN pg_class p ON p.oid = i.inhparent
+                    WHERE p.relname = :parent
+                    """
+                ),
+                {"parent": table},
+            ).all()
+            for partition_name, bound in partitions:
+                match = PARTITION_BOUND_PATTERN.search(bound or "")
+                if not match or datetime.fromisoformat(match.group(2)) > cutoff:
+                    continue
+                self.session.execute(
+                    text(f"ALTER TABLE {table} DETACH PARTITION {partition_name}")
+                )
+                self.session.execute(
+                    text(
+                        f"ALTER TABLE {partition_name} "
+                        f"SET SCHEMA {ARCHIVE_PENDING_SCHEMA}"
+                    )
+                )
+                logger.info(f"파티션 분리: {partition_name}")
+
+    def detach_cold_partitions(self, today: Optional[date] = None) -> None:
+        """보관 기간이 지난 파티션 분리"""
+        schema = self._get_partman_schema()
+        if schema:
+            self._detach_with_partman(schema)
+        else:
+            self._detach_manually(self.cutoff(today))
+        self.session.commit()
+
+    def list_pending(self) -> List[Tuple[str, str]]:
+        """보관 대기 중인 (파티션 이름, 부모 테이블) 목록"""
+        names = self.session.execute(
+            text(
+                "SELECT tablename FROM pg_tables WHERE schemaname = :schema "
+                "ORDER BY tablename"
+            ),
+            {"schema": ARCHIVE_PENDING_SCHEMA},
+        ).scalars()
+
+        pending = []
+        for name in names:
+            parents = [
+                table
+                for table in ARCHIVE_READING_TABLES
+                if name.startswith(f"{table}_")
+            ]
+            if parents:
+                pending.append((name, max(parents, key=len)))
+            else:
+                logger.warning(
+                    f"보관 대상이 아닌 테이블: {ARCHIVE_PENDING_SCHEMA}.{name}"
+                )
+        return pending
+
+    def archive_partition(
+        self, partition_name: str, parent_table: str
+    ) -> Optional[ArchivedPartition]:
+        """
+        분리된 파티션 하나를 Parquet 파일로 저장하고 목록에 기록한 뒤 삭제
+        - 부모 id, start_time_local 순으로 정렬해서 저장
+          (row group 통계로 조회 범위 축소)
+        - 파일 저장 후 커밋 전에 실패하면 다음 실행에서 같은 경로로 다시 저장
+        """
+        pa, pq = import_pyarrow()
+        table = Base.metadata.tables[parent_table]
+        schema = arrow_schema(table)
+        parent_column = ARCHIVE_READING_TABLES[parent_table]
+        qualified_name = f"{ARCHIVE_PENDING_SCHEMA}.{partition_name}"
+        column_list = ", ".join(column.name for column in table.columns)
+
+        row_count = 0
+        first = last = None
+        with tempfile.TemporaryDirectory() as temp_dir:
+            local_path = os.path.join(temp_dir, f"{partition_name}.parquet")
+            writer = pq.ParquetWriter(local_path, schema, compression="zstd")
+            try:
+                result = (
+                    self.session.connection()
+                    .execution_options(stream_results=True)
+                    .execute(
+                        text(
+                            f"SELECT {column_list} FROM {qualified_name} "
+                            f"ORDER BY {parent_column}, start_time_local"
+                        )
+                    )
+                )
+                for rows in result.mappings().partitions(self.batch_size):
+                    batch = pa.Table.from_pylist([dict(row) for row in rows], schema)
+                    writer.write_table(batch)
+                    row_count += len(rows)
+                    starts = [row["start_time_local"] for row in rows]
+                    first = min(starts) if first is None else min(first, *starts)
+                    last = max(starts) if last is None else max(last, *starts)
+            finally:
+                writer.close()
+
+            if row_count == 0:
+                self.session.execute(text(f"DROP TABLE {qualified_name}"))
+                self.session.commit()
+                logger.info(f"빈 파티션 삭제: {qualified_name}")
+                return None
+
+            with open(local_path, "rb") as archive_file:
+                sha256 = hashlib.sha256(archive_file.read()).hexdigest()
+            size_bytes = os.path.getsize(local_path)
+            uri = self.storage.put(
+                local_path, f"{parent_table}/{partition_name}.parquet"
+            )
+
+        archived = self.session.merge(
+            ArchivedPartition(
+                partition_name=partition_name,
+                parent_table=parent_table,
+                range_start=_month_start(first),
+                range_end=_add_months(_month_start(last), 1),
+                uri=uri,
+                row_count=row_count,
+                size_bytes=size_bytes,
+                sha256=sha256,
+            )
+        )
+        self.session.execute(text(f"DROP TABLE {qualified_name}"))
+        self.session.commit()
+        logger.info(
+            f"파티션 보관 완료: {qualified_name} -> {uri} "
+            f"({row_count}행, {size_bytes} bytes)"
+        )
+        return archived
+
+    def run(self, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        분리 + 보관 전체 실행 (파티션별로 커밋, 실패한 파티션은 다음 실행에서 재시도)
+
+        returns:
+            {"archived": [파티션 이름], "failed": {파티션 이름: 오류}}
+        """
+        self.detach_cold_partitions(today)
+
+        archived, failed = [], {}
+        for partition_name, parent_table in self.list_pending():
+            try:
+                self.archive_partition(partition_name, parent_table)
+                archived.append(partition_name)
+            except Exception as e:
+                self.session.rollback()
+                logger.error(f"파티션 보관 실패 ({partition_name}): {str(e)}")
+                failed[partition_name] = str(e)
+        return {"archived": archived, "failed": failed}
+
+
+class ArchivedReadingStore:
+    """보관 파일에서 측정값 조회 (DB에서 제거된 오래된 날짜용)"""
+
+    def __init__(self, session: Session, storage: Optional[ArchiveStorage] = None):
+        self.session = session
+        self.storage = storage or ArchiveStorage()
+
+    def load(
+        self, table_name: str, parent_id: int, start: datetime, end: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        부모 id의 [start, end) 측정값 (start_time_local 순)
+        - 보관 목록에 해당 범위 파일이 없으면 pyarrow 없이 빈 목록 반환
+        """
+        uris = (
+            self.session.execute(
+                select(ArchivedPartition.uri)
+                .where(
+                    ArchivedPartition.parent_table == table_name,
+                    ArchivedPartition.range_start < end,
+                    ArchivedPartition.range_end > start,
+                )
+                .order_by(ArchivedPartition.range_start)
+            )
+            .scalars()
+            .all()
+        )
+        if not uris:
+            return []
+
+        _, pq = import_pyarrow()
+        parent_column = ARCHIVE_READING_TABLES[table_name]
+        readings = []
+        for uri in uris:
+            archived = pq.read_table(
+                self.storage.open(uri),
+                filters=[
+                    (parent_column, "=", parent_id),
+                    ("start_time_local", ">=", start),
+                    ("start_time_local", "<", end),
+                ],
+            )
+            readings.extend(archived.to_pylist())
+        readings.sort(key=lambda reading: reading["start_time_local"])
+        return readings
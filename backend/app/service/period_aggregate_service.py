@@ -0,0 +1,278 @@
+import logging
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.model import (
+    HeartRateDaily,
+    PeriodAggregate,
+    SleepSession,
+    StepsDaily,
+    StressDaily,
+)
+from core.db.base_model import utc_now
+
+logger = logging.getLogger(__name__)
+
+PERIOD_WEEK = "week"
+PERIOD_MONTH = "month"
+PERIODS = (PERIOD_WEEK, PERIOD_MONTH)
+
+# 조회 기간이 이보다 길면 월간 집계 사용 (짧으면 주간)
+MONTHLY_THRESHOLD_DAYS = 62
+
+
+@dataclass(frozen=True)
+class AggregateSpec:
+    """집계할 일일 요약 컬럼"""
+
+    model: Any
+    column: str
+    # 값 >= 목표 컬럼이면 목표 달성으로 계산
+    goal_column: Optional[str] = None
+
+
+PERIOD_METRICS: Dict[str, AggregateSpec] = {
+    "resting_hr": AggregateSpec(HeartRateDaily, "resting_hr"),
+    "avg_hr": AggregateSpec(HeartRateDaily, "avg_hr"),
+    "total_steps": AggregateSpec(StepsDaily, "total_steps", goal_column="goal_steps"),
+    "active_minutes": AggregateSpec(StepsDaily, "active_minutes"),
+    "avg_stress_level": AggregateSpec(StressDaily, "avg_stress_level"),
+    "sleep_seconds": AggregateSpec(SleepSession, "total_seconds"),
+    "sleep_hrv": AggregateSpec(SleepSession, "hrv_last_night_avg"),
+}
+
+
+def period_bounds(period: str, target_date: date) -> Tuple[date, date]:
+    """target_date가 속한 주(월요일 시작)/월의 [시작, 끝] 날짜"""
+    if period == PERIOD_WEEK:
+        start = target_date - timedelta(days=target_date.weekday())
+        return start, start + timedelta(days=6)
+    if period == PERIOD_MONTH:
+        start = target_date.replace(day=1)
+        next_month = (start + timedelta(days=32)).replace(day=1)
+        return start, next_month - timedelta(days=1)
+    raise ValueError(f"지원하지 않는 집계 주기: {period}")
+
+
+def choose_period(start_date: date, end_date: date) -> str:
+    """조회 기간 길이에 맞는 집계 주기"""
+    if (end_date - start_date).days + 1 > MONTHLY_THRESHOLD_DAYS:
+        return PERIOD_MONTH
+    return PERIOD_WEEK
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    """정렬된 값의 선형 보간 백분위수"""
+    position = (len(values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def _trend_slope(points: Sequence[Tuple[int, float]]) -> Optional[float]:
+    """(경과 일수, 값) 목록의 최소제곱 기울기 (하루당 변화량)"""
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    denominator = sum((x - mean_x) ** 2 for x, _ in points)
+    if denominator == 0:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / denominator
+
+
+def summarize_period(
+    period_start: date,
+    days: Iterable[Tuple[date, Optional[float], Optional[float]]],
+) -> Optional[Dict[str, Any]]:
+    """
+    (날짜, 값, 목표) 목록의 기간 통계
+    - 값이 없는 날은 제외, 값이 있는 날이 없으면 None
+    """
+    points = [
+        (day, float(value), goal) for day, value, goal in days if value is not None
+    ]
+    if not points:
+        return None
+
+    values = sorted(value for _, value, _ in points)
+    goals = [(value, goal) for _, value, goal in points if goal]
+    goal_days = sum(1 for value, goal in goals if value >= goal)
+    return {
+        "day_count": len(values),
+        "mean": sum(values) / len(values),
+        "min_value": values[0],
+        "max_value": values[-1],
+        "p10": _percentile(values, 0.1),
+        "p50": _percentile(values, 0.5),
+        "p90": _percentile(values, 0.9),
+        "trend_slope": _trend_slope(
+            [((day - period_start).days, value) for day, value, _ in points]
+        ),
+        "goal_days": goal_days if goals else None,
+        "goal_hit_rate": goal_days / len(goals) if goals else None,
+    }
+
+
+class PeriodAggregateService:
+    """일일 요약 지표의 주간/월간 집계 갱신/조회"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def _load_days(
+        self, user_id: int, start: date, end: date
+    ) -> Dict[str, List[Tuple[date, Any, Any]]]:
+        """지표별 (날짜, 값, 목표) 목록 (일일 요약 테이블마다 쿼리 한 번)"""
+        by_model: Dict[Any, List[str]] = {}
+        for metric, spec in PERIOD_METRICS.items():
+            by_model.setdefault(spec.model, []).append(metric)
+
+        days: Dict[str, List[Tuple[date, Any, Any]]] = {}
+        for model, metrics in by_model.items():
+            rows = self.session.execute(
+                select(model).where(
+                    model.user_id == user_id,
+                    model.date >= start,
+                    model.date <= end,
+                )
+            ).scalars()
+            for row in rows:
+                for metric in metrics:
+                    spec = PERIOD_METRICS[metric]
+                    goal = getattr(row, spec.goal_column) if spec.goal_column else None
+                    days.setdefault(metric, []).append(
+                        (row.date, getattr(row, spec.column), goal)
+                    )
+        return days
+
+    def refresh_periods(self, user_id: int, periods: Iterable[Tuple[str, date]]) -> int:
+        """
+        (주기, 시작 날짜) 집계를 일일 요약에서 다시 계산해서 교체
+        - 값이 없는 지표의 집계 행은 삭제
+
+        returns:
+            저장한 집계 행 수
+        """
+        bounds = {
+            (period, period_start): period_bounds(period, period_start)[1]
+            for period, period_start in periods
+        }
+        if not bounds:
+            return 0
+
+        start = min(period_start for _, period_start in bounds)
+        end = max(bounds.values())
+        days = self._load_days(user_id, start, end)
+
+        now = utc_now()
+        rows = []
+        for (period, period_start), period_end in bounds.items():
+            for metric in PERIOD_METRICS:
+                stats = summarize_period(
+                    period_start,
+                    (
+                        day
+                        for day in days.get(metric, [])
+                        if period_start <= day[0] <= period_end
+                    ),
+                )
+                if stats is None:
+                    continue
+                rows.append(
+                    {
+                        "user_id": user_id,
+                        "period": period,
+                        "period_start": period_start,
+                        "metric": metric,
+                        "period_end": period_end,
+                        "created_at": now,
+                        "updated_at": now,
+                        **stats,
+                    }
+                )
+
+        self.session.execute(
+            delete(PeriodAggregate).where(
+                PeriodAggregate.user_id == user_id,
+                tuple_(PeriodAggregate.period, PeriodAggregate.period_start).in_(
+                    list(bounds)
+                ),
+            )
+        )
+        if rows:
+            self.session.execute(insert(PeriodAggregate), rows)
+        logger.debug(
+            f"기간 집계 갱신 - User: {user_id}, Periods: {len(bounds)}, Rows: "
+            f"{len(rows)}"
+        )
+        return len(rows)
+
+    def refresh_day(self, user_id: int, target_date: date) -> int:
+        """수집한 날짜가 속한 주/월 집계 갱신"""
+        return self.refresh_periods(
+            user_id,
+            [(period, period_bounds(period, target_date)[0]) for period in PERIODS],
+        )
+
+    def refresh_range(self, user_id: int, start_date: date, end_date: date) -> int:
+        """기간에 걸친 모든 주/월 집계 갱신 (기존 데이터 백필용)"""
+        periods = set()
+        current = start_date
+        while current <= end_date:
+            for period in PERIODS:
+                periods.add((period, period_bounds(period, current)[0]))
+            current += timedelta(days=1)
+        return self.refresh_periods(user_id, sorted(periods))
+
+    def query(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        period: Optional[str] = None,
+        metrics: Optional[Sequence[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        기간과 겹치는 주간/월간 집계 조회 (PK 인덱스 범위 조회 한 번)
+        - period가 없으면 기간 길이에 맞춰 선택
+
+        returns:
+            {"period": 주기, "data": {지표: [집계, ...]}}
+        """
+        period = period or choose_period(start_date, end_date)
+        first_start = period_bounds(period, start_date)[0]
+        query = select(PeriodAggregate).where(
+            PeriodAggregate.user_id == user_id,
+            PeriodAggregate.period == period,
+            PeriodAggregate.period_start >= first_start,
+            PeriodAggregate.period_start <= end_date,
+        )
+        if metrics:
+            query = query.where(PeriodAggregate.metric.in_(metrics))
+        aggregates = self.session.execute(
+            query.order_by(PeriodAggregate.period_start, PeriodAggregate.metric)
+        ).scalars()
+
+        data: Dict[str, List[Dict[str, Any]]] = {}
+        for aggregate in aggregates:
+            data.setdefault(aggregate.metric, []).append(
+                {
+                    "period_start": aggregate.period_start,
+                    "period_end": aggregate.period_end,
+                    "days": aggregate.day_count,
+                    "mean": aggregate.mean,
+                    "min": aggregate.min_value,
+                    "max": aggregate.max_value,
+                    "p10": aggregate.p10,
+                    "p50": aggregate.p50,
+                    "p90": aggregate.p90,
+                    "trend_slope": aggregate.trend_slope,
+                    "goal_hit_rate": aggregate.goal_hit_rate,
+                }
+            )
+        return {"period": period, "data": data}
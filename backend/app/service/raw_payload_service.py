@@ -0,0 +1,132 @@
+import hashlib
+import json
+import logging
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import zstandard
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.model import RawPayload
+from core.config import RAW_PAYLOAD_ZSTD_LEVEL
+from core.db.shard import each_shard_bind
+
+logger = logging.getLogger(__name__)
+
+
+class RawPayloadArchive:
+    """
+    Garmin 원본 응답 보관소
+    - 사용자/엔드포인트/날짜별로 JSON을 zstd 압축해서 저장
+    - 내용이 바뀌지 않은 응답은 다시 쓰지 않음 (압축 전 SHA-256 비교)
+    """
+
+    def __init__(self, session: Session, level: int = RAW_PAYLOAD_ZSTD_LEVEL):
+        self.session = session
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def encode(self, raw_data: Any) -> Tuple[bytes, str, int]:
+        """원본 응답을 (압축 데이터, SHA-256, 압축 전 크기)로 변환"""
+        body = json.dumps(
+            raw_data, ensure_ascii=False, separators=(",", ":"), sort_keys=True
+        ).encode("utf-8")
+        return (
+            self._compressor.compress(body),
+            hashlib.sha256(body).hexdigest(),
+            len(body),
+        )
+
+    def decode(self, payload: bytes) -> Any:
+        """압축 데이터를 원본 응답으로 복원"""
+        return json.loads(self._decompressor.decompress(payload))
+
+    def save_many(
+        self, user_id: int, target_date: date, payloads: Dict[str, Any]
+    ) -> int:
+        """
+        하루치 원본 응답을 엔드포인트별로 upsert
+
+        returns:
+            저장 요청한 응답 수
+        """
+        now = datetime.now(timezone.utc)
+        rows = []
+        for endpoint, raw_data in payloads.items():
+            payload, payload_sha256, raw_size = self.encode(raw_data)
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "endpoint": endpoint,
+                    "date": target_date,
+                    "payload": payload,
+                    "payload_sha256": payload_sha256,
+                    "raw_size": raw_size,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+        if not rows:
+            return 0
+
+        stmt = pg_insert(RawPayload)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "endpoint", "date"],
+            set_={
+                "payload": stmt.excluded.payload,
+                "payload_sha256": stmt.excluded.payload_sha256,
+                "raw_size": stmt.excluded.raw_size,
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=RawPayload.payload_sha256 != stmt.excluded.payload_sha256,
+        )
+        self.session.execute(stmt, rows)
+        logger.debug(
+            f"원본 응답 보관 - User: {user_id}, Date: {target_date}, "
+            f"Endpoints: {', '.join(payloads)}"
+        )
+        return len(rows)
+
+    def load_range(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        endpoints: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        기간 내 보관된 원본 응답 조회
+
+        returns:
+            날짜(YYYY-MM-DD)별 {엔드포인트: 원본 응답}
+        """
+        query = select(RawPayload.date, RawPayload.endpoint, RawPayload.payload).where(
+            RawPayload.user_id == user_id,
+            RawPayload.date >= start_date,
+            RawPayload.date <= end_date,
+        )
+        if endpoints:
+            query = query.where(RawPayload.endpoint.in_(endpoints))
+
+        archived: Dict[str, Dict[str, Any]] = {}
+        for target_date, endpoint, payload in self.session.execute(query):
+            archived.setdefault(target_date.isoformat(), {})[endpoint] = self.decode(
+                payload
+            )
+        return archived
+
+    def list_user_ids(self, start_date: date, end_date: date) -> List[int]:
+        """기간 내 원본 응답이 보관된 사용자 목록 (샤딩 중이면 모든 샤드 조회)"""
+        query = (
+            select(RawPayload.user_id)
+            .where(RawPayload.date >= start_date, RawPayload.date <= end_date)
+            .distinct()
+        )
+        user_ids = set()
+        for bind_arguments in each_shard_bind(self.session):
+            user_ids.update(
+                self.session.execute(query, bind_arguments=bind_arguments).scalars()
+            )
+        return sorted(user_ids)
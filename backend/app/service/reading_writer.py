@@ -0,0 +1,280 @@
+import io
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import Table, delete, insert, inspect, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import RelationshipProperty, Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+logger = logging.getLogger(__name__)
+
+WRITE_MODE_ORM = "orm"
+WRITE_MODE_EXECUTEMANY = "executemany"
+WRITE_MODE_COPY = "copy"
+WRITE_MODE_UPSERT = "upsert"
+BULK_WRITE_MODES = (WRITE_MODE_EXECUTEMANY, WRITE_MODE_COPY, WRITE_MODE_UPSERT)
+
+# upsert 기준 키
+DAILY_CONFLICT_KEYS = ("user_id", "date")
+READING_CONFLICT_KEY = "start_time_local"
+TIMESTAMP_COLUMNS = ("created_at", "updated_at")
+
+
+def _format_copy_value(value: Any) -> str:
+    """COPY text 포맷 값 변환 (NULL은 \\N, 구분자/개행은 이스케이프)"""
+    if value is None:
+        return r"\N"
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class ReadingBulkWriter:
+    """
+    일일 요약(부모)과 시계열 측정값(자식) 대량 저장
+    - 부모 행만 ORM으로 flush 해서 id를 확보
+    - 측정값은 identity map을 거치지 않고 COPY 또는 executemany로 저장
+    - upsert 방식은 삭제 없이 (user_id, date) / (부모, start_time_local) 기준으로 갱신
+    """
+
+    def __init__(self, session: Session, mode: str = WRITE_MODE_COPY):
+        if mode not in BULK_WRITE_MODES:
+            raise ValueError(f"지원하지 않는 저장 방식: {mode}")
+        self.session = session
+        self.mode = mode
+
+    @staticmethod
+    def _get_parent_relationship(
+        reading_cls: type, parent_cls: type
+    ) -> RelationshipProperty:
+        """측정값 모델에서 부모 모델로 향하는 관계 조회"""
+        for relationship in inspect(reading_cls).relationships:
+            if relationship.mapper.class_ is parent_cls:
+                return relationship
+        raise ValueError(
+            f"{reading_cls.__name__}에서 {parent_cls.__name__}로의 관계가 없습니다."
+        )
+
+    @staticmethod
+    def _foreign_key_values(
+        relationship: RelationshipProperty, parent: Any
+    ) -> Dict[str, Any]:
+        """부모 객체에서 측정값의 외래키 값 조회"""
+        parent_mapper = inspect(type(parent))
+        return {
+            local.key: getattr(parent, parent_mapper.get_property_by_column(remote).key)
+            for local, remote in relationship.local_remote_pairs
+        }
+
+    def _build_rows(
+        self,
+        readings: Sequence[Any],
+        foreign_keys: Dict[str, Any],
+        now: datetime,
+    ) -> List[Dict[str, Any]]:
+        """측정값 객체를 컬럼 이름 기준 dict로 변환 (외래키와 타임스탬프 채움)"""
+        column_attrs = [
+            (attr.key, attr.columns[0].name)
+            for attr in inspect(type(readings[0])).column_attrs
+        ]
+
+        rows = []
+        for reading in readings:
+            row = {column: getattr(reading, key) for key, column in column_attrs}
+            row.update(foreign_keys)
+            if "created_at" in row and row["created_at"] is None:
+                row["created_at"] = now
+            if "updated_at" in row and row["updated_at"] is None:
+                row["updated_at"] = now
+            rows.append(row)
+        return rows
+
+    def _copy_rows(self, table: Table, rows: List[Dict[str, Any]]) -> None:
+        """psycopg2 COPY FROM STDIN으로 저장 (파티션 테이블은 부모 테이블로 라우팅)"""
+        columns = list(rows[0].keys())
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write(
+                "\t".join(_format_copy_value(row[column]) for column in columns)
+            )
+            buffer.write("\n")
+        buffer.seek(0)
+
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        # 샤드 세션이면 테이블의 샤드 연결 (스키마 샤드는 스키마까지 지정)
+        connection = self.session.connection(bind_arguments={"clause": table})
+        schema = connection.schema_for_object(table)
+        table_name = f'"{schema}"."{table.name}"' if schema else f'"{table.name}"'
+        dbapi_connection = connection.connection.dbapi_connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(f"COPY {table_name} ({column_list}) FROM STDIN", buffer)
+
+    def _insert_rows(self, table: Table, rows: List[Dict[str, Any]]) -> None:
+        """저장 방식에 따라 COPY 또는 executemany (insertmanyvalues 배치)로 저장"""
+        if self.mode == WRITE_MODE_COPY:
+            self._copy_rows(table, rows)
+        else:
+            self.session.execute(insert(table), rows)
+
+    @staticmethod
+    def _model_row(model: Any, now: datetime) -> Dict[str, Any]:
+        """모델 객체를 컬럼 이름 기준 dict로 변환 (값 없는 PK 제외, 타임스탬프 채움)"""
+        mapper = inspect(type(model))
+        row = {}
+        for attr in mapper.column_attrs:
+            column_obj = attr.columns[0]
+            value = getattr(model, attr.key)
+            if value is None and column_obj.primary_key:
+                continue
+            if value is None and column_obj.name in TIMESTAMP_COLUMNS:
+                value = now
+            row[column_obj.name] = value
+        return row
+
+    def _upsert_parent(self, parent: Any, now: datetime) -> int:
+        """일일 요약 행을 (user_id, date) 기준으로 upsert 하고 id 반환"""
+        table = type(parent).__table__
+        row = self._model_row(parent, now)
+        stmt = pg_insert(table).values(row)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(DAILY_CONFLICT_KEYS),
+            set_={
+                name: stmt.excluded[name]
+                for name in row
+                if name not in DAILY_CONFLICT_KEYS and name != "created_at"
+            },
+        ).returning(table.c.id)
+        return self.session.execute(stmt).scalar_one()
+
+    def _upsert_readings(
+        self, table: Table, foreign_key: str, parent_id: int, rows: List[Dict]
+    ) -> None:
+        """
+        측정값을 (부모, start_time_local) 기준으로 동기화
+        - 새 응답에 없는 행은 DELETE
+        - 나머지는 ON CONFLICT로 값이 바뀐 행만 UPDATE, 없는 행은 INSERT
+        """
+        # 한 문장에서 같은 키를 두 번 갱신할 수 없으므로 응답 내 중복은 마지막 값만 사용
+        rows = list({row[READING_CONFLICT_KEY]: row for row in rows}.values())
+        key_names = (foreign_key, READING_CONFLICT_KEY)
+        value_names = [
+            name
+            for name in rows[0]
+            if name not in key_names and name not in TIMESTAMP_COLUMNS
+        ]
+
+        self.session.execute(
+            delete(table).where(
+                table.c[foreign_key] == parent_id,
+                table.c[READING_CONFLICT_KEY].not_in(
+                    [row[READING_CONFLICT_KEY] for row in rows]
+                ),
+            )
+        )
+
+        stmt = pg_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_names),
+            set_={
+                **{name: stmt.excluded[name] for name in value_names},
+                "updated_at": stmt.excluded.updated_at,
+            },
+            where=tuple_(*[table.c[name] for name in value_names]).is_distinct_from(
+                tuple_(*[stmt.excluded[name] for name in value_names])
+            ),
+        )
+        self.session.execute(stmt, rows)
+
+    def upsert_rows(self, models: Sequence[Any], conflict_keys: Sequence[str]) -> int:
+        """독립 행(활동 등)을 conflict_keys 기준으로 upsert"""
+        models = [model for model in models if model is not None]
+        if not models:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        table = type(models[0]).__table__
+        rows = [self._model_row(model, now) for model in models]
+        stmt = pg_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(conflict_keys),
+            set_={
+                name: stmt.excluded[name]
+                for name in rows[0]
+                if name not in conflict_keys and name != "created_at"
+            },
+        )
+        self.session.execute(stmt, rows)
+        return len(rows)
+
+    def write(self, parent: Any, reading_groups: Dict[str, List[Any]]) -> int:
+        """
+        부모 행과 측정값 저장
+
+        args:
+            parent: 일일 요약 모델 (HeartRateDaily, SleepSession 등)
+            reading_groups: 매핑 결과 키(readings, movements 등)별 측정값 목록
+
+        returns:
+            저장한 측정값 수
+        """
+        now = datetime.now(timezone.utc)
+        groups = []
+        for readings in reading_groups.values():
+            readings = [reading for reading in readings if reading is not None]
+            if not readings:
+                continue
+            relationship = self._get_parent_relationship(
+                type(readings[0]), type(parent)
+            )
+            # ORM cascade로 측정값이 함께 저장되지 않도록 부모 컬렉션에서 분리
+            set_committed_value(parent, relationship.back_populates, [])
+            groups.append((readings, relationship))
+
+        if self.mode == WRITE_MODE_UPSERT:
+            parent.id = self._upsert_parent(parent, now)
+        else:
+            self.session.add(parent)
+            self.session.flush()
+
+        total = 0
+        for readings, relationship in groups:
+            table = type(readings[0]).__table__
+            rows = self._build_rows(
+                readings, self._foreign_key_values(relationship, parent), now
+            )
+            if self.mode == WRITE_MODE_UPSERT:
+                foreign_key = relationship.local_remote_pairs[0][0].name
+                self._upsert_readings(table, foreign_key, parent.id, rows)
+            else:
+                self._insert_rows(table, rows)
+            total += len(rows)
+            logger.debug(f"{table.name} {len(rows)}건 저장 ({self.mode})")
+
+        return total
+
+    def append(self, parent_cls: type, parent_id: int, readings: List[Any]) -> int:
+        """
+        이미 저장된 부모 행에 측정값 추가 (증분 수집용)
+        - 부모 행은 건드리지 않고 측정값만 INSERT/COPY
+        """
+        readings = [reading for reading in readings if reading is not None]
+        if not readings:
+            return 0
+
+        relationship = self._get_parent_relationship(type(readings[0]), parent_cls)
+        foreign_keys = {
+            local.key: parent_id for local, _ in relationship.local_remote_pairs
+        }
+        table = type(readings[0]).__table__
+        rows = self._build_rows(readings, foreign_keys, datetime.now(timezone.utc))
+        self._insert_rows(table, rows)
+        logger.debug(f"{table.name} {len(rows)}건 추가 ({self.mode})")
+        return len(rows)
@@ -0,0 +1,189 @@
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.model import MetricRollup
+from core.db.base_model import utc_now
+
+logger = logging.getLogger(__name__)
+
+# 집계 구간 (초, 세밀한 순서)
+ROLLUP_RESOLUTIONS = (900, 3600)
+
+
+@dataclass(frozen=True)
+class RollupSpec:
+    """지표별 집계 방식"""
+
+    metric: str
+    value_attr: str
+    # 이보다 작은 값은 측정 없음으로 간주 (스트레스 -1 등)
+    min_value: Optional[int] = None
+    with_sum: bool = False
+
+
+def _bucket_start(value: datetime, resolution_seconds: int) -> datetime:
+    """로컬 시각이 속한 구간의 시작 시각"""
+    day_start = datetime.combine(value.date(), time.min)
+    elapsed = int((value - day_start).total_seconds())
+    return day_start + timedelta(seconds=elapsed - elapsed % resolution_seconds)
+
+
+def build_rollups(
+    user_id: int, spec: RollupSpec, readings: Sequence[Any]
+) -> List[Dict[str, Any]]:
+    """측정값 목록을 구간별 최소/최대/평균/개수(/합계) 행으로 집계"""
+    now = utc_now()
+    rows = []
+    for resolution in ROLLUP_RESOLUTIONS:
+        buckets: Dict[datetime, List[int]] = {}
+        for reading in readings:
+            if reading is None:
+                continue
+            value = getattr(reading, spec.value_attr)
+            if value is None or (spec.min_value is not None and value < spec.min_value):
+                continue
+            bucket = _bucket_start(reading.start_time_local, resolution)
+            buckets.setdefault(bucket, []).append(value)
+
+        for bucket, values in sorted(buckets.items()):
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "metric": spec.metric,
+                    "resolution_seconds": resolution,
+                    "bucket_start_local": bucket,
+                    "min_value": min(values),
+                    "max_value": max(values),
+                    "avg_value": sum(values) / len(values),
+                    "sum_value": sum(values) if spec.with_sum else None,
+                    "sample_count": len(values),
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+    return rows
+
+
+def choose_resolution(start: datetime, end: datetime, max_points: int) -> int:
+    """
+    요청 범위를 max_points 이하로 표현할 수 있는 가장 세밀한 집계 구간
+    - 어느 구간도 맞지 않으면 가장 큰 구간 사용
+    """
+    span = (end - start).total_seconds()
+    for resolution in ROLLUP_RESOLUTIONS:
+        if span / resolution <= max_points:
+            return resolution
+    return ROLLUP_RESOLUTIONS[-1]
+
+
+class MetricRollupService:
+    """시계열 집계 테이블 갱신/조회"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def replace_day(
+        self,
+        user_id: int,
+        spec: RollupSpec,
+        target_date: date,
+        readings: Sequence[Any],
+    ) -> int:
+        """
+        하루치 집계를 다시 계산해서 교체 (수집과 같은 트랜잭션에서 호출)
+
+        returns:
+            저장한 집계 행 수
+        """
+        day_start = datetime.combine(target_date, time.min)
+        self.session.execute(
+            delete(MetricRollup).where(
+                MetricRollup.user_id == user_id,
+                MetricRollup.metric == spec.metric,
+                MetricRollup.bucket_start_local >= day_start,
+                MetricRollup.bucket_start_local < day_start + timedelta(days=1),
+            )
+        )
+
+        rows = build_rollups(user_id, spec, readings)
+        if not rows:
+            return 0
+
+        # 로컬 날짜를 벗어난 측정값의 구간은 다른 날과 겹칠 수 있어 upsert
+        stmt = pg_insert(MetricRollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                "user_id",
+                "metric",
+                "resolution_seconds",
+                "bucket_start_local",
+            ],
+            set_={
+                name: stmt.excluded[name]
+                for name in (
+                    "min_value",
+                    "max_value",
+                    "avg_value",
+                    "sum_value",
+                    "sample_count",
+                    "updated_at",
+                )
+            },
+        )
+        self.session.execute(stmt, rows)
+        logger.debug(
+            f"집계 갱신 - User: {user_id}, Metric: {spec.metric}, Date: {target_date}, "
+            f"Rows: {len(rows)}"
+        )
+        return len(rows)
+
+    def query(
+        self,
+        user_id: int,
+        metric: str,
+        start: datetime,
+        end: datetime,
+        max_points: int = 200,
+    ) -> Dict[str, Any]:
+        """
+        [start, end) 범위의 집계 조회 (max_points에 맞는 가장 세밀한 구간 사용)
+
+        returns:
+            {
+                "resolution_seconds": 구간,
+                "points": [{"time", "min", "max", "avg", "count", "sum"}],
+            }
+        """
+        resolution = choose_resolution(start, end, max_points)
+        rollups = self.session.execute(
+            select(MetricRollup)
+            .where(
+                MetricRollup.user_id == user_id,
+                MetricRollup.metric == metric,
+                MetricRollup.resolution_seconds == resolution,
+                MetricRollup.bucket_start_local >= start,
+                MetricRollup.bucket_start_local < end,
+            )
+            .order_by(MetricRollup.bucket_start_local)
+        ).scalars()
+
+        return {
+            "resolution_seconds": resolution,
+            "points": [
+                {
+                    "time": rollup.bucket_start_local,
+                    "min": rollup.min_value,
+                    "max": rollup.max_value,
+                    "avg": rollup.avg_value,
+                    "count": rollup.sample_count,
+                    "sum": rollup.sum_value,
+                }
+                for rollup in rollups
+            ],
+        }
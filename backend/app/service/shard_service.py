@@ -0,0 +1,169 @@
+import logging
+from argparse import Namespace
+from datetime import date, datetime, timezone
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.model import User
+from core.config import SHARD_DATABASE_URLS, SHARD_MODE
+from core.db import Base
+from core.db.shard import (
+    SHARD_MODE_DATABASE,
+    SHARD_MODE_SCHEMA,
+    SHARDED_TABLES,
+    ShardRoutingSession,
+    use_user_shard,
+)
+
+logger = logging.getLogger(__name__)
+
+# 스키마 샤드의 측정값 파티션을 미리 만들 기간 (현재 달 기준 이전/이후 개월 수)
+PAST_PARTITION_MONTHS = 24
+PREMAKE_PARTITION_MONTHS = 4
+
+# 샤드 사용자 행을 이미 확인한 사용자 id를 두는 세션 info 키
+ENSURED_USERS_KEY = "shard_ensured_users"
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + value.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+class ShardService:
+    """
+    사용자별 샤드 준비
+    - 샤드 테이블의 user_id 외래 키를 위해 샤드마다 users 최소 행을 복제
+    - 스키마 샤드 생성 / DB 샤드 마이그레이션
+    """
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    @property
+    def enabled(self) -> bool:
+        return isinstance(self.session, ShardRoutingSession)
+
+    def use_user(self, user_id: int) -> None:
+        """세션을 user_id의 샤드로 전환하고 샤드에 사용자 행이 있는지 확인"""
+        if use_user_shard(self.session, user_id) is None:
+            return
+        self.ensure_user(user_id)
+
+    def ensure_user(self, user_id: int) -> bool:
+        """
+        primary의 사용자 행을 사용자의 샤드에 복제 (이미 있으면 그대로 둠)
+
+        returns:
+            샤드에 사용자 행이 있으면 True
+        """
+        if not self.enabled:
+            return False
+        ensured = self.session.info.setdefault(ENSURED_USERS_KEY, set())
+        if user_id in ensured:
+            return True
+
+        user = self.session.get(User, user_id)
+        if user is None:
+            logger.warning(
+                f"샤드에 복제할 사용자가 primary에 없습니다 - User: {user_id}"
+            )
+            return False
+
+        now = datetime.now(timezone.utc)
+        stmt = (
+            pg_insert(User.__table__)
+            .values(
+                id=user.id,
+                email=user.email,
+                display_name=user.display_name,
+                full_name=user.full_name,
+                # 토큰은 primary에만 보관
+                oauth_token="",
+                oauth_token_secret="",
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(index_elements=["id"])
+        )
+        self.session.execute(
+            stmt, bind_arguments={"bind": self.session.shard_bind_for(user_id)}
+        )
+        ensured.add(user_id)
+        logger.debug(f"샤드 사용자 행 확인 - User: {user_id}")
+        return True
+
+    def provision(self) -> List[str]:
+        """
+        설정된 모든 샤드 준비
+        - database: 샤드 DB마다 alembic upgrade head
+        - schema: shard_NN 스키마와 테이블, 월 파티션 생성
+
+        returns:
+            준비한 샤드 이름 목록
+        """
+        if SHARD_MODE == SHARD_MODE_DATABASE:
+            return self._migrate_database_shards()
+        if SHARD_MODE == SHARD_MODE_SCHEMA:
+            return self._create_schema_shards()
+        return []
+
+    def _migrate_database_shards(self) -> List[str]:
+        from alembic import command
+        from alembic.config import Config
+
+        for url in SHARD_DATABASE_URLS:
+            config = Config("alembic.ini")
+            # migration/env.py가 -x url=...로 대상 DB를 바꿈
+            config.cmd_opts = Namespace(x=[f"url={url}"])
+            command.upgrade(config, "head")
+            logger.info(f"샤드 DB 마이그레이션 완료 - {url.rsplit('@', 1)[-1]}")
+        return list(SHARD_DATABASE_URLS)
+
+    def _create_schema_shards(self) -> List[str]:
+        tables = [
+            table
+            for table in Base.metadata.sorted_tables
+            if table.name in SHARDED_TABLES or table.name == User.__tablename__
+        ]
+        schemas = []
+        for bind in self.session.shard_binds:
+            schema = bind.get_execution_options()["schema_translate_map"][None]
+            self.session.execute(
+                text(f'CREATE SCHEMA IF NOT EXISTS "{schema}"'),
+                bind_arguments={"bind": bind},
+            )
+            connection = self.session.connection(bind_arguments={"bind": bind})
+            Base.metadata.create_all(connection, tables=tables, checkfirst=True)
+            for table in tables:
+                if table.dialect_options["postgresql"].get("partition_by"):
+                    self._create_partitions(bind, schema, table.name)
+            self.session.commit()
+            schemas.append(schema)
+            logger.info(f"스키마 샤드 준비 완료 - {schema}")
+        return schemas
+
+    def _create_partitions(self, bind, schema: str, table: str) -> None:
+        """월 RANGE 파티션과 기본 파티션 생성 (이름은 pg_partman 4.x 형식)"""
+        current_month = date.today().replace(day=1)
+        for offset in range(-PAST_PARTITION_MONTHS, PREMAKE_PARTITION_MONTHS + 1):
+            month_start = _add_months(current_month, offset)
+            month_end = _add_months(month_start, 1)
+            self.session.execute(
+                text(
+                    f'CREATE TABLE IF NOT EXISTS "{schema}"."{table}_p'
+                    f'{month_start:%Y_%m}" PARTITION OF "{schema}"."{table}" '
+                    f"FOR VALUES FROM ('{month_start}') TO ('{month_end}')"
+                ),
+                bind_arguments={"bind": bind},
+            )
+        self.session.execute(
+            text(
+                f'CREATE TABLE IF NOT EXISTS "{schema}"."{table}_default" '
+                f'PARTITION OF "{schema}"."{table}" DEFAULT'
+            ),
+            bind_arguments={"bind": bind},
+        )
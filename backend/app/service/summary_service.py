@@ -1,11 +1,11 @@
 import logging
 from typing import List, Optional
 
-from garth import SleepData
 from garth.data.sleep import DailySleepDTO
 
-from app.domain import Activity, DailySummary, SleepHRV
+from app.domain import Activity, DailySummary, Sleep, SleepHRV
 from app.service import BaseGarminService
+from core.util.sync_timestamp_cache import sync_timestamp_cache
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +32,7 @@ class GarminSummaryService(BaseGarminService):
         endpoint_name = "일일 전체 활동 요약"
         logger.info("%s 조회 - Date: %s", endpoint_name, date)
         try:
-            daily_summary = DailySummary.get(date, client=self.client)
+            daily_summary = self._fetch_cached("daily_summary", date, DailySummary)
             if daily_summary:
                 return self._format_response(daily_summary, message="success")
             return self._format_response(None, message="success")
@@ -54,7 +54,7 @@ class GarminSummaryService(BaseGarminService):
         endpoint_name = "수면 데이터 요약"
         logger.info("%s 조회 - Date: %s", endpoint_name, date)
         try:
-            sleep_data = SleepData.get(date, client=self.client)
+            sleep_data = self._fetch_cached("sleep_data", date, Sleep)
             if sleep_data:
                 return self._format_response(sleep_data, message="success")
             return self._format_response(None, message="success")
@@ -76,7 +76,7 @@ class GarminSummaryService(BaseGarminService):
         endpoint_name = "수면 HRV 요약"
         logger.info("%s 조회 - Date: %s", endpoint_name, date)
         try:
-            hrv_data = SleepHRV.get(date, client=self.client)
+            hrv_data = self._fetch_cached("sleep_hrv", date, SleepHRV)
             if hrv_data:
                 return self._format_response(hrv_data, message="success")
             return self._format_response(None, message="success")
@@ -128,8 +128,9 @@ class GarminSummaryService(BaseGarminService):
         logger.info("%s 조회", endpoint_name)
 
         try:
-            response = self.client.connectapi(
-                "/wellness-service/wellness/syncTimestamp"
+            response = sync_timestamp_cache.get_or_fetch(
+                self.display_name,
+                lambda: self._make_request("/wellness-service/wellness/syncTimestamp"),
             )
 
             if response:
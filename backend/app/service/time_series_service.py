@@ -1,10 +1,9 @@
 import logging
 from typing import List, Optional
 
-from garth import SleepData
 from garth.data.sleep import SleepMovement
 
-from app.domain import HeartRate, SleepHRV, StepsValue, Stress
+from app.domain import HeartRate, Sleep, SleepHRV, StepsValue, Stress
 from app.service import BaseGarminService
 
 logger = logging.getLogger(__name__)
@@ -32,7 +31,7 @@ class GarminTimeSeriesService(BaseGarminService):
         endpoint_name = "심박수 시계열 데이터"
         logger.info("%s 조회 - Date: %s", endpoint_name, date)
         try:
-            data = HeartRate.get(date, client=self.client)
+            data = self._fetch_cached("heart_rate", date, HeartRate)
             if data:
                 return self._format_response(data, message="success")
             return self._format_response(None, message="success")
@@ -54,7 +53,7 @@ class GarminTimeSeriesService(BaseGarminService):
         endpoint_name = "스트레스 시계열 데이터"
         logger.info("%s 조회 - Date: %s", endpoint_name, date)
         try:
-            data = Stress.get(date, client=self.client)
+            data = self._fetch_cached("stress", date, Stress)
             if data:
                 return self._format_response(data, message="success")
             return self._format_response(None, message="success")
@@ -76,7 +75,7 @@ class GarminTimeSeriesService(BaseGarminService):
         endpoint_name = "걸음수 시계열 데이터"
         logger.info("%s 조회 - Date: %s", endpoint_name, date)
         try:
-            data = StepsValue.get_readings(date, client=self.client)
+            data = self._fetch_cached("steps_data", date, StepsValue)
             if data:
                 return self._format_response(data, message="success")
             return self._format_response(None, message="success")
@@ -97,7 +96,7 @@ class GarminTimeSeriesService(BaseGarminService):
         endpoint_name = "수면 움직임 시계열 데이터"
         logger.info("%s 조회 - Date: %s", endpoint_name, date)
         try:
-            sleep_data = SleepData.get(date, client=self.client)
+            sleep_data = self._fetch_cached("sleep_data", date, Sleep)
             if sleep_data:
                 return self._format_response(
                     sleep_data.sleep_movement, message="success"
@@ -122,7 +121,9 @@ class GarminTimeSeriesService(BaseGarminService):
         endpoint_name = "수면 HRV 시계열 데이터"
         logger.info("%s 조회 - Date: %s", endpoint_name, date)
         try:
-            data = SleepHRV.get_readings(date, client=self.client)
+            data = self._fetch_cached(
+                "sleep_hrv", date, SleepHRV, parse=SleepHRV.readings_from_raw
+            )
             if data:
                 return self._format_response(data, message="success")
             return self._format_response(None, message="success")
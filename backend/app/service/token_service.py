@@ -8,6 +8,7 @@ from sqlalchemy.future import select
 
 from app.model.temp_token import TempClientToken
 from core.config import ALGORITHM, SECRET_KEY
+from core.util.oauth2_token_store import oauth2_token_store
 
 
 class TokenService:
@@ -35,11 +36,11 @@ class TokenService:
 
     @staticmethod
     def create_garmin_client(oauth1_token: dict) -> GarthClient:
-        """Garmin 클라이언트 생성"""
+        """Garmin 클라이언트 생성 (캐시된 OAuth2 토큰이 만료 전이면 재사용)"""
         client = GarthClient()
         oauth1 = OAuth1Token(**oauth1_token)
         client.configure(oauth1_token=oauth1)
-        client.refresh_oauth2()
+        oauth2_token_store.configure_client(client)
         return client
 
 
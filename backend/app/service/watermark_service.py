@@ -0,0 +1,69 @@
+import logging
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.model import CollectionWatermark
+
+logger = logging.getLogger(__name__)
+
+
+def as_utc(value: datetime) -> datetime:
+    """naive datetime은 UTC로 간주해서 timezone-aware로 변환"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class CollectionWatermarkService:
+    """증분 수집용 워터마크 (사용자/지표/날짜별 마지막 저장 시각) 관리"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def get(self, user_id: int, metric: str, target_date: date) -> Optional[datetime]:
+        """마지막으로 저장한 측정값의 start_time_gmt 조회"""
+        watermark = self.session.execute(
+            select(CollectionWatermark.last_start_time_gmt).where(
+                CollectionWatermark.user_id == user_id,
+                CollectionWatermark.metric == metric,
+                CollectionWatermark.date == target_date,
+            )
+        ).scalar_one_or_none()
+        return as_utc(watermark) if watermark else None
+
+    def advance(
+        self,
+        user_id: int,
+        metric: str,
+        target_date: date,
+        last_start_time_gmt: datetime,
+    ) -> None:
+        """워터마크 갱신 (기존 값보다 뒤로 가지 않음)"""
+        now = datetime.now(timezone.utc)
+        stmt = pg_insert(CollectionWatermark).values(
+            user_id=user_id,
+            metric=metric,
+            date=target_date,
+            last_start_time_gmt=as_utc(last_start_time_gmt),
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "metric", "date"],
+            set_={
+                "last_start_time_gmt": func.greatest(
+                    CollectionWatermark.last_start_time_gmt,
+                    stmt.excluded.last_start_time_gmt,
+                ),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        self.session.execute(stmt)
+        logger.debug(
+            f"워터마크 갱신 - User: {user_id}, Metric: {metric}, Date: {target_date}, "
+            f"Last: {last_start_time_gmt}"
+        )
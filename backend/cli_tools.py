@@ -100,10 +100,170 @@ if __name__ == "__main__":
 
             except Exception as e:
                 print(f"파티션 관리 작업 실행 중 오류 발생: {str(e)}")
+        elif sys.argv[1] == "replay":
+            # 보관된 원본 응답 재처리
+            if len(sys.argv) < 4:
+                print(
+                    "사용법: python cli_tools.py replay <start_date> <end_date> "
+                    "[user_id]"
+                )
+                print("예시: python cli_tools.py replay 2024-01-01 2024-12-31 123")
+                sys.exit(1)
+
+            from core.db.celery_session import SessionFactory
+            from task.util import replay_garmin_raw_payloads
+
+            session = SessionFactory()
+            try:
+                user_id = int(sys.argv[4]) if len(sys.argv) > 4 else None
+                summary = replay_garmin_raw_payloads(
+                    session, sys.argv[2], sys.argv[3], user_id=user_id
+                )
+                for target_user_id, result in summary.items():
+                    print(
+                        f"사용자 {target_user_id}: 성공 {result['succeeded']}일, "
+                        f"실패 {len(result['failed'])}일"
+                    )
+                    for date_str, errors in result["failed"].items():
+                        print(f"  {date_str}: {'; '.join(errors)}")
+            except Exception as e:
+                print(f"원본 응답 재처리 중 오류 발생: {str(e)}")
+            finally:
+                session.close()
+        elif sys.argv[1] == "archive":
+            # 보관 기간이 지난 측정값 파티션을 Parquet 파일로 이동
+            from app.service.partition_archive_service import PartitionArchiver
+            from core.db.celery_session import SessionFactory
+
+            session = SessionFactory()
+            try:
+                archiver = (
+                    PartitionArchiver(session, retention_months=int(sys.argv[2]))
+                    if len(sys.argv) > 2
+                    else PartitionArchiver(session)
+                )
+                result = archiver.run()
+                print(f"보관 완료: {len(result['archived'])}개 파티션")
+                for partition_name in result["archived"]:
+                    print(f"  {partition_name}")
+                for partition_name, error in result["failed"].items():
+                    print(f"  실패 {partition_name}: {error}")
+            except Exception as e:
+                session.rollback()
+                print(f"파티션 보관 중 오류 발생: {str(e)}")
+            finally:
+                session.close()
+        elif sys.argv[1] == "aggregate":
+            # 주간/월간 집계 재계산 (기존 데이터 백필)
+            if len(sys.argv) < 5:
+                print(
+                    "사용법: python cli_tools.py aggregate <start_date> <end_date> "
+                    "<user_id>"
+                )
+                print("예시: python cli_tools.py aggregate 2024-01-01 2024-12-31 123")
+                sys.exit(1)
+
+            from datetime import date
+
+            from app.service.period_aggregate_service import PeriodAggregateService
+            from core.db.celery_session import SessionFactory
+            from core.db.shard import use_user_shard
+
+            session = SessionFactory()
+            try:
+                use_user_shard(session, int(sys.argv[4]))
+                saved = PeriodAggregateService(session).refresh_range(
+                    int(sys.argv[4]),
+                    date.fromisoformat(sys.argv[2]),
+                    date.fromisoformat(sys.argv[3]),
+                )
+                session.commit()
+                print(f"기간 집계 {saved}개를 저장했습니다.")
+            except Exception as e:
+                session.rollback()
+                print(f"기간 집계 재계산 중 오류 발생: {str(e)}")
+            finally:
+                session.close()
+        elif sys.argv[1] == "export":
+            # 사용자 전체 데이터 내보내기 (중단되면 같은 명령으로 이어서)
+            if len(sys.argv) < 4:
+                print(
+                    "사용법: python cli_tools.py export <user_id> <output> "
+                    "[ndjson|parquet]"
+                )
+                print("예시: python cli_tools.py export 123 export_123.ndjson")
+                print("예시: python cli_tools.py export 123 export_123 parquet")
+                sys.exit(1)
+
+            from app.service.export_service import (
+                EXPORT_FORMAT_PARQUET,
+                EXPORT_FORMATS,
+                UserExportService,
+            )
+            from core.db.celery_session import create_read_session
+
+            export_format = sys.argv[4] if len(sys.argv) > 4 else EXPORT_FORMATS[0]
+            if export_format not in EXPORT_FORMATS:
+                print(
+                    f"지원하지 않는 형식: {export_format} ({', '.join(EXPORT_FORMATS)})"
+                )
+                sys.exit(1)
+
+            session = create_read_session()
+            try:
+                service = UserExportService(session, int(sys.argv[2]))
+                if export_format == EXPORT_FORMAT_PARQUET:
+                    pages = service.write_parquet_directory(sys.argv[3])
+                    print(f"Parquet 페이지 {pages}개를 저장했습니다: {sys.argv[3]}")
+                else:
+                    rows = service.write_ndjson_file(sys.argv[3])
+                    print(f"{rows}행을 저장했습니다: {sys.argv[3]}")
+            except Exception as e:
+                print(
+                    "데이터 내보내기 중 오류 발생 (다시 실행하면 이어서 진행): "
+                    f"{str(e)}"
+                )
+            finally:
+                session.rollback()
+                session.close()
+        elif sys.argv[1] == "shard-init":
+            # 샤드 준비 (SHARD_MODE=schema: 스키마 생성, database: 샤드 DB 마이그레이션)
+            from app.service.shard_service import ShardService
+            from core.db.celery_session import SessionFactory
+
+            session = SessionFactory()
+            try:
+                shards = ShardService(session).provision()
+                if not shards:
+                    print("SHARD_MODE가 설정되지 않아 준비할 샤드가 없습니다.")
+                for shard in shards:
+                    print(f"  {shard.rsplit('@', 1)[-1]}")
+            except Exception as e:
+                session.rollback()
+                print(f"샤드 준비 중 오류 발생: {str(e)}")
+            finally:
+                session.close()
     else:
-        print("사용법: python run_celery.py [agent|graph-viz|partition]")
+        print(
+            "사용법: python run_celery.py "
+            "[agent|graph-viz|partition|replay|archive|aggregate|export|shard-init]"
+        )
         print("  agent <user_id> <query>: AI 에이전트 실행")
         print(
             "  graph-viz [output_path]: 에이전트 그래프 시각화 (기본: agent_graph.png)"
         )
         print("  partition: 파티션 관리 작업 수동 실행")
+        print(
+            "  replay <start_date> <end_date> [user_id]: 보관된 원본 응답 재처리 (API "
+            "호출 없음)"
+        )
+        print(
+            "  archive [retention_months]: 보관 기간이 지난 측정값 파티션을 Parquet "
+            "파일로 이동"
+        )
+        print("  aggregate <start_date> <end_date> <user_id>: 주간/월간 집계 재계산")
+        print(
+            "  export <user_id> <output> [ndjson|parquet]: 사용자 전체 데이터 내보내기 "
+            "(재개 가능)"
+        )
+        print("  shard-init: 사용자별 샤드 준비 (SHARD_MODE 설정 필요)")
@@ -7,8 +7,21 @@ from celery import Celery, signals
 
 from core.config import (
     BROKER_URL,
+    CELERY_ANALYSIS_QUEUE,
+    CELERY_COLLECT_QUEUE,
+    CELERY_DEFAULT_QUEUE,
+    CELERY_MAX_MEMORY_PER_CHILD,
+    CELERY_MAX_TASKS_PER_CHILD,
+    CELERY_WORKER_POOL,
     RESULT_BACKEND,
 )
+from core.db.celery_session import (
+    engine,
+    replica_engine,
+    reset_engines_after_fork,
+    shard_engines,
+)
+from core.util.worker_health import WorkerLeakDetector
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +37,7 @@ celery_app = Celery(
     "garmin_fit_bot",
     broker=BROKER_URL,
     backend=RESULT_BACKEND,
-    include=["task.agent_task", "task.garmin_collector"],
+    include=["task.agent_task", "task.garmin_collector", "task.partition_manager"],
     result_persistent=True,
 )
 
@@ -35,11 +48,31 @@ celery_app.conf.update(
     result_serializer="json",
     timezone="Asia/Seoul",
     enable_utc=False,
-    worker_max_tasks_per_child=1,
+    # 프로세스를 계속 재사용하고 메모리 기준으로만 교체
+    worker_max_tasks_per_child=CELERY_MAX_TASKS_PER_CHILD,
+    worker_max_memory_per_child=CELERY_MAX_MEMORY_PER_CHILD,
     broker_connection_retry_on_startup=True,
     broker_connection_timeout=30,
     broker_pool_limit=10,
     task_track_started=True,
+    # 수집과 분석이 서로의 워커를 점유하지 않도록 큐 분리 (큐마다 별도 워커)
+    # - collect: 스레드 풀, 높은 동시 실행 수 (make celery-collect)
+    # - analysis + 기본 큐: prefork, prefetch 1 (make celery-analysis)
+    task_default_queue=CELERY_DEFAULT_QUEUE,
+    task_routes={
+        "collect-fit-data": {"queue": CELERY_COLLECT_QUEUE},
+        "collect-fit-data-range": {"queue": CELERY_COLLECT_QUEUE},
+        "collect-fit-data-part": {"queue": CELERY_COLLECT_QUEUE},
+        "collect-fit-data-merge": {"queue": CELERY_COLLECT_QUEUE},
+        "analysis-health": {"queue": CELERY_ANALYSIS_QUEUE},
+    },
+    # 예약 메시지는 워커 prefetch 배수로 제한 (기본은 긴 분석 태스크 기준 1)
+    worker_prefetch_multiplier=1,
+    # -P를 주지 않으면 CELERY_WORKER_POOL (DB 연결 풀 크기와 같은 값을 쓰도록)
+    worker_pool=CELERY_WORKER_POOL,
+    # 태스크 지표는 워커 이벤트로 집계 (python -m core.celery_exporter)
+    worker_send_task_events=True,
+    task_send_sent_event=True,
 )
 
 
@@ -55,22 +88,28 @@ def setup_logger(logger, *args, **kwargs):
     logger.setLevel(logging.INFO)
 
 
+leak_detector = WorkerLeakDetector([engine, replica_engine, *shard_engines])
+
+
+@signals.worker_process_init.connect
+def init_worker_process(*args, **kwargs):
+    """fork된 워커 프로세스마다 DB 풀과 누수 감지 상태 초기화"""
+    global leak_detector
+    reset_engines_after_fork()
+    leak_detector = WorkerLeakDetector([engine, replica_engine, *shard_engines])
+
+
 @signals.task_prerun.connect
-def on_task_start(*args, **kwargs):
-    try:
-        sync_redis_client.incr("celery:active_tasks")
-        logger.info("Task started, active tasks count increased")
-    except Exception as e:
-        logger.error(f"Error increasing active tasks count: {e}")
+def check_leaks_before_task(*args, **kwargs):
+    leak_detector.before_task()
 
 
 @signals.task_postrun.connect
-def on_task_end(*args, **kwargs):
+def check_leaks_after_task(sender=None, *args, **kwargs):
     try:
-        sync_redis_client.decr("celery:active_tasks")
-        logger.info("Task ended, active tasks count decreased")
+        leak_detector.after_task(getattr(sender, "name", str(sender)))
     except Exception as e:
-        logger.error(f"Error decreasing active tasks count: {e}")
+        logger.error(f"Error checking worker leaks: {e}")
 
 
 def set_result_ttl(task_id: str, ttl_seconds: int):
@@ -97,7 +136,6 @@ def set_result_ttl(task_id: str, ttl_seconds: int):
 def apply_task_result_expires(sender=None, task_id=None, **kwargs):
     """
     Task 성공/실패 후 결과 키의 TTL을 task의 expires 속성에 따라 설정합니다.
-    기존 on_task_end 핸들러와 별개로 실행됩니다.
     """
     if sender is not None and hasattr(sender, "expires"):
         expires_value = sender.expires
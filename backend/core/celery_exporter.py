@@ -0,0 +1,187 @@
+"""
+Celery 워커 Prometheus exporter (워커 이벤트 기반)
+
+실행 (backend 디렉토리에서):
+    python -m core.celery_exporter
+
+- 워커가 보내는 태스크/하트비트 이벤트를 받아 /metrics로 노출
+- 워커 프로세스 안에서 세지 않으므로 prefork 자식 프로세스나 Redis 왕복 없이 집계
+- 실행 중 태스크 수는 하트비트의 active 값이라 워커가 죽으면 하트비트 만료와 함께 사라짐
+- Garmin API 요청 한도 지표는 워커가 Redis에 누적한 값을 scrape할 때 읽어 노출
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from celery import Celery
+from celery.events.state import State
+from prometheus_client import (
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    start_http_server,
+)
+
+from core.config import CELERY_EXPORTER_PORT
+from core.util.garmin_rate_limit import RateLimitMetricsCollector, rate_limit_metrics
+
+logger = logging.getLogger(__name__)
+
+# 워커 지표 갱신 주기 (하트비트가 끊긴 워커를 제거, 단위: 초)
+REFRESH_INTERVAL = 5.0
+
+RUNTIME_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800)
+WAIT_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 300, 900)
+
+
+def _parse_eta(eta: Optional[str]) -> Optional[float]:
+    """이벤트의 eta(ISO 문자열)를 epoch 초로 변환"""
+    if not eta:
+        return None
+    try:
+        return datetime.fromisoformat(eta).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class CeleryEventsExporter:
+    """워커 이벤트를 Prometheus 지표로 변환"""
+
+    def __init__(self, app: Celery, registry: Optional[CollectorRegistry] = None):
+        self.app = app
+        self.state = State(max_tasks_in_memory=5000, max_workers_in_memory=100)
+        registry = registry or CollectorRegistry()
+        self.registry = registry
+        self.tasks_total = Counter(
+            "celery_tasks_total",
+            "완료된 태스크 수 (state: succeeded, failed, retried, rejected, revoked)",
+            ["task", "state"],
+            registry=registry,
+        )
+        self.task_runtime = Histogram(
+            "celery_task_runtime_seconds",
+            "태스크 실행 시간 (초)",
+            ["task", "state"],
+            buckets=RUNTIME_BUCKETS,
+            registry=registry,
+        )
+        self.task_queue_wait = Histogram(
+            "celery_task_queue_wait_seconds",
+            "발행(또는 eta) 시각부터 실행 시작까지 대기 시간 (초)",
+            ["task", "queue"],
+            buckets=WAIT_BUCKETS,
+            registry=registry,
+        )
+        self.worker_up = Gauge(
+            "celery_worker_up",
+            "하트비트가 살아 있는 워커 (1)",
+            ["worker"],
+            registry=registry,
+        )
+        self.worker_active = Gauge(
+            "celery_worker_tasks_active",
+            "워커 하트비트 기준 실행 중 태스크 수",
+            ["worker"],
+            registry=registry,
+        )
+        self.worker_processed = Gauge(
+            "celery_worker_tasks_processed",
+            "워커 시작 후 처리한 태스크 수",
+            ["worker"],
+            registry=registry,
+        )
+        self._lock = threading.Lock()
+
+    def on_event(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            self.state.event(event)
+            event_type = event.get("type", "")
+            if event_type.startswith("task-"):
+                self._observe_task(event_type, event)
+
+    def _observe_task(self, event_type: str, event: Dict[str, Any]) -> None:
+        task = self.state.tasks.get(event.get("uuid"))
+        if task is None:
+            return
+        name = task.name or "unknown"
+        if event_type == "task-started":
+            # 발행 이벤트가 있으면 발행 시각 (워커 prefetch 대기 포함), 없으면 수신 시각
+            queued_at = task.sent or task.received
+            eta = _parse_eta(task.eta)
+            if eta is not None and queued_at is not None:
+                queued_at = max(queued_at, eta)
+            if queued_at is not None:
+                self.task_queue_wait.labels(
+                    name, task.routing_key or "unknown"
+                ).observe(max(0.0, event["timestamp"] - queued_at))
+        elif event_type == "task-succeeded":
+            self.tasks_total.labels(name, "succeeded").inc()
+            if event.get("runtime") is not None:
+                self.task_runtime.labels(name, "succeeded").observe(event["runtime"])
+        elif event_type in ("task-failed", "task-retried"):
+            state = event_type[len("task-") :]
+            self.tasks_total.labels(name, state).inc()
+            if task.started:
+                self.task_runtime.labels(name, state).observe(
+                    max(0.0, event["timestamp"] - task.started)
+                )
+        elif event_type in ("task-rejected", "task-revoked"):
+            self.tasks_total.labels(name, event_type[len("task-") :]).inc()
+
+    def refresh_workers(self) -> None:
+        """하트비트 만료를 반영해 워커 지표 갱신 (죽은 워커는 라벨 제거)"""
+        with self._lock:
+            workers = list(self.state.workers.items())
+        for hostname, worker in workers:
+            if worker.alive:
+                self.worker_up.labels(hostname).set(1)
+                self.worker_active.labels(hostname).set(worker.active or 0)
+                self.worker_processed.labels(hostname).set(worker.processed or 0)
+                continue
+            for gauge in (self.worker_up, self.worker_active, self.worker_processed):
+                try:
+                    gauge.remove(hostname)
+                except KeyError:
+                    pass
+
+    def _refresh_loop(self) -> None:
+        while True:
+            time.sleep(REFRESH_INTERVAL)
+            try:
+                self.refresh_workers()
+            except Exception as e:
+                logger.error(f"워커 지표 갱신 실패: {e}")
+
+    def run(self) -> None:
+        """브로커 이벤트를 계속 수신 (연결이 끊기면 재연결)"""
+        threading.Thread(target=self._refresh_loop, daemon=True).start()
+        while True:
+            try:
+                with self.app.connection() as connection:
+                    receiver = self.app.events.Receiver(
+                        connection, handlers={"*": self.on_event}
+                    )
+                    logger.info("Celery 이벤트 수신 시작")
+                    receiver.capture(limit=None, timeout=None, wakeup=True)
+            except (ConnectionError, OSError) as e:
+                logger.error(f"Celery 이벤트 수신 연결 오류, 재연결: {e}")
+                time.sleep(REFRESH_INTERVAL)
+
+
+def main() -> None:
+    from core.celery_app import celery_app
+
+    logging.basicConfig(level=logging.INFO)
+    exporter = CeleryEventsExporter(celery_app)
+    exporter.registry.register(RateLimitMetricsCollector(rate_limit_metrics))
+    start_http_server(CELERY_EXPORTER_PORT, registry=exporter.registry)
+    logger.info(f"Celery exporter 시작 - :{CELERY_EXPORTER_PORT}/metrics")
+    exporter.run()
+
+
+if __name__ == "__main__":
+    main()
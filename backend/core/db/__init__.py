@@ -7,12 +7,28 @@
 - AsyncSession: 비동기 세션
 - engine: 데이터베이스 엔진
 - get_session: 세션 의존성 제공자
+- get_read_session / create_read_session: 조회 전용 세션 (복제본, 지연 시 primary)
+- use_user_shard: 세션의 시계열/일일 테이블 작업을 사용자 샤드로 라우팅
 - init_db: 데이터베이스 초기화
 """
 
 from .base_model import Base, TimeStampMixin
-from .celery_session import DatabaseTask, SessionFactory, with_db_context
-from .session import AsyncSession, engine, get_session, init_db, transaction
+from .celery_session import (
+    DatabaseTask,
+    SessionFactory,
+    create_read_session,
+    with_db_context,
+)
+from .session import (
+    AsyncSession,
+    engine,
+    get_read_session,
+    get_session,
+    init_db,
+    replica_engine,
+    transaction,
+)
+from .shard import use_user_shard
 
 __all__ = [
     "Base",
@@ -20,9 +36,13 @@ __all__ = [
     "AsyncSession",
     "engine",
     "get_session",
+    "get_read_session",
+    "replica_engine",
     "init_db",
     "transaction",
     "DatabaseTask",
     "with_db_context",
     "SessionFactory",
+    "create_read_session",
+    "use_user_shard",
 ]
@@ -9,13 +9,16 @@ class Base(AsyncAttrs, DeclarativeBase):
     pass
 
 
+def utc_now() -> datetime:
+    """현재 UTC 시각 (행마다 호출되도록 컬럼 기본값에는 함수 자체를 전달)"""
+    return datetime.now(timezone.utc)
+
+
 class TimeStampMixin:
-    created_at = Column(
-        DateTime(timezone=True), default=datetime.now(timezone.utc), nullable=False
-    )
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at = Column(
         DateTime(timezone=True),
-        default=datetime.now(timezone.utc),
-        onupdate=datetime.now(timezone.utc),
+        default=utc_now,
+        onupdate=utc_now,
         nullable=False,
     )
@@ -1,13 +1,103 @@
+import logging
+import threading
 from functools import wraps
+from typing import Optional
 
 from celery import Task
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from core.config import DEBUG, SYNC_DATABASE_URL
+from core.config import (
+    CELERY_COLLECT_CONCURRENCY,
+    CELERY_WORKER_POOL,
+    DEBUG,
+    POOL_RECYCLE,
+    POOL_TIMEOUT,
+    REPLICA_LAG_CHECK_INTERVAL,
+    REPLICA_MAX_LAG_SECONDS,
+    SHARD_DATABASE_URLS,
+    SYNC_DATABASE_URL,
+    SYNC_REPLICA_DATABASE_URL,
+    WORKER_MAX_OVERFLOW,
+    WORKER_POOL_SIZE,
+)
+from core.db.replica import REPLICA_LAG_QUERY, ReplicaLagGuard
+from core.db.shard import build_shard_binds, shard_session_class
 
-engine = create_engine(SYNC_DATABASE_URL, echo=DEBUG)
-SessionFactory = sessionmaker(autoflush=False, autocommit=False, bind=engine)
+logger = logging.getLogger(__name__)
+
+# 워커 프로세스가 계속 재사용하는 연결 풀 (끊긴 연결은 pre-ping으로 교체)
+# prefork 자식 프로세스는 태스크를 하나씩 실행하므로 WORKER_POOL_SIZE만 보관
+ENGINE_OPTIONS = dict(
+    echo=DEBUG,
+    pool_size=WORKER_POOL_SIZE,
+    max_overflow=WORKER_MAX_OVERFLOW,
+    pool_timeout=POOL_TIMEOUT,
+    pool_recycle=POOL_RECYCLE,
+    pool_pre_ping=True,
+)
+# 스레드 풀 수집 워커는 한 프로세스에서 동시 실행 수만큼 태스크가 겹치므로
+# 수집 태스크가 쓰는 primary/샤드 연결 풀만 동시 실행 수까지 보관 (복제본은 그대로)
+COLLECT_ENGINE_OPTIONS = (
+    dict(ENGINE_OPTIONS, pool_size=CELERY_COLLECT_CONCURRENCY)
+    if CELERY_WORKER_POOL == "threads"
+    else ENGINE_OPTIONS
+)
+
+engine = create_engine(SYNC_DATABASE_URL, **COLLECT_ENGINE_OPTIONS)
+# 사용자별 샤드 (SHARD_MODE가 없으면 빈 목록, 세션도 일반 Session)
+shard_engines = build_shard_binds(
+    engine,
+    SHARD_DATABASE_URLS,
+    lambda url: create_engine(url, **COLLECT_ENGINE_OPTIONS),
+)
+session_class = shard_session_class(shard_engines) or Session
+SessionFactory = sessionmaker(
+    autoflush=False, autocommit=False, bind=engine, class_=session_class
+)
+
+# 읽기 전용 복제본 (에이전트 도구 등 조회 전용 작업)
+replica_engine = (
+    create_engine(SYNC_REPLICA_DATABASE_URL, **ENGINE_OPTIONS)
+    if SYNC_REPLICA_DATABASE_URL
+    else None
+)
+ReplicaSessionFactory = sessionmaker(
+    autoflush=False, autocommit=False, bind=replica_engine, class_=session_class
+)
+replica_guard = ReplicaLagGuard(REPLICA_MAX_LAG_SECONDS, REPLICA_LAG_CHECK_INTERVAL)
+
+
+def _replica_available() -> bool:
+    """복제본 설정 여부와 복제 지연 확인"""
+    if replica_engine is None:
+        return False
+    if not replica_guard.needs_check():
+        return replica_guard.healthy
+    try:
+        with replica_engine.connect() as conn:
+            lag = float(conn.execute(REPLICA_LAG_QUERY).scalar())
+    except Exception as e:
+        logger.warning(f"복제본 지연 확인 실패: {e}")
+        lag = None
+    return replica_guard.record(lag)
+
+
+def reset_engines_after_fork() -> None:
+    """
+    fork된 워커 프로세스에서 부모에게 물려받은 풀 연결을 버리고 새 풀 사용
+    (부모의 연결은 닫지 않음)
+    """
+    for target in (engine, replica_engine, *shard_engines):
+        if target is not None:
+            target.dispose(close=False)
+
+
+def create_read_session() -> Session:
+    """조회 전용 세션 (복제본을 쓸 수 없으면 primary)"""
+    if _replica_available():
+        return ReplicaSessionFactory()
+    return SessionFactory()
 
 
 def with_db_context(func):
@@ -32,11 +122,22 @@ def with_db_context(func):
 
 
 class DatabaseTask(Task):
-    """데이터베이스 세션을 관리하는 Celery Task"""
+    """
+    데이터베이스 세션을 관리하는 Celery Task
+    (태스크 객체는 프로세스에 하나이므로 스레드 풀에서도 겹치지 않게 스레드별 세션 사용)
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._session = None
+        self._local = threading.local()
+
+    @property
+    def _session(self) -> Optional[Session]:
+        return getattr(self._local, "session", None)
+
+    @_session.setter
+    def _session(self, session: Optional[Session]) -> None:
+        self._local.session = session
 
     @property
     def session(self) -> Session:
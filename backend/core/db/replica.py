@@ -0,0 +1,63 @@
+import logging
+import time
+from typing import Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# 복제본의 재생 지연 (초)
+# - 받은 WAL을 모두 재생했으면 0 (쓰기가 없어 재생 시각이 오래된 경우 포함)
+# - 복제본이 아닌 서버(pg_last_xact_replay_timestamp가 NULL)도 0
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+
+class ReplicaLagGuard:
+    """
+    복제본 사용 가능 여부 판단
+    - 마지막 확인 후 check_interval 동안은 결과를 재사용
+    - 지연이 max_lag_seconds를 넘거나 확인/조회에 실패하면 다음 확인까지 primary 사용
+    """
+
+    def __init__(self, max_lag_seconds: float, check_interval: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self.lag: Optional[float] = None
+        self.healthy = False
+        self._checked_at: Optional[float] = None
+
+    def needs_check(self) -> bool:
+        """지연을 다시 확인해야 하는지"""
+        return (
+            self._checked_at is None
+            or time.monotonic() - self._checked_at >= self.check_interval
+        )
+
+    def record(self, lag: Optional[float]) -> bool:
+        """확인한 지연 기록 (None이면 확인 실패) 후 사용 가능 여부 반환"""
+        self._checked_at = time.monotonic()
+        self.lag = lag
+        healthy = lag is not None and lag <= self.max_lag_seconds
+        if healthy != self.healthy:
+            if healthy:
+                logger.info(f"복제본 읽기 사용 - 지연: {lag:.1f}초")
+            else:
+                logger.warning(
+                    f"복제본 읽기 중단, primary 사용 - 지연: {lag}초 "
+                    f"(허용: {self.max_lag_seconds}초)"
+                )
+        self.healthy = healthy
+        return healthy
+
+    def mark_failed(self) -> None:
+        """복제본 조회 실패 시 다음 확인까지 primary 사용"""
+        self.record(None)
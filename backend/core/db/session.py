@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from core.config import (
     DATABASE_URL,
@@ -11,8 +12,15 @@ from core.config import (
     POOL_RECYCLE,
     POOL_SIZE,
     POOL_TIMEOUT,
+    REPLICA_DATABASE_URL,
+    REPLICA_LAG_CHECK_INTERVAL,
+    REPLICA_MAX_LAG_SECONDS,
+    SHARD_ASYNC_DATABASE_URLS,
+    SHARD_DATABASE_URLS,
 )
 from core.db import Base
+from core.db.replica import REPLICA_LAG_QUERY, ReplicaLagGuard
+from core.db.shard import build_shard_binds, shard_session_class
 
 logger = logging.getLogger(__name__)
 
@@ -27,15 +35,66 @@ engine = create_async_engine(
     pool_pre_ping=True,
 )
 
+# 사용자별 샤드 (SHARD_MODE가 없으면 빈 목록)
+shard_engines = build_shard_binds(
+    engine,
+    SHARD_ASYNC_DATABASE_URLS,
+    lambda url: create_async_engine(
+        url,
+        echo=DEBUG,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_recycle=POOL_RECYCLE,
+        pool_pre_ping=True,
+    ),
+)
+# 동기/비동기 샤드 수가 다르면 같은 사용자가 다른 샤드로 가므로 시작 시 차단
+if SHARD_ASYNC_DATABASE_URLS and len(SHARD_ASYNC_DATABASE_URLS) != len(
+    SHARD_DATABASE_URLS
+):
+    raise ValueError(
+        "SHARD_DATABASE_URLS와 SHARD_ASYNC_DATABASE_URLS의 샤드 수가 다릅니다"
+    )
+# 샤드 테이블은 AsyncSession 내부 동기 세션의 get_bind에서 사용자 샤드로 라우팅
+sync_session_class = (
+    shard_session_class([shard.sync_engine for shard in shard_engines]) or Session
+)
+
 # 세션 팩토리
 async_session_factory = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=sync_session_class,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
 )
 
+# 읽기 전용 복제본 (프로필/카카오 사용자 조회 등)
+replica_engine = (
+    create_async_engine(
+        REPLICA_DATABASE_URL,
+        echo=DEBUG,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
+        pool_recycle=POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+    if REPLICA_DATABASE_URL
+    else None
+)
+replica_session_factory = async_sessionmaker(
+    replica_engine,
+    class_=AsyncSession,
+    sync_session_class=sync_session_class,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+replica_guard = ReplicaLagGuard(REPLICA_MAX_LAG_SECONDS, REPLICA_LAG_CHECK_INTERVAL)
+
 
 # FastAPI 의존성 주입용
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -47,6 +106,34 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def _replica_available() -> bool:
+    """복제본 설정 여부와 복제 지연 확인"""
+    if replica_engine is None:
+        return False
+    if not replica_guard.needs_check():
+        return replica_guard.healthy
+    try:
+        async with replica_engine.connect() as conn:
+            lag = float((await conn.execute(REPLICA_LAG_QUERY)).scalar())
+    except Exception as e:
+        logger.warning(f"복제본 지연 확인 실패: {e}")
+        lag = None
+    return replica_guard.record(lag)
+
+
+# FastAPI 의존성 주입용 (조회 전용)
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """조회 전용 세션 제공 (복제본을 쓸 수 없으면 primary)"""
+    factory = (
+        replica_session_factory if await _replica_available() else async_session_factory
+    )
+    async with factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 # 트랜잭션 관리를 위한 컨텍스트 매니저
 @asynccontextmanager
 async def transaction(session: AsyncSession):
@@ -0,0 +1,153 @@
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.util import find_tables
+
+from core.config import SHARD_MODE, SHARD_SCHEMA_COUNT
+
+logger = logging.getLogger(__name__)
+
+SHARD_MODE_DATABASE = "database"
+SHARD_MODE_SCHEMA = "schema"
+SHARD_SCHEMA_PREFIX = "shard_"
+
+# 사용자별로 샤드에 저장하는 테이블 (users 등 나머지는 primary)
+SHARDED_TABLES = frozenset(
+    {
+        "heart_rate_daily",
+        "heart_rate_readings",
+        "stress_daily",
+        "stress_readings",
+        "steps_daily",
+        "steps_intraday",
+        "sleep_sessions",
+        "sleep_movement",
+        "sleep_hrv_readings",
+        "activities",
+        "collection_watermarks",
+        "raw_payloads",
+        "metric_rollups",
+        "period_aggregates",
+    }
+)
+
+# 세션 info에 현재 사용자 id를 두는 키
+SHARD_USER_KEY = "shard_user_id"
+
+
+def jump_consistent_hash(key: int, num_buckets: int) -> int:
+    """
+    Jump consistent hash (Lamping & Veach)
+    - 샤드 수를 N -> N+1로 늘리면 약 1/(N+1)의 사용자만 새 샤드로 이동
+    """
+    key &= 0xFFFFFFFFFFFFFFFF
+    bucket, jump = -1, 0
+    while jump < num_buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        jump = int((bucket + 1) * (float(1 << 31) / float((key >> 33) + 1)))
+    return bucket
+
+
+def shard_schema_name(index: int) -> str:
+    return f"{SHARD_SCHEMA_PREFIX}{index:02d}"
+
+
+def build_shard_binds(
+    primary: Any, urls: Sequence[str], create_engine: Callable[[str], Any]
+) -> List[Any]:
+    """
+    샤드별 엔진 목록 (샤딩을 쓰지 않으면 빈 목록)
+    - database: URL마다 엔진 생성
+    - schema: primary 풀을 공유하고 테이블 스키마만 shard_NN으로 바꾸는 엔진
+    """
+    if SHARD_MODE == SHARD_MODE_DATABASE:
+        if not urls:
+            raise ValueError("SHARD_MODE=database에는 샤드 DB URL이 필요합니다")
+        return [create_engine(url) for url in urls]
+    if SHARD_MODE == SHARD_MODE_SCHEMA:
+        return [
+            primary.execution_options(
+                schema_translate_map={None: shard_schema_name(index)}
+            )
+            for index in range(SHARD_SCHEMA_COUNT)
+        ]
+    if SHARD_MODE:
+        raise ValueError(f"지원하지 않는 SHARD_MODE: {SHARD_MODE}")
+    return []
+
+
+def _touches_sharded_table(mapper: Any, clause: Any) -> bool:
+    if mapper is not None:
+        table = getattr(mapper, "local_table", None)
+        if getattr(table, "name", None) in SHARDED_TABLES:
+            return True
+    if clause is not None:
+        return any(
+            table.name in SHARDED_TABLES
+            for table in find_tables(clause, include_crud=True)
+            if hasattr(table, "name")
+        )
+    return False
+
+
+class ShardRoutingSession(Session):
+    """
+    샤드 테이블은 세션에 지정한 사용자의 샤드로, 나머지는 기본 엔진으로 보내는 세션
+    (use_user_shard로 사용자를 먼저 지정)
+    """
+
+    shard_binds: Sequence[Any] = ()
+
+    def shard_bind_for(self, user_id: int) -> Any:
+        return self.shard_binds[jump_consistent_hash(user_id, len(self.shard_binds))]
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if kw.get("bind") is None and _touches_sharded_table(mapper, clause):
+            user_id = self.info.get(SHARD_USER_KEY)
+            if user_id is None:
+                raise RuntimeError(
+                    "샤드 테이블을 다루기 전에 use_user_shard(session, user_id)로 "
+                    "사용자를 지정해야 합니다"
+                )
+            return self.shard_bind_for(user_id)
+        return super().get_bind(mapper, clause=clause, **kw)
+
+
+def shard_session_class(binds: Sequence[Any]) -> Optional[type]:
+    """샤드 엔진을 쓰는 세션 클래스 (샤딩을 쓰지 않으면 None)"""
+    if not binds:
+        return None
+    return type("ShardRoutingSession", (ShardRoutingSession,), {"shard_binds": binds})
+
+
+def use_user_shard(session: Any, user_id: int) -> Optional[int]:
+    """
+    세션의 샤드 테이블 작업을 user_id의 샤드로 보냄 (AsyncSession도 가능)
+    - 다른 사용자로 바꿀 때는 이전 사용자의 변경을 먼저 flush
+    - 샤딩을 쓰지 않으면 아무것도 하지 않고 None
+
+    returns:
+        샤드 번호
+    """
+    sync_session = getattr(session, "sync_session", session)
+    if not isinstance(sync_session, ShardRoutingSession):
+        return None
+    current = sync_session.info.get(SHARD_USER_KEY)
+    if current is not None and current != user_id:
+        if sync_session.new or sync_session.dirty or sync_session.deleted:
+            sync_session.flush()
+    sync_session.info[SHARD_USER_KEY] = user_id
+    return jump_consistent_hash(user_id, len(sync_session.shard_binds))
+
+
+def each_shard_bind(session: Any) -> List[Dict[str, Any]]:
+    """
+    모든 샤드를 훑는 조회용 bind_arguments 목록 (사용자를 모르는 관리 작업용)
+    샤딩을 쓰지 않으면 기본 바인드 하나
+    """
+    sync_session = getattr(session, "sync_session", session)
+    if not isinstance(sync_session, ShardRoutingSession):
+        return [{}]
+    return [{"bind": bind} for bind in sync_session.shard_binds]
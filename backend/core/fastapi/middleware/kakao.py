@@ -14,7 +14,7 @@ from api.common.schema import (
 from app.model import User
 from app.service.token_service import TempTokenService
 from core.config import FRONTEND_URL, KAKAO_BOT_ID
-from core.db import get_session
+from core.db import get_read_session, get_session
 
 
 class KakaoBotMiddleware(BaseHTTPMiddleware):
@@ -47,9 +47,12 @@ class KakaoBotMiddleware(BaseHTTPMiddleware):
 class KakaoUserMiddleware(BaseHTTPMiddleware):
     """카카오톡 유저 서비스 연결 검증 미들웨어"""
 
-    def __init__(self, app, session_factory=get_session):
+    def __init__(
+        self, app, session_factory=get_session, read_session_factory=get_read_session
+    ):
         super().__init__(app)
         self.session_factory = session_factory
+        self.read_session_factory = read_session_factory
         self.kakao_bot_signup_path = "/auth/kakao/signup"
 
     async def _get_user(self, session: AsyncSession, user_key: str) -> User:
@@ -130,15 +133,17 @@ class KakaoUserMiddleware(BaseHTTPMiddleware):
                         content={"detail": "유저 ID가 없습니다."},
                     )
 
-                async for session in self.session_factory():
+                # 사용자 확인은 복제본에서 조회
+                async for session in self.read_session_factory():
                     user = await self._get_user(session, user_key)
 
-                    # 회원가입 요청인데 이미 유저가 있는 경우
-                    if self.kakao_bot_signup_path in request.url.path and user:
-                        return await self._handle_existing_user(user)
+                # 회원가입 요청인데 이미 유저가 있는 경우
+                if self.kakao_bot_signup_path in request.url.path and user:
+                    return await self._handle_existing_user(user)
 
-                    # 회원가입이 아닌 요청인데 유저가 없는 경우
-                    if self.kakao_bot_signup_path not in request.url.path and not user:
+                # 회원가입이 아닌 요청인데 유저가 없는 경우 (가입 토큰 저장은 primary)
+                if self.kakao_bot_signup_path not in request.url.path and not user:
+                    async for session in self.session_factory():
                         return await self._handle_unregistered_user(session, user_key)
 
             response = await call_next(request)
@@ -0,0 +1,338 @@
+import hashlib
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, TypeVar
+
+import requests
+from garth.exc import GarthHTTPError
+from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+from prometheus_client.utils import floatToGoString
+
+from core.config import (
+    GARMIN_ACCOUNT_BURST,
+    GARMIN_ACCOUNT_RATE,
+    GARMIN_API_BACKOFF_BASE,
+    GARMIN_API_BACKOFF_MAX,
+    GARMIN_API_MAX_RETRIES,
+    GARMIN_GLOBAL_BURST,
+    GARMIN_GLOBAL_RATE,
+    GARMIN_RATE_LIMIT_ENABLED,
+    GARMIN_RATE_LIMIT_MAX_WAIT,
+)
+from core.util.sync_redis import get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+WAIT_BUCKETS = (0, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BACKOFF_BUCKETS = (0.1, 0.5, 1, 2, 4, 8, 16, 32)
+# 재시도 사유: throttled(429, urllib3 재시도 소진), timeout, connection
+RETRY_REASONS = ("throttled", "timeout", "connection")
+
+# KEYS: 버킷 키 목록, ARGV: 버킷별 (초당 토큰, 최대 토큰) 쌍
+# 모든 버킷에 토큰이 있을 때만 함께 차감하고, 부족하면 필요한 대기 시간(초)을 반환
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local wait = 0
+local tokens = {}
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local capacity = tonumber(ARGV[2 * i])
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local current = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    current = math.min(capacity, current + math.max(0, now - ts) * rate)
+    if current < 1 then
+        wait = math.max(wait, (1 - current) / rate)
+    end
+    tokens[i] = current
+end
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[2 * i - 1])
+    local capacity = tonumber(ARGV[2 * i])
+    local current = tokens[i]
+    if wait == 0 then
+        current = current - 1
+    end
+    redis.call('HSET', key, 'tokens', tostring(current), 'ts', tostring(now))
+    redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+end
+
+return tostring(wait)
+"""
+
+
+class RateLimitMetrics:
+    """
+    토큰 버킷 대기 시간/재시도 지표 (Redis 해시에 누적)
+    - 호출은 여러 워커 프로세스에서 일어나므로 프로세스별 레지스트리 대신
+      Redis에 합산하고 Celery exporter가 RateLimitMetricsCollector로 노출
+    - 히스토그램은 구간별 개수(누적 아님), 합계, 개수를 필드로 저장
+    - Redis를 사용할 수 없거나 오류가 나면 기록하지 않음
+    """
+
+    def __init__(
+        self,
+        key: str = "garmin:ratelimit:metrics",
+        redis_factory: Callable = get_sync_redis,
+    ):
+        self.key = key
+        self._redis_factory = redis_factory
+
+    @staticmethod
+    def _histogram_fields(
+        prefix: str, buckets: Tuple[float, ...], value: float
+    ) -> Dict[str, float]:
+        bucket = next((bound for bound in buckets if value <= bound), float("inf"))
+        return {
+            f"{prefix}:bucket:{floatToGoString(bucket)}": 1,
+            f"{prefix}:sum": value,
+            f"{prefix}:count": 1,
+        }
+
+    def _record(self, fields: Dict[str, float]) -> None:
+        redis_client = self._redis_factory()
+        if redis_client is None:
+            return
+        try:
+            pipeline = redis_client.pipeline(transaction=False)
+            for field, amount in fields.items():
+                pipeline.hincrbyfloat(self.key, field, amount)
+            pipeline.execute()
+        except Exception as e:
+            logger.debug(f"Garmin API 요청 한도 지표 기록 실패: {str(e)}")
+
+    def observe_wait(self, seconds: float) -> None:
+        """토큰 버킷 대기 시간 기록 (대기하지 않은 호출도 0으로 기록)"""
+        self._record(self._histogram_fields("wait", WAIT_BUCKETS, seconds))
+
+    def observe_retry(self, reason: str, delay: float) -> None:
+        """재시도 사유와 백오프 시간 기록 (재시도 횟수는 백오프 개수)"""
+        self._record(
+            self._histogram_fields(f"backoff:{reason}", BACKOFF_BUCKETS, delay)
+        )
+
+    def read(self) -> Dict[str, float]:
+        """누적된 필드 전체"""
+        redis_client = self._redis_factory()
+        if redis_client is None:
+            return {}
+        return {
+            field.decode(): float(value)
+            for field, value in redis_client.hgetall(self.key).items()
+        }
+
+
+class RateLimitMetricsCollector:
+    """RateLimitMetrics에 누적된 값을 Prometheus 지표로 변환 (exporter에 등록)"""
+
+    def __init__(self, metrics: RateLimitMetrics):
+        self.metrics = metrics
+
+    @staticmethod
+    def _buckets(
+        values: Dict[str, float], prefix: str, buckets: Tuple[float, ...]
+    ) -> Tuple[list, float]:
+        cumulative = 0.0
+        result = []
+        for bound in (*buckets, float("inf")):
+            label = floatToGoString(bound)
+            cumulative += values.get(f"{prefix}:bucket:{label}", 0.0)
+            result.append((label, cumulative))
+        return result, values.get(f"{prefix}:sum", 0.0)
+
+    def _families(self, values: Dict[str, float]) -> list:
+        wait_buckets, wait_sum = self._buckets(values, "wait", WAIT_BUCKETS)
+        wait = HistogramMetricFamily(
+            "garmin_api_rate_limit_wait_seconds",
+            "Garmin API 토큰 버킷 대기 시간 (초)",
+            buckets=wait_buckets,
+            sum_value=wait_sum,
+        )
+        backoff = HistogramMetricFamily(
+            "garmin_api_retry_backoff_seconds",
+            "Garmin API 재시도 전 백오프 시간 (초)",
+            labels=["reason"],
+        )
+        retries = CounterMetricFamily(
+            "garmin_api_retries",
+            "Garmin API 재시도 횟수 (reason: throttled(429), timeout, connection)",
+            labels=["reason"],
+        )
+        for reason in RETRY_REASONS:
+            prefix = f"backoff:{reason}"
+            buckets, total = self._buckets(values, prefix, BACKOFF_BUCKETS)
+            backoff.add_metric([reason], buckets, total)
+            retries.add_metric([reason], values.get(f"{prefix}:count", 0.0))
+        return [wait, backoff, retries]
+
+    def describe(self) -> Iterable:
+        # 레지스트리 등록 시 Redis를 읽지 않도록 지표 이름만 제공
+        return self._families({})
+
+    def collect(self) -> Iterable:
+        try:
+            values = self.metrics.read()
+        except Exception as e:
+            logger.warning(f"Garmin API 요청 한도 지표 조회 실패: {str(e)}")
+            return []
+        return self._families(values)
+
+
+rate_limit_metrics = RateLimitMetrics()
+
+
+class GarminRateLimitTimeout(Exception):
+    """토큰 버킷 대기 시간이 최대 대기 시간을 넘은 경우"""
+
+
+class GarminRateLimiter:
+    """
+    Redis 기반 Garmin API 토큰 버킷 (클러스터 전체 + Garmin 계정별)
+    - Redis를 사용할 수 없으면 제한 없이 통과
+    """
+
+    def __init__(
+        self,
+        enabled: bool = GARMIN_RATE_LIMIT_ENABLED,
+        global_rate: float = GARMIN_GLOBAL_RATE,
+        global_burst: int = GARMIN_GLOBAL_BURST,
+        account_rate: float = GARMIN_ACCOUNT_RATE,
+        account_burst: int = GARMIN_ACCOUNT_BURST,
+        max_wait: float = GARMIN_RATE_LIMIT_MAX_WAIT,
+        namespace: str = "garmin:ratelimit",
+        redis_factory: Callable = get_sync_redis,
+    ):
+        self.enabled = enabled
+        self.global_rate = global_rate
+        self.global_burst = global_burst
+        self.account_rate = account_rate
+        self.account_burst = account_burst
+        self.max_wait = max_wait
+        self.namespace = namespace
+        self._redis_factory = redis_factory
+        self._script = None
+
+    def _get_script(self):
+        if self._script is None:
+            redis_client = self._redis_factory()
+            if redis_client is None:
+                return None
+            self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+    def _try_acquire(self, account_key: str) -> float:
+        """토큰 획득 시도, 획득하면 0, 아니면 필요한 대기 시간(초)"""
+        script = self._get_script()
+        if script is None:
+            return 0.0
+        try:
+            wait = script(
+                keys=[
+                    f"{self.namespace}:global",
+                    f"{self.namespace}:account:{account_key}",
+                ],
+                args=[
+                    self.global_rate,
+                    self.global_burst,
+                    self.account_rate,
+                    self.account_burst,
+                ],
+            )
+            return float(wait)
+        except Exception as e:
+            logger.warning(f"Garmin API 요청 한도 확인 실패, 제한 없이 진행: {str(e)}")
+            return 0.0
+
+    def acquire(self, account_key: str) -> float:
+        """
+        토큰을 얻을 때까지 대기
+
+        returns:
+            실제 대기한 시간 (초)
+        """
+        if not self.enabled:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(account_key)
+            if wait <= 0:
+                rate_limit_metrics.observe_wait(waited)
+                return waited
+            if waited + wait > self.max_wait:
+                rate_limit_metrics.observe_wait(waited)
+                raise GarminRateLimitTimeout(
+                    f"Garmin API 요청 한도 대기 시간 초과 (timeout {self.max_wait}s)"
+                )
+            # 여러 워커가 같은 시점에 다시 시도하지 않도록 약간의 지터 추가
+            delay = wait + random.uniform(0, wait * 0.1)
+            time.sleep(delay)
+            waited += delay
+
+
+rate_limiter = GarminRateLimiter()
+
+
+def get_account_key(client) -> str:
+    """Garmin 계정 식별 키 (OAuth1 토큰 해시, 토큰 원문은 Redis에 남기지 않음)"""
+    oauth1_token = getattr(client, "oauth1_token", None)
+    token = getattr(oauth1_token, "oauth_token", None)
+    if not token:
+        return "unknown"
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+def _get_retry_reason(error: Exception) -> Optional[str]:
+    """재시도 대상 오류면 사유, 아니면 None"""
+    if isinstance(error, GarthHTTPError):
+        response = getattr(error.error, "response", None)
+        if response is not None and response.status_code == 429:
+            return "throttled"
+        return None
+    if isinstance(error, requests.exceptions.RetryError):
+        # urllib3 재시도(429/5xx)가 모두 소진된 경우
+        return "throttled"
+    # ConnectTimeout은 ConnectionError이기도 하므로 Timeout을 먼저 확인
+    if isinstance(error, requests.exceptions.Timeout):
+        return "timeout"
+    if isinstance(error, requests.ConnectionError):
+        return "connection"
+    return None
+
+
+def call_garmin(client, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    요청 한도를 지키며 Garmin API 호출
+    - 호출마다 전역/계정 토큰 버킷에서 토큰 획득
+    - 429, 타임아웃, 연결 오류는 지터를 준 지수 백오프로 재시도
+    """
+    account_key = get_account_key(client)
+    for attempt in range(GARMIN_API_MAX_RETRIES + 1):
+        rate_limiter.acquire(account_key)
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            reason = _get_retry_reason(e)
+            if reason is None or attempt >= GARMIN_API_MAX_RETRIES:
+                raise
+
+            delay = random.uniform(
+                0, min(GARMIN_API_BACKOFF_MAX, GARMIN_API_BACKOFF_BASE * 2**attempt)
+            )
+            rate_limit_metrics.observe_retry(reason, delay)
+            logger.warning(
+                f"Garmin API 재시도 ({attempt + 1}/{GARMIN_API_MAX_RETRIES}, "
+                f"{reason}, {delay:.2f}s 후): {str(e)}"
+            )
+            time.sleep(delay)
+
+
+def connectapi(client, path: str, **kwargs: Any) -> Any:
+    """client.connectapi를 요청 한도/재시도와 함께 호출"""
+    return call_garmin(client, client.connectapi, path, **kwargs)
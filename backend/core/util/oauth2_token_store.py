@@ -0,0 +1,182 @@
+import base64
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict
+from typing import Callable, Optional
+
+from garth import Client as GarthClient
+from garth.auth_tokens import OAuth2Token
+
+from core.config import (
+    OAUTH2_TOKEN_CACHE_ENABLED,
+    OAUTH2_TOKEN_ENCRYPTION_KEY,
+    OAUTH2_TOKEN_LOCK_TIMEOUT,
+    OAUTH2_TOKEN_LOCK_WAIT,
+    OAUTH2_TOKEN_REFRESH_MARGIN,
+    SECRET_KEY,
+)
+from core.util.sync_redis import get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+
+def _import_fernet():
+    """cryptography는 토큰 캐시를 쓸 때만 필요하므로 사용할 때 import"""
+    try:
+        from cryptography.fernet import Fernet, InvalidToken
+    except ImportError:
+        return None, None
+    return Fernet, InvalidToken
+
+
+class OAuth2TokenStore:
+    """
+    Garmin OAuth2 토큰 캐시 (Redis, Fernet 암호화)
+    - 클라이언트를 만들 때마다 SSO 교환(refresh_oauth2)을 하지 않고 만료 전 토큰 재사용
+    - 키: OAuth1 토큰 해시 (사용자 로그인 단위, 토큰 자체는 키에 남기지 않음)
+    - 만료가 refresh_margin 이내로 남으면 분산 락을 잡은 워커 하나만 재발급
+    - Redis/cryptography가 없거나 오류가 나면 기존처럼 매번 재발급
+    """
+
+    def __init__(
+        self,
+        enabled: bool = OAUTH2_TOKEN_CACHE_ENABLED,
+        encryption_key: str = OAUTH2_TOKEN_ENCRYPTION_KEY,
+        refresh_margin: int = OAUTH2_TOKEN_REFRESH_MARGIN,
+        lock_timeout: int = OAUTH2_TOKEN_LOCK_TIMEOUT,
+        lock_wait: float = OAUTH2_TOKEN_LOCK_WAIT,
+        namespace: str = "garmin:oauth2",
+        redis_factory: Callable = get_sync_redis,
+    ):
+        self.enabled = enabled
+        self.refresh_margin = refresh_margin
+        self.lock_timeout = lock_timeout
+        self.lock_wait = lock_wait
+        self.namespace = namespace
+        self._encryption_key = encryption_key
+        self._redis_factory = redis_factory
+        self._fernet = None
+        self._invalid_token_error: type = Exception
+
+    def make_key(self, oauth_token: str) -> str:
+        """캐시 키 생성"""
+        digest = hashlib.sha256(oauth_token.encode()).hexdigest()
+        return f"{self.namespace}:{digest}"
+
+    def _get_fernet(self):
+        if self._fernet is None:
+            fernet_class, invalid_token = _import_fernet()
+            if fernet_class is None:
+                logger.warning(
+                    "cryptography가 없어 OAuth2 토큰 캐시를 사용하지 않습니다 "
+                    "(pip install cryptography)"
+                )
+                self.enabled = False
+                return None
+            # 키를 따로 지정하지 않으면 JWT 서명 키에서 유도
+            key = self._encryption_key or base64.urlsafe_b64encode(
+                hashlib.sha256(SECRET_KEY.encode()).digest()
+            )
+            self._fernet = fernet_class(key)
+            self._invalid_token_error = invalid_token
+        return self._fernet
+
+    def _is_fresh(self, token: Optional[OAuth2Token]) -> bool:
+        return (
+            token is not None and token.expires_at - time.time() > self.refresh_margin
+        )
+
+    def get(self, oauth_token: str) -> Optional[OAuth2Token]:
+        """캐시된 OAuth2 토큰 조회 (복호화 실패 시 None)"""
+        redis_client = self._redis_factory()
+        fernet = self._get_fernet()
+        if redis_client is None or fernet is None:
+            return None
+
+        key = self.make_key(oauth_token)
+        try:
+            encrypted = redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"OAuth2 토큰 캐시 조회 실패: {str(e)}")
+            return None
+        if encrypted is None:
+            return None
+
+        try:
+            return OAuth2Token(**json.loads(fernet.decrypt(encrypted)))
+        except (self._invalid_token_error, TypeError, ValueError) as e:
+            # 암호화 키가 바뀌었거나 형식이 다르면 재발급해서 덮어씀
+            logger.warning(f"OAuth2 토큰 캐시 복호화 실패: {type(e).__name__}")
+            return None
+
+    def set(self, oauth_token: str, token: OAuth2Token) -> None:
+        """토큰을 암호화해서 만료 시각까지 저장"""
+        redis_client = self._redis_factory()
+        fernet = self._get_fernet()
+        ttl = int(token.expires_at - time.time())
+        if redis_client is None or fernet is None or ttl <= 0:
+            return
+        try:
+            redis_client.set(
+                self.make_key(oauth_token),
+                fernet.encrypt(json.dumps(asdict(token)).encode()),
+                ex=ttl,
+            )
+        except Exception as e:
+            logger.warning(f"OAuth2 토큰 캐시 저장 실패: {str(e)}")
+
+    def configure_client(self, client: GarthClient) -> None:
+        """
+        OAuth1 토큰이 설정된 클라이언트에 OAuth2 토큰 설정
+        - 캐시에 충분히 남은 토큰이 있으면 재사용
+        - 없으면 락을 잡고 다시 확인한 뒤 재발급 (동시 재발급 방지)
+        - 락을 기다리다 시간이 지나면 락 없이 재발급
+        """
+        oauth_token = client.oauth1_token.oauth_token
+        if not self.enabled:
+            client.refresh_oauth2()
+            return
+
+        cached = self.get(oauth_token)
+        if self._is_fresh(cached):
+            client.configure(oauth2_token=cached)
+            return
+
+        redis_client = self._redis_factory()
+        if redis_client is None or not self.enabled:
+            client.refresh_oauth2()
+            return
+
+        lock = redis_client.lock(
+            f"{self.make_key(oauth_token)}:lock",
+            timeout=self.lock_timeout,
+            blocking_timeout=self.lock_wait,
+        )
+        try:
+            acquired = lock.acquire()
+        except Exception as e:
+            logger.warning(f"OAuth2 토큰 재발급 락 획득 실패: {str(e)}")
+            acquired = False
+
+        try:
+            # 락을 기다리는 동안 다른 워커가 재발급했으면 그 토큰 사용
+            cached = self.get(oauth_token)
+            if self._is_fresh(cached):
+                client.configure(oauth2_token=cached)
+                return
+            if not acquired:
+                logger.warning("OAuth2 토큰 재발급 락 대기 시간 초과, 락 없이 재발급")
+            client.refresh_oauth2()
+            self.set(oauth_token, client.oauth2_token)
+        finally:
+            if acquired:
+                try:
+                    lock.release()
+                except Exception as e:
+                    # 락이 이미 만료된 경우
+                    logger.warning(f"OAuth2 토큰 재발급 락 해제 실패: {str(e)}")
+
+
+oauth2_token_store = OAuth2TokenStore()
@@ -0,0 +1,149 @@
+import json
+import logging
+import threading
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Optional
+
+from cachetools import TTLCache
+
+from core.config import (
+    PAYLOAD_CACHE_ENABLED,
+    PAYLOAD_CACHE_L1_SIZE,
+    PAYLOAD_CACHE_L1_TTL,
+    PAYLOAD_CACHE_PAST_TTL,
+    PAYLOAD_CACHE_RECENT_TTL,
+)
+from core.util.sync_redis import get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadCache:
+    """
+    Garmin 원본 응답 캐시
+    - L1: 프로세스 메모리 (TTL + LRU)
+    - L2: Redis (태스크 재시도, API 요청, 분석 작업 간 공유)
+    - 키: 엔드포인트 / 사용자 / 날짜
+    - 값: Garmin JSON 응답을 JSON 문자열로 저장 (공유 Redis 값을 코드로 실행하지 않도록)
+    - 최근 날짜는 데이터가 계속 바뀌므로 짧은 TTL, 지난 날짜는 긴 TTL
+    """
+
+    def __init__(
+        self,
+        enabled: bool = PAYLOAD_CACHE_ENABLED,
+        l1_size: int = PAYLOAD_CACHE_L1_SIZE,
+        l1_ttl: int = PAYLOAD_CACHE_L1_TTL,
+        recent_ttl: int = PAYLOAD_CACHE_RECENT_TTL,
+        past_ttl: int = PAYLOAD_CACHE_PAST_TTL,
+        namespace: str = "garmin:raw",
+        redis_factory: Callable = get_sync_redis,
+    ):
+        self.enabled = enabled
+        self.recent_ttl = recent_ttl
+        self.past_ttl = past_ttl
+        self.namespace = namespace
+        self._redis_factory = redis_factory
+        self._l1 = TTLCache(maxsize=l1_size, ttl=min(l1_ttl, recent_ttl))
+        self._lock = threading.Lock()
+
+    def make_key(self, endpoint: str, user_key: str, date_str: str) -> str:
+        """캐시 키 생성"""
+        return f"{self.namespace}:{endpoint}:{user_key}:{date_str}"
+
+    def ttl_for(self, date_str: str) -> int:
+        """
+        날짜별 TTL
+        - 사용자 시간대를 알 수 없으므로 UTC 기준 어제 이후는 최근 날짜로 취급
+        """
+        try:
+            target_date = date.fromisoformat(date_str)
+        except ValueError:
+            return self.recent_ttl
+        recent_since = datetime.now(timezone.utc).date() - timedelta(days=1)
+        return self.recent_ttl if target_date >= recent_since else self.past_ttl
+
+    def get(self, endpoint: str, user_key: str, date_str: str) -> Optional[Any]:
+        """L1 -> Redis 순서로 조회"""
+        if not self.enabled:
+            return None
+
+        key = self.make_key(endpoint, user_key, date_str)
+        with self._lock:
+            if key in self._l1:
+                return self._l1[key]
+
+        redis_client = self._redis_factory()
+        if redis_client is None:
+            return None
+        try:
+            raw = redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"페이로드 캐시 조회 실패 ({key}): {str(e)}")
+            return None
+        if raw is None:
+            return None
+
+        try:
+            data = json.loads(raw)
+        except ValueError as e:
+            logger.warning(f"페이로드 캐시 역직렬화 실패 ({key}): {str(e)}")
+            return None
+
+        with self._lock:
+            self._l1[key] = data
+        return data
+
+    def set(self, endpoint: str, user_key: str, date_str: str, data: Any) -> None:
+        """L1과 Redis에 저장 (빈 응답은 저장하지 않음)"""
+        if not self.enabled or not data:
+            return
+
+        key = self.make_key(endpoint, user_key, date_str)
+        with self._lock:
+            self._l1[key] = data
+
+        redis_client = self._redis_factory()
+        if redis_client is None:
+            return
+        try:
+            redis_client.set(
+                key,
+                json.dumps(data, separators=(",", ":")),
+                ex=self.ttl_for(date_str),
+            )
+        except Exception as e:
+            logger.warning(f"페이로드 캐시 저장 실패 ({key}): {str(e)}")
+
+    def get_or_fetch(
+        self,
+        endpoint: str,
+        user_key: str,
+        date_str: str,
+        fetch: Callable[[], Any],
+    ) -> Any:
+        """캐시에 없으면 fetch 결과를 저장 후 반환"""
+        data = self.get(endpoint, user_key, date_str)
+        if data is not None:
+            logger.debug(f"페이로드 캐시 사용: {endpoint}:{user_key}:{date_str}")
+            return data
+
+        data = fetch()
+        self.set(endpoint, user_key, date_str, data)
+        return data
+
+    def invalidate(self, endpoint: str, user_key: str, date_str: str) -> None:
+        """캐시 항목 삭제"""
+        key = self.make_key(endpoint, user_key, date_str)
+        with self._lock:
+            self._l1.pop(key, None)
+
+        redis_client = self._redis_factory()
+        if redis_client is None:
+            return
+        try:
+            redis_client.delete(key)
+        except Exception as e:
+            logger.warning(f"페이로드 캐시 삭제 실패 ({key}): {str(e)}")
+
+
+payload_cache = PayloadCache()
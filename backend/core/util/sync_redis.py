@@ -0,0 +1,24 @@
+import logging
+from functools import lru_cache
+from typing import Optional
+
+import redis
+
+from core.config import SYNC_REDIS_URL
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_sync_redis() -> Optional[redis.Redis]:
+    """
+    동기 Redis 클라이언트 (Celery 워커/동기 서비스용)
+    - 값은 bytes 그대로 다룸 (decode_responses=False)
+    - Redis URL이 아니면 None (처음 한 번만 확인하고 경고, 결과는 프로세스 동안 재사용)
+    """
+    if not SYNC_REDIS_URL.startswith(("redis://", "rediss://")):
+        logger.warning(
+            f"Redis URL이 아니므로 Redis를 사용하지 않습니다: {SYNC_REDIS_URL}"
+        )
+        return None
+    return redis.Redis.from_url(SYNC_REDIS_URL)
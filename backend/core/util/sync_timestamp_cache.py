@@ -0,0 +1,104 @@
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+from core.config import SYNC_TIMESTAMP_CACHE_TTL
+from core.util.sync_redis import get_sync_redis
+
+logger = logging.getLogger(__name__)
+
+SYNC_TIMESTAMP_FORMATS = ("%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S")
+
+
+def parse_sync_timestamp(value: Any) -> Optional[datetime]:
+    """Garmin syncTimestamp(UTC 문자열)를 datetime으로 변환, 알 수 없는 형식이면 None"""
+    if not isinstance(value, str):
+        return None
+    for time_format in SYNC_TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(value, time_format).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    return None
+
+
+class SyncTimestampCache:
+    """
+    Garmin 마지막 동기화 시간 캐시 (사용자별, Redis 공유)
+    - 같은 사용자의 여러 날짜 수집, 프로필 조회가 짧은 시간 안에 이어질 때
+      syncTimestamp 요청을 한 번만 보냄
+    - 키: Garmin displayName (원본 응답 캐시와 같은 사용자 키)
+    - 수집한 측정값이 캐시된 동기화 시간보다 새로우면 그 사이 동기화된 것이므로 삭제
+    """
+
+    def __init__(
+        self,
+        ttl: int = SYNC_TIMESTAMP_CACHE_TTL,
+        namespace: str = "garmin:sync",
+        redis_factory: Callable = get_sync_redis,
+    ):
+        self.ttl = ttl
+        self.namespace = namespace
+        self._redis_factory = redis_factory
+
+    def make_key(self, user_key: str) -> str:
+        """캐시 키 생성"""
+        return f"{self.namespace}:{user_key}"
+
+    def _redis(self, user_key: Optional[str]):
+        if self.ttl <= 0 or not user_key:
+            return None
+        return self._redis_factory()
+
+    def get(self, user_key: Optional[str]) -> Optional[str]:
+        """캐시된 syncTimestamp 응답 조회"""
+        redis_client = self._redis(user_key)
+        if redis_client is None:
+            return None
+        key = self.make_key(user_key)
+        try:
+            raw = redis_client.get(key)
+        except Exception as e:
+            logger.warning(f"동기화 시간 캐시 조회 실패 ({key}): {str(e)}")
+            return None
+        return raw.decode() if raw is not None else None
+
+    def get_or_fetch(self, user_key: Optional[str], fetch: Callable[[], Any]) -> Any:
+        """캐시에 없으면 fetch 결과를 저장 후 반환 (문자열 응답만 저장)"""
+        cached = self.get(user_key)
+        if cached is not None:
+            logger.debug(f"동기화 시간 캐시 사용: {user_key}")
+            return cached
+
+        value = fetch()
+        redis_client = self._redis(user_key)
+        if redis_client is not None and isinstance(value, str):
+            key = self.make_key(user_key)
+            try:
+                redis_client.set(key, value, ex=self.ttl)
+            except Exception as e:
+                logger.warning(f"동기화 시간 캐시 저장 실패 ({key}): {str(e)}")
+        return value
+
+    def observe(self, user_key: Optional[str], observed_at: datetime) -> None:
+        """수집한 데이터 시각이 캐시된 동기화 시간보다 새로우면 캐시 삭제"""
+        cached_at = parse_sync_timestamp(self.get(user_key))
+        if cached_at is not None and observed_at > cached_at:
+            logger.debug(
+                f"캐시보다 새로운 데이터 확인, 동기화 시간 캐시 삭제: {user_key}"
+            )
+            self.invalidate(user_key)
+
+    def invalidate(self, user_key: Optional[str]) -> None:
+        """캐시 항목 삭제"""
+        redis_client = self._redis(user_key)
+        if redis_client is None:
+            return
+        key = self.make_key(user_key)
+        try:
+            redis_client.delete(key)
+        except Exception as e:
+            logger.warning(f"동기화 시간 캐시 삭제 실패 ({key}): {str(e)}")
+
+
+sync_timestamp_cache = SyncTimestampCache()
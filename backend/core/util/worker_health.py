@@ -0,0 +1,101 @@
+import logging
+import os
+import resource
+import sys
+import threading
+from typing import Iterable, Optional
+
+from sqlalchemy.engine import Engine
+
+from core.config import WORKER_RSS_GROWTH_WARN_KB, WORKER_TASK_RSS_WARN_KB
+
+logger = logging.getLogger(__name__)
+
+
+def current_rss_kb() -> int:
+    """현재 프로세스 상주 메모리 (KiB)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        # /proc이 없으면 최대 상주 메모리로 대신 (macOS는 바이트 단위)
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss // 1024 if sys.platform == "darwin" else max_rss
+
+
+class WorkerLeakDetector:
+    """
+    오래 실행되는 워커 프로세스의 누수 감지 (태스크 전후 비교)
+    - 태스크 후 반환되지 않은 DB 연결
+    - 태스크 한 번의 메모리 증가량과 첫 태스크 이후 누적 증가량
+    실제 프로세스 교체는 worker_max_memory_per_child가 담당
+    스레드 풀처럼 한 프로세스에서 태스크가 겹치면 태스크별 메모리 증가량과
+    미반환 연결은 실행 중인 태스크가 없을 때만 검사
+    """
+
+    def __init__(
+        self,
+        engines: Iterable[Optional[Engine]],
+        task_rss_warn_kb: int = WORKER_TASK_RSS_WARN_KB,
+        rss_growth_warn_kb: int = WORKER_RSS_GROWTH_WARN_KB,
+    ):
+        # 스키마 샤드 엔진은 primary 풀을 공유하므로 풀 기준으로 한 번만 검사
+        pools = {id(engine.pool): engine for engine in engines if engine is not None}
+        self.engines = list(pools.values())
+        self.task_rss_warn_kb = task_rss_warn_kb
+        self.rss_growth_warn_kb = rss_growth_warn_kb
+        self.baseline_rss_kb: Optional[int] = None
+        self.task_count = 0
+        self._task_start_rss_kb: Optional[int] = None
+        self._growth_warned = False
+        self._running = 0
+        self._overlapped = False
+        self._lock = threading.Lock()
+
+    def before_task(self) -> None:
+        with self._lock:
+            self._running += 1
+            if self._running > 1:
+                self._overlapped = True
+            else:
+                self._overlapped = False
+                self._task_start_rss_kb = current_rss_kb()
+
+    def after_task(self, task_name: str) -> None:
+        with self._lock:
+            self._running = max(self._running - 1, 0)
+            self.task_count += 1
+            if not self._running:
+                self._check(task_name)
+
+    def _check(self, task_name: str) -> None:
+        rss_kb = current_rss_kb()
+        # 첫 태스크에서 지연 import/캐시 초기화가 끝나므로 그 이후를 기준으로 삼음
+        if self.baseline_rss_kb is None:
+            self.baseline_rss_kb = rss_kb
+
+        if self._task_start_rss_kb is not None and not self._overlapped:
+            task_growth = rss_kb - self._task_start_rss_kb
+            if task_growth > self.task_rss_warn_kb:
+                logger.warning(
+                    f"태스크 메모리 증가 - Task: {task_name}, "
+                    f"증가: {task_growth}KiB, 현재: {rss_kb}KiB"
+                )
+        self._task_start_rss_kb = None
+
+        total_growth = rss_kb - self.baseline_rss_kb
+        if total_growth > self.rss_growth_warn_kb and not self._growth_warned:
+            self._growth_warned = True
+            logger.warning(
+                f"워커 메모리 누적 증가, 누수 의심 - PID: {os.getpid()}, "
+                f"태스크 수: {self.task_count}, 증가: {total_growth}KiB"
+            )
+
+        for engine in self.engines:
+            checked_out = engine.pool.checkedout()
+            if checked_out:
+                logger.warning(
+                    f"태스크 후 반환되지 않은 DB 연결 - Task: {task_name}, "
+                    f"Engine: {engine.url.render_as_string()}, 연결 수: {checked_out}"
+                )
@@ -7,6 +7,7 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from starlette.middleware.authentication import AuthenticationMiddleware
 
 from api.v1.auth.router import router as auth_router
+from api.v1.export.router import router as export_router
 from api.v1.kakao.router import router as kakao_router
 from api.v1.profile.router import router as profile_router
 from api.v1.stats.router import router as stats_router
@@ -14,7 +15,8 @@ from api.v1.summary.router import router as summary_router
 from api.v1.task.router import router as task_router
 from api.v1.time_series.router import router as time_series_router
 from core.config import CORS_ORIGINS
-from core.db import engine, get_session, init_db
+from core.db import engine, get_read_session, get_session, init_db, replica_engine
+from core.db.session import shard_engines
 from core.fastapi.middleware import (
     GarminAuthBackend,
     KakaoBotMiddleware,
@@ -27,6 +29,10 @@ async def lifespan(app: FastAPI):
     await init_db()
     yield
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+    for shard_engine in shard_engines:
+        await shard_engine.dispose()
 
 
 app = FastAPI(
@@ -47,7 +53,11 @@ app.add_middleware(
 )
 
 # 카카오톡 미들웨어 등록 (순서 중요: 봇 검증 -> 유저 검증)
-app.add_middleware(KakaoUserMiddleware, session_factory=get_session)
+app.add_middleware(
+    KakaoUserMiddleware,
+    session_factory=get_session,
+    read_session_factory=get_read_session,
+)
 app.add_middleware(KakaoBotMiddleware)
 
 security = HTTPBearer()
@@ -60,5 +70,6 @@ app.include_router(kakao_router)
 app.include_router(summary_router)
 app.include_router(time_series_router)
 app.include_router(stats_router)
+app.include_router(export_router)
 
 app.add_middleware(AuthenticationMiddleware, backend=GarminAuthBackend())
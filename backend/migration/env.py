@@ -11,7 +11,11 @@ from core.db import Base
 config = context.config
 
 # alembic.ini의 sqlalchemy.url 대신 config.py의 동기 URL 사용
-config.set_main_option("sqlalchemy.url", SYNC_DATABASE_URL)
+# (샤드 DB는 alembic -x url=postgresql://... upgrade head 로 지정)
+config.set_main_option(
+    "sqlalchemy.url",
+    context.get_x_argument(as_dictionary=True).get("url", SYNC_DATABASE_URL),
+)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
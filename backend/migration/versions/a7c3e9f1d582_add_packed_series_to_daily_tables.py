@@ -0,0 +1,50 @@
+"""add packed series to daily tables
+
+Revision ID: a7c3e9f1d582
+Revises: f3b6d8e2a417
+Create Date: 2026-10-17 00:54:18.362094
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e9f1d582"
+down_revision: Union[str, None] = "f3b6d8e2a417"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PACKED_SERIES_TABLES = ("heart_rate_daily", "stress_daily")
+
+
+def upgrade():
+    for table in PACKED_SERIES_TABLES:
+        op.add_column(
+            table,
+            sa.Column("series_start_gmt", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.add_column(
+            table,
+            sa.Column("series_start_local", sa.DateTime(timezone=False), nullable=True),
+        )
+        op.add_column(
+            table, sa.Column("series_interval_seconds", sa.Integer(), nullable=True)
+        )
+        op.add_column(
+            table,
+            sa.Column(
+                "series_values", postgresql.ARRAY(sa.SmallInteger()), nullable=True
+            ),
+        )
+
+
+def downgrade():
+    for table in PACKED_SERIES_TABLES:
+        op.drop_column(table, "series_values")
+        op.drop_column(table, "series_interval_seconds")
+        op.drop_column(table, "series_start_local")
+        op.drop_column(table, "series_start_gmt")
@@ -0,0 +1,53 @@
+"""add metric rollups
+
+Revision ID: b4d1f6a8c930
+Revises: a7c3e9f1d582
+Create Date: 2026-10-17 01:26:44.905173
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d1f6a8c930"
+down_revision: Union[str, None] = "a7c3e9f1d582"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "metric_rollups",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("metric", sa.String(length=50), nullable=False),
+        sa.Column("resolution_seconds", sa.Integer(), nullable=False),
+        sa.Column("bucket_start_local", sa.DateTime(timezone=False), nullable=False),
+        sa.Column("min_value", sa.Integer(), nullable=True),
+        sa.Column("max_value", sa.Integer(), nullable=True),
+        sa.Column("avg_value", sa.Float(), nullable=True),
+        sa.Column("sum_value", sa.BigInteger(), nullable=True),
+        sa.Column("sample_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "user_id", "metric", "resolution_seconds", "bucket_start_local"
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("metric_rollups")
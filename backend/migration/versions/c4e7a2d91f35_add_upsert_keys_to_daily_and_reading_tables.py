@@ -0,0 +1,80 @@
+"""add upsert keys to daily and reading tables
+
+Revision ID: c4e7a2d91f35
+Revises: b91def08a10f
+Create Date: 2026-10-16 23:05:12.418305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e7a2d91f35"
+down_revision: Union[str, None] = "b91def08a10f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 일일 테이블 -> [(측정값 테이블, 부모 id 컬럼)]
+DAILY_READING_TABLES = {
+    "heart_rate_daily": [("heart_rate_readings", "daily_summary_id")],
+    "stress_daily": [("stress_readings", "daily_summary_id")],
+    "steps_daily": [("steps_intraday", "daily_summary_id")],
+    "sleep_sessions": [
+        ("sleep_movement", "sleep_session_id"),
+        ("sleep_hrv_readings", "sleep_session_id"),
+    ],
+}
+
+
+def upgrade():
+    for daily_table, reading_tables in DAILY_READING_TABLES.items():
+        # (user_id, date) 중복 행 정리: 가장 최근 id만 남기고 측정값도 함께 삭제
+        # (측정값 테이블에는 외래키가 없어 CASCADE로 지워지지 않음)
+        for reading_table, parent_column in reading_tables:
+            op.execute(
+                f"""
+                DELETE FROM {reading_table} r
+                USING {daily_table} d
+                WHERE r.{parent_column} = d.id
+                  AND EXISTS (
+                      SELECT 1 FROM {daily_table} newer
+                      WHERE newer.user_id = d.user_id
+                        AND newer.date = d.date
+                        AND newer.id > d.id
+                  );
+                """
+            )
+        op.execute(
+            f"""
+            DELETE FROM {daily_table} d
+            USING {daily_table} newer
+            WHERE newer.user_id = d.user_id
+              AND newer.date = d.date
+              AND newer.id > d.id;
+            """
+        )
+        op.create_unique_constraint(
+            f"uq_{daily_table}_user_id_date", daily_table, ["user_id", "date"]
+        )
+
+        # 측정값 upsert 조회용 인덱스 (파티션에도 전파됨)
+        for reading_table, parent_column in reading_tables:
+            op.create_index(
+                f"ix_{reading_table}_{parent_column}_start_time_local",
+                reading_table,
+                [parent_column, "start_time_local"],
+            )
+
+
+def downgrade():
+    for daily_table, reading_tables in DAILY_READING_TABLES.items():
+        for reading_table, parent_column in reading_tables:
+            op.drop_index(
+                f"ix_{reading_table}_{parent_column}_start_time_local",
+                table_name=reading_table,
+            )
+        op.drop_constraint(
+            f"uq_{daily_table}_user_id_date", daily_table, type_="unique"
+        )
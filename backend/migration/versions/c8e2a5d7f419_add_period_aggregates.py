@@ -0,0 +1,58 @@
+"""add period aggregates
+
+Revision ID: c8e2a5d7f419
+Revises: b4d1f6a8c930
+Create Date: 2026-10-17 02:08:13.264519
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e2a5d7f419"
+down_revision: Union[str, None] = "b4d1f6a8c930"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "period_aggregates",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("period", sa.String(length=10), nullable=False),
+        sa.Column("period_start", sa.Date(), nullable=False),
+        sa.Column("metric", sa.String(length=50), nullable=False),
+        sa.Column("period_end", sa.Date(), nullable=False),
+        sa.Column("day_count", sa.Integer(), nullable=False),
+        sa.Column("mean", sa.Float(), nullable=True),
+        sa.Column("min_value", sa.Float(), nullable=True),
+        sa.Column("max_value", sa.Float(), nullable=True),
+        sa.Column("p10", sa.Float(), nullable=True),
+        sa.Column("p50", sa.Float(), nullable=True),
+        sa.Column("p90", sa.Float(), nullable=True),
+        sa.Column("trend_slope", sa.Float(), nullable=True),
+        sa.Column("goal_days", sa.Integer(), nullable=True),
+        sa.Column("goal_hit_rate", sa.Float(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        # 사용자/주기별 기간 조회가 PK 인덱스 범위 하나로 끝나도록 metric을 마지막에 둠
+        sa.PrimaryKeyConstraint("user_id", "period", "period_start", "metric"),
+    )
+
+
+def downgrade():
+    op.drop_table("period_aggregates")
@@ -0,0 +1,56 @@
+"""add covering indexes for daily lookups
+
+Revision ID: d1f4b7e9a263
+Revises: c8e2a5d7f419
+Create Date: 2026-10-17 02:47:31.120837
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d1f4b7e9a263"
+down_revision: Union[str, None] = "c8e2a5d7f419"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+DAILY_TABLES = [
+    "heart_rate_daily",
+    "stress_daily",
+    "steps_daily",
+    "sleep_sessions",
+]
+
+
+def upgrade():
+    # (user_id, date) 유니크 제약을 id를 포함한 유니크 인덱스로 교체
+    # - 워터마크/증분 수집의 id 조회가 index-only scan으로 끝남
+    # - ON CONFLICT (user_id, date) 충돌 대상으로 그대로 사용 가능
+    for table in DAILY_TABLES:
+        op.drop_constraint(f"uq_{table}_user_id_date", table, type_="unique")
+        op.create_index(
+            f"uq_{table}_user_id_date",
+            table,
+            ["user_id", "date"],
+            unique=True,
+            postgresql_include=["id"],
+        )
+
+    # 활동은 로컬 날짜 범위(start_time_local >= 시작 AND < 끝)로 조회/삭제
+    op.create_index(
+        "ix_activities_user_id_start_time_local",
+        "activities",
+        ["user_id", "start_time_local"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_activities_user_id_start_time_local", table_name="activities")
+
+    for table in DAILY_TABLES:
+        op.drop_index(f"uq_{table}_user_id_date", table_name=table)
+        op.create_unique_constraint(
+            f"uq_{table}_user_id_date", table, ["user_id", "date"]
+        )
@@ -0,0 +1,46 @@
+"""add collection watermarks
+
+Revision ID: d82f5b3c6e14
+Revises: c4e7a2d91f35
+Create Date: 2026-10-16 23:12:40.731904
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d82f5b3c6e14"
+down_revision: Union[str, None] = "c4e7a2d91f35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "collection_watermarks",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("metric", sa.String(length=50), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("last_start_time_gmt", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "metric", "date"),
+    )
+
+
+def downgrade():
+    op.drop_table("collection_watermarks")
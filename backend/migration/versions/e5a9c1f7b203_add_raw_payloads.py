@@ -0,0 +1,50 @@
+"""add raw payloads
+
+Revision ID: e5a9c1f7b203
+Revises: d82f5b3c6e14
+Create Date: 2026-10-16 23:48:05.214637
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a9c1f7b203"
+down_revision: Union[str, None] = "d82f5b3c6e14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "raw_payloads",
+        sa.Column("user_id", sa.BigInteger(), nullable=False),
+        sa.Column("endpoint", sa.String(length=50), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("payload_sha256", sa.String(length=64), nullable=False),
+        sa.Column("raw_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "endpoint", "date"),
+    )
+    # 이미 압축된 값이므로 TOAST 재압축 생략
+    op.execute("ALTER TABLE raw_payloads ALTER COLUMN payload SET STORAGE EXTERNAL")
+
+
+def downgrade():
+    op.drop_table("raw_payloads")
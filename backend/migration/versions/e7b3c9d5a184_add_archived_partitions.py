@@ -0,0 +1,63 @@
+"""add archived partitions
+
+Revision ID: e7b3c9d5a184
+Revises: d1f4b7e9a263
+Create Date: 2026-10-17 03:31:58.640271
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b3c9d5a184"
+down_revision: Union[str, None] = "d1f4b7e9a263"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 분리(detach)된 뒤 보관 파일로 옮겨지기 전까지 파티션을 두는 스키마
+ARCHIVE_PENDING_SCHEMA = "archive_pending"
+
+
+def upgrade():
+    op.execute(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_PENDING_SCHEMA}")
+    op.create_table(
+        "archived_partitions",
+        sa.Column("partition_name", sa.String(length=100), nullable=False),
+        sa.Column("parent_table", sa.String(length=50), nullable=False),
+        sa.Column("range_start", sa.DateTime(timezone=False), nullable=False),
+        sa.Column("range_end", sa.DateTime(timezone=False), nullable=False),
+        sa.Column("uri", sa.Text(), nullable=False),
+        sa.Column("row_count", sa.BigInteger(), nullable=False),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=False),
+        sa.Column("sha256", sa.String(length=64), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("partition_name"),
+    )
+    op.create_index(
+        "ix_archived_partitions_parent_table_range",
+        "archived_partitions",
+        ["parent_table", "range_start"],
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_archived_partitions_parent_table_range", table_name="archived_partitions"
+    )
+    op.drop_table("archived_partitions")
+    # 보관 대기 중인 파티션이 남아 있으면 실패하도록 CASCADE 없이 삭제
+    op.execute(f"DROP SCHEMA IF EXISTS {ARCHIVE_PENDING_SCHEMA}")
@@ -0,0 +1,244 @@
+"""partition readings by start_time_local
+
+Revision ID: f3b6d8e2a417
+Revises: e5a9c1f7b203
+Create Date: 2026-10-17 00:21:37.508126
+
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b6d8e2a417"
+down_revision: Union[str, None] = "e5a9c1f7b203"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 측정값 테이블 -> 부모 id 컬럼
+READING_TABLES = {
+    "heart_rate_readings": "daily_summary_id",
+    "stress_readings": "daily_summary_id",
+    "steps_intraday": "daily_summary_id",
+    "sleep_movement": "sleep_session_id",
+    "sleep_hrv_readings": "sleep_session_id",
+}
+
+# 현재 시점 이후로 미리 만들어 둘 월 파티션 수 (pg_partman 기본값과 동일)
+PREMAKE_MONTHS = 4
+
+
+def _get_partman() -> Optional[tuple]:
+    """pg_partman (스키마, 메이저 버전) 조회, 설치되어 있지 않으면 None"""
+    row = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT n.nspname, e.extversion
+                FROM pg_extension e
+                JOIN pg_namespace n ON n.oid = e.extnamespace
+                WHERE e.extname = 'pg_partman'
+                """
+            )
+        )
+        .first()
+    )
+    if row is None:
+        return None
+    return row[0], int(row[1].split(".")[0])
+
+
+def _unregister_partman(partman: Optional[tuple], table: str) -> None:
+    """기존 파티션 설정과 pg_partman이 만든 템플릿 테이블 제거"""
+    if partman is None:
+        return
+    schema, _ = partman
+    bind = op.get_bind()
+    template = bind.execute(
+        sa.text(
+            f"SELECT template_table FROM {schema}.part_config WHERE parent_table = "
+            ":parent"
+        ),
+        {"parent": f"public.{table}"},
+    ).scalar()
+    bind.execute(
+        sa.text(f"DELETE FROM {schema}.part_config WHERE parent_table = :parent"),
+        {"parent": f"public.{table}"},
+    )
+    if template:
+        op.execute(f"DROP TABLE IF EXISTS {template}")
+
+
+def _register_partman(
+    partman: tuple, table: str, control: str, start_partition: str
+) -> None:
+    """월 단위 RANGE 파티션으로 pg_partman에 등록 (4.x: native, 5.x: range)"""
+    schema, major_version = partman
+    if major_version >= 5:
+        args = "p_interval => '1 month', p_type => 'range'"
+    else:
+        args = "p_type => 'native', p_interval => 'monthly'"
+    op.get_bind().execute(
+        sa.text(
+            f"""
+            SELECT {schema}.create_parent(
+                p_parent_table => :parent,
+                p_control => :control,
+                {args},
+                p_premake => {PREMAKE_MONTHS},
+                p_start_partition => :start_partition
+            )
+            """
+        ),
+        {
+            "parent": f"public.{table}",
+            "control": control,
+            "start_partition": start_partition,
+        },
+    )
+
+
+def _create_monthly_partitions(table: str, start: str, months: int) -> None:
+    """pg_partman 없이 월 파티션 생성 (이름은 pg_partman 4.x 형식)"""
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month_start date;
+        BEGIN
+            FOR i IN 0..{months - 1} LOOP
+                month_start := date_trunc('month', '{start}'::timestamp)::date
+                    + make_interval(months => i);
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF {table} '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    '{table}_p' || to_char(month_start, 'YYYY_MM'),
+                    month_start,
+                    (month_start + interval '1 month')::date
+                );
+            END LOOP;
+        END $$;
+        """
+    )
+
+
+def _rename_old_partitions(table: str) -> None:
+    """
+    이름을 바꾼 기존 부모({table}_old)의 파티션도 {table}_old_* 로 변경
+    - 새 파티션이 같은 이름({table}_pYYYY_MM, {table}_default)을 쓰므로 먼저 비워 둠
+    """
+    partitions = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                """
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = to_regclass(:parent)
+                """
+            ),
+            {"parent": f"public.{table}_old"},
+        )
+        .scalars()
+        .all()
+    )
+    for partition in partitions:
+        suffix = partition.removeprefix(f"{table}_")
+        op.execute(f'ALTER TABLE "{partition}" RENAME TO "{table}_old_{suffix}"')
+
+
+def _repartition(
+    table: str,
+    parent_column: str,
+    control: str,
+    primary_key: List[str],
+    partman: Optional[tuple],
+) -> None:
+    """
+    측정값 테이블을 control 컬럼 기준 월 RANGE 파티션으로 다시 만들고 데이터 이동
+    - 기존 테이블과 파티션은 이름을 바꿔 두었다가 데이터를 옮긴 뒤 삭제
+    - 같은 (부모, start_time_local)이 여러 번 저장된 경우 가장 최근 행만 유지
+    """
+    _unregister_partman(partman, table)
+    op.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+    op.execute(
+        f"ALTER TABLE {table}_old RENAME CONSTRAINT {table}_pkey TO {table}_old_pkey"
+    )
+    _rename_old_partitions(table)
+    op.execute(
+        f"""
+        CREATE TABLE {table} (
+            LIKE {table}_old INCLUDING DEFAULTS
+        ) PARTITION BY RANGE ({control})
+        """
+    )
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({', '.join(primary_key)})")
+
+    # 기존 데이터의 가장 이른 달부터 파티션 생성 (데이터가 기본 파티션에 쌓이지 않도록)
+    bind = op.get_bind()
+    now = bind.execute(sa.text("SELECT LOCALTIMESTAMP")).scalar()
+    bounds = bind.execute(
+        sa.text(
+            f"SELECT min({control})::timestamp, max({control})::timestamp "
+            f"FROM {table}_old"
+        )
+    ).first()
+    first = min(bounds[0], now) if bounds[0] else now
+    last = max(bounds[1], now) if bounds[1] else now
+    start_partition = first.strftime("%Y-%m-01 00:00:00")
+
+    if partman is not None:
+        _register_partman(partman, table, control, start_partition)
+    else:
+        months = (last.year - first.year) * 12 + last.month - first.month + 1
+        _create_monthly_partitions(table, start_partition, months + PREMAKE_MONTHS)
+    # pg_partman은 create_parent에서 기본 파티션을 만들 수 있으므로 없을 때만 생성
+    has_default = bind.execute(
+        sa.text("SELECT to_regclass(:name)"), {"name": f"public.{table}_default"}
+    ).scalar()
+    if has_default is None:
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    op.execute(
+        f"""
+        INSERT INTO {table}
+        SELECT DISTINCT ON ({parent_column}, start_time_local) *
+        FROM {table}_old
+        ORDER BY {parent_column}, start_time_local, updated_at DESC, created_at DESC
+        """
+    )
+    op.execute(f"DROP TABLE {table}_old CASCADE")
+    op.execute(f"DROP TABLE IF EXISTS {table}_template")
+
+
+def upgrade():
+    partman = _get_partman()
+    for table, parent_column in READING_TABLES.items():
+        _repartition(
+            table,
+            parent_column,
+            control="start_time_local",
+            primary_key=[parent_column, "start_time_local"],
+            partman=partman,
+        )
+
+
+def downgrade():
+    partman = _get_partman()
+    for table, parent_column in READING_TABLES.items():
+        _repartition(
+            table,
+            parent_column,
+            control="created_at",
+            primary_key=[parent_column, "created_at", "start_time_local"],
+            partman=partman,
+        )
+        op.create_index(
+            f"ix_{table}_{parent_column}_start_time_local",
+            table,
+            [parent_column, "start_time_local"],
+        )
@@ -9,6 +9,11 @@ import os
 import sys
 import unittest
 
+# core.config가 import 시점에 읽는 필수 환경 변수 (tests/conftest.py와 같은 기본값)
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+os.environ.setdefault("RESULT_BACKEND", "redis://localhost:6379/0")
+
 # 현재 디렉토리를 시스템 경로에 추가
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
@@ -0,0 +1,192 @@
+"""
+Celery 큐 분리 벤치마크 (수집/분석 혼합 부하)
+
+사용법 (backend 디렉토리에서 실행, 로컬 Redis 필요):
+    docker run -d --name bench-redis -p 6379:6379 redis:7-alpine
+    python script/benchmark_celery_queues.py --collect 300 --analysis 8
+
+- shared: 기존 구성처럼 prefork 워커 하나가 한 큐에서 두 종류 태스크를 모두 실행
+- split: collect 큐는 스레드 풀 워커(높은 동시 실행 수, prefetch 4),
+  analysis 큐는 prefork 워커(prefetch 1)가 따로 실행
+- 수집 태스크는 Garmin 응답 대기, 분석 태스크는 LLM 응답 대기를 sleep으로 흉내냄
+  (실제 API/DB를 쓰지 않으므로 큐/풀 구성 차이만 비교)
+- 분석 태스크를 먼저 넣은 뒤 수집 태스크를 넣어 분석이 수집을 막는지 확인
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from celery import Celery
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BROKER_URL = os.getenv("BENCH_BROKER_URL", "redis://localhost:6379/15")
+
+SHARED_QUEUE = "bench-shared"
+COLLECT_QUEUE = "bench-collect"
+ANALYSIS_QUEUE = "bench-analysis"
+
+bench_app = Celery("bench_queues", broker=BROKER_URL, backend=BROKER_URL)
+bench_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    result_serializer="json",
+    worker_hijack_root_logger=False,
+)
+
+
+@bench_app.task(name="bench-collect")
+def bench_collect(sent_at: float, io_seconds: float) -> float:
+    """Garmin API 응답 대기와 같은 I/O 대기"""
+    time.sleep(io_seconds)
+    return time.time() - sent_at
+
+
+@bench_app.task(name="bench-analysis")
+def bench_analysis(sent_at: float, llm_seconds: float) -> float:
+    """LLM 응답 대기 여러 번으로 워커를 오래 점유"""
+    for _ in range(4):
+        time.sleep(llm_seconds / 4)
+    return time.time() - sent_at
+
+
+def start_worker(name: str, queue: str, pool: str, concurrency: int, prefetch: int):
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "celery",
+            "-A",
+            "benchmark_celery_queues",
+            "worker",
+            "--loglevel=warning",
+            "-n",
+            f"{name}@%h",
+            "-Q",
+            queue,
+            "-P",
+            pool,
+            "-c",
+            str(concurrency),
+            "--prefetch-multiplier",
+            str(prefetch),
+            "--without-gossip",
+            "--without-mingle",
+            "--without-heartbeat",
+        ],
+        cwd=SCRIPT_DIR,
+        env=dict(os.environ, PYTHONPATH=SCRIPT_DIR),
+    )
+
+
+def wait_for_workers(count: int, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if len(bench_app.control.ping(timeout=0.5) or []) >= count:
+            return
+    sys.exit("워커가 시작되지 않았습니다 (Redis 연결 확인)")
+
+
+def percentile(values, ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def purge_queues() -> None:
+    """이전 실행에서 남은 메시지 제거"""
+    with bench_app.connection_for_write() as connection:
+        for queue in (SHARED_QUEUE, COLLECT_QUEUE, ANALYSIS_QUEUE):
+            connection.default_channel.queue_purge(queue)
+
+
+def run(mode: str, args) -> None:
+    purge_queues()
+    if mode == "shared":
+        workers = [
+            start_worker("shared", SHARED_QUEUE, "prefork", args.shared_concurrency, 4)
+        ]
+        collect_queue = analysis_queue = SHARED_QUEUE
+    else:
+        workers = [
+            start_worker(
+                "collect", COLLECT_QUEUE, "threads", args.collect_concurrency, 4
+            ),
+            start_worker(
+                "analysis", ANALYSIS_QUEUE, "prefork", args.analysis_concurrency, 1
+            ),
+        ]
+        collect_queue, analysis_queue = COLLECT_QUEUE, ANALYSIS_QUEUE
+
+    try:
+        wait_for_workers(len(workers))
+        started_at = time.time()
+        analysis_results = [
+            bench_analysis.apply_async(
+                (time.time(), args.llm_seconds), queue=analysis_queue
+            )
+            for _ in range(args.analysis)
+        ]
+        collect_results = [
+            bench_collect.apply_async(
+                (time.time(), args.io_seconds), queue=collect_queue
+            )
+            for _ in range(args.collect)
+        ]
+        collect_latencies = [result.get(timeout=3600) for result in collect_results]
+        collect_done_at = time.time()
+        analysis_latencies = [result.get(timeout=3600) for result in analysis_results]
+        finished_at = time.time()
+    finally:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.wait()
+
+    print(
+        f"{mode:<7} 수집 {args.collect / (collect_done_at - started_at):7.1f} tasks/s  "
+        f"지연 p50 {statistics.median(collect_latencies):6.2f}s "
+        f"p95 {percentile(collect_latencies, 0.95):6.2f}s  |  "
+        f"분석 지연 p50 {statistics.median(analysis_latencies):6.2f}s "
+        f"최대 {max(analysis_latencies):6.2f}s  |  전체 "
+        f"{finished_at - started_at:6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Celery 큐 분리 벤치마크")
+    parser.add_argument("--collect", type=int, default=300, help="수집 태스크 수")
+    parser.add_argument("--analysis", type=int, default=8, help="분석 태스크 수")
+    parser.add_argument(
+        "--io-seconds", type=float, default=0.3, help="수집 태스크 I/O 대기 (초)"
+    )
+    parser.add_argument(
+        "--llm-seconds", type=float, default=8.0, help="분석 태스크 LLM 대기 (초)"
+    )
+    parser.add_argument(
+        "--shared-concurrency", type=int, default=4, help="shared 워커 프로세스 수"
+    )
+    parser.add_argument(
+        "--collect-concurrency", type=int, default=32, help="수집 워커 스레드 수"
+    )
+    parser.add_argument(
+        "--analysis-concurrency", type=int, default=2, help="분석 워커 프로세스 수"
+    )
+    parser.add_argument(
+        "--mode", choices=("shared", "split", "both"), default="both", help="실행 구성"
+    )
+    args = parser.parse_args()
+
+    print(
+        f"수집 {args.collect}개 x {args.io_seconds}s, "
+        f"분석 {args.analysis}개 x {args.llm_seconds}s ({BROKER_URL})"
+    )
+    modes = ("shared", "split") if args.mode == "both" else (args.mode,)
+    for mode in modes:
+        run(mode, args)
+
+
+if __name__ == "__main__":
+    main()
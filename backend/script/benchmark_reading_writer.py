@@ -0,0 +1,103 @@
+"""
+시계열 측정값 저장 방식 벤치마크 (orm / executemany / copy / upsert)
+
+사용법 (backend 디렉토리에서 실행, SYNC_DATABASE_URL의 DB 사용):
+    python script/benchmark_reading_writer.py --days 7 --repeat 3
+
+모든 쓰기는 하나의 트랜잭션 안에서 실행한 뒤 롤백하므로 DB에 데이터가 남지 않음
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.model import HeartRateDaily, HeartRateReading, User  # noqa: E402
+from app.service.reading_writer import (  # noqa: E402
+    WRITE_MODE_COPY,
+    WRITE_MODE_EXECUTEMANY,
+    WRITE_MODE_ORM,
+    WRITE_MODE_UPSERT,
+    ReadingBulkWriter,
+)
+from core.db.celery_session import SessionFactory  # noqa: E402
+
+BENCHMARK_USER_ID = -1
+READINGS_PER_DAY = 720  # 2분 간격 심박수
+
+
+def build_day(target_date: date) -> HeartRateDaily:
+    """하루치 심박수 일일 요약과 측정값 생성"""
+    daily = HeartRateDaily(
+        user_id=BENCHMARK_USER_ID,
+        date=target_date,
+        resting_hr=55,
+        max_hr=160,
+        min_hr=48,
+        avg_hr=72,
+    )
+    day_start = datetime.combine(target_date, datetime.min.time())
+    for index in range(READINGS_PER_DAY):
+        start_time_local = day_start + timedelta(minutes=2 * index)
+        HeartRateReading(
+            start_time_gmt=start_time_local.replace(tzinfo=timezone.utc),
+            start_time_local=start_time_local,
+            heart_rate=60 + index % 40,
+            daily_summary=daily,
+        )
+    return daily
+
+
+def run(mode: str, days: int) -> float:
+    """지정한 방식으로 days일치 데이터를 저장하고 초당 저장 행 수 반환"""
+    session = SessionFactory()
+    try:
+        session.add(
+            User(
+                id=BENCHMARK_USER_ID,
+                email="benchmark@example.com",
+                oauth_token="benchmark",
+                oauth_token_secret="benchmark",
+            )
+        )
+        session.flush()
+
+        dailies = [build_day(date(2024, 1, 1) + timedelta(days=i)) for i in range(days)]
+        writer = ReadingBulkWriter(session, mode) if mode != WRITE_MODE_ORM else None
+
+        started_at = time.perf_counter()
+        for daily in dailies:
+            if writer is None:
+                session.add(daily)
+                session.flush()
+            else:
+                writer.write(daily, {"readings": list(daily.readings)})
+        elapsed = time.perf_counter() - started_at
+    finally:
+        session.rollback()
+        session.close()
+
+    return days * READINGS_PER_DAY / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시계열 측정값 저장 방식 벤치마크")
+    parser.add_argument("--days", type=int, default=7, help="저장할 일 수")
+    parser.add_argument("--repeat", type=int, default=3, help="방식별 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"심박수 {args.days}일 x {READINGS_PER_DAY}건, {args.repeat}회 반복")
+    modes = (WRITE_MODE_ORM, WRITE_MODE_EXECUTEMANY, WRITE_MODE_COPY, WRITE_MODE_UPSERT)
+    for mode in modes:
+        rates = [run(mode, args.days) for _ in range(args.repeat)]
+        print(
+            f"{mode:>12}: 최고 {max(rates):>10,.0f} rows/s, 평균 "
+            f"{sum(rates) / len(rates):>10,.0f} rows/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
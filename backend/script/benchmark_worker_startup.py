@@ -0,0 +1,119 @@
+"""
+Celery 워커 프로세스 재사용 벤치마크 (태스크마다 새 프로세스 vs 상주 프로세스)
+
+사용법 (backend 디렉토리에서 실행, SYNC_DATABASE_URL의 DB 사용):
+    python script/benchmark_worker_startup.py --tasks 20
+    python script/benchmark_worker_startup.py --tasks 20 --no-db
+
+- recycle: worker_max_tasks_per_child=1과 같이 태스크마다 새 프로세스에서
+  워커 모듈 import, 엔진 생성, DB 연결 후 태스크 1개 실행
+- persistent: 한 프로세스에서 import 1회 후 같은 연결 풀로 태스크를 이어서 실행
+- 태스크 본문은 DatabaseTask와 같이 세션을 열고 조회 1회 후 닫음 (--no-db면 생략)
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(tasks: int, use_db: bool) -> None:
+    """워커 프로세스 역할: import 시간과 태스크별 실행 시간을 JSON으로 출력"""
+    started_at = time.perf_counter()
+    sys.path.insert(0, BACKEND_DIR)
+    from sqlalchemy import text
+
+    import task  # noqa: F401  (워커가 불러오는 태스크 모듈 전체)
+    from core.db.celery_session import SessionFactory, engine
+
+    imported_at = time.perf_counter()
+    durations = []
+    for _ in range(tasks):
+        task_started_at = time.perf_counter()
+        if use_db:
+            session = SessionFactory()
+            try:
+                session.execute(text("SELECT 1")).scalar()
+                session.commit()
+            finally:
+                session.close()
+        durations.append(time.perf_counter() - task_started_at)
+    engine.dispose()
+
+    print(
+        json.dumps(
+            {
+                "import_seconds": imported_at - started_at,
+                "task_seconds": durations,
+            }
+        )
+    )
+
+
+def spawn(tasks: int, use_db: bool) -> dict:
+    """새 인터프리터에서 child 실행 (프로세스 시작 시간 포함)"""
+    command = [sys.executable, os.path.abspath(__file__), "--child", str(tasks)]
+    if not use_db:
+        command.append("--no-db")
+    started_at = time.perf_counter()
+    completed = subprocess.run(command, cwd=BACKEND_DIR, capture_output=True, text=True)
+    if completed.returncode != 0:
+        sys.exit(f"워커 프로세스 실행 실패:\n{completed.stderr}")
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["wall_seconds"] = time.perf_counter() - started_at
+    return result
+
+
+def report(name: str, first_task: list, per_task: list, total: float) -> None:
+    print(
+        f"{name:<10} 첫 태스크 완료까지 {statistics.median(first_task) * 1000:8.1f}ms  "
+        f"태스크당 {statistics.median(per_task) * 1000:8.2f}ms  "
+        f"전체 {total:6.2f}s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 프로세스 재사용 벤치마크")
+    parser.add_argument("--tasks", type=int, default=20, help="실행할 태스크 수")
+    parser.add_argument("--no-db", action="store_true", help="DB 조회 생략")
+    parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    use_db = not args.no_db
+
+    if args.child is not None:
+        child(args.child, use_db)
+        return
+
+    # 태스크마다 새 프로세스: 프로세스 시작 + import + 연결이 매번 포함
+    recycle = [spawn(1, use_db) for _ in range(args.tasks)]
+    recycle_latencies = [result["wall_seconds"] for result in recycle]
+    report(
+        "recycle",
+        recycle_latencies,
+        recycle_latencies,
+        sum(recycle_latencies),
+    )
+
+    # 상주 프로세스: 시작 비용은 한 번, 이후 태스크는 풀의 연결 재사용
+    persistent = spawn(args.tasks, use_db)
+    task_seconds = persistent["task_seconds"]
+    first_task = persistent["wall_seconds"] - sum(task_seconds[1:])
+    report(
+        "persistent",
+        [first_task],
+        task_seconds[1:] or task_seconds,
+        persistent["wall_seconds"],
+    )
+    print(
+        f"\nimport 시간 중앙값: "
+        f"{statistics.median(r['import_seconds'] for r in recycle) * 1000:.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
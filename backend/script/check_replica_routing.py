@@ -0,0 +1,133 @@
+"""
+읽기/쓰기 세션 라우팅 확인 (primary + 복제본 로컬 구성)
+
+로컬에서 Postgres 두 개로 스트리밍 복제 구성:
+    docker network create pg-replica
+    docker run -d --name pg-primary --network pg-replica -p 5432:5432 \\
+        -e POSTGRES_PASSWORD=postgres -e POSTGRES_DB=garmin_db \\
+        postgres:16 -c wal_level=replica -c hot_standby=on
+    docker exec pg-primary sh -c \\
+        "echo 'host replication all all trust' >> \\$PGDATA/pg_hba.conf" && \\
+        docker exec -u postgres pg-primary pg_ctl reload
+    docker run -d --name pg-replica --network pg-replica -p 5433:5432 \\
+        -e PGPASSWORD=postgres postgres:16 sh -c \\
+        "rm -rf /tmp/data && pg_basebackup -h pg-primary -U postgres -D /tmp/data \\
+         -R -X stream && chmod 700 /tmp/data && chown -R postgres /tmp/data && \\
+         su postgres -c 'postgres -D /tmp/data'"
+
+사용법 (backend 디렉토리에서 실행):
+    REPLICA=postgres:postgres@localhost:5433/garmin_db
+    SYNC_REPLICA_DATABASE_URL=postgresql://$REPLICA \\
+    REPLICA_DATABASE_URL=postgresql+asyncpg://$REPLICA \\
+        python script/check_replica_routing.py
+
+- 동기(에이전트 도구)/비동기(API) 조회 세션이 각각 어느 서버에서 실행되는지 출력
+- --max-lag 0 --pause-replay 로 복제 재생을 멈추고 primary에 쓰기를 하면
+  지연이 생겨 primary로 되돌아가는지 확인 가능 (확인 후 재생 재개)
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+
+from core.db import (  # noqa: E402
+    SessionFactory,
+    celery_session,
+    create_read_session,
+    get_read_session,
+)
+from core.db import session as async_session  # noqa: E402
+
+SERVER_QUERY = text(
+    "SELECT pg_is_in_recovery(), inet_server_port(), current_database()"
+)
+
+
+def describe(row) -> str:
+    in_recovery, port, database = row
+    role = "replica" if in_recovery else "primary"
+    return f"{role} (port {port}, db {database})"
+
+
+def check_sync() -> None:
+    """에이전트 도구가 쓰는 동기 조회 세션"""
+    session = create_read_session()
+    try:
+        row = session.execute(SERVER_QUERY).one()
+    finally:
+        session.close()
+    guard = celery_session.replica_guard
+    print(f"[sync ] 조회 세션: {describe(row)}, 복제 지연: {guard.lag}")
+
+
+async def check_async() -> None:
+    """API 의존성이 쓰는 비동기 조회 세션"""
+    async for session in get_read_session():
+        row = (await session.execute(SERVER_QUERY)).one()
+    guard = async_session.replica_guard
+    print(f"[async] 조회 세션: {describe(row)}, 복제 지연: {guard.lag}")
+
+
+def write_heartbeat() -> None:
+    """primary에 쓰기를 만들어 복제 지연 유발"""
+    session = SessionFactory()
+    try:
+        session.execute(text("SELECT txid_current()"))
+        session.commit()
+    finally:
+        session.close()
+
+
+def set_replay_paused(paused: bool) -> None:
+    """복제본의 WAL 재생 일시 정지/재개"""
+    engine = celery_session.replica_engine
+    function = "pg_wal_replay_pause" if paused else "pg_wal_replay_resume"
+    with engine.connect() as conn:
+        conn.execute(text(f"SELECT {function}()"))
+
+
+async def run(pause_replay: bool) -> None:
+    check_sync()
+    await check_async()
+
+    if pause_replay and celery_session.replica_engine is not None:
+        set_replay_paused(True)
+        try:
+            write_heartbeat()
+            time.sleep(1)
+            write_heartbeat()
+            print("복제 재생 정지 + primary 쓰기 후:")
+            check_sync()
+            await check_async()
+        finally:
+            set_replay_paused(False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="읽기/쓰기 세션 라우팅 확인")
+    parser.add_argument("--max-lag", type=float, help="허용 복제 지연 재정의 (초)")
+    parser.add_argument(
+        "--pause-replay",
+        action="store_true",
+        help="복제 재생을 멈추고 primary 쓰기 후 fallback 확인",
+    )
+    args = parser.parse_args()
+
+    if celery_session.replica_engine is None:
+        print("SYNC_REPLICA_DATABASE_URL이 없어 모든 조회가 primary로 갑니다")
+    for guard in (celery_session.replica_guard, async_session.replica_guard):
+        guard.check_interval = 0
+        if args.max_lag is not None:
+            guard.max_lag_seconds = args.max_lag
+
+    asyncio.run(run(args.pause_replay))
+
+
+if __name__ == "__main__":
+    main()
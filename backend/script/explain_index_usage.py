@@ -0,0 +1,339 @@
+"""
+에이전트 도구/수집기 쿼리 실행 계획 회귀 검사 (EXPLAIN)
+
+사용법 (backend 디렉토리에서 실행, SYNC_DATABASE_URL의 DB 사용, 마이그레이션 적용 필요):
+    python script/explain_index_usage.py --days 35
+
+- 테스트 사용자 데이터를 넣고 실제 도구/수집기 코드를 실행하면서
+  나간 SQL을 캡처한 뒤 EXPLAIN
+- seq scan/bitmap scan을 끄고 계획을 세우므로, 인덱스로 처리할 수 없는 조건이면
+  (인덱스 누락, 컬럼에 함수 적용 등) 데이터 양과 관계없이 Seq Scan이 남아 실패로 표시
+- 모든 작업은 하나의 트랜잭션 안에서 실행한 뒤 롤백하므로 DB에 데이터가 남지 않음
+- 회귀가 있으면 종료 코드 1
+"""
+
+import argparse
+import os
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, select  # noqa: E402
+
+from app.agent.tool import (  # noqa: E402
+    ActivitySummaryTool,
+    HeartRateSummaryTool,
+    HeartRateTimeSeriesTool,
+    MetricRollupTool,
+    PeriodSummaryTool,
+    SleepSummaryTool,
+    SleepTimeSeriesTool,
+    StepsSummaryTool,
+    StepsTimeSeriesTool,
+    StressSummaryTool,
+    StressTimeSeriesTool,
+)
+from app.model import (  # noqa: E402
+    Activity,
+    HeartRateDaily,
+    HeartRateReading,
+    SleepHRVReading,
+    SleepMovement,
+    SleepSession,
+    StepsDaily,
+    StepsIntraday,
+    StressDaily,
+    StressReading,
+    User,
+)
+from app.service.data_collector_service import (  # noqa: E402
+    ActivityCollector,
+    HeartRateCollector,
+    SleepCollector,
+    StepsCollector,
+    StressCollector,
+)
+from app.service.period_aggregate_service import PeriodAggregateService  # noqa: E402
+from core.db.celery_session import SessionFactory  # noqa: E402
+
+EXPLAIN_USER_ID = -2
+TARGET_DATE = date(2024, 3, 15)
+INDEX_SCANS = {"Index Scan", "Index Only Scan"}
+
+# 검사할 테이블 (파티션은 "<테이블>_" 접두사로 매칭)
+CHECKED_TABLES = (
+    "heart_rate_daily",
+    "heart_rate_readings",
+    "stress_daily",
+    "stress_readings",
+    "steps_daily",
+    "steps_intraday",
+    "sleep_sessions",
+    "sleep_movement",
+    "sleep_hrv_readings",
+    "activities",
+    "period_aggregates",
+    "metric_rollups",
+)
+
+
+def seed(session, days: int) -> None:
+    """테스트 사용자의 일일 요약, 측정값, 활동 생성"""
+    session.add(
+        User(
+            id=EXPLAIN_USER_ID,
+            email="explain@example.com",
+            oauth_token="explain",
+            oauth_token_secret="explain",
+        )
+    )
+    session.flush()
+
+    for offset in range(days):
+        target_date = TARGET_DATE - timedelta(days=offset)
+        day_start = datetime.combine(target_date, datetime.min.time())
+        heart_rate = HeartRateDaily(
+            user_id=EXPLAIN_USER_ID, date=target_date, resting_hr=55, avg_hr=70
+        )
+        stress = StressDaily(
+            user_id=EXPLAIN_USER_ID, date=target_date, avg_stress_level=30
+        )
+        steps = StepsDaily(
+            user_id=EXPLAIN_USER_ID, date=target_date, total_steps=8000, goal_steps=7000
+        )
+        sleep = SleepSession(
+            user_id=EXPLAIN_USER_ID,
+            date=target_date,
+            start_time_gmt=(day_start - timedelta(hours=1)).replace(
+                tzinfo=timezone.utc
+            ),
+            end_time_gmt=(day_start + timedelta(hours=7)).replace(tzinfo=timezone.utc),
+            start_time_local=day_start - timedelta(hours=1),
+            end_time_local=day_start + timedelta(hours=7),
+            total_seconds=28800,
+        )
+        for minute in range(0, 24 * 60, 15):
+            local = day_start + timedelta(minutes=minute)
+            gmt = local.replace(tzinfo=timezone.utc)
+            HeartRateReading(
+                start_time_gmt=gmt,
+                start_time_local=local,
+                heart_rate=70,
+                daily_summary=heart_rate,
+            )
+            StressReading(
+                start_time_gmt=gmt,
+                start_time_local=local,
+                stress_level=30,
+                daily_summary=stress,
+            )
+            StepsIntraday(
+                start_time_gmt=gmt,
+                end_time_gmt=gmt + timedelta(minutes=15),
+                start_time_local=local,
+                end_time_local=local + timedelta(minutes=15),
+                steps=100,
+                daily_summary=steps,
+            )
+            if minute < 7 * 60:
+                SleepMovement(
+                    start_time_gmt=gmt,
+                    start_time_local=local,
+                    activity_level=1,
+                    session=sleep,
+                )
+                SleepHRVReading(
+                    start_time_gmt=gmt,
+                    start_time_local=local,
+                    hrv_value=40,
+                    session=sleep,
+                )
+        activity = Activity(
+            user_id=EXPLAIN_USER_ID,
+            activity_type="running",
+            start_time_utc=(day_start + timedelta(hours=18)).replace(
+                tzinfo=timezone.utc
+            ),
+            start_time_local=day_start + timedelta(hours=18),
+            end_time_utc=(day_start + timedelta(hours=19)).replace(tzinfo=timezone.utc),
+            end_time_local=day_start + timedelta(hours=19),
+        )
+        session.add_all([heart_rate, stress, steps, sleep, activity])
+    session.flush()
+
+
+def build_cases(session) -> List[Tuple[str, Callable[[], Any], Optional[set]]]:
+    """(이름, 실행 함수, 허용 스캔 종류) 목록 (None이면 INDEX_SCANS)"""
+    start_date = TARGET_DATE - timedelta(days=29)
+    range_args = dict(
+        user_id=EXPLAIN_USER_ID, start_date=start_date, end_date=TARGET_DATE
+    )
+    day_args = dict(user_id=EXPLAIN_USER_ID, target_date=TARGET_DATE)
+
+    cases = []
+    for tool in (
+        HeartRateSummaryTool(),
+        StepsSummaryTool(),
+        StressSummaryTool(),
+        SleepSummaryTool(),
+        ActivitySummaryTool(),
+        PeriodSummaryTool(),
+    ):
+        cases.append(
+            (tool.name, lambda tool=tool: tool._execute(session, **range_args), None)
+        )
+    for tool in (
+        HeartRateTimeSeriesTool(),
+        StepsTimeSeriesTool(),
+        StressTimeSeriesTool(),
+        SleepTimeSeriesTool(),
+    ):
+        cases.append(
+            (tool.name, lambda tool=tool: tool._execute(session, **day_args), None)
+        )
+    rollup_tool = MetricRollupTool()
+    cases.append(
+        (
+            rollup_tool.name,
+            lambda: rollup_tool._execute(session, metric="heart_rate", **range_args),
+            None,
+        )
+    )
+
+    # 증분 수집의 일일 행 id 조회는 INCLUDE (id) 인덱스만으로 끝나야 함
+    cases.append(
+        (
+            "incremental_daily_id",
+            lambda: session.execute(
+                select(HeartRateDaily.id).where(
+                    HeartRateDaily.user_id == EXPLAIN_USER_ID,
+                    HeartRateDaily.date == TARGET_DATE,
+                )
+            ).all(),
+            {"Index Only Scan"},
+        )
+    )
+    cases.append(
+        (
+            "period_aggregate_refresh",
+            lambda: PeriodAggregateService(session).refresh_day(
+                EXPLAIN_USER_ID, TARGET_DATE
+            ),
+            None,
+        )
+    )
+    for collector_class in (
+        HeartRateCollector,
+        StressCollector,
+        StepsCollector,
+        SleepCollector,
+        ActivityCollector,
+    ):
+        collector = collector_class(None, {}, session)
+        cases.append(
+            (
+                f"{collector_class.__name__}.delete_existing_data",
+                lambda collector=collector: collector.delete_existing_data(
+                    EXPLAIN_USER_ID, TARGET_DATE
+                ),
+                None,
+            )
+        )
+    return cases
+
+
+def capture_statements(session, run: Callable[[], Any]) -> List[Tuple[str, Any]]:
+    """run 실행 중 나간 SELECT/DELETE/UPDATE 문과 파라미터"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        if not many and statement.lstrip().split(None, 1)[0].upper() in (
+            "SELECT",
+            "DELETE",
+            "UPDATE",
+        ):
+            statements.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        run()
+        session.flush()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def checked_table(relation: str) -> Optional[str]:
+    """계획 노드의 테이블(파티션 포함)이 검사 대상이면 테이블 이름"""
+    for table in CHECKED_TABLES:
+        if relation == table or relation.startswith(f"{table}_"):
+            return table
+    return None
+
+
+def collect_scans(plan: Dict[str, Any], scans: List[Tuple[str, str]]) -> None:
+    """계획 트리에서 검사 대상 테이블의 (테이블, 스캔 종류) 수집"""
+    relation = plan.get("Relation Name")
+    table = checked_table(relation) if relation else None
+    if table and plan["Node Type"].endswith("Scan"):
+        scans.append((table, plan["Node Type"]))
+    for child in plan.get("Plans", []):
+        collect_scans(child, scans)
+
+
+def explain(session, statement: str, parameters: Any) -> List[Tuple[str, str]]:
+    """EXPLAIN (FORMAT JSON) 결과에서 검사 대상 스캔 목록"""
+    result = (
+        session.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        .scalar()
+    )
+    scans: List[Tuple[str, str]] = []
+    collect_scans(result[0]["Plan"], scans)
+    return scans
+
+
+def check(session, cases: Sequence) -> int:
+    """모든 케이스 검사 후 실패 수 반환"""
+    failures = 0
+    for name, run, allowed in cases:
+        allowed = allowed or INDEX_SCANS
+        for statement, parameters in capture_statements(session, run):
+            scans = explain(session, statement, parameters)
+            bad = [(table, node) for table, node in scans if node not in allowed]
+            status = "FAIL" if bad else "ok"
+            summary = ", ".join(f"{table}: {node}" for table, node in scans) or "-"
+            print(f"[{status:>4}] {name:<40} {summary}")
+            if bad:
+                failures += 1
+                print(f"       {' '.join(statement.split())}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쿼리 실행 계획 인덱스 사용 검사")
+    parser.add_argument("--days", type=int, default=35, help="생성할 일 수")
+    args = parser.parse_args()
+
+    session = SessionFactory()
+    try:
+        seed(session, args.days)
+        # 인덱스로 처리할 수 있으면 반드시 인덱스를 쓰도록 (작은 테이블에서도 안정적)
+        session.connection().exec_driver_sql("SET LOCAL enable_seqscan = off")
+        session.connection().exec_driver_sql("SET LOCAL enable_bitmapscan = off")
+        failures = check(session, build_cases(session))
+    finally:
+        session.rollback()
+        session.close()
+
+    if failures:
+        print(f"\n인덱스를 사용하지 않는 쿼리 {failures}개")
+        sys.exit(1)
+    print("\n모든 쿼리가 인덱스를 사용합니다")
+
+
+if __name__ == "__main__":
+    main()
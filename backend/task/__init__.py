@@ -8,9 +8,17 @@ Celery 작업 패키지
 """
 
 from .agent_task import analysis_health_query
-from .garmin_collector import collect_fit_data
+from .garmin_collector import (
+    collect_fit_data,
+    collect_fit_data_range,
+    replay_raw_payloads,
+)
+from .partition_manager import archive_cold_partitions
 
 __all__ = [
     "analysis_health_query",
     "collect_fit_data",
+    "collect_fit_data_range",
+    "replay_raw_payloads",
+    "archive_cold_partitions",
 ]
@@ -5,13 +5,21 @@ from langchain_core.tracers.langchain import wait_for_all_tracers
 
 from app.agent.react_agent import create_agent
 from core.celery_app import celery_app
+from core.config import ANALYSIS_SOFT_TIME_LIMIT, ANALYSIS_TIME_LIMIT
 from core.db.celery_session import DatabaseTask
 from task.util import get_user_by_kakao_id, handle_task_failure
 
 logger = logging.getLogger(__name__)
 
 
-@celery_app.task(bind=True, base=DatabaseTask, name="analysis-health", expires=172800)
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="analysis-health",
+    expires=172800,
+    soft_time_limit=ANALYSIS_SOFT_TIME_LIMIT,
+    time_limit=ANALYSIS_TIME_LIMIT,
+)
 def analysis_health_query(
     self: DatabaseTask,
     kakao_client_id: str,
@@ -1,21 +1,52 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
+from celery import chord
+
+from app.model import User
 from app.service import TokenService
 from core.celery_app import celery_app
+from core.config import (
+    COLLECT_FANOUT_ENABLED,
+    COLLECT_RANGE_SOFT_TIME_LIMIT,
+    COLLECT_RANGE_TIME_LIMIT,
+    COLLECT_SOFT_TIME_LIMIT,
+    COLLECT_TIME_LIMIT,
+    RESULT_BACKEND,
+)
 from core.db.celery_session import DatabaseTask
 from task.util import (
+    collect_garmin_collector_data,
     collect_garmin_daily_data,
+    collect_garmin_range_data,
     create_garmin_client_from_user,
     get_user_by_kakao_id,
     handle_task_failure,
+    list_garmin_collector_names,
+    merge_garmin_collector_results,
+    replay_garmin_raw_payloads,
     validate_garmin_sync_time,
 )
 
 logger = logging.getLogger(__name__)
 
+# chord는 결과 백엔드에서 서브태스크 완료를 세므로 Redis 결과 백엔드에서만 사용
+FANOUT_AVAILABLE = COLLECT_FANOUT_ENABLED and RESULT_BACKEND.startswith("redis")
+if COLLECT_FANOUT_ENABLED and not FANOUT_AVAILABLE:
+    logger.warning(
+        "COLLECT_FANOUT_ENABLED는 Redis 결과 백엔드가 필요합니다. 순차 수집으로 "
+        "실행합니다."
+    )
 
-@celery_app.task(bind=True, base=DatabaseTask, name="collect-fit-data", expires=21600)
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="collect-fit-data",
+    expires=21600,
+    soft_time_limit=COLLECT_SOFT_TIME_LIMIT,
+    time_limit=COLLECT_TIME_LIMIT,
+)
 def collect_fit_data(
     self: DatabaseTask, kakao_client_id: str, target_date: str, user_timezone: str
 ) -> Optional[dict]:
@@ -29,8 +60,152 @@ def collect_fit_data(
         user = get_user_by_kakao_id(self.session, kakao_client_id)
         garmin_client = create_garmin_client_from_user(user, token_service)
         validate_garmin_sync_time(garmin_client, target_date, user_timezone)
-        result = collect_garmin_daily_data(
-            self.session, garmin_client, user.id, target_date
+        if not FANOUT_AVAILABLE:
+            result = collect_garmin_daily_data(
+                self.session, garmin_client, user.id, target_date
+            )
+            logger.info(f"{log_prefix} 완료")
+            return result
+    except ValueError as ve:
+        handle_task_failure(self, ve, log_prefix)
+        raise Exception(str(ve))
+    except Exception as e:
+        handle_task_failure(self, e, log_prefix)
+        raise
+
+    # 컬렉터별 서브태스크로 나누고, 합친 결과는 이 태스크 ID로 저장
+    # (replace는 Ignore 예외로 태스크를 끝내므로 try 밖에서 호출)
+    logger.info(f"{log_prefix} 컬렉터별 병렬 수집으로 전환")
+    fanout = chord(
+        [
+            collect_fit_data_part.s(user.id, target_date, collector_name)
+            for collector_name in list_garmin_collector_names()
+        ],
+        merge_fit_data_parts.s(user.id, target_date),
+    )
+    return self.replace(fanout)
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="collect-fit-data-part",
+    expires=21600,
+    soft_time_limit=COLLECT_SOFT_TIME_LIMIT,
+    time_limit=COLLECT_TIME_LIMIT,
+)
+def collect_fit_data_part(
+    self: DatabaseTask, user_id: int, target_date: str, collector_name: str
+) -> dict:
+    """일일 수집 팬아웃 서브태스크 (컬렉터 하나, 실패도 결과로 반환)"""
+    log_prefix = (
+        f"사용자 {user_id}의 {target_date} {collector_name} 수집 (Task ID: "
+        f"{self.request.id})"
+    )
+    try:
+        user = self.session.get(User, user_id)
+        if user is None:
+            raise ValueError(f"사용자 {user_id}를 찾을 수 없습니다.")
+        garmin_client = create_garmin_client_from_user(user, TokenService())
+        return collect_garmin_collector_data(
+            self.session, garmin_client, user_id, target_date, collector_name
+        )
+    except Exception as e:
+        # chord 콜백이 실행되도록 예외 대신 오류를 결과로 전달
+        logger.error(f"{log_prefix} 실패: {str(e)}", exc_info=True)
+        return {
+            "collector": collector_name,
+            "result": None,
+            "error": f"{collector_name}: {str(e)}",
+        }
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="collect-fit-data-merge",
+    expires=21600,
+    soft_time_limit=COLLECT_SOFT_TIME_LIMIT,
+    time_limit=COLLECT_TIME_LIMIT,
+)
+def merge_fit_data_parts(
+    self: DatabaseTask, parts: List[dict], user_id: int, target_date: str
+) -> Optional[dict]:
+    """팬아웃 서브태스크 결과 취합 (collect-fit-data와 같은 결과 형태)"""
+    log_prefix = (
+        f"사용자 {user_id}의 {target_date} Garmin 데이터 수집 (Task ID: "
+        f"{self.request.id})"
+    )
+    try:
+        result = merge_garmin_collector_results(
+            self.session, user_id, target_date, parts
+        )
+        logger.info(f"{log_prefix} 완료")
+        return result
+    except Exception as e:
+        handle_task_failure(self, e, log_prefix)
+        raise
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name="collect-fit-data-range",
+    expires=21600,
+    soft_time_limit=COLLECT_RANGE_SOFT_TIME_LIMIT,
+    time_limit=COLLECT_RANGE_TIME_LIMIT,
+)
+def collect_fit_data_range(
+    self: DatabaseTask,
+    kakao_client_id: str,
+    start_date: str,
+    end_date: str,
+    user_timezone: str,
+) -> Optional[dict]:
+    """Garmin 기간 데이터 수집 태스크 (인증 1회, 날짜별 결과 반환)"""
+    log_prefix = (
+        f"사용자 {kakao_client_id}의 {start_date} ~ {end_date} Garmin 데이터 수집 "
+        f"(Task ID: {self.request.id})"
+    )
+    logger.info(f"{log_prefix} 시작")
+
+    token_service = TokenService()
+
+    try:
+        user = get_user_by_kakao_id(self.session, kakao_client_id)
+        garmin_client = create_garmin_client_from_user(user, token_service)
+        validate_garmin_sync_time(garmin_client, end_date, user_timezone)
+        result = collect_garmin_range_data(
+            self.session, garmin_client, user.id, start_date, end_date
+        )
+        logger.info(f"{log_prefix} 완료")
+        return result
+    except ValueError as ve:
+        handle_task_failure(self, ve, log_prefix)
+        raise Exception(str(ve))
+    except Exception as e:
+        handle_task_failure(self, e, log_prefix)
+        raise
+
+
+@celery_app.task(bind=True, base=DatabaseTask, name="replay-raw-payloads")
+def replay_raw_payloads(
+    self: DatabaseTask,
+    start_date: str,
+    end_date: str,
+    user_id: Optional[int] = None,
+) -> Optional[dict]:
+    """보관된 원본 응답 재처리 태스크 (매퍼 변경 후 데이터 재생성, API 호출 없음)"""
+    target = f"사용자 {user_id}" if user_id is not None else "전체 사용자"
+    log_prefix = (
+        f"{target}의 {start_date} ~ {end_date} 원본 응답 재처리 (Task ID: "
+        f"{self.request.id})"
+    )
+    logger.info(f"{log_prefix} 시작")
+
+    try:
+        result = replay_garmin_raw_payloads(
+            self.session, start_date, end_date, user_id=user_id
         )
         logger.info(f"{log_prefix} 완료")
         return result
@@ -0,0 +1,38 @@
+import logging
+from typing import Optional
+
+from app.service.partition_archive_service import PartitionArchiver
+from core.celery_app import celery_app
+from core.config import PARTITION_ARCHIVE_ENABLED
+from core.db.celery_session import DatabaseTask
+from task.util import handle_task_failure
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True, base=DatabaseTask, name="archive-cold-partitions")
+def archive_cold_partitions(
+    self: DatabaseTask, retention_months: Optional[int] = None
+) -> Optional[dict]:
+    """보관 기간이 지난 측정값 파티션을 Parquet 파일로 옮기는 태스크"""
+    log_prefix = f"측정값 파티션 보관 (Task ID: {self.request.id})"
+    if not PARTITION_ARCHIVE_ENABLED:
+        logger.info(f"{log_prefix} 비활성화 상태, 건너뜀")
+        return None
+
+    logger.info(f"{log_prefix} 시작")
+    try:
+        archiver = (
+            PartitionArchiver(self.session)
+            if retention_months is None
+            else PartitionArchiver(self.session, retention_months=retention_months)
+        )
+        result = archiver.run()
+        logger.info(
+            f"{log_prefix} 완료: 보관 {len(result['archived'])}개, "
+            f"실패 {len(result['failed'])}개"
+        )
+        return result
+    except Exception as e:
+        handle_task_failure(self, e, log_prefix)
+        raise
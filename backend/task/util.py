@@ -1,7 +1,7 @@
 import logging
 import traceback
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional
 
 import pytz
 from sqlalchemy import select
@@ -9,7 +9,11 @@ from sqlalchemy.orm import Session
 
 from app.model import User
 from app.service import GarminDataCollectorService, TokenService
+from app.service.data_collector_service import COLLECTOR_PREFETCH_JOBS
+from app.service.reading_writer import WRITE_MODE_UPSERT
 from core.db import DatabaseTask
+from core.util.garmin_rate_limit import connectapi
+from core.util.sync_timestamp_cache import parse_sync_timestamp, sync_timestamp_cache
 
 logger = logging.getLogger(__name__)
 
@@ -39,24 +43,16 @@ def create_garmin_client_from_user(user: User, token_service: TokenService):
 
 
 def get_garmin_last_sync_time(garmin_client) -> datetime:
-    """Garmin 마지막 동기화 시간 조회 (UTC)"""
-    get_last_sync_time_str = garmin_client.connectapi(
-        "/wellness-service/wellness/syncTimestamp"
+    """Garmin 마지막 동기화 시간 조회 (UTC, 사용자별 짧은 TTL 캐시 사용)"""
+    get_last_sync_time_str = sync_timestamp_cache.get_or_fetch(
+        garmin_client.profile["displayName"],
+        lambda: connectapi(garmin_client, "/wellness-service/wellness/syncTimestamp"),
     )
-    try:
-        last_sync_time_utc = datetime.strptime(
-            get_last_sync_time_str, "%Y-%m-%dT%H:%M:%S.%f"
-        )
-    except ValueError:
-        try:
-            last_sync_time_utc = datetime.strptime(
-                get_last_sync_time_str, "%Y-%m-%dT%H:%M:%S"
-            )
-        except ValueError:
-            logger.error(f"알 수 없는 동기화 시간 형식: {get_last_sync_time_str}")
-            raise ValueError("동기화 시간 형식을 파싱할 수 없습니다.")
-
-    return last_sync_time_utc.replace(tzinfo=timezone.utc)
+    last_sync_time_utc = parse_sync_timestamp(get_last_sync_time_str)
+    if last_sync_time_utc is None:
+        logger.error(f"알 수 없는 동기화 시간 형식: {get_last_sync_time_str}")
+        raise ValueError("동기화 시간 형식을 파싱할 수 없습니다.")
+    return last_sync_time_utc
 
 
 def get_pytz_timezone(user_timezone_str: str) -> pytz.timezone:
@@ -113,6 +109,114 @@ def collect_garmin_daily_data(
     return result
 
 
+def list_garmin_collector_names() -> List[str]:
+    """일일 수집 팬아웃에서 서브태스크로 나눌 컬렉터 이름"""
+    return list(COLLECTOR_PREFETCH_JOBS)
+
+
+def collect_garmin_collector_data(
+    session: Session,
+    garmin_client,
+    user_id: int,
+    target_date_str: str,
+    collector_name: str,
+) -> dict:
+    """Garmin 일일 데이터 중 컬렉터 하나만 수집 (팬아웃 서브태스크)"""
+    collector_service = GarminDataCollectorService(
+        client=garmin_client, session=session
+    )
+    try:
+        target_date = datetime.strptime(target_date_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"잘못된 날짜 형식: {target_date_str}")
+
+    return collector_service.collect_collector_data(
+        user_id, target_date, collector_name
+    )
+
+
+def merge_garmin_collector_results(
+    session: Session, user_id: int, target_date_str: str, parts: List[dict]
+) -> dict:
+    """팬아웃 서브태스크 결과를 일일 수집 결과로 합침 (Garmin API 호출 없음)"""
+    collector_service = GarminDataCollectorService(
+        client=None, session=session, archive_raw=False
+    )
+    try:
+        target_date = datetime.strptime(target_date_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"잘못된 날짜 형식: {target_date_str}")
+
+    return collector_service.merge_collector_results(user_id, target_date, parts)
+
+
+def collect_garmin_range_data(
+    session: Session,
+    garmin_client,
+    user_id: int,
+    start_date_str: str,
+    end_date_str: str,
+) -> dict:
+    """Garmin 기간 데이터 수집 실행 (하나의 클라이언트로 여러 날짜 수집)"""
+    collector_service = GarminDataCollectorService(
+        client=garmin_client, session=session
+    )
+    try:
+        start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
+        end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"잘못된 날짜 형식: {start_date_str} ~ {end_date_str}")
+
+    return collector_service.collect_range(user_id, start_date, end_date)
+
+
+def replay_garmin_raw_payloads(
+    session: Session,
+    start_date_str: str,
+    end_date_str: str,
+    user_id: Optional[int] = None,
+) -> dict:
+    """
+    보관된 Garmin 원본 응답으로 기간 데이터 재처리 (Garmin API 호출 없음)
+    - user_id가 없으면 기간 내 원본 응답이 있는 모든 사용자 재처리
+
+    returns:
+        사용자별 {"succeeded": 성공 일수, "failed": {날짜: 오류 목록}}
+    """
+    collector_service = GarminDataCollectorService(
+        client=None,
+        session=session,
+        write_mode=WRITE_MODE_UPSERT,
+        incremental=False,
+        archive_raw=False,
+    )
+    try:
+        start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
+        end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"잘못된 날짜 형식: {start_date_str} ~ {end_date_str}")
+
+    user_ids = (
+        [user_id]
+        if user_id is not None
+        else collector_service.raw_archive.list_user_ids(start_date, end_date)
+    )
+
+    summary = {}
+    for target_user_id in user_ids:
+        results = collector_service.replay_range(target_user_id, start_date, end_date)
+        failed = {
+            date_str: result["errors"]
+            for date_str, result in results.items()
+            if len(result) == 1 and "errors" in result
+        }
+        summary[str(target_user_id)] = {
+            "succeeded": len(results) - len(failed),
+            "failed": failed,
+        }
+    return summary
+
+
 def handle_task_failure(
     task: DatabaseTask,
     error: Exception,
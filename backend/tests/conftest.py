@@ -0,0 +1,6 @@
+import os
+
+# core.config가 import 시점에 읽는 필수 환경 변수 (run_tests.py와 같은 기본값)
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+os.environ.setdefault("RESULT_BACKEND", "redis://localhost:6379/0")
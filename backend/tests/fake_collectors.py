@@ -0,0 +1,89 @@
+"""
+테스트용 컬렉터 (Garmin 응답 대신 미리 만든 모델을 매핑 결과로 반환)
+
+수집 서비스의 저장 경로(증분/삭제/저장/워터마크)는 실제 코드 그대로 실행
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from app.model import HeartRateDaily, HeartRateReading, SleepMovement, SleepSession
+from app.service.data_collector_service import HeartRateCollector, SleepCollector
+
+TARGET_DATE = date(2024, 1, 15)
+DAY_START = datetime(2024, 1, 15)
+
+
+def heart_rate_values(count: int, offset: int = 0) -> List[int]:
+    return [60 + offset + index % 30 for index in range(count)]
+
+
+class FakeHeartRateCollector(HeartRateCollector):
+    """values의 측정값을 target_date 0시부터 2분 간격으로 매핑"""
+
+    def __init__(self, session, values: List[int], resting_hr: int = 55):
+        super().__init__(None, {}, session)
+        self.values = values
+        self.resting_hr = resting_hr
+
+    def fetch_data(self, date_str: str) -> Optional[Dict]:
+        return {"values": self.values}
+
+    def map_data(self, user_id: int, target_date: date, data: Dict) -> Dict:
+        daily = HeartRateDaily(
+            user_id=user_id,
+            date=target_date,
+            resting_hr=self.resting_hr,
+            max_hr=max(self.values),
+            min_hr=min(self.values),
+            avg_hr=sum(self.values) // len(self.values),
+        )
+        day_start = datetime.combine(target_date, datetime.min.time())
+        readings = [
+            HeartRateReading(
+                start_time_gmt=(day_start + timedelta(minutes=2 * index)).replace(
+                    tzinfo=timezone.utc
+                ),
+                start_time_local=day_start + timedelta(minutes=2 * index),
+                heart_rate=value,
+                daily_summary=daily,
+            )
+            for index, value in enumerate(self.values)
+        ]
+        return {"daily_summary": daily, "readings": readings}
+
+
+class FakeSleepCollector(SleepCollector):
+    """movement_count개의 1분 간격 수면 움직임을 매핑"""
+
+    def __init__(self, session, movement_count: int):
+        super().__init__(None, {}, session)
+        self.movement_count = movement_count
+
+    def fetch_data(self, date_str: str) -> Optional[Dict]:
+        return {"movements": self.movement_count}
+
+    def map_data(self, user_id: int, target_date: date, data: Dict) -> Dict:
+        start_local = DAY_START - timedelta(hours=1)
+        end_local = start_local + timedelta(minutes=self.movement_count)
+        sleep_session = SleepSession(
+            user_id=user_id,
+            date=target_date,
+            start_time_gmt=start_local.replace(tzinfo=timezone.utc),
+            end_time_gmt=end_local.replace(tzinfo=timezone.utc),
+            start_time_local=start_local,
+            end_time_local=end_local,
+        )
+        movements = [
+            SleepMovement(
+                start_time_gmt=(start_local + timedelta(minutes=index)).replace(
+                    tzinfo=timezone.utc
+                ),
+                start_time_local=start_local + timedelta(minutes=index),
+                interval=60,
+                activity_level=index % 4,
+                session=sleep_session,
+            )
+            for index in range(self.movement_count)
+        ]
+        return {"daily_summary": sleep_session, "movements": movements}
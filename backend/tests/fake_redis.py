@@ -0,0 +1,149 @@
+"""
+테스트용 Redis (사용하는 명령만 메모리에서 흉내)
+
+- 값은 실제 클라이언트처럼 bytes로 반환 (decode_responses=False)
+- 만료(ex)는 저장만 하고 시간이 지나도 삭제하지 않음
+- TIME은 now 값을 반환 (테스트에서 직접 시간을 옮김)
+- register_script는 lupa가 있을 때만 사용 가능 (Redis와 같은 Lua 5.1로 실행)
+"""
+
+from typing import Dict, List, Optional
+
+try:
+    from lupa.lua51 import LuaRuntime
+except ImportError:
+    LuaRuntime = None
+
+
+class FakeLock:
+    def __init__(self, redis_client: "FakeRedis", name: str, acquired: bool):
+        self.redis_client = redis_client
+        self.name = name
+        self.acquired = acquired
+
+    def acquire(self) -> bool:
+        self.redis_client.lock_calls.append(self.name)
+        return self.acquired
+
+    def release(self) -> None:
+        self.redis_client.released.append(self.name)
+
+
+class FakePipeline:
+    """명령을 모았다가 execute에서 차례로 실행"""
+
+    def __init__(self, redis_client: "FakeRedis"):
+        self.redis_client = redis_client
+        self.commands = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self) -> list:
+        results = [
+            getattr(self.redis_client, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+        self.commands = []
+        return results
+
+
+class FakeScript:
+    """Lua 스크립트 실행 (redis.call은 FakeRedis 명령으로 연결)"""
+
+    def __init__(self, redis_client: "FakeRedis", script: str):
+        self.redis_client = redis_client
+        self.script = script
+
+    def _call(self, lua, command: str, *args):
+        redis_client = self.redis_client
+        command = command.upper()
+        if command == "TIME":
+            seconds, fraction = divmod(redis_client.now, 1)
+            result = [str(int(seconds)), str(int(fraction * 1_000_000))]
+        elif command == "HMGET":
+            values = redis_client.hmget(args[0], list(args[1:]))
+            # nil 응답은 Lua에서 false
+            result = [False if value is None else value.decode() for value in values]
+        elif command == "HSET":
+            mapping = dict(zip(args[1::2], args[2::2]))
+            return redis_client.hset(args[0], mapping=mapping)
+        elif command == "EXPIRE":
+            return redis_client.expire(args[0], int(args[1]))
+        else:
+            raise NotImplementedError(command)
+        return lua.table_from(result)
+
+    def __call__(self, keys=(), args=()):
+        lua = LuaRuntime()
+        lua_globals = lua.globals()
+        lua_globals.redis = lua.table_from(
+            {"call": lambda command, *call_args: self._call(lua, command, *call_args)}
+        )
+        # Redis처럼 인자는 문자열로 전달
+        lua_globals.KEYS = lua.table_from([str(key) for key in keys])
+        lua_globals.ARGV = lua.table_from([str(arg) for arg in args])
+        return lua.execute(self.script)
+
+
+class FakeRedis:
+    def __init__(self, lock_acquired: bool = True):
+        self.values: Dict[str, bytes] = {}
+        self.hashes: Dict[str, Dict[bytes, bytes]] = {}
+        self.ttls: Dict[str, Optional[int]] = {}
+        self.lock_acquired = lock_acquired
+        self.now = 1_700_000_000.0
+        self.lock_calls = []
+        self.released = []
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.values.get(key)
+
+    def set(self, key: str, value, ex: Optional[int] = None) -> None:
+        self.values[key] = value.encode() if isinstance(value, str) else value
+        self.ttls[key] = ex
+
+    def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+        self.ttls.pop(key, None)
+
+    def lock(self, name: str, timeout=None, blocking_timeout=None) -> FakeLock:
+        return FakeLock(self, name, self.lock_acquired)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def hincrbyfloat(self, key: str, field: str, amount: float) -> float:
+        fields = self.hashes.setdefault(key, {})
+        value = float(fields.get(field.encode(), b"0")) + amount
+        fields[field.encode()] = repr(value).encode()
+        return value
+
+    def hgetall(self, key: str) -> Dict[bytes, bytes]:
+        return dict(self.hashes.get(key, {}))
+
+    def hmget(self, key: str, fields: List[str]) -> List[Optional[bytes]]:
+        values = self.hashes.get(key, {})
+        return [values.get(field.encode()) for field in fields]
+
+    def hset(self, key: str, mapping: Dict[str, str]) -> int:
+        fields = self.hashes.setdefault(key, {})
+        added = sum(1 for field in mapping if field.encode() not in fields)
+        for field, value in mapping.items():
+            fields[field.encode()] = str(value).encode()
+        return added
+
+    def expire(self, key: str, seconds: int) -> int:
+        self.ttls[key] = seconds
+        return 1
+
+    def register_script(self, script: str) -> FakeScript:
+        if LuaRuntime is None:
+            raise RuntimeError(
+                "lupa가 설치되지 않아 Lua 스크립트를 실행할 수 없습니다."
+            )
+        return FakeScript(self, script)
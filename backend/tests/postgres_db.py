@@ -0,0 +1,50 @@
+"""
+테스트용 PostgreSQL DB
+(파티션, 마이그레이션, 실행 계획처럼 SQLite로 확인할 수 없는 테스트)
+
+- TEST_DATABASE_URL(동기 URL)을 지정했을 때만 실행, 없으면 건너뜀
+- 테스트마다 public 스키마를 지우고 다시 만드므로 비워도 되는 DB를 지정
+"""
+
+import os
+import unittest
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+
+import app.model  # noqa: F401
+from core.db import Base
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+# 측정값 테이블 (start_time_local RANGE 파티션 부모)
+READING_TABLES = (
+    "heart_rate_readings",
+    "stress_readings",
+    "steps_intraday",
+    "sleep_movement",
+    "sleep_hrv_readings",
+)
+
+requires_postgres = unittest.skipUnless(
+    TEST_DATABASE_URL, "TEST_DATABASE_URL이 없어 PostgreSQL 테스트를 건너뜀"
+)
+
+
+def reset_database(engine: Engine) -> None:
+    """public 스키마를 비우고 현재 모델로 테이블 생성 (측정값은 기본 파티션만 생성)"""
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+        Base.metadata.create_all(connection)
+        for table in READING_TABLES:
+            connection.execute(
+                text(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+            )
+
+
+def create_test_engine() -> Engine:
+    """빈 스키마에 테이블이 준비된 엔진"""
+    engine = create_engine(TEST_DATABASE_URL)
+    reset_database(engine)
+    return engine
@@ -0,0 +1,67 @@
+"""
+테스트용 인메모리 SQLite DB
+
+- 운영 DB(PostgreSQL) 전용 타입/함수를 SQLite에서 쓸 수 있게 맞춘 뒤 전체 테이블 생성
+- BIGINT PK는 SQLite에서 자동 증가하지 않으므로 INTEGER로 생성
+- ARRAY(압축 시계열)는 JSON 컬럼으로 생성 (목록은 JSON 문자열로 저장)
+- greatest()는 워터마크 갱신에서 사용
+"""
+
+import json
+import sqlite3
+
+from sqlalchemy import BigInteger, create_engine, event
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, sessionmaker
+
+import app.model  # noqa: F401
+from app.model import User
+from core.db import Base
+
+TEST_USER_ID = 1
+
+sqlite3.register_adapter(list, json.dumps)
+
+
+@compiles(BigInteger, "sqlite")
+def _compile_big_integer(type_, compiler, **kw):
+    return "INTEGER"
+
+
+@compiles(ARRAY, "sqlite")
+def _compile_array(type_, compiler, **kw):
+    return "JSON"
+
+
+def _greatest(*values):
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def create_test_engine(url: str = "sqlite://") -> Engine:
+    """전체 테이블이 준비된 엔진"""
+    engine = create_engine(url)
+
+    @event.listens_for(engine, "connect")
+    def _register_functions(dbapi_connection, _):
+        dbapi_connection.create_function("greatest", -1, _greatest)
+
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def create_test_session() -> Session:
+    """테이블과 테스트 사용자가 준비된 세션"""
+    session = sessionmaker(bind=create_test_engine())()
+    session.add(
+        User(
+            id=TEST_USER_ID,
+            email="test@example.com",
+            oauth_token="token",
+            oauth_token_secret="secret",
+        )
+    )
+    session.commit()
+    return session
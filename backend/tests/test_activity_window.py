@@ -0,0 +1,144 @@
+"""기간 활동 목록 조회와 로컬 날짜별 인덱스 테스트"""
+
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+from sqlite_db import create_test_session
+
+from app.domain import Activity
+from app.service.data_collector_service import GarminDataCollectorService
+from core.util import garmin_rate_limit
+from core.util.garmin_rate_limit import GarminRateLimiter
+
+
+def activity_payload(activity_id: int, start_time_local: datetime) -> dict:
+    """Garmin 활동 목록 응답의 항목 하나 (필수 필드만)"""
+    return {
+        "activityId": activity_id,
+        "activityName": f"Run {activity_id}",
+        "startTimeLocal": start_time_local.isoformat(sep=" "),
+        "startTimeGMT": (start_time_local - timedelta(hours=9)).isoformat(sep=" "),
+        "activityType": {
+            "typeId": 1,
+            "typeKey": "running",
+            "parentTypeId": 17,
+            "isHidden": False,
+            "restricted": False,
+            "trimmable": True,
+        },
+        "eventType": {"typeId": 9, "typeKey": "uncategorized", "sortOrder": 10},
+        "ownerId": 1,
+        "ownerDisplayName": "runner",
+        "ownerFullName": "Runner",
+        "userPro": False,
+    }
+
+
+class FakeClient:
+    """최신순 활동 목록을 limit/start로 나눠 반환"""
+
+    oauth1_token = None
+
+    def __init__(self, activities):
+        self.activities = activities
+        self.requests = []
+
+    def connectapi(self, path: str, params: dict):
+        self.requests.append(params)
+        return self.activities[params["start"] : params["start"] + params["limit"]]
+
+
+# 최신순, 하루 2건씩 1월 20일 ~ 1월 11일
+ACTIVITIES = [
+    activity_payload(
+        100 - index,
+        datetime(2024, 1, 20, 18 - 6 * (index % 2)) - timedelta(days=index // 2),
+    )
+    for index in range(20)
+]
+
+
+class ActivityWindowTestCase(unittest.TestCase):
+    def setUp(self):
+        patch = mock.patch.object(
+            garmin_rate_limit, "rate_limiter", GarminRateLimiter(enabled=False)
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_indexes_activities_by_local_date(self):
+        client = FakeClient(ACTIVITIES)
+
+        index = Activity.fetch_raw_window(
+            date(2024, 1, 17), date(2024, 1, 18), page_size=3, client=client
+        )
+
+        self.assertEqual(sorted(index), ["2024-01-17", "2024-01-18"])
+        self.assertEqual([item["activityId"] for item in index["2024-01-18"]], [96, 95])
+        # 요청 기간보다 오래된 활동(1월 16일)이 나오는 페이지에서 조회 중단
+        self.assertEqual([params["start"] for params in client.requests], [0, 3, 6])
+
+    def test_short_page_is_last(self):
+        client = FakeClient(ACTIVITIES[:4])
+
+        index = Activity.fetch_raw_window(
+            date(2024, 1, 1), date(2024, 1, 31), page_size=3, client=client
+        )
+
+        self.assertEqual(sum(len(items) for items in index.values()), 4)
+        self.assertEqual(len(client.requests), 2)
+
+    def test_unparsable_activity_is_skipped(self):
+        broken = {"activityId": 1, "activityName": "broken"}
+        client = FakeClient([ACTIVITIES[0], broken, ACTIVITIES[1]])
+
+        index = Activity.fetch_raw_window(
+            date(2024, 1, 20), date(2024, 1, 20), page_size=5, client=client
+        )
+
+        self.assertEqual(
+            [item["activityId"] for item in index["2024-01-20"]], [100, 99]
+        )
+
+
+class ActivityWindowServiceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.windows = []
+        self.service = GarminDataCollectorService(client=None, session=self.session)
+
+        def fetch_raw_window(start_date, end_date, client=None):
+            self.windows.append((start_date, end_date))
+            return {"2024-01-18": [ACTIVITIES[4]]}
+
+        patch = mock.patch.object(Activity, "fetch_raw_window", fetch_raw_window)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_dates_in_window_use_index(self):
+        self.service.load_activity_window(date(2024, 1, 15), date(2024, 1, 20))
+
+        self.assertEqual(
+            self.service._get_raw_activities_for_date("2024-01-18"), [ACTIVITIES[4]]
+        )
+        self.assertIsNone(self.service._get_raw_activities_for_date("2024-01-19"))
+        self.assertEqual(self.windows, [(date(2024, 1, 15), date(2024, 1, 20))])
+
+    def test_date_outside_window_loads_that_day(self):
+        self.service.load_activity_window(date(2024, 1, 15), date(2024, 1, 20))
+        self.service._get_raw_activities_for_date("2024-01-21")
+
+        self.assertEqual(self.windows[-1], (date(2024, 1, 21), date(2024, 1, 21)))
+
+    def test_evicting_a_day_drops_its_index(self):
+        self.service.load_activity_window(date(2024, 1, 15), date(2024, 1, 20))
+        self.service._evict_cache("2024-01-18")
+
+        self.assertIsNone(self.service._get_raw_activities_for_date("2024-01-18"))
+        self.assertEqual(len(self.windows), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""워커 이벤트 기반 Celery Prometheus 지표 테스트"""
+
+import time
+import unittest
+from datetime import datetime
+
+from celery import Celery
+
+from core.celery_exporter import CeleryEventsExporter, _parse_eta
+
+TASK_NAME = "collect-fit-data"
+
+
+class CeleryEventsExporterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.exporter = CeleryEventsExporter(Celery("test"))
+        self.now = time.time()
+        self.clock = 0
+
+    def _event(self, event_type: str, offset: float = 0, **fields) -> None:
+        self.clock += 1
+        self.exporter.on_event(
+            {
+                "type": event_type,
+                "timestamp": self.now + offset,
+                "local_received": self.now + offset,
+                "clock": self.clock,
+                "hostname": "collect@host",
+                **fields,
+            }
+        )
+
+    def _task(self, uuid: str, *events, **sent_fields) -> None:
+        """발행부터 events까지 한 태스크의 이벤트 순서대로 전달"""
+        self._event(
+            "task-sent",
+            uuid=uuid,
+            name=TASK_NAME,
+            routing_key="collect",
+            **sent_fields,
+        )
+        self._event("task-received", 1, uuid=uuid, name=TASK_NAME)
+        self._event("task-started", 2, uuid=uuid)
+        for event_type, offset, fields in events:
+            self._event(event_type, offset, uuid=uuid, **fields)
+
+    def _sample(self, name: str, **labels):
+        return self.exporter.registry.get_sample_value(name, labels)
+
+    def test_succeeded_task(self):
+        self._task("t1", ("task-succeeded", 5, {"runtime": 3.0}))
+
+        self.assertEqual(
+            self._sample("celery_tasks_total", task=TASK_NAME, state="succeeded"), 1
+        )
+        self.assertEqual(
+            self._sample(
+                "celery_task_runtime_seconds_sum", task=TASK_NAME, state="succeeded"
+            ),
+            3.0,
+        )
+        # 발행 시각부터 시작까지 (워커 prefetch 대기 포함)
+        self.assertAlmostEqual(
+            self._sample(
+                "celery_task_queue_wait_seconds_sum", task=TASK_NAME, queue="collect"
+            ),
+            2.0,
+        )
+
+    def test_failed_and_retried_tasks(self):
+        self._task("t1", ("task-failed", 6, {"exception": "boom"}))
+        self._task("t2", ("task-retried", 4, {"exception": "later"}))
+        self._task("t3", ("task-revoked", 3, {}))
+
+        for state in ("failed", "retried", "revoked"):
+            with self.subTest(state=state):
+                self.assertEqual(
+                    self._sample("celery_tasks_total", task=TASK_NAME, state=state), 1
+                )
+        # 실패 실행 시간은 시작 이벤트부터 계산
+        self.assertAlmostEqual(
+            self._sample(
+                "celery_task_runtime_seconds_sum", task=TASK_NAME, state="failed"
+            ),
+            4.0,
+        )
+
+    def test_queue_wait_starts_at_eta(self):
+        eta = datetime.fromtimestamp(self.now + 1.5).isoformat()
+
+        self._task("t1", eta=eta)
+
+        self.assertAlmostEqual(
+            self._sample(
+                "celery_task_queue_wait_seconds_sum", task=TASK_NAME, queue="collect"
+            ),
+            0.5,
+            places=3,
+        )
+
+    def test_event_for_unknown_task_is_ignored(self):
+        self._event("task-succeeded", uuid=None, runtime=1.0)
+
+        self.assertIsNone(
+            self._sample("celery_tasks_total", task=TASK_NAME, state="succeeded")
+        )
+
+    def test_worker_gauges_follow_heartbeats(self):
+        self._event("worker-online", freq=2.0)
+        self._event("worker-heartbeat", freq=2.0, active=3, processed=10)
+
+        self.exporter.refresh_workers()
+
+        self.assertEqual(self._sample("celery_worker_up", worker="collect@host"), 1)
+        self.assertEqual(
+            self._sample("celery_worker_tasks_active", worker="collect@host"), 3
+        )
+        self.assertEqual(
+            self._sample("celery_worker_tasks_processed", worker="collect@host"), 10
+        )
+
+        self._event("worker-offline")
+        self.exporter.refresh_workers()
+
+        self.assertIsNone(self._sample("celery_worker_up", worker="collect@host"))
+        self.assertIsNone(
+            self._sample("celery_worker_tasks_active", worker="collect@host")
+        )
+
+    def test_parse_eta(self):
+        self.assertEqual(
+            _parse_eta("2024-01-15T08:30:00+00:00"),
+            datetime.fromisoformat("2024-01-15T08:30:00+00:00").timestamp(),
+        )
+        self.assertIsNone(_parse_eta(None))
+        self.assertIsNone(_parse_eta("soon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""수집/분석 큐 분리와 스레드 풀 워커 테스트"""
+
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+import task  # noqa: F401
+from core.celery_app import celery_app
+from core.config import (
+    ANALYSIS_SOFT_TIME_LIMIT,
+    ANALYSIS_TIME_LIMIT,
+    CELERY_ANALYSIS_QUEUE,
+    CELERY_COLLECT_QUEUE,
+    CELERY_DEFAULT_QUEUE,
+    COLLECT_RANGE_SOFT_TIME_LIMIT,
+    COLLECT_RANGE_TIME_LIMIT,
+    COLLECT_SOFT_TIME_LIMIT,
+    COLLECT_TIME_LIMIT,
+)
+from core.db import celery_session
+from core.db.celery_session import DatabaseTask
+from core.util import worker_health
+from core.util.worker_health import WorkerLeakDetector
+
+
+class TaskRoutingTestCase(unittest.TestCase):
+    def _queue(self, task_name: str) -> str:
+        return celery_app.amqp.router.route({}, task_name)["queue"].name
+
+    def test_tasks_go_to_their_queue(self):
+        cases = [
+            ("collect-fit-data", CELERY_COLLECT_QUEUE),
+            ("collect-fit-data-range", CELERY_COLLECT_QUEUE),
+            ("analysis-health", CELERY_ANALYSIS_QUEUE),
+            # 재처리/보관 태스크는 기본 큐
+            ("replay-raw-payloads", CELERY_DEFAULT_QUEUE),
+            ("archive-cold-partitions", CELERY_DEFAULT_QUEUE),
+        ]
+        for task_name, queue in cases:
+            with self.subTest(task=task_name):
+                self.assertIn(task_name, celery_app.tasks)
+                self.assertEqual(self._queue(task_name), queue)
+
+    def test_time_limits(self):
+        cases = [
+            ("collect-fit-data", COLLECT_SOFT_TIME_LIMIT, COLLECT_TIME_LIMIT),
+            (
+                "collect-fit-data-range",
+                COLLECT_RANGE_SOFT_TIME_LIMIT,
+                COLLECT_RANGE_TIME_LIMIT,
+            ),
+            ("analysis-health", ANALYSIS_SOFT_TIME_LIMIT, ANALYSIS_TIME_LIMIT),
+        ]
+        for task_name, soft_limit, hard_limit in cases:
+            with self.subTest(task=task_name):
+                registered = celery_app.tasks[task_name]
+                self.assertEqual(registered.soft_time_limit, soft_limit)
+                self.assertEqual(registered.time_limit, hard_limit)
+                self.assertLess(soft_limit, hard_limit)
+
+    def test_prefetch_one_by_default(self):
+        self.assertEqual(celery_app.conf.worker_prefetch_multiplier, 1)
+
+
+class ThreadPoolWorkerTestCase(unittest.TestCase):
+    def test_task_session_per_thread(self):
+        task_object = DatabaseTask()
+        sessions = {}
+
+        def run(name: str) -> None:
+            sessions[name] = (task_object.session, task_object.session)
+            task_object.after_return()
+
+        with mock.patch.object(
+            celery_session, "SessionFactory", side_effect=lambda: mock.Mock()
+        ):
+            threads = [
+                threading.Thread(target=run, args=(name,)) for name in ("a", "b")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertIsNot(sessions["a"][0], sessions["b"][0])
+        for first, second in sessions.values():
+            # 같은 스레드에서는 같은 세션을 재사용하고 태스크가 끝나면 닫음
+            self.assertIs(first, second)
+            first.close.assert_called_once()
+
+    def test_overlapping_tasks_are_checked_when_idle(self):
+        rss_kb = [100_000]
+        patch = mock.patch.object(worker_health, "current_rss_kb", lambda: rss_kb[0])
+        patch.start()
+        self.addCleanup(patch.stop)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        engine = create_engine(
+            f"sqlite:///{os.path.join(temp_dir.name, 'worker.db')}",
+            poolclass=QueuePool,
+        )
+        self.addCleanup(engine.dispose)
+        detector = WorkerLeakDetector([engine], task_rss_warn_kb=1000)
+
+        connection = engine.connect()
+        detector.before_task()
+        detector.before_task()
+        rss_kb[0] += 1500
+
+        # 다른 태스크가 실행 중이면 검사하지 않음
+        with mock.patch.object(detector, "_check") as check:
+            detector.after_task("collect-fit-data")
+        check.assert_not_called()
+
+        # 겹친 태스크의 메모리 증가량은 태스크별로 나눌 수 없으므로 경고하지 않음
+        connection.close()
+        with self.assertNoLogs(worker_health.logger, "WARNING"):
+            detector.after_task("collect-fit-data")
+        self.assertEqual(detector.task_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+"""일일 수집 컬렉터별 서브태스크(chord) 팬아웃 테스트"""
+
+import unittest
+from unittest import mock
+
+from fake_collectors import (
+    TARGET_DATE,
+    FakeHeartRateCollector,
+    FakeSleepCollector,
+    heart_rate_values,
+)
+from sqlalchemy import func, select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import HeartRateReading, SleepSession
+from app.service.data_collector_service import (
+    COLLECTOR_PREFETCH_JOBS,
+    DataCollectionError,
+    GarminDataCollectorService,
+)
+from app.service.reading_writer import WRITE_MODE_EXECUTEMANY
+from core.db import celery_session
+from task import garmin_collector
+from task.garmin_collector import (
+    collect_fit_data,
+    collect_fit_data_part,
+    merge_fit_data_parts,
+)
+
+DATE_STR = TARGET_DATE.isoformat()
+
+
+# 팬아웃은 실제 컬렉터 이름으로 서브태스크를 나누므로 같은 이름의 테스트 컬렉터
+class HeartRateCollector(FakeHeartRateCollector):
+    pass
+
+
+class SleepCollector(FakeSleepCollector):
+    """수면 세션 저장 후 측정값 저장에서 실패"""
+
+    def map_data(self, user_id, target_date, data):
+        mapped = super().map_data(user_id, target_date, data)
+        mapped["movements"] = mapped["movements"] * 2
+        return mapped
+
+
+class CollectorPartTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.service = GarminDataCollectorService(
+            client=None,
+            session=self.session,
+            max_workers=1,
+            write_mode=WRITE_MODE_EXECUTEMANY,
+            incremental=False,
+            archive_raw=False,
+            packed_series=False,
+            rollups=False,
+            period_aggregates=False,
+        )
+        self.service._prefetch_data = mock.Mock()
+        self.service._create_collectors = lambda: [
+            HeartRateCollector(self.session, heart_rate_values(30)),
+            SleepCollector(self.session, 20),
+        ]
+
+    def _count(self, model) -> int:
+        return self.session.execute(select(func.count()).select_from(model)).scalar()
+
+    def test_part_collects_and_commits_one_collector(self):
+        part = self.service.collect_collector_data(
+            TEST_USER_ID, TARGET_DATE, "HeartRateCollector"
+        )
+
+        self.assertEqual(part["collector"], "HeartRateCollector")
+        self.assertIsNotNone(part["result"])
+        self.assertIsNone(part["error"])
+        # 자기 컬렉터가 읽는 엔드포인트만 프리페치
+        self.service._prefetch_data.assert_called_once_with(
+            DATE_STR, COLLECTOR_PREFETCH_JOBS["HeartRateCollector"]
+        )
+        self.session.rollback()
+        self.assertEqual(self._count(HeartRateReading), 30)
+
+    def test_failures_are_returned_not_raised(self):
+        failed = self.service.collect_collector_data(
+            TEST_USER_ID, TARGET_DATE, "SleepCollector"
+        )
+        unknown = self.service.collect_collector_data(
+            TEST_USER_ID, TARGET_DATE, "WeatherCollector"
+        )
+
+        self.assertIsNone(failed["result"])
+        self.assertTrue(failed["error"].startswith("SleepCollector: "))
+        self.assertEqual(self._count(SleepSession), 0)
+        self.assertEqual(unknown["error"], "WeatherCollector: 알 수 없는 컬렉터")
+
+    def test_merge_matches_daily_result(self):
+        parts = [
+            {"collector": "HeartRateCollector", "result": "ok", "error": None},
+            {"collector": "SleepCollector", "result": None, "error": "Sleep: 실패"},
+            {"collector": "StepsCollector", "result": None, "error": None},
+        ]
+
+        result = self.service.merge_collector_results(TEST_USER_ID, TARGET_DATE, parts)
+
+        self.assertEqual(result["HeartRateCollector"], "ok")
+        self.assertEqual(result["errors"], ["Sleep: 실패"])
+        self.assertNotIn("StepsCollector", result)
+
+    def test_merge_all_failed(self):
+        parts = [{"collector": "SleepCollector", "result": None, "error": "실패"}]
+
+        with self.assertRaises(DataCollectionError):
+            self.service.merge_collector_results(TEST_USER_ID, TARGET_DATE, parts)
+
+
+class FanoutTaskTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        patch = mock.patch.object(
+            celery_session, "SessionFactory", lambda: self.session
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_collect_task_is_replaced_by_chord(self):
+        user = mock.Mock(id=TEST_USER_ID)
+        collect_daily = mock.Mock()
+        patch = mock.patch.multiple(
+            garmin_collector,
+            FANOUT_AVAILABLE=True,
+            get_user_by_kakao_id=mock.Mock(return_value=user),
+            create_garmin_client_from_user=mock.Mock(),
+            validate_garmin_sync_time=mock.Mock(),
+            collect_garmin_daily_data=collect_daily,
+        )
+        with patch, mock.patch.object(collect_fit_data, "replace") as replace:
+            collect_fit_data("kakao", DATE_STR, "Asia/Seoul")
+
+        collect_daily.assert_not_called()
+        (fanout,), _ = replace.call_args
+        self.assertEqual(
+            [(part.task, tuple(part.args)) for part in fanout.tasks],
+            [
+                ("collect-fit-data-part", (TEST_USER_ID, DATE_STR, name))
+                for name in COLLECTOR_PREFETCH_JOBS
+            ],
+        )
+        self.assertEqual(fanout.body.task, "collect-fit-data-merge")
+        self.assertEqual(tuple(fanout.body.args), (TEST_USER_ID, DATE_STR))
+
+    def test_part_task_returns_error_for_chord_callback(self):
+        part = collect_fit_data_part(9999, DATE_STR, "HeartRateCollector")
+
+        self.assertEqual(part["collector"], "HeartRateCollector")
+        self.assertIsNone(part["result"])
+        self.assertIn("9999", part["error"])
+
+    def test_merge_task(self):
+        parts = [{"collector": "HeartRateCollector", "result": "ok", "error": None}]
+
+        result = merge_fit_data_parts(parts, TEST_USER_ID, DATE_STR)
+
+        self.assertEqual(result["HeartRateCollector"], "ok")
+
+
+if __name__ == "__main__":
+    unittest.main()
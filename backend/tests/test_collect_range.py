@@ -0,0 +1,125 @@
+"""기간 데이터 수집 테스트 (하나의 세션으로 여러 날짜 수집)"""
+
+import threading
+import unittest
+from datetime import timedelta
+from unittest import mock
+
+from fake_collectors import TARGET_DATE, FakeHeartRateCollector, heart_rate_values
+from sqlalchemy import select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import HeartRateDaily
+from app.service.data_collector_service import (
+    DataCollectionError,
+    GarminDataCollectorService,
+)
+from app.service.reading_writer import WRITE_MODE_EXECUTEMANY
+
+END_DATE = TARGET_DATE + timedelta(days=2)
+DATE_STRS = [(TARGET_DATE + timedelta(days=offset)).isoformat() for offset in range(3)]
+
+
+class CollectRangeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.prefetched = []
+        self.failing_dates = set()
+
+        self.service = GarminDataCollectorService(
+            client=None,
+            session=self.session,
+            max_workers=1,
+            write_mode=WRITE_MODE_EXECUTEMANY,
+            incremental=False,
+            archive_raw=False,
+            packed_series=False,
+            rollups=False,
+            period_aggregates=False,
+        )
+        self.service.load_activity_window = mock.Mock()
+        self.service._prefetch_data = self._prefetch
+        self.service._create_collectors = lambda: [
+            FakeHeartRateCollector(self.session, heart_rate_values(30))
+        ]
+
+    def _prefetch(self, date_str: str) -> None:
+        self.prefetched.append(date_str)
+        if date_str in self.failing_dates:
+            raise DataCollectionError(f"{date_str} 프리페치 실패")
+
+    def _stored_dates(self) -> list:
+        self.session.rollback()
+        return [
+            stored.isoformat()
+            for stored in self.session.execute(
+                select(HeartRateDaily.date).order_by(HeartRateDaily.date)
+            ).scalars()
+        ]
+
+    def test_collects_every_day_with_one_activity_window(self):
+        results = self.service.collect_range(TEST_USER_ID, TARGET_DATE, END_DATE)
+
+        self.assertEqual(list(results), DATE_STRS)
+        for result in results.values():
+            self.assertIn("FakeHeartRateCollector", result)
+        self.assertEqual(self.prefetched, DATE_STRS)
+        self.service.load_activity_window.assert_called_once_with(TARGET_DATE, END_DATE)
+        self.assertEqual(self._stored_dates(), DATE_STRS)
+
+    def test_commits_once_per_batch(self):
+        with mock.patch.object(
+            self.session, "commit", wraps=self.session.commit
+        ) as commit:
+            self.service.collect_range(
+                TEST_USER_ID, TARGET_DATE, END_DATE, batch_size=2
+            )
+        self.assertEqual(commit.call_count, 2)
+
+    def test_failed_day_does_not_stop_range(self):
+        self.failing_dates.add(DATE_STRS[1])
+
+        results = self.service.collect_range(TEST_USER_ID, TARGET_DATE, END_DATE)
+
+        self.assertEqual(
+            results[DATE_STRS[1]], {"errors": [f"{DATE_STRS[1]} 프리페치 실패"]}
+        )
+        self.assertEqual(self._stored_dates(), [DATE_STRS[0], DATE_STRS[2]])
+
+    def test_activity_window_failure_falls_back_to_daily_lookup(self):
+        self.service.load_activity_window.side_effect = RuntimeError("timeout")
+
+        results = self.service.collect_range(TEST_USER_ID, TARGET_DATE, END_DATE)
+
+        self.assertEqual(list(results), DATE_STRS)
+        self.assertEqual(self._stored_dates(), DATE_STRS)
+
+    def test_next_day_is_prefetched_while_storing(self):
+        next_day_prefetched = threading.Event()
+        overlapped = []
+
+        def prefetch(date_str: str) -> None:
+            self._prefetch(date_str)
+            if date_str == DATE_STRS[1]:
+                next_day_prefetched.set()
+
+        def create_collectors():
+            # 첫 날짜 저장 중에 다음 날짜 프리페치가 끝나는지 확인
+            if not overlapped:
+                overlapped.append(next_day_prefetched.wait(timeout=5))
+            return [FakeHeartRateCollector(self.session, heart_rate_values(30))]
+
+        self.service._prefetch_data = prefetch
+        self.service._create_collectors = create_collectors
+        self.service.collect_range(TEST_USER_ID, TARGET_DATE, END_DATE)
+
+        self.assertEqual(overlapped, [True])
+
+    def test_start_after_end_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.service.collect_range(TEST_USER_ID, END_DATE, TARGET_DATE)
+
+
+if __name__ == "__main__":
+    unittest.main()
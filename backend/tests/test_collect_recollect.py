@@ -0,0 +1,111 @@
+"""같은 날짜를 다시 수집할 때 기존 행 교체 테스트"""
+
+import unittest
+
+from fake_collectors import (
+    TARGET_DATE,
+    FakeHeartRateCollector,
+    FakeSleepCollector,
+    heart_rate_values,
+)
+from sqlalchemy import func, select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import HeartRateDaily, HeartRateReading, SleepMovement, SleepSession
+from app.service.data_collector_service import GarminDataCollectorService
+from app.service.reading_writer import (
+    WRITE_MODE_EXECUTEMANY,
+    WRITE_MODE_ORM,
+    WRITE_MODE_UPSERT,
+)
+
+
+class RecollectTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+
+    def tearDown(self):
+        self.session.close()
+
+    def _service(self, write_mode: str) -> GarminDataCollectorService:
+        return GarminDataCollectorService(
+            client=None,
+            session=self.session,
+            max_workers=1,
+            write_mode=write_mode,
+            daily_snapshot=False,
+            incremental=False,
+            archive_raw=False,
+            packed_series=False,
+            rollups=False,
+            period_aggregates=False,
+        )
+
+    def _collect(self, service: GarminDataCollectorService, collector) -> str:
+        return service._collect_with_collector(
+            collector, TEST_USER_ID, TARGET_DATE, TARGET_DATE.isoformat()
+        )
+
+    def _count(self, model) -> int:
+        return self.session.execute(select(func.count()).select_from(model)).scalar()
+
+    def _assert_heart_rate_replaced(self, write_mode: str) -> None:
+        service = self._service(write_mode)
+        self._collect(
+            service, FakeHeartRateCollector(self.session, heart_rate_values(30))
+        )
+        result = self._collect(
+            service,
+            FakeHeartRateCollector(
+                self.session, heart_rate_values(45, offset=5), resting_hr=50
+            ),
+        )
+
+        self.assertIn("저장 성공", result)
+        self.assertEqual(self._count(HeartRateDaily), 1)
+        self.assertEqual(self._count(HeartRateReading), 45)
+        resting_hr = self.session.execute(select(HeartRateDaily.resting_hr)).scalar()
+        self.assertEqual(resting_hr, 50)
+
+    def test_recollect_heart_rate_bulk(self):
+        self._assert_heart_rate_replaced(WRITE_MODE_EXECUTEMANY)
+
+    def test_recollect_heart_rate_orm(self):
+        self._assert_heart_rate_replaced(WRITE_MODE_ORM)
+
+    def test_recollect_sleep_bulk(self):
+        service = self._service(WRITE_MODE_EXECUTEMANY)
+        self._collect(service, FakeSleepCollector(self.session, 20))
+        self._collect(service, FakeSleepCollector(self.session, 35))
+
+        self.assertEqual(self._count(SleepSession), 1)
+        self.assertEqual(self._count(SleepMovement), 35)
+
+    def test_upsert_is_idempotent(self):
+        service = self._service(WRITE_MODE_UPSERT)
+        for _ in range(3):
+            self._collect(
+                service, FakeHeartRateCollector(self.session, heart_rate_values(30))
+            )
+        daily_id = self.session.execute(select(HeartRateDaily.id)).scalar()
+
+        self._collect(
+            service,
+            FakeHeartRateCollector(self.session, heart_rate_values(30, offset=5)),
+        )
+
+        self.assertEqual(self._count(HeartRateDaily), 1)
+        self.assertEqual(self._count(HeartRateReading), 30)
+        self.assertEqual(
+            self.session.execute(select(HeartRateDaily.id)).scalar(), daily_id
+        )
+        stored = self.session.execute(
+            select(HeartRateReading.heart_rate).order_by(
+                HeartRateReading.start_time_local
+            )
+        ).scalars()
+        self.assertEqual(list(stored), heart_rate_values(30, offset=5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""엔드포인트 병렬 프리페치 테스트"""
+
+import threading
+import unittest
+
+from sqlite_db import create_test_session
+
+from app.service.data_collector_service import (
+    DataCollectionError,
+    DataFetchError,
+    GarminDataCollectorService,
+)
+
+DATE_STR = "2024-01-15"
+# sleep_hrv는 sleep_data 작업 안에서 순차 조회하므로 동시에 대기하는 엔드포인트는 6개
+CONCURRENT_ENDPOINTS = (
+    "daily_summary",
+    "heart_rate",
+    "stress",
+    "steps_data",
+    "sleep_data",
+    "activities",
+)
+
+
+class ConcurrentPrefetchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.calls = []
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def _service(self, max_workers: int, fetch=None) -> GarminDataCollectorService:
+        service = GarminDataCollectorService(
+            client=None,
+            session=self.session,
+            max_workers=max_workers,
+            archive_raw=False,
+        )
+        # 실제 API 대신 호출한 엔드포인트와 스레드만 기록
+        service._fetch_with_cache = fetch or self._fetch
+        return service
+
+    def _fetch(self, endpoint: str, date_str: str, source, **kwargs):
+        with self.lock:
+            self.calls.append(endpoint)
+            self.threads.add(threading.current_thread().name)
+        return {"endpoint": endpoint}
+
+    def test_endpoints_are_fetched_in_parallel(self):
+        barrier = threading.Barrier(len(CONCURRENT_ENDPOINTS), timeout=5)
+
+        def fetch(endpoint, date_str, source, **kwargs):
+            # 모든 엔드포인트가 동시에 대기해야 통과 (순차 실행이면 BrokenBarrierError)
+            if endpoint != "sleep_hrv":
+                barrier.wait()
+            return self._fetch(endpoint, date_str, source)
+
+        self._service(len(CONCURRENT_ENDPOINTS), fetch)._prefetch_data(DATE_STR)
+
+        self.assertCountEqual(self.calls, CONCURRENT_ENDPOINTS + ("sleep_hrv",))
+        self.assertEqual(len(self.threads), len(CONCURRENT_ENDPOINTS))
+        self.assertTrue(
+            all(name.startswith("garmin-prefetch") for name in self.threads)
+        )
+
+    def test_sleep_hrv_is_fetched_after_sleep_data(self):
+        self._service(max_workers=4)._prefetch_data(DATE_STR)
+        self.assertLess(self.calls.index("sleep_data"), self.calls.index("sleep_hrv"))
+
+    def test_single_worker_fetches_sequentially(self):
+        self._service(max_workers=1)._prefetch_data(DATE_STR)
+
+        self.assertEqual(
+            self.calls, [*CONCURRENT_ENDPOINTS[:5], "sleep_hrv", "activities"]
+        )
+        self.assertEqual(self.threads, {threading.current_thread().name})
+
+    def test_job_names_limit_endpoints(self):
+        self._service(max_workers=4)._prefetch_data(DATE_STR, ["heart_rate", "stress"])
+        self.assertCountEqual(self.calls, ["heart_rate", "stress"])
+
+    def test_first_error_in_job_order_is_raised(self):
+        def fetch(endpoint, date_str, source, **kwargs):
+            self._fetch(endpoint, date_str, source)
+            if endpoint in ("stress", "activities"):
+                raise DataFetchError(f"{endpoint} 실패")
+            return {"endpoint": endpoint}
+
+        with self.assertRaises(DataCollectionError) as context:
+            self._service(4, fetch)._prefetch_data(DATE_STR)
+
+        self.assertEqual(context.exception.error_type, "PREFETCH_ERROR")
+        self.assertIn("stress 실패", str(context.exception))
+        # 오류가 나도 나머지 작업은 끝까지 실행
+        self.assertCountEqual(self.calls, CONCURRENT_ENDPOINTS + ("sleep_hrv",))
+
+
+if __name__ == "__main__":
+    unittest.main()
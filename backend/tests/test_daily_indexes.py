@@ -0,0 +1,114 @@
+"""사용자별 일일 조회 인덱스와 실행 계획 회귀 테스트"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from fake_collectors import DAY_START, TARGET_DATE
+from postgres_db import create_test_engine, requires_postgres
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import Activity, HeartRateDaily, SleepSession, StepsDaily, StressDaily
+from app.service.data_collector_service import ActivityCollector
+
+DAILY_MODELS = (HeartRateDaily, StressDaily, StepsDaily, SleepSession)
+
+
+def make_activity(start_time_local: datetime) -> Activity:
+    return Activity(
+        user_id=TEST_USER_ID,
+        activity_type="running",
+        start_time_utc=start_time_local.replace(tzinfo=timezone.utc),
+        start_time_local=start_time_local,
+        end_time_utc=(start_time_local + timedelta(minutes=30)).replace(
+            tzinfo=timezone.utc
+        ),
+        end_time_local=start_time_local + timedelta(minutes=30),
+    )
+
+
+class DailyIndexTestCase(unittest.TestCase):
+    def test_daily_tables_have_covering_unique_index(self):
+        for model in DAILY_MODELS:
+            with self.subTest(table=model.__tablename__):
+                indexes = {
+                    index.name: index
+                    for index in model.__table__.indexes
+                    if [column.name for column in index.columns] == ["user_id", "date"]
+                }
+                index = indexes[f"uq_{model.__tablename__}_user_id_date"]
+                self.assertTrue(index.unique)
+                self.assertEqual(index.dialect_options["postgresql"]["include"], ["id"])
+
+    def test_activity_delete_uses_local_day_range(self):
+        session = create_test_session()
+        self.addCleanup(session.close)
+        session.add_all(
+            make_activity(start_time_local)
+            for start_time_local in (
+                DAY_START - timedelta(seconds=1),
+                DAY_START,
+                DAY_START + timedelta(days=1, seconds=-1),
+                DAY_START + timedelta(days=1),
+            )
+        )
+        session.commit()
+
+        ActivityCollector(None, {}, session).delete_existing_data(
+            TEST_USER_ID, TARGET_DATE
+        )
+        session.commit()
+
+        remaining = session.execute(
+            select(Activity.start_time_local).order_by(Activity.start_time_local)
+        ).scalars()
+        self.assertEqual(
+            list(remaining),
+            [DAY_START - timedelta(seconds=1), DAY_START + timedelta(days=1)],
+        )
+
+
+class ExplainHarnessTestCase(unittest.TestCase):
+    """EXPLAIN 검사 스크립트의 데이터 생성과 케이스 실행 (SQLite, 실행 계획 제외)"""
+
+    def test_every_case_captures_statements(self):
+        from script import explain_index_usage
+
+        session = create_test_session()
+        self.addCleanup(session.close)
+        explain_index_usage.seed(session, days=3)
+        # 삭제 케이스가 메모리에 남은 측정값을 다시 지우지 않도록 (DB에서 다시 읽음)
+        session.expire_all()
+
+        for name, run, _ in explain_index_usage.build_cases(session):
+            with self.subTest(case=name):
+                self.assertTrue(explain_index_usage.capture_statements(session, run))
+
+
+@requires_postgres
+class ExplainIndexUsageTestCase(unittest.TestCase):
+    """script/explain_index_usage.py와 같은 검사를 테스트 DB에서 실행"""
+
+    def test_queries_use_indexes(self):
+        from script import explain_index_usage
+
+        engine = create_test_engine()
+        self.addCleanup(engine.dispose)
+        session = Session(engine)
+        try:
+            explain_index_usage.seed(session, days=35)
+            session.connection().exec_driver_sql("SET LOCAL enable_seqscan = off")
+            session.connection().exec_driver_sql("SET LOCAL enable_bitmapscan = off")
+            failures = explain_index_usage.check(
+                session, explain_index_usage.build_cases(session)
+            )
+        finally:
+            session.rollback()
+            session.close()
+
+        self.assertEqual(failures, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""하루 수집을 하나의 트랜잭션으로 저장하는 스냅샷 모드 테스트"""
+
+import unittest
+from unittest import mock
+
+from fake_collectors import (
+    TARGET_DATE,
+    FakeHeartRateCollector,
+    FakeSleepCollector,
+    heart_rate_values,
+)
+from sqlalchemy import func, select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import HeartRateDaily, HeartRateReading, SleepMovement, SleepSession
+from app.service.data_collector_service import (
+    DataCollectionError,
+    GarminDataCollectorService,
+)
+from app.service.reading_writer import WRITE_MODE_EXECUTEMANY
+
+
+class DuplicateMovementSleepCollector(FakeSleepCollector):
+    """수면 세션은 저장되지만 중복 측정값 때문에 측정값 저장에서 실패"""
+
+    def map_data(self, user_id, target_date, data):
+        mapped = super().map_data(user_id, target_date, data)
+        mapped["movements"] = mapped["movements"] * 2
+        return mapped
+
+
+class DailySnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.service = GarminDataCollectorService(
+            client=None,
+            session=self.session,
+            max_workers=1,
+            write_mode=WRITE_MODE_EXECUTEMANY,
+            daily_snapshot=True,
+            incremental=False,
+            archive_raw=False,
+            packed_series=False,
+            rollups=False,
+            period_aggregates=False,
+        )
+        self.service._prefetch_data = mock.Mock()
+
+    def _collect(self, *collectors) -> dict:
+        self.service._create_collectors = lambda: list(collectors)
+        with mock.patch.object(
+            self.session, "commit", wraps=self.session.commit
+        ) as commit:
+            try:
+                return self.service.collect_daily_data(TEST_USER_ID, TARGET_DATE)
+            finally:
+                self.commit_count = commit.call_count
+
+    def _count(self, model) -> int:
+        return self.session.execute(select(func.count()).select_from(model)).scalar()
+
+    def test_collectors_are_committed_once(self):
+        result = self._collect(
+            FakeHeartRateCollector(self.session, heart_rate_values(30)),
+            FakeSleepCollector(self.session, 20),
+        )
+
+        self.assertEqual(set(result), {"FakeHeartRateCollector", "FakeSleepCollector"})
+        self.assertEqual(self.commit_count, 1)
+        self.session.rollback()
+        self.assertEqual(self._count(HeartRateReading), 30)
+        self.assertEqual(self._count(SleepMovement), 20)
+
+    def test_failed_collector_is_rolled_back_to_its_savepoint(self):
+        result = self._collect(
+            FakeHeartRateCollector(self.session, heart_rate_values(30)),
+            DuplicateMovementSleepCollector(self.session, 20),
+        )
+
+        self.assertIn("FakeHeartRateCollector", result)
+        self.assertEqual(len(result["errors"]), 1)
+        self.assertIn("DuplicateMovementSleepCollector", result["errors"][0])
+        self.assertEqual(self.commit_count, 1)
+        # 실패한 컬렉터는 먼저 저장된 수면 세션까지 함께 취소
+        self.session.rollback()
+        self.assertEqual(self._count(HeartRateDaily), 1)
+        self.assertEqual(self._count(HeartRateReading), 30)
+        self.assertEqual(self._count(SleepSession), 0)
+        self.assertEqual(self._count(SleepMovement), 0)
+
+    def test_all_collectors_failing_commits_nothing(self):
+        with self.assertRaises(DataCollectionError):
+            self._collect(DuplicateMovementSleepCollector(self.session, 20))
+
+        self.assertEqual(self.commit_count, 0)
+        self.assertEqual(self._count(SleepSession), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
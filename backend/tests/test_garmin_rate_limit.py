@@ -0,0 +1,235 @@
+"""Garmin API 요청 한도 지표와 재시도 테스트"""
+
+import unittest
+from unittest import mock
+
+import requests
+from fake_redis import FakeRedis, LuaRuntime
+from garth.exc import GarthHTTPError
+from prometheus_client import CollectorRegistry
+
+from core.util import garmin_rate_limit
+from core.util.garmin_rate_limit import (
+    GarminRateLimiter,
+    GarminRateLimitTimeout,
+    RateLimitMetrics,
+    RateLimitMetricsCollector,
+    call_garmin,
+)
+
+
+def http_error(status_code: int) -> GarthHTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return GarthHTTPError(msg="error", error=requests.HTTPError(response=response))
+
+
+class FakeClient:
+    oauth1_token = None
+
+
+class RateLimitMetricsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.metrics = RateLimitMetrics(redis_factory=lambda: self.redis)
+        self.registry = CollectorRegistry()
+        self.registry.register(RateLimitMetricsCollector(self.metrics))
+
+    def _sample(self, name: str, labels: dict = None) -> float:
+        return self.registry.get_sample_value(name, labels or {})
+
+    def test_wait_histogram(self):
+        for seconds in (0, 0, 0.3, 12):
+            self.metrics.observe_wait(seconds)
+
+        name = "garmin_api_rate_limit_wait_seconds"
+        self.assertEqual(self._sample(f"{name}_bucket", {"le": "0.0"}), 2)
+        self.assertEqual(self._sample(f"{name}_bucket", {"le": "0.25"}), 2)
+        self.assertEqual(self._sample(f"{name}_bucket", {"le": "0.5"}), 3)
+        self.assertEqual(self._sample(f"{name}_bucket", {"le": "10.0"}), 3)
+        self.assertEqual(self._sample(f"{name}_bucket", {"le": "+Inf"}), 4)
+        self.assertEqual(self._sample(f"{name}_count"), 4)
+        self.assertAlmostEqual(self._sample(f"{name}_sum"), 12.3)
+
+    def test_retries_by_reason(self):
+        self.metrics.observe_retry("throttled", 0.4)
+        self.metrics.observe_retry("throttled", 3)
+        self.metrics.observe_retry("connection", 0.2)
+
+        retries = "garmin_api_retries_total"
+        self.assertEqual(self._sample(retries, {"reason": "throttled"}), 2)
+        self.assertEqual(self._sample(retries, {"reason": "connection"}), 1)
+        self.assertEqual(self._sample(retries, {"reason": "timeout"}), 0)
+        self.assertEqual(
+            self._sample(
+                "garmin_api_retry_backoff_seconds_bucket",
+                {"reason": "throttled", "le": "0.5"},
+            ),
+            1,
+        )
+
+    def test_without_redis_nothing_is_recorded(self):
+        metrics = RateLimitMetrics(redis_factory=lambda: None)
+        metrics.observe_wait(1)
+        self.assertEqual(metrics.read(), {})
+
+
+@unittest.skipIf(LuaRuntime is None, "lupa가 없어 Lua 스크립트를 실행할 수 없음")
+class TokenBucketTestCase(unittest.TestCase):
+    GLOBAL_KEY = "garmin:ratelimit:global"
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.limiter = GarminRateLimiter(
+            enabled=True,
+            global_rate=10,
+            global_burst=20,
+            account_rate=1,
+            account_burst=3,
+            max_wait=5,
+            redis_factory=lambda: self.redis,
+        )
+        self.metrics = RateLimitMetrics(redis_factory=lambda: self.redis)
+        patches = [
+            mock.patch.object(garmin_rate_limit, "rate_limit_metrics", self.metrics),
+            # 대기 대신 Redis 시각을 옮김
+            mock.patch.object(
+                garmin_rate_limit.time, "sleep", side_effect=self._advance
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _advance(self, seconds: float) -> None:
+        self.redis.now += seconds
+
+    def _tokens(self, key: str) -> float:
+        return float(self.redis.hashes[key][b"tokens"])
+
+    def test_account_burst_then_wait(self):
+        waits = [self.limiter._try_acquire("a") for _ in range(4)]
+
+        self.assertEqual(waits[:3], [0, 0, 0])
+        self.assertAlmostEqual(waits[3], 1.0)
+        # 대기가 필요한 시도는 어느 버킷에서도 토큰을 쓰지 않음
+        self.assertAlmostEqual(self._tokens(self.GLOBAL_KEY), 17)
+        self.assertAlmostEqual(self._tokens("garmin:ratelimit:account:a"), 0)
+
+    def test_tokens_refill_over_time(self):
+        for _ in range(3):
+            self.limiter._try_acquire("a")
+
+        self._advance(2.5)
+
+        self.assertEqual(self.limiter._try_acquire("a"), 0)
+        self.assertAlmostEqual(self._tokens("garmin:ratelimit:account:a"), 1.5)
+
+    def test_global_bucket_is_shared_by_accounts(self):
+        self.limiter.global_burst = 2
+
+        self.assertEqual(self.limiter._try_acquire("a"), 0)
+        self.assertEqual(self.limiter._try_acquire("b"), 0)
+
+        self.assertAlmostEqual(self.limiter._try_acquire("c"), 0.1)
+        self.assertAlmostEqual(self._tokens("garmin:ratelimit:account:c"), 3)
+
+    def test_keys_expire_after_full_refill(self):
+        self.limiter._try_acquire("a")
+
+        self.assertEqual(self.redis.ttls[self.GLOBAL_KEY], 3)
+        self.assertEqual(self.redis.ttls["garmin:ratelimit:account:a"], 4)
+
+    def test_acquire_waits_and_records_wait_time(self):
+        for _ in range(3):
+            self.limiter.acquire("a")
+
+        waited = self.limiter.acquire("a")
+
+        # 지터(최대 10%)를 더해 대기
+        self.assertGreaterEqual(waited, 1.0)
+        self.assertLessEqual(waited, 1.1)
+        values = self.metrics.read()
+        self.assertEqual(values["wait:count"], 4)
+        self.assertEqual(values["wait:bucket:0.0"], 3)
+        self.assertAlmostEqual(values["wait:sum"], waited)
+
+    def test_wait_longer_than_max_wait_raises(self):
+        self.limiter.account_rate = 0.1
+        for _ in range(3):
+            self.limiter.acquire("a")
+
+        with self.assertRaises(GarminRateLimitTimeout):
+            self.limiter.acquire("a")
+
+    def test_redis_error_lets_call_through(self):
+        self.redis.hmget = mock.Mock(side_effect=ConnectionError("down"))
+        self.assertEqual(self.limiter._try_acquire("a"), 0.0)
+
+
+class RetryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patches = [
+            mock.patch.object(
+                garmin_rate_limit,
+                "rate_limit_metrics",
+                RateLimitMetrics(redis_factory=lambda: self.redis),
+            ),
+            mock.patch.object(
+                garmin_rate_limit, "rate_limiter", GarminRateLimiter(enabled=False)
+            ),
+            mock.patch.object(garmin_rate_limit.time, "sleep"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _retry_counts(self) -> dict:
+        values = garmin_rate_limit.rate_limit_metrics.read()
+        return {
+            reason: values.get(f"backoff:{reason}:count", 0)
+            for reason in garmin_rate_limit.RETRY_REASONS
+        }
+
+    def test_retry_reason(self):
+        cases = {
+            http_error(429): "throttled",
+            requests.exceptions.RetryError(): "throttled",
+            requests.exceptions.ConnectTimeout(): "timeout",
+            requests.exceptions.ReadTimeout(): "timeout",
+            requests.ConnectionError(): "connection",
+            http_error(500): None,
+            ValueError(): None,
+        }
+        for error, reason in cases.items():
+            with self.subTest(error=type(error).__name__):
+                self.assertEqual(garmin_rate_limit._get_retry_reason(error), reason)
+
+    def test_retries_until_success(self):
+        responses = iter([http_error(429), requests.ConnectionError(), "ok"])
+
+        def func():
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        self.assertEqual(call_garmin(FakeClient(), func), "ok")
+        self.assertEqual(
+            self._retry_counts(), {"throttled": 1, "timeout": 0, "connection": 1}
+        )
+
+    def test_non_retryable_error_is_raised(self):
+        def func():
+            raise http_error(404)
+
+        with self.assertRaises(GarthHTTPError):
+            call_garmin(FakeClient(), func)
+        self.assertEqual(
+            self._retry_counts(), {"throttled": 0, "timeout": 0, "connection": 0}
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+"""워터마크 기반 증분 수집과 압축 저장 전환 테스트"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from fake_collectors import (
+    DAY_START,
+    TARGET_DATE,
+    FakeHeartRateCollector,
+    heart_rate_values,
+)
+from sqlalchemy import func, select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import HeartRateDaily, HeartRateReading
+from app.service import data_collector_service
+from app.service.data_collector_service import (
+    DataCollectionError,
+    GarminDataCollectorService,
+)
+from app.service.reading_writer import WRITE_MODE_EXECUTEMANY
+from app.service.watermark_service import CollectionWatermarkService
+
+
+class IncrementalCollectTestCase(unittest.TestCase):
+    FULL_WRITE = "FakeHeartRateCollector 데이터 저장 성공"
+
+    def setUp(self):
+        self.session = create_test_session()
+
+    def tearDown(self):
+        self.session.close()
+
+    def _service(self, packed_series: bool = False) -> GarminDataCollectorService:
+        return GarminDataCollectorService(
+            client=None,
+            session=self.session,
+            max_workers=1,
+            write_mode=WRITE_MODE_EXECUTEMANY,
+            daily_snapshot=False,
+            incremental=True,
+            archive_raw=False,
+            packed_series=packed_series,
+            rollups=False,
+            period_aggregates=False,
+        )
+
+    def _collect(self, values, packed_series: bool = False) -> str:
+        return self._collect_with(
+            FakeHeartRateCollector(self.session, values), packed_series
+        )
+
+    def _collect_with(self, collector, packed_series: bool = False) -> str:
+        return self._service(packed_series)._collect_with_collector(
+            collector, TEST_USER_ID, TARGET_DATE, TARGET_DATE.isoformat()
+        )
+
+    def _stored_values(self):
+        return list(
+            self.session.execute(
+                select(HeartRateReading.heart_rate).order_by(
+                    HeartRateReading.start_time_local
+                )
+            ).scalars()
+        )
+
+    def _watermark(self):
+        return CollectionWatermarkService(self.session).get(
+            TEST_USER_ID, "heart_rate", TARGET_DATE
+        )
+
+    def test_appends_readings_after_watermark(self):
+        self.assertEqual(self._collect(heart_rate_values(30)), self.FULL_WRITE)
+        daily_id = self.session.execute(select(HeartRateDaily.id)).scalar()
+
+        # 워터마크 시각(마지막 측정값)부터 다시 저장하므로 1 + 15건
+        result = self._collect(heart_rate_values(45))
+
+        self.assertIn("16건 추가", result)
+        self.assertEqual(self._stored_values(), heart_rate_values(45))
+        self.assertEqual(
+            self.session.execute(select(HeartRateDaily.id)).scalar(), daily_id
+        )
+        self.assertEqual(
+            self._watermark(),
+            (DAY_START + timedelta(minutes=2 * 44)).replace(tzinfo=timezone.utc),
+        )
+
+    def test_daily_aggregates_are_updated_in_place(self):
+        self._collect(heart_rate_values(30))
+
+        daily_id = self.session.execute(select(HeartRateDaily.id)).scalar()
+        values = heart_rate_values(45, offset=5)
+
+        result = self._collect_with(
+            FakeHeartRateCollector(self.session, values, resting_hr=48)
+        )
+
+        self.assertIn("16건 추가", result)
+        self.assertEqual(
+            self.session.execute(
+                select(
+                    HeartRateDaily.id, HeartRateDaily.resting_hr, HeartRateDaily.max_hr
+                )
+            ).one(),
+            (daily_id, 48, max(values)),
+        )
+
+    def test_disabled_incremental_rewrites_day(self):
+        self._collect(heart_rate_values(30))
+        service = self._service()
+        service.incremental = False
+
+        result = service._collect_with_collector(
+            FakeHeartRateCollector(self.session, heart_rate_values(45)),
+            TEST_USER_ID,
+            TARGET_DATE,
+            TARGET_DATE.isoformat(),
+        )
+
+        self.assertEqual(result, self.FULL_WRITE)
+        self.assertEqual(self._stored_values(), heart_rate_values(45))
+
+    def test_unpacking_rewrites_packed_day(self):
+        self._collect(heart_rate_values(30))
+        self._collect(heart_rate_values(40), packed_series=True)
+        self.assertEqual(
+            self.session.execute(
+                select(func.count()).select_from(HeartRateReading)
+            ).scalar(),
+            0,
+        )
+
+        # 워터마크가 남아 있어도 압축된 날짜는 전체를 다시 저장
+        result = self._collect(heart_rate_values(45))
+
+        self.assertEqual(result, self.FULL_WRITE)
+        self.assertEqual(self._stored_values(), heart_rate_values(45))
+        self.assertIsNone(
+            self.session.execute(select(HeartRateDaily.series_values)).scalar()
+        )
+
+    def test_packing_failure_does_not_leave_savepoint_open(self):
+        service = self._service(packed_series=True)
+        with mock.patch.object(
+            data_collector_service, "pack_readings", side_effect=ValueError("boom")
+        ):
+            with self.assertRaises(DataCollectionError):
+                service._collect_with_collector(
+                    FakeHeartRateCollector(self.session, heart_rate_values(30)),
+                    TEST_USER_ID,
+                    TARGET_DATE,
+                    TARGET_DATE.isoformat(),
+                    commit=False,
+                )
+
+        # 다음 컬렉터의 저장이 남은 세이브포인트 안으로 들어가지 않음
+        self.assertFalse(self.session.in_nested_transaction())
+
+
+class CollectionWatermarkTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.watermarks = CollectionWatermarkService(self.session)
+
+    def test_watermark_never_moves_backwards(self):
+        later = datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
+        self.assertIsNone(self.watermarks.get(TEST_USER_ID, "heart_rate", TARGET_DATE))
+
+        self.watermarks.advance(TEST_USER_ID, "heart_rate", TARGET_DATE, later)
+        self.watermarks.advance(
+            TEST_USER_ID, "heart_rate", TARGET_DATE, later - timedelta(hours=1)
+        )
+
+        self.assertEqual(
+            self.watermarks.get(TEST_USER_ID, "heart_rate", TARGET_DATE), later
+        )
+
+    def test_watermarks_are_kept_per_metric_and_date(self):
+        # naive datetime은 UTC로 간주
+        self.watermarks.advance(
+            TEST_USER_ID, "heart_rate", TARGET_DATE, datetime(2024, 1, 15, 8)
+        )
+
+        self.assertEqual(
+            self.watermarks.get(TEST_USER_ID, "heart_rate", TARGET_DATE),
+            datetime(2024, 1, 15, 8, tzinfo=timezone.utc),
+        )
+        self.assertIsNone(self.watermarks.get(TEST_USER_ID, "stress", TARGET_DATE))
+        self.assertIsNone(
+            self.watermarks.get(
+                TEST_USER_ID, "heart_rate", TARGET_DATE + timedelta(days=1)
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
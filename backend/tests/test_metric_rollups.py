@@ -0,0 +1,220 @@
+"""15분/1시간 시계열 집계 테스트"""
+
+import unittest
+from datetime import timedelta
+from types import SimpleNamespace
+
+from fake_collectors import (
+    DAY_START,
+    TARGET_DATE,
+    FakeHeartRateCollector,
+    heart_rate_values,
+)
+from sqlalchemy import func, select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import MetricRollup
+from app.service.data_collector_service import GarminDataCollectorService
+from app.service.reading_writer import WRITE_MODE_EXECUTEMANY
+from app.service.rollup_service import (
+    MetricRollupService,
+    RollupSpec,
+    build_rollups,
+    choose_resolution,
+)
+
+HEART_RATE = RollupSpec("heart_rate", "heart_rate")
+STRESS = RollupSpec("stress", "stress_level", min_value=0)
+STEPS = RollupSpec("steps", "steps", with_sum=True)
+
+
+def reading(minutes: int, **values) -> SimpleNamespace:
+    return SimpleNamespace(
+        start_time_local=DAY_START + timedelta(minutes=minutes), **values
+    )
+
+
+def rows_by_resolution(rows, resolution: int) -> list:
+    return [row for row in rows if row["resolution_seconds"] == resolution]
+
+
+class BuildRollupsTestCase(unittest.TestCase):
+    def test_min_max_avg_per_bucket(self):
+        readings = [
+            reading(0, heart_rate=60),
+            reading(10, heart_rate=70),
+            reading(20, heart_rate=90),
+            reading(75, heart_rate=100),
+        ]
+
+        rows = build_rollups(TEST_USER_ID, HEART_RATE, readings)
+
+        quarter = rows_by_resolution(rows, 900)
+        self.assertEqual(
+            [
+                (row["bucket_start_local"], row["min_value"], row["max_value"])
+                for row in quarter
+            ],
+            [
+                (DAY_START, 60, 70),
+                (DAY_START + timedelta(minutes=15), 90, 90),
+                (DAY_START + timedelta(minutes=75), 100, 100),
+            ],
+        )
+        self.assertEqual(quarter[0]["avg_value"], 65)
+        self.assertEqual(quarter[0]["sample_count"], 2)
+        self.assertIsNone(quarter[0]["sum_value"])
+
+        hourly = rows_by_resolution(rows, 3600)
+        self.assertEqual(
+            [(row["bucket_start_local"], row["sample_count"]) for row in hourly],
+            [(DAY_START, 3), (DAY_START + timedelta(hours=1), 1)],
+        )
+        self.assertAlmostEqual(hourly[0]["avg_value"], 220 / 3)
+
+    def test_missing_and_invalid_values_are_skipped(self):
+        readings = [
+            None,
+            reading(0, stress_level=-1),
+            reading(3, stress_level=None),
+            reading(6, stress_level=40),
+            reading(9, stress_level=0),
+        ]
+
+        (quarter,) = rows_by_resolution(
+            build_rollups(TEST_USER_ID, STRESS, readings), 900
+        )
+
+        self.assertEqual(
+            (quarter["min_value"], quarter["max_value"], quarter["sample_count"]),
+            (0, 40, 2),
+        )
+
+    def test_sum_for_additive_metrics(self):
+        readings = [reading(0, steps=100), reading(15, steps=250)]
+
+        (hourly,) = rows_by_resolution(
+            build_rollups(TEST_USER_ID, STEPS, readings), 3600
+        )
+
+        self.assertEqual(hourly["sum_value"], 350)
+
+    def test_no_readings_no_rows(self):
+        self.assertEqual(build_rollups(TEST_USER_ID, HEART_RATE, [None]), [])
+
+
+class ChooseResolutionTestCase(unittest.TestCase):
+    def test_finest_resolution_within_max_points(self):
+        cases = [
+            (timedelta(hours=6), 200, 900),
+            (timedelta(days=1), 96, 900),
+            (timedelta(days=1), 95, 3600),
+            (timedelta(days=7), 200, 3600),
+            # 어느 구간도 맞지 않으면 가장 큰 구간
+            (timedelta(days=30), 200, 3600),
+        ]
+        for span, max_points, expected in cases:
+            with self.subTest(span=span, max_points=max_points):
+                self.assertEqual(
+                    choose_resolution(DAY_START, DAY_START + span, max_points), expected
+                )
+
+
+class MetricRollupServiceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.service = MetricRollupService(self.session)
+
+    def _count(self) -> int:
+        return self.session.execute(
+            select(func.count()).select_from(MetricRollup)
+        ).scalar()
+
+    def test_replace_day_overwrites_previous_rollups(self):
+        self.service.replace_day(
+            TEST_USER_ID, HEART_RATE, TARGET_DATE, [reading(0, heart_rate=60)]
+        )
+        written = self.service.replace_day(
+            TEST_USER_ID,
+            HEART_RATE,
+            TARGET_DATE,
+            [reading(0, heart_rate=80), reading(20, heart_rate=90)],
+        )
+
+        self.assertEqual(written, 3)
+        self.assertEqual(self._count(), 3)
+        result = self.service.query(
+            TEST_USER_ID, "heart_rate", DAY_START, DAY_START + timedelta(hours=1)
+        )
+        self.assertEqual(result["resolution_seconds"], 900)
+        self.assertEqual(
+            [(point["time"], point["avg"]) for point in result["points"]],
+            [(DAY_START, 80), (DAY_START + timedelta(minutes=15), 90)],
+        )
+
+    def test_query_is_limited_to_range_and_metric(self):
+        self.service.replace_day(
+            TEST_USER_ID,
+            HEART_RATE,
+            TARGET_DATE,
+            [reading(0, heart_rate=60), reading(120, heart_rate=70)],
+        )
+        self.service.replace_day(
+            TEST_USER_ID, STRESS, TARGET_DATE, [reading(0, stress_level=30)]
+        )
+
+        result = self.service.query(
+            TEST_USER_ID,
+            "heart_rate",
+            DAY_START,
+            DAY_START + timedelta(hours=2),
+            max_points=1,
+        )
+
+        self.assertEqual(result["resolution_seconds"], 3600)
+        self.assertEqual(
+            [(point["time"], point["max"]) for point in result["points"]],
+            [(DAY_START, 60)],
+        )
+
+
+class CollectRollupsTestCase(unittest.TestCase):
+    def test_collecting_a_day_refreshes_rollups(self):
+        session = create_test_session()
+        self.addCleanup(session.close)
+        service = GarminDataCollectorService(
+            client=None,
+            session=session,
+            max_workers=1,
+            write_mode=WRITE_MODE_EXECUTEMANY,
+            incremental=False,
+            archive_raw=False,
+            packed_series=False,
+            rollups=True,
+            period_aggregates=False,
+        )
+
+        # 2분 간격 60건 = 2시간
+        service._collect_with_collector(
+            FakeHeartRateCollector(session, heart_rate_values(60)),
+            TEST_USER_ID,
+            TARGET_DATE,
+            TARGET_DATE.isoformat(),
+        )
+
+        counts = dict(
+            session.execute(
+                select(MetricRollup.resolution_seconds, func.count())
+                .where(MetricRollup.metric == "heart_rate")
+                .group_by(MetricRollup.resolution_seconds)
+            ).all()
+        )
+        self.assertEqual(counts, {900: 8, 3600: 2})
+        self.assertEqual(
+            session.execute(select(func.sum(MetricRollup.sample_count))).scalar(), 120
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""Garmin OAuth2 토큰 캐시 테스트 (캐시 적중/누락, 재발급 락 대기 시간 초과)"""
+
+import time
+import unittest
+
+from fake_redis import FakeRedis
+from garth.auth_tokens import OAuth1Token, OAuth2Token
+
+from core.util.oauth2_token_store import OAuth2TokenStore
+
+
+def make_oauth2_token(access_token: str, expires_in: int = 3600) -> OAuth2Token:
+    now = int(time.time())
+    return OAuth2Token(
+        scope="CONNECT_READ",
+        jti="jti",
+        token_type="Bearer",
+        access_token=access_token,
+        refresh_token="refresh",
+        expires_in=expires_in,
+        expires_at=now + expires_in,
+        refresh_token_expires_in=86400,
+        refresh_token_expires_at=now + 86400,
+    )
+
+
+class FakeFernet:
+    """cryptography 없이 암호화 경로를 통과시키는 대역 (접두어만 붙임)"""
+
+    def encrypt(self, data: bytes) -> bytes:
+        return b"encrypted:" + data
+
+    def decrypt(self, token: bytes) -> bytes:
+        if not token.startswith(b"encrypted:"):
+            raise ValueError("invalid token")
+        return token[len(b"encrypted:") :]
+
+
+class FakeGarthClient:
+    """재발급(refresh_oauth2) 횟수를 세는 garth 클라이언트 대역"""
+
+    def __init__(self, oauth_token: str = "oauth1-token"):
+        self.oauth1_token = OAuth1Token(
+            oauth_token=oauth_token, oauth_token_secret="secret"
+        )
+        self.oauth2_token = None
+        self.refresh_count = 0
+
+    def refresh_oauth2(self) -> None:
+        self.refresh_count += 1
+        self.oauth2_token = make_oauth2_token(f"refreshed-{self.refresh_count}")
+
+    def configure(self, oauth2_token: OAuth2Token) -> None:
+        self.oauth2_token = oauth2_token
+
+
+class OAuth2TokenStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.store = self._store(self.redis)
+
+    def _store(self, redis_client: FakeRedis) -> OAuth2TokenStore:
+        store = OAuth2TokenStore(
+            enabled=True, refresh_margin=300, redis_factory=lambda: redis_client
+        )
+        store._fernet = FakeFernet()
+        return store
+
+    def test_cache_hit_skips_refresh(self):
+        self.store.set("oauth1-token", make_oauth2_token("cached"))
+        client = FakeGarthClient()
+
+        self.store.configure_client(client)
+
+        self.assertEqual(client.refresh_count, 0)
+        self.assertEqual(client.oauth2_token.access_token, "cached")
+        self.assertEqual(self.redis.lock_calls, [])
+
+    def test_cache_miss_refreshes_under_lock(self):
+        client = FakeGarthClient()
+
+        self.store.configure_client(client)
+
+        key = self.store.make_key("oauth1-token")
+        self.assertEqual(client.refresh_count, 1)
+        self.assertEqual(self.redis.lock_calls, [f"{key}:lock"])
+        self.assertEqual(self.redis.released, [f"{key}:lock"])
+        self.assertTrue(self.redis.values[key].startswith(b"encrypted:"))
+        self.assertEqual(self.store.get("oauth1-token").access_token, "refreshed-1")
+
+        # 다음 클라이언트는 캐시된 토큰 재사용
+        next_client = FakeGarthClient()
+        self.store.configure_client(next_client)
+        self.assertEqual(next_client.refresh_count, 0)
+        self.assertEqual(next_client.oauth2_token.access_token, "refreshed-1")
+
+    def test_expiring_token_is_refreshed(self):
+        self.store.set("oauth1-token", make_oauth2_token("expiring", expires_in=60))
+        client = FakeGarthClient()
+
+        self.store.configure_client(client)
+
+        self.assertEqual(client.refresh_count, 1)
+        self.assertEqual(self.store.get("oauth1-token").access_token, "refreshed-1")
+
+    def test_lock_timeout_refreshes_without_lock(self):
+        redis_client = FakeRedis(lock_acquired=False)
+        store = self._store(redis_client)
+        client = FakeGarthClient()
+
+        store.configure_client(client)
+
+        self.assertEqual(client.refresh_count, 1)
+        self.assertEqual(len(redis_client.lock_calls), 1)
+        self.assertEqual(redis_client.released, [])
+        self.assertEqual(store.get("oauth1-token").access_token, "refreshed-1")
+
+    def test_undecryptable_token_is_replaced(self):
+        self.redis.set(self.store.make_key("oauth1-token"), b"garbage")
+        client = FakeGarthClient()
+
+        self.store.configure_client(client)
+
+        self.assertEqual(client.refresh_count, 1)
+        self.assertEqual(self.store.get("oauth1-token").access_token, "refreshed-1")
+
+    def test_disabled_always_refreshes(self):
+        store = OAuth2TokenStore(enabled=False, redis_factory=lambda: self.redis)
+        client = FakeGarthClient()
+
+        store.configure_client(client)
+
+        self.assertEqual(client.refresh_count, 1)
+        self.assertEqual(self.redis.values, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
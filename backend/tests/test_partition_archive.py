@@ -0,0 +1,275 @@
+"""오래된 측정값 파티션의 Parquet 보관과 보관 파일 조회 테스트"""
+
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from postgres_db import create_test_engine, requires_postgres
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import ArchivedPartition, Base, HeartRateDaily, HeartRateReading, User
+from app.service import partition_archive_service
+from app.service.partition_archive_service import (
+    ARCHIVE_PENDING_SCHEMA,
+    ArchivedReadingStore,
+    ArchiveStorage,
+    PartitionArchiver,
+    arrow_schema,
+    import_pyarrow,
+)
+
+try:
+    pa, pq = import_pyarrow()
+except RuntimeError:
+    pa = pq = None
+
+requires_pyarrow = unittest.skipIf(pa is None, "pyarrow가 없어 건너뜀")
+
+JANUARY_START = datetime(2023, 1, 1)
+
+
+def heart_rate_rows(daily_summary_id: int, start: datetime, count: int) -> list:
+    return [
+        {
+            "daily_summary_id": daily_summary_id,
+            "start_time_gmt": (start + timedelta(minutes=30 * index)).replace(
+                tzinfo=timezone.utc
+            ),
+            "start_time_local": start + timedelta(minutes=30 * index),
+            "heart_rate": 60 + index,
+            "created_at": datetime(2023, 2, 1, tzinfo=timezone.utc),
+            "updated_at": datetime(2023, 2, 1, tzinfo=timezone.utc),
+        }
+        for index in range(count)
+    ]
+
+
+class PartitionArchiverTestCase(unittest.TestCase):
+    def test_cutoff_is_retention_months_before_this_month(self):
+        archiver = PartitionArchiver(session=None, retention_months=12)
+        self.assertEqual(archiver.cutoff(date(2024, 3, 10)), datetime(2023, 3, 1))
+
+        archiver = PartitionArchiver(session=None, retention_months=1)
+        self.assertEqual(archiver.cutoff(date(2024, 1, 31)), datetime(2023, 12, 1))
+
+    def test_failed_partition_is_retried_next_run(self):
+        session = mock.Mock()
+        archiver = PartitionArchiver(session=session)
+        archiver.detach_cold_partitions = mock.Mock()
+        archiver.list_pending = mock.Mock(
+            return_value=[
+                ("heart_rate_readings_p20230101", "heart_rate_readings"),
+                ("stress_readings_p20230101", "stress_readings"),
+            ]
+        )
+        archiver.archive_partition = mock.Mock(
+            side_effect=[None, RuntimeError("disk full")]
+        )
+
+        result = archiver.run(date(2024, 3, 10))
+
+        self.assertEqual(result["archived"], ["heart_rate_readings_p20230101"])
+        self.assertEqual(result["failed"], {"stress_readings_p20230101": "disk full"})
+        session.rollback.assert_called_once()
+
+
+class ArchiveStorageTestCase(unittest.TestCase):
+    def test_local_directory(self):
+        with tempfile.TemporaryDirectory() as root:
+            source = os.path.join(root, "source.parquet")
+            with open(source, "wb") as source_file:
+                source_file.write(b"parquet")
+            storage = ArchiveStorage(os.path.join(root, "archive"))
+
+            uri = storage.put(source, "heart_rate_readings/p1.parquet")
+
+            self.assertFalse(storage.is_s3)
+            self.assertEqual(
+                uri, os.path.join(root, "archive", "heart_rate_readings", "p1.parquet")
+            )
+            self.assertEqual(storage.open(uri), uri)
+            with open(uri, "rb") as archived:
+                self.assertEqual(archived.read(), b"parquet")
+
+    def test_s3_uri(self):
+        storage = ArchiveStorage("s3://bucket/garmin/archive/")
+        storage._s3_client = mock.Mock()
+
+        uri = storage.put("/tmp/p1.parquet", "heart_rate_readings/p1.parquet")
+
+        self.assertEqual(
+            uri, "s3://bucket/garmin/archive/heart_rate_readings/p1.parquet"
+        )
+        storage._s3_client.upload_file.assert_called_once_with(
+            "/tmp/p1.parquet", "bucket", "garmin/archive/heart_rate_readings/p1.parquet"
+        )
+
+
+@requires_pyarrow
+class ArrowSchemaTestCase(unittest.TestCase):
+    def test_reading_columns(self):
+        schema = arrow_schema(Base.metadata.tables["heart_rate_readings"])
+
+        self.assertEqual(schema.field("daily_summary_id").type, pa.int64())
+        self.assertEqual(schema.field("start_time_local").type, pa.timestamp("us"))
+        self.assertEqual(
+            schema.field("start_time_gmt").type, pa.timestamp("us", tz="UTC")
+        )
+        self.assertFalse(schema.field("start_time_local").nullable)
+
+
+@requires_pyarrow
+class ArchivedReadingStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = temp_dir.name
+        self.store = ArchivedReadingStore(self.session, ArchiveStorage(self.root))
+
+    def _archive(self, partition_name: str, rows: list, range_start: datetime) -> None:
+        table = Base.metadata.tables["heart_rate_readings"]
+        uri = os.path.join(self.root, f"{partition_name}.parquet")
+        pq.write_table(pa.Table.from_pylist(rows, arrow_schema(table)), uri)
+        self.session.add(
+            ArchivedPartition(
+                partition_name=partition_name,
+                parent_table="heart_rate_readings",
+                range_start=range_start,
+                range_end=partition_archive_service._add_months(range_start, 1),
+                uri=uri,
+                row_count=len(rows),
+                size_bytes=os.path.getsize(uri),
+                sha256="0" * 64,
+            )
+        )
+        self.session.flush()
+
+    def test_reads_parent_rows_in_range(self):
+        day_start = datetime(2023, 1, 31)
+        self._archive(
+            "heart_rate_readings_p20230101",
+            heart_rate_rows(7, day_start, 48) + heart_rate_rows(8, day_start, 48),
+            JANUARY_START,
+        )
+        self._archive(
+            "heart_rate_readings_p20230201",
+            heart_rate_rows(7, datetime(2023, 2, 1), 48),
+            datetime(2023, 2, 1),
+        )
+
+        readings = self.store.load(
+            "heart_rate_readings",
+            7,
+            day_start + timedelta(hours=12),
+            day_start + timedelta(hours=36),
+        )
+
+        # 월 경계를 넘는 범위는 두 파일에서 읽어 시각 순으로 합침
+        self.assertEqual(len(readings), 48)
+        self.assertEqual(
+            readings[0]["start_time_local"], day_start + timedelta(hours=12)
+        )
+        self.assertEqual(
+            readings[-1]["start_time_local"],
+            day_start + timedelta(hours=35, minutes=30),
+        )
+        self.assertTrue(all(row["daily_summary_id"] == 7 for row in readings))
+
+    def test_uncatalogued_range_does_not_need_pyarrow(self):
+        with mock.patch.object(
+            partition_archive_service, "import_pyarrow", side_effect=RuntimeError
+        ):
+            readings = self.store.load(
+                "heart_rate_readings",
+                TEST_USER_ID,
+                JANUARY_START,
+                JANUARY_START + timedelta(days=1),
+            )
+
+        self.assertEqual(readings, [])
+
+
+@requires_postgres
+@requires_pyarrow
+class PartitionArchiveRunTestCase(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_test_engine()
+        self.addCleanup(self.engine.dispose)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = temp_dir.name
+        with self.engine.begin() as connection:
+            connection.execute(
+                text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_PENDING_SCHEMA}")
+            )
+            for month in ("2023-01-01", "2024-05-01"):
+                suffix = month.replace("-", "")
+                connection.execute(
+                    text(
+                        f"CREATE TABLE heart_rate_readings_p{suffix} "
+                        "PARTITION OF heart_rate_readings "
+                        f"FOR VALUES FROM ('{month}') "
+                        f"TO ('{month}'::date + interval '1 month')"
+                    )
+                )
+        with Session(self.engine) as session:
+            session.add(
+                User(
+                    id=TEST_USER_ID,
+                    email="test@example.com",
+                    oauth_token="token",
+                    oauth_token_secret="secret",
+                )
+            )
+            self.daily_ids = []
+            for day in (date(2023, 1, 15), date(2024, 5, 15)):
+                daily = HeartRateDaily(user_id=TEST_USER_ID, date=day)
+                session.add(daily)
+                session.flush()
+                self.daily_ids.append(daily.id)
+                session.execute(
+                    HeartRateReading.__table__.insert(),
+                    heart_rate_rows(
+                        daily.id, datetime.combine(day, datetime.min.time()), 48
+                    ),
+                )
+            session.commit()
+
+    def test_cold_partition_is_archived_and_readable(self):
+        with Session(self.engine) as session:
+            result = PartitionArchiver(
+                session, ArchiveStorage(self.root), retention_months=12
+            ).run(date(2024, 6, 10))
+
+            self.assertEqual(result["archived"], ["heart_rate_readings_p20230101"])
+            self.assertEqual(result["failed"], {})
+            archived = session.get(ArchivedPartition, "heart_rate_readings_p20230101")
+            self.assertEqual(archived.row_count, 48)
+            self.assertEqual(archived.range_start, JANUARY_START)
+            self.assertEqual(archived.range_end, datetime(2023, 2, 1))
+            self.assertTrue(os.path.exists(archived.uri))
+            # 보관된 행은 DB에서 제거되고, 보관 기간 안의 파티션은 그대로
+            self.assertEqual(
+                session.execute(
+                    select(func.count()).select_from(HeartRateReading)
+                ).scalar(),
+                48,
+            )
+
+            readings = ArchivedReadingStore(session, ArchiveStorage(self.root)).load(
+                "heart_rate_readings",
+                self.daily_ids[0],
+                datetime(2023, 1, 15),
+                datetime(2023, 1, 16),
+            )
+        self.assertEqual([row["heart_rate"] for row in readings], list(range(60, 108)))
+
+
+if __name__ == "__main__":
+    unittest.main()
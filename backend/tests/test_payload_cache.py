@@ -0,0 +1,145 @@
+"""Garmin 원본 응답 캐시와 동기 Redis 클라이언트 테스트"""
+
+import pickle
+import unittest
+from datetime import date, datetime, timedelta, timezone
+from unittest import mock
+
+from fake_redis import FakeRedis
+
+from app.service import _base_service
+from app.service._base_service import BaseGarminService
+from core.util import sync_redis
+from core.util.payload_cache import PayloadCache
+
+
+class FakeClient:
+    def __init__(self, display_name: str):
+        self.profile = {"displayName": display_name}
+
+
+PAYLOAD = {"calendarDate": "2024-01-15", "heartRateValues": [[1, 60], [2, None]]}
+
+
+class PayloadCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+
+    def _cache(self) -> PayloadCache:
+        return PayloadCache(
+            enabled=True,
+            recent_ttl=60,
+            past_ttl=3600,
+            redis_factory=lambda: self.redis,
+        )
+
+    def test_shared_through_redis_as_json(self):
+        fetches = []
+        self._cache().get_or_fetch(
+            "heart_rate", "runner", "2024-01-15", lambda: fetches.append(1) or PAYLOAD
+        )
+
+        # 다른 프로세스(새 L1)도 Redis 값을 사용
+        data = self._cache().get_or_fetch(
+            "heart_rate", "runner", "2024-01-15", lambda: fetches.append(1) or PAYLOAD
+        )
+
+        self.assertEqual(data, PAYLOAD)
+        self.assertEqual(len(fetches), 1)
+        key = "garmin:raw:heart_rate:runner:2024-01-15"
+        self.assertEqual(self.redis.ttls[key], 3600)
+        self.assertTrue(self.redis.values[key].startswith(b"{"))
+
+    def test_pickled_value_is_not_loaded(self):
+        self.redis.set("garmin:raw:heart_rate:runner:2024-01-15", pickle.dumps(PAYLOAD))
+        self.assertIsNone(self._cache().get("heart_rate", "runner", "2024-01-15"))
+
+    def test_empty_response_is_not_cached(self):
+        self._cache().set("heart_rate", "runner", "2024-01-15", None)
+        self.assertEqual(self.redis.values, {})
+
+    def test_l1_serves_without_redis(self):
+        cache = PayloadCache(enabled=True, redis_factory=lambda: None)
+        cache.set("heart_rate", "runner", "2024-01-15", PAYLOAD)
+        self.assertEqual(cache.get("heart_rate", "runner", "2024-01-15"), PAYLOAD)
+
+    def test_redis_errors_fall_back_to_fetch(self):
+        broken = mock.Mock()
+        broken.get.side_effect = ConnectionError("down")
+        broken.set.side_effect = ConnectionError("down")
+        cache = PayloadCache(enabled=True, redis_factory=lambda: broken)
+
+        data = cache.get_or_fetch("heart_rate", "runner", "2024-01-15", lambda: PAYLOAD)
+
+        self.assertEqual(data, PAYLOAD)
+
+    def test_invalidate_clears_both_levels(self):
+        cache = self._cache()
+        cache.set("heart_rate", "runner", "2024-01-15", PAYLOAD)
+
+        cache.invalidate("heart_rate", "runner", "2024-01-15")
+
+        self.assertIsNone(cache.get("heart_rate", "runner", "2024-01-15"))
+        self.assertEqual(self.redis.values, {})
+
+    def test_disabled_cache_always_fetches(self):
+        cache = PayloadCache(enabled=False, redis_factory=lambda: self.redis)
+        fetches = []
+        for _ in range(2):
+            cache.get_or_fetch(
+                "heart_rate",
+                "runner",
+                "2024-01-15",
+                lambda: fetches.append(1) or PAYLOAD,
+            )
+        self.assertEqual(len(fetches), 2)
+
+    def test_services_share_payloads_per_user(self):
+        cache = self._cache()
+        calls = []
+
+        def fetch_raw(date_str, client=None):
+            calls.append((client.profile["displayName"], date_str))
+            return PAYLOAD
+
+        with mock.patch.object(_base_service, "payload_cache", cache):
+            for display_name in ("runner", "runner", "walker"):
+                service = BaseGarminService(FakeClient(display_name))
+                self.assertEqual(
+                    service._fetch_raw_cached("heart_rate", "2024-01-15", fetch_raw),
+                    PAYLOAD,
+                )
+
+        self.assertEqual(calls, [("runner", "2024-01-15"), ("walker", "2024-01-15")])
+
+    def test_recent_dates_use_short_ttl(self):
+        cache = self._cache()
+        today = datetime.now(timezone.utc).date()
+        self.assertEqual(cache.ttl_for(today.isoformat()), 60)
+        self.assertEqual(cache.ttl_for((today - timedelta(days=1)).isoformat()), 60)
+        self.assertEqual(cache.ttl_for(date(2024, 1, 15).isoformat()), 3600)
+        self.assertEqual(cache.ttl_for("not-a-date"), 60)
+
+
+class SyncRedisTestCase(unittest.TestCase):
+    def setUp(self):
+        sync_redis.get_sync_redis.cache_clear()
+        self.addCleanup(sync_redis.get_sync_redis.cache_clear)
+
+    def test_non_redis_url_is_checked_once(self):
+        with mock.patch.object(sync_redis, "SYNC_REDIS_URL", "rpc://"):
+            with self.assertLogs(sync_redis.logger, "WARNING") as logs:
+                self.assertIsNone(sync_redis.get_sync_redis())
+                self.assertIsNone(sync_redis.get_sync_redis())
+        self.assertEqual(len(logs.records), 1)
+
+    def test_redis_client_is_reused(self):
+        with mock.patch.object(
+            sync_redis, "SYNC_REDIS_URL", "redis://localhost:6379/0"
+        ):
+            client = sync_redis.get_sync_redis()
+            self.assertIs(sync_redis.get_sync_redis(), client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""주간/월간 기간 집계 테스트"""
+
+import unittest
+from datetime import date, timedelta
+
+from sqlalchemy import func, select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import PeriodAggregate, StepsDaily
+from app.service.period_aggregate_service import (
+    PERIOD_MONTH,
+    PERIOD_WEEK,
+    PeriodAggregateService,
+    choose_period,
+    period_bounds,
+    summarize_period,
+)
+
+# 2024-01-01은 월요일
+JANUARY = [date(2024, 1, 1) + timedelta(days=offset) for offset in range(31)]
+
+
+class PeriodBoundsTestCase(unittest.TestCase):
+    def test_week_starts_on_monday(self):
+        self.assertEqual(
+            period_bounds(PERIOD_WEEK, date(2024, 1, 10)),
+            (date(2024, 1, 8), date(2024, 1, 14)),
+        )
+        self.assertEqual(
+            period_bounds(PERIOD_WEEK, date(2024, 1, 8)),
+            (date(2024, 1, 8), date(2024, 1, 14)),
+        )
+
+    def test_month_bounds(self):
+        self.assertEqual(
+            period_bounds(PERIOD_MONTH, date(2024, 2, 15)),
+            (date(2024, 2, 1), date(2024, 2, 29)),
+        )
+        self.assertEqual(
+            period_bounds(PERIOD_MONTH, date(2024, 12, 31)),
+            (date(2024, 12, 1), date(2024, 12, 31)),
+        )
+
+    def test_unknown_period(self):
+        with self.assertRaises(ValueError):
+            period_bounds("year", date(2024, 1, 1))
+
+    def test_long_ranges_use_monthly_aggregates(self):
+        start = date(2024, 1, 1)
+        self.assertEqual(choose_period(start, start + timedelta(days=61)), PERIOD_WEEK)
+        self.assertEqual(choose_period(start, start + timedelta(days=62)), PERIOD_MONTH)
+
+
+class SummarizePeriodTestCase(unittest.TestCase):
+    def test_statistics(self):
+        start = date(2024, 1, 1)
+        days = [
+            (start, 8000, 10000),
+            (start + timedelta(days=1), None, 10000),
+            (start + timedelta(days=2), 12000, 10000),
+            (start + timedelta(days=3), 10000, 10000),
+            (start + timedelta(days=4), 14000, None),
+        ]
+
+        stats = summarize_period(start, days)
+
+        self.assertEqual(stats["day_count"], 4)
+        self.assertEqual(stats["mean"], 11000)
+        self.assertEqual((stats["min_value"], stats["max_value"]), (8000, 14000))
+        self.assertEqual(stats["p50"], 11000)
+        self.assertAlmostEqual(stats["p10"], 8600)
+        self.assertAlmostEqual(stats["p90"], 13400)
+        # (0, 8000), (2, 12000), (3, 10000), (4, 14000)의 최소제곱 기울기
+        self.assertAlmostEqual(stats["trend_slope"], 1257.142857, places=5)
+        # 목표가 있는 3일 중 목표 이상 2일
+        self.assertEqual(stats["goal_days"], 2)
+        self.assertAlmostEqual(stats["goal_hit_rate"], 2 / 3)
+
+    def test_without_values_or_goals(self):
+        start = date(2024, 1, 1)
+        self.assertIsNone(summarize_period(start, [(start, None, None)]))
+
+        stats = summarize_period(start, [(start, 55, None)])
+        self.assertIsNone(stats["trend_slope"])
+        self.assertIsNone(stats["goal_hit_rate"])
+        self.assertEqual(stats["p90"], 55)
+
+
+class PeriodAggregateServiceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.service = PeriodAggregateService(self.session)
+        self.session.add_all(
+            StepsDaily(
+                user_id=TEST_USER_ID,
+                date=day,
+                total_steps=1000 * (index + 1),
+                goal_steps=10000,
+            )
+            for index, day in enumerate(JANUARY)
+        )
+        self.session.flush()
+
+    def _aggregate_count(self) -> int:
+        return self.session.execute(
+            select(func.count()).select_from(PeriodAggregate)
+        ).scalar()
+
+    def test_refresh_range_and_query_weeks(self):
+        written = self.service.refresh_range(TEST_USER_ID, JANUARY[0], JANUARY[-1])
+
+        # 주 5개(1월 29일 주 포함) + 월 1개, 값이 있는 지표는 total_steps뿐
+        self.assertEqual(written, 6)
+        result = self.service.query(
+            TEST_USER_ID, date(2024, 1, 8), date(2024, 1, 21), metrics=["total_steps"]
+        )
+        self.assertEqual(result["period"], PERIOD_WEEK)
+        weeks = result["data"]["total_steps"]
+        self.assertEqual(
+            [(week["period_start"], week["days"]) for week in weeks],
+            [(date(2024, 1, 8), 7), (date(2024, 1, 15), 7)],
+        )
+        self.assertEqual(weeks[0]["mean"], 11000)
+        self.assertAlmostEqual(weeks[1]["goal_hit_rate"], 1.0)
+        self.assertAlmostEqual(weeks[0]["trend_slope"], 1000)
+
+    def test_query_month_for_long_range(self):
+        self.service.refresh_range(TEST_USER_ID, JANUARY[0], JANUARY[-1])
+
+        result = self.service.query(TEST_USER_ID, date(2024, 1, 1), date(2024, 3, 31))
+
+        self.assertEqual(result["period"], PERIOD_MONTH)
+        (month,) = result["data"]["total_steps"]
+        self.assertEqual(month["days"], 31)
+        self.assertEqual(month["period_end"], date(2024, 1, 31))
+        self.assertAlmostEqual(month["goal_hit_rate"], 22 / 31)
+
+    def test_refresh_day_replaces_its_week_and_month(self):
+        self.service.refresh_range(TEST_USER_ID, JANUARY[0], JANUARY[-1])
+        steps = self.session.execute(
+            select(StepsDaily).where(StepsDaily.date == date(2024, 1, 10))
+        ).scalar_one()
+        steps.total_steps = None
+        self.session.flush()
+
+        self.assertEqual(self.service.refresh_day(TEST_USER_ID, date(2024, 1, 10)), 2)
+
+        self.assertEqual(self._aggregate_count(), 6)
+        result = self.service.query(
+            TEST_USER_ID, date(2024, 1, 8), date(2024, 1, 14), period=PERIOD_WEEK
+        )
+        self.assertEqual(result["data"]["total_steps"][0]["days"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""보관된 원본 응답 재처리 테스트 (이미 저장된 날짜 다시 쓰기)"""
+
+import unittest
+from datetime import timedelta
+
+from fake_collectors import DAY_START, TARGET_DATE, heart_rate_values
+from sqlalchemy import func, select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import HeartRateDaily, HeartRateReading
+from app.service.data_collector_service import GarminDataCollectorService
+from app.service.raw_payload_service import RawPayloadArchive
+from app.service.reading_writer import WRITE_MODE_COPY
+from task.util import replay_garmin_raw_payloads
+
+
+def heart_rate_payload(values):
+    """Garmin dailyHeartRate 원본 응답 형태"""
+    start_ms = int(DAY_START.timestamp() * 1000)
+    return {
+        "userProfilePK": TEST_USER_ID,
+        "calendarDate": TARGET_DATE.isoformat(),
+        "startTimestampGMT": DAY_START.isoformat(),
+        "endTimestampGMT": (DAY_START + timedelta(days=1)).isoformat(),
+        "startTimestampLocal": DAY_START.isoformat(),
+        "endTimestampLocal": (DAY_START + timedelta(days=1)).isoformat(),
+        "maxHeartRate": max(values),
+        "minHeartRate": min(values),
+        "restingHeartRate": 55,
+        "heartRateValues": [
+            [start_ms + index * 120_000, value] for index, value in enumerate(values)
+        ],
+    }
+
+
+class RawPayloadReplayTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.archive = RawPayloadArchive(self.session)
+
+    def tearDown(self):
+        self.session.close()
+
+    def _archive_heart_rate(self, values):
+        self.archive.save_many(
+            TEST_USER_ID, TARGET_DATE, {"heart_rate": heart_rate_payload(values)}
+        )
+        self.session.commit()
+
+    def _replay(self) -> dict:
+        date_str = TARGET_DATE.isoformat()
+        return replay_garmin_raw_payloads(
+            self.session, date_str, date_str, user_id=TEST_USER_ID
+        )
+
+    def _count(self, model) -> int:
+        return self.session.execute(select(func.count()).select_from(model)).scalar()
+
+    def test_replay_day_already_stored(self):
+        self._archive_heart_rate(heart_rate_values(30))
+        self.assertEqual(self._replay()[str(TEST_USER_ID)]["succeeded"], 1)
+
+        # 매퍼 변경 후 재처리처럼 같은 날짜를 다시 저장
+        self._archive_heart_rate(heart_rate_values(40, offset=3))
+        summary = self._replay()[str(TEST_USER_ID)]
+
+        self.assertEqual(summary, {"succeeded": 1, "failed": {}})
+        self.assertEqual(self._count(HeartRateDaily), 1)
+        self.assertEqual(self._count(HeartRateReading), 40)
+
+    def test_replay_requires_upsert_mode(self):
+        service = GarminDataCollectorService(
+            client=None,
+            session=self.session,
+            write_mode=WRITE_MODE_COPY,
+            incremental=False,
+            archive_raw=False,
+        )
+        with self.assertRaises(ValueError):
+            service.replay_range(TEST_USER_ID, TARGET_DATE, TARGET_DATE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+측정값 테이블 재파티션 마이그레이션 테스트 (PostgreSQL 필요)
+
+- f3b6d8e2a417을 되돌렸다가 다시 적용해도 기존 파티션과 이름이 겹치지 않고
+  측정값이 그대로 옮겨지는지 확인
+"""
+
+import argparse
+import os
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from postgres_db import (
+    READING_TABLES,
+    TEST_DATABASE_URL,
+    create_test_engine,
+    requires_postgres,
+)
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.model import HeartRateDaily, HeartRateReading, User
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# f3b6d8e2a417 (start_time_local 파티션) 직전 리비전
+BEFORE_PARTITION_REVISION = "e5a9c1f7b203"
+TEST_USER_ID = 1
+# 월 경계를 넘도록 두 달에 걸친 측정값
+DAYS = (date(2024, 1, 31), date(2024, 2, 1))
+READINGS_PER_DAY = 48
+
+
+def alembic_config():
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migration"))
+    config.cmd_opts = argparse.Namespace(x=[f"url={TEST_DATABASE_URL}"])
+    return config
+
+
+@requires_postgres
+class ReadingPartitionMigrationTestCase(unittest.TestCase):
+    def setUp(self):
+        from alembic import command
+
+        self.command = command
+        self.engine = create_test_engine()
+        self.config = alembic_config()
+        command.stamp(self.config, "head")
+        self._seed()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _seed(self) -> None:
+        with Session(self.engine) as session:
+            session.add(
+                User(
+                    id=TEST_USER_ID,
+                    email="test@example.com",
+                    oauth_token="token",
+                    oauth_token_secret="secret",
+                )
+            )
+            for target_date in DAYS:
+                daily = HeartRateDaily(user_id=TEST_USER_ID, date=target_date)
+                day_start = datetime.combine(target_date, datetime.min.time())
+                for index in range(READINGS_PER_DAY):
+                    local = day_start + timedelta(minutes=30 * index)
+                    HeartRateReading(
+                        start_time_gmt=local.replace(tzinfo=timezone.utc),
+                        start_time_local=local,
+                        heart_rate=60 + index,
+                        daily_summary=daily,
+                    )
+                session.add(daily)
+            session.commit()
+
+    def _partitions(self, table: str) -> list:
+        with self.engine.connect() as connection:
+            return list(
+                connection.execute(
+                    text(
+                        """
+                        SELECT c.relname
+                        FROM pg_inherits i
+                        JOIN pg_class c ON c.oid = i.inhrelid
+                        WHERE i.inhparent = to_regclass(:parent)
+                        """
+                    ),
+                    {"parent": f"public.{table}"},
+                ).scalars()
+            )
+
+    def _old_relations(self) -> list:
+        with self.engine.connect() as connection:
+            return list(
+                connection.execute(
+                    text(
+                        "SELECT relname FROM pg_class "
+                        "WHERE relname LIKE '%\\_old%' AND relkind IN ('r', 'p')"
+                    )
+                ).scalars()
+            )
+
+    def _reading_count(self) -> int:
+        with Session(self.engine) as session:
+            return session.execute(
+                select(func.count()).select_from(HeartRateReading)
+            ).scalar()
+
+    def test_downgrade_and_upgrade_keep_readings(self):
+        expected = len(DAYS) * READINGS_PER_DAY
+
+        # created_at 기준으로 되돌린 뒤 (월 파티션 이름이 새 파티션과 같아짐) 다시 적용
+        self.command.downgrade(self.config, BEFORE_PARTITION_REVISION)
+        self.assertEqual(self._reading_count(), expected)
+        self.command.upgrade(self.config, "head")
+
+        self.assertEqual(self._reading_count(), expected)
+        self.assertEqual(self._old_relations(), [])
+        for table in READING_TABLES:
+            self.assertIn(f"{table}_default", self._partitions(table))
+        # 측정 시각 기준 파티션이라 두 달의 측정값이 각 달 파티션에 들어감
+        with self.engine.connect() as connection:
+            default_rows = connection.execute(
+                text("SELECT count(*) FROM heart_rate_readings_default")
+            ).scalar()
+        self.assertEqual(default_rows, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
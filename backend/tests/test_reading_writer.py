@@ -0,0 +1,144 @@
+"""측정값 대량 저장(COPY/executemany) 테스트"""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from fake_collectors import DAY_START, TARGET_DATE, heart_rate_values
+from sqlalchemy import func, select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import HeartRateDaily, HeartRateReading
+from app.service.reading_writer import (
+    WRITE_MODE_COPY,
+    WRITE_MODE_EXECUTEMANY,
+    WRITE_MODE_ORM,
+    ReadingBulkWriter,
+    _format_copy_value,
+)
+
+
+def heart_rate_readings(values, start=DAY_START):
+    return [
+        HeartRateReading(
+            start_time_gmt=(start + timedelta(minutes=2 * index)).replace(
+                tzinfo=timezone.utc
+            ),
+            start_time_local=start + timedelta(minutes=2 * index),
+            heart_rate=value,
+        )
+        for index, value in enumerate(values)
+    ]
+
+
+class FakeCursor:
+    """copy_expert로 받은 SQL과 데이터만 기록"""
+
+    def __init__(self):
+        self.copies = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def copy_expert(self, sql: str, buffer) -> None:
+        self.copies.append((sql, buffer.read()))
+
+
+class FormatCopyValueTestCase(unittest.TestCase):
+    def test_null_and_escapes(self):
+        self.assertEqual(_format_copy_value(None), r"\N")
+        self.assertEqual(_format_copy_value(72), "72")
+        self.assertEqual(_format_copy_value("a\tb\nc\\d\re"), "a\\tb\\nc\\\\d\\re")
+        self.assertEqual(
+            _format_copy_value(datetime(2024, 1, 15, 8, 30, tzinfo=timezone.utc)),
+            "2024-01-15T08:30:00+00:00",
+        )
+
+
+class ReadingBulkWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+
+    def _count(self, model) -> int:
+        return self.session.execute(select(func.count()).select_from(model)).scalar()
+
+    def _daily(self) -> HeartRateDaily:
+        return HeartRateDaily(user_id=TEST_USER_ID, date=TARGET_DATE, resting_hr=55)
+
+    def test_unsupported_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            ReadingBulkWriter(self.session, WRITE_MODE_ORM)
+
+    def test_executemany_writes_parent_and_readings(self):
+        daily = self._daily()
+        readings = heart_rate_readings(heart_rate_values(30))
+        for reading in readings:
+            reading.daily_summary = daily
+
+        written = ReadingBulkWriter(self.session, WRITE_MODE_EXECUTEMANY).write(
+            daily, {"readings": readings}
+        )
+
+        self.assertEqual(written, 30)
+        self.assertIsNotNone(daily.id)
+        # 측정값은 identity map을 거치지 않음 (부모 컬렉션도 비움)
+        self.assertEqual(daily.readings, [])
+        self.assertTrue(all(reading not in self.session for reading in readings))
+        self.session.commit()
+        stored = self.session.execute(
+            select(
+                HeartRateReading.daily_summary_id,
+                HeartRateReading.heart_rate,
+                HeartRateReading.created_at,
+            ).order_by(HeartRateReading.start_time_local)
+        ).all()
+        self.assertEqual([row.heart_rate for row in stored], heart_rate_values(30))
+        self.assertTrue(all(row.daily_summary_id == daily.id for row in stored))
+        self.assertTrue(all(row.created_at is not None for row in stored))
+
+    def test_append_adds_readings_to_stored_parent(self):
+        daily = self._daily()
+        self.session.add(daily)
+        self.session.flush()
+
+        writer = ReadingBulkWriter(self.session, WRITE_MODE_EXECUTEMANY)
+        appended = writer.append(
+            HeartRateDaily, daily.id, heart_rate_readings(heart_rate_values(10))
+        )
+
+        self.assertEqual(appended, 10)
+        self.assertEqual(writer.append(HeartRateDaily, daily.id, [None]), 0)
+        self.assertEqual(self._count(HeartRateReading), 10)
+
+    def test_copy_writes_text_rows_to_table(self):
+        cursor = FakeCursor()
+        connection = mock.Mock()
+        connection.schema_for_object.return_value = None
+        connection.connection.dbapi_connection.cursor.return_value = cursor
+        writer = ReadingBulkWriter(self.session, WRITE_MODE_COPY)
+        daily = self._daily()
+        self.session.add(daily)
+        self.session.flush()
+
+        with mock.patch.object(self.session, "connection", return_value=connection):
+            writer.append(HeartRateDaily, daily.id, heart_rate_readings([60, 61]))
+
+        ((sql, data),) = cursor.copies
+        self.assertTrue(sql.startswith('COPY "heart_rate_readings" ('))
+        self.assertTrue(sql.endswith(") FROM STDIN"))
+        columns = sql[sql.index("(") + 1 : sql.index(")")].replace('"', "").split(", ")
+        lines = data.splitlines()
+        self.assertEqual(len(lines), 2)
+        first = dict(zip(columns, lines[0].split("\t")))
+        self.assertEqual(first["heart_rate"], "60")
+        self.assertEqual(first["daily_summary_id"], str(daily.id))
+        self.assertNotEqual(first["created_at"], r"\N")
+        self.assertEqual(first["start_time_local"], DAY_START.isoformat())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+"""복제 지연 확인과 조회 전용 세션의 복제본 라우팅 테스트"""
+
+import asyncio
+import unittest
+from typing import Type
+from unittest import mock
+
+from pydantic import BaseModel
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.agent.tool import base_tool
+from app.agent.tool.base_tool import BaseDBTool
+from core.db import celery_session
+from core.db import session as async_session
+from core.db.replica import ReplicaLagGuard
+
+
+def set_lag(engine: mock.MagicMock, lag) -> None:
+    connection = engine.connect.return_value.__enter__.return_value
+    connection.execute.return_value.scalar.return_value = lag
+
+
+def lag_engine(lag=None, error=None) -> mock.MagicMock:
+    """REPLICA_LAG_QUERY 결과(또는 연결 오류)만 돌려주는 엔진"""
+    engine = mock.MagicMock()
+    if error is not None:
+        engine.connect.side_effect = error
+    set_lag(engine, lag)
+    return engine
+
+
+def async_lag_engine(lag) -> mock.MagicMock:
+    engine = mock.MagicMock()
+    connection = engine.connect.return_value.__aenter__.return_value
+    connection.execute = mock.AsyncMock(
+        return_value=mock.Mock(**{"scalar.return_value": lag})
+    )
+    return engine
+
+
+class ReplicaLagGuardTestCase(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        patch = mock.patch("core.db.replica.time.monotonic", lambda: self.now)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.guard = ReplicaLagGuard(max_lag_seconds=5, check_interval=10)
+
+    def test_result_is_reused_for_check_interval(self):
+        self.assertTrue(self.guard.needs_check())
+        self.assertTrue(self.guard.record(1.5))
+
+        self.now += 9
+        self.assertFalse(self.guard.needs_check())
+        self.now += 1
+        self.assertTrue(self.guard.needs_check())
+
+    def test_lag_over_limit_or_failed_check_uses_primary(self):
+        self.assertTrue(self.guard.record(5))
+        self.assertFalse(self.guard.record(5.1))
+        self.assertTrue(self.guard.record(0))
+
+        self.guard.mark_failed()
+
+        self.assertFalse(self.guard.healthy)
+        self.assertIsNone(self.guard.lag)
+        self.assertFalse(self.guard.needs_check())
+
+
+class CreateReadSessionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        patches = [
+            mock.patch("core.db.replica.time.monotonic", lambda: self.now),
+            mock.patch.object(celery_session, "replica_guard", ReplicaLagGuard(5, 10)),
+            mock.patch.object(celery_session, "SessionFactory", lambda: "primary"),
+            mock.patch.object(
+                celery_session, "ReplicaSessionFactory", lambda: "replica"
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def _use_replica(self, engine) -> None:
+        patch = mock.patch.object(celery_session, "replica_engine", engine)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_without_replica_uses_primary(self):
+        self._use_replica(None)
+
+        self.assertEqual(celery_session.create_read_session(), "primary")
+
+    def test_replica_within_lag_and_cached_check(self):
+        engine = lag_engine(lag=1.0)
+        self._use_replica(engine)
+
+        self.assertEqual(celery_session.create_read_session(), "replica")
+        self.assertEqual(celery_session.create_read_session(), "replica")
+        engine.connect.assert_called_once()
+
+    def test_lagging_replica_uses_primary_until_next_check(self):
+        engine = lag_engine(lag=30.0)
+        self._use_replica(engine)
+
+        self.assertEqual(celery_session.create_read_session(), "primary")
+
+        set_lag(engine, 0.0)
+        self.assertEqual(celery_session.create_read_session(), "primary")
+        self.now += 10
+        self.assertEqual(celery_session.create_read_session(), "replica")
+
+    def test_unreachable_replica_uses_primary(self):
+        self._use_replica(lag_engine(error=OSError("connection refused")))
+
+        self.assertEqual(celery_session.create_read_session(), "primary")
+        self.assertIsNone(celery_session.replica_guard.lag)
+
+
+class GetReadSessionTestCase(unittest.TestCase):
+    def _read_session_bind(self, engine) -> str:
+        factories, sessions = {}, {}
+        for name in ("primary", "replica"):
+            sessions[name] = mock.Mock(close=mock.AsyncMock())
+            factories[name] = mock.MagicMock()
+            factories[name].return_value.__aenter__.return_value = sessions[name]
+
+        async def first_session():
+            generator = async_session.get_read_session()
+            session = await generator.__anext__()
+            await generator.aclose()
+            session.close.assert_awaited_once()
+            return session
+
+        with mock.patch.multiple(
+            async_session,
+            replica_engine=engine,
+            replica_guard=ReplicaLagGuard(5, 10),
+            async_session_factory=factories["primary"],
+            replica_session_factory=factories["replica"],
+        ):
+            session = asyncio.run(first_session())
+        return next(name for name, value in sessions.items() if value is session)
+
+    def test_replica_within_lag(self):
+        self.assertEqual(self._read_session_bind(async_lag_engine(1.0)), "replica")
+
+    def test_lagging_or_missing_replica_uses_primary(self):
+        self.assertEqual(self._read_session_bind(async_lag_engine(30.0)), "primary")
+        self.assertEqual(self._read_session_bind(None), "primary")
+
+
+class ReplicaBoundTool(BaseDBTool):
+    """복제본 세션이면 연결 오류, primary 세션이면 조회 결과"""
+
+    name: str = "replica_bound"
+    description: str = "테스트 도구"
+    args_schema: Type[BaseModel] = BaseModel
+
+    def _execute(self, session: Session, user_id: int):
+        if session.get_bind() is base_tool.replica_engine:
+            raise OperationalError("SELECT 1", {}, Exception("replica down"))
+        return session.execute(text("SELECT 'primary'")).scalar()
+
+
+class BaseDBToolFallbackTestCase(unittest.TestCase):
+    def setUp(self):
+        self.primary = create_engine("sqlite://")
+        self.replica = create_engine("sqlite://")
+        self.guard = ReplicaLagGuard(5, 10)
+        self.guard.record(0)
+        patch = mock.patch.multiple(
+            base_tool,
+            replica_engine=self.replica,
+            replica_guard=self.guard,
+            SessionFactory=lambda: Session(self.primary),
+            create_read_session=lambda: Session(self.replica),
+        )
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_replica_error_retries_on_primary(self):
+        self.assertEqual(ReplicaBoundTool()._run(user_id=1), "primary")
+        # 다음 지연 확인까지 복제본을 쓰지 않음
+        self.assertFalse(self.guard.healthy)
+
+    def test_primary_error_is_raised(self):
+        with mock.patch.object(
+            base_tool, "create_read_session", lambda: Session(self.primary)
+        ):
+            with mock.patch.object(
+                ReplicaBoundTool,
+                "_execute",
+                side_effect=OperationalError("SELECT 1", {}, Exception("down")),
+            ):
+                with self.assertRaises(OperationalError):
+                    ReplicaBoundTool()._run(user_id=1)
+        self.assertTrue(self.guard.healthy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Garmin 마지막 동기화 시간 캐시 테스트"""
+
+import unittest
+from datetime import datetime, timezone
+
+from fake_redis import FakeRedis
+
+from core.util.sync_timestamp_cache import SyncTimestampCache, parse_sync_timestamp
+
+SYNC_TIMESTAMP = "2024-01-15T08:30:00.0"
+
+
+class SyncTimestampCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.cache = SyncTimestampCache(ttl=60, redis_factory=lambda: self.redis)
+        self.fetch_count = 0
+
+    def _fetch(self) -> str:
+        self.fetch_count += 1
+        return SYNC_TIMESTAMP
+
+    def test_fetches_once_per_user(self):
+        self.assertEqual(self.cache.get_or_fetch("runner", self._fetch), SYNC_TIMESTAMP)
+        self.assertEqual(self.cache.get_or_fetch("runner", self._fetch), SYNC_TIMESTAMP)
+        self.assertEqual(self.fetch_count, 1)
+        self.assertEqual(self.redis.ttls["garmin:sync:runner"], 60)
+
+        self.cache.get_or_fetch("walker", self._fetch)
+        self.assertEqual(self.fetch_count, 2)
+
+    def test_non_string_response_is_not_cached(self):
+        self.assertIsNone(self.cache.get_or_fetch("runner", lambda: None))
+        self.assertEqual(self.redis.values, {})
+
+    def test_disabled_without_ttl_or_user_key(self):
+        cache = SyncTimestampCache(ttl=0, redis_factory=lambda: self.redis)
+        cache.get_or_fetch("runner", self._fetch)
+        self.cache.get_or_fetch(None, self._fetch)
+
+        self.assertEqual(self.fetch_count, 2)
+        self.assertEqual(self.redis.values, {})
+
+    def test_newer_data_invalidates_cache(self):
+        self.cache.get_or_fetch("runner", self._fetch)
+
+        self.cache.observe("runner", datetime(2024, 1, 15, 8, tzinfo=timezone.utc))
+        self.assertIn("garmin:sync:runner", self.redis.values)
+
+        self.cache.observe("runner", datetime(2024, 1, 15, 9, tzinfo=timezone.utc))
+        self.assertNotIn("garmin:sync:runner", self.redis.values)
+
+    def test_parse_sync_timestamp(self):
+        expected = datetime(2024, 1, 15, 8, 30, tzinfo=timezone.utc)
+        self.assertEqual(parse_sync_timestamp(SYNC_TIMESTAMP), expected)
+        self.assertEqual(parse_sync_timestamp("2024-01-15T08:30:00"), expected)
+        self.assertIsNone(parse_sync_timestamp("yesterday"))
+        self.assertIsNone(parse_sync_timestamp(None))
+
+
+if __name__ == "__main__":
+    unittest.main()
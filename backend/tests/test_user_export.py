@@ -0,0 +1,250 @@
+"""사용자 전체 데이터 내보내기(NDJSON/Parquet)와 재개 커서 테스트"""
+
+import json
+import os
+import tempfile
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from fake_collectors import DAY_START, TARGET_DATE
+from sqlalchemy import select
+from sqlite_db import TEST_USER_ID, create_test_session
+
+from app.model import ArchivedPartition, HeartRateDaily, HeartRateReading, User
+from app.service.export_service import (
+    EXPORT_SOURCE_NAMES,
+    NDJSON_COMPLETE_LINE,
+    PARQUET_NEXT_CURSOR_KEY,
+    PARQUET_STATE_FILE,
+    PARQUET_TABLE_KEY,
+    ExportCursor,
+    UserExportService,
+)
+from app.service.partition_archive_service import (
+    ArchiveStorage,
+    arrow_schema,
+    import_pyarrow,
+)
+
+try:
+    pa, pq = import_pyarrow()
+except RuntimeError:
+    pa = pq = None
+
+requires_pyarrow = unittest.skipIf(pa is None, "pyarrow가 없어 건너뜀")
+
+OTHER_USER_ID = 2
+DAYS = (TARGET_DATE, TARGET_DATE + timedelta(days=1))
+READINGS_PER_DAY = 12
+
+
+def heart_rate_day(user_id: int, target_date: date, count: int) -> HeartRateDaily:
+    daily = HeartRateDaily(user_id=user_id, date=target_date, resting_hr=55)
+    day_start = datetime.combine(target_date, datetime.min.time())
+    for index in range(count):
+        local = day_start + timedelta(minutes=2 * index)
+        HeartRateReading(
+            start_time_gmt=local.replace(tzinfo=timezone.utc),
+            start_time_local=local,
+            heart_rate=60 + index,
+            daily_summary=daily,
+        )
+    return daily
+
+
+class ExportCursorTestCase(unittest.TestCase):
+    def test_round_trip_restores_key_types(self):
+        cursor = ExportCursor("heart_rate_readings", key=(7, DAY_START))
+
+        decoded = ExportCursor.decode(cursor.encode())
+
+        self.assertEqual(decoded, cursor)
+        self.assertNotIn("=", cursor.encode())
+        self.assertEqual(
+            ExportCursor.decode(
+                ExportCursor("heart_rate_daily", (TARGET_DATE,)).encode()
+            ),
+            ExportCursor("heart_rate_daily", (TARGET_DATE,)),
+        )
+
+    def test_archive_position(self):
+        cursor = ExportCursor(
+            "sleep_movement", archive_partition="sleep_movement_p1", archive_offset=40
+        )
+
+        self.assertEqual(ExportCursor.decode(cursor.encode()), cursor)
+
+    def test_invalid_tokens(self):
+        tokens = [
+            "not-a-token",
+            ExportCursor("users").encode(),
+            ExportCursor("heart_rate_readings", key=(7,)).encode(),
+        ]
+        for token in tokens:
+            with self.subTest(token=token):
+                with self.assertRaises(ValueError):
+                    ExportCursor.decode(token)
+
+
+class UserExportTestCase(unittest.TestCase):
+    def setUp(self):
+        self.session = create_test_session()
+        self.addCleanup(self.session.close)
+        self.session.add(
+            User(
+                id=OTHER_USER_ID,
+                email="other@example.com",
+                oauth_token="token",
+                oauth_token_secret="secret",
+            )
+        )
+        self.session.add_all(
+            heart_rate_day(TEST_USER_ID, day, READINGS_PER_DAY) for day in DAYS
+        )
+        self.session.add(heart_rate_day(OTHER_USER_ID, TARGET_DATE, 5))
+        self.session.commit()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.root = temp_dir.name
+        self.service = UserExportService(
+            self.session, TEST_USER_ID, chunk_size=5, storage=ArchiveStorage(self.root)
+        )
+
+    def _rows(self, chunks) -> list:
+        return [
+            (chunk.source.name, row.get("start_time_local") or row.get("date"))
+            for chunk in chunks
+            for row in chunk.rows
+        ]
+
+    def test_only_user_rows_in_key_order(self):
+        chunks = list(self.service.iter_chunks())
+
+        rows = self._rows(chunks)
+        self.assertEqual(
+            [name for name, _ in rows],
+            ["heart_rate_daily"] * 2 + ["heart_rate_readings"] * 24,
+        )
+        readings = [value for name, value in rows if name == "heart_rate_readings"]
+        self.assertEqual(readings, sorted(readings))
+        self.assertTrue(all(len(chunk.rows) <= 5 for chunk in chunks))
+
+    def test_resume_from_chunk_cursor(self):
+        chunks = list(self.service.iter_chunks())
+        token = chunks[2].next_cursor.encode()
+
+        resumed = list(self.service.iter_chunks(ExportCursor.decode(token)))
+
+        self.assertEqual(self._rows(resumed), self._rows(chunks[3:]))
+
+    @requires_pyarrow
+    def test_archived_readings_follow_db_rows(self):
+        daily_id = self.session.execute(
+            select(HeartRateDaily.id).where(
+                HeartRateDaily.user_id == TEST_USER_ID, HeartRateDaily.date == DAYS[0]
+            )
+        ).scalar()
+        archived_start = DAY_START - timedelta(days=400)
+        table = HeartRateReading.__table__
+        rows = [
+            {
+                "daily_summary_id": summary_id,
+                "start_time_gmt": archived_start + timedelta(minutes=index),
+                "start_time_local": archived_start + timedelta(minutes=index),
+                "heart_rate": 50,
+                "created_at": archived_start,
+                "updated_at": archived_start,
+            }
+            for summary_id in (daily_id, 999)
+            for index in range(7)
+        ]
+        uri = os.path.join(self.root, "heart_rate_readings_p1.parquet")
+        pq.write_table(pa.Table.from_pylist(rows, arrow_schema(table)), uri)
+        self.session.add(
+            ArchivedPartition(
+                partition_name="heart_rate_readings_p1",
+                parent_table="heart_rate_readings",
+                range_start=archived_start,
+                range_end=archived_start + timedelta(days=31),
+                uri=uri,
+                row_count=len(rows),
+                size_bytes=os.path.getsize(uri),
+                sha256="0" * 64,
+            )
+        )
+        self.session.commit()
+
+        chunks = list(self.service.iter_chunks(sources=["heart_rate_readings"]))
+
+        archived = [chunk for chunk in chunks if chunk.next_cursor.archive_partition]
+        self.assertEqual(sum(len(chunk.rows) for chunk in archived), 7)
+        self.assertEqual(chunks[-len(archived) :], archived)
+        # 보관 파일 안의 위치로 재개
+        resumed = list(self.service.iter_chunks(archived[0].next_cursor))
+        self.assertEqual(len(resumed), 1)
+        self.assertEqual(len(resumed[0].rows), 2)
+
+    def test_ndjson_stream(self):
+        lines = b"".join(self.service.iter_ndjson()).splitlines(keepends=True)
+
+        self.assertEqual(lines[-1], NDJSON_COMPLETE_LINE)
+        records = [json.loads(line) for line in lines[:-1]]
+        data = [record for record in records if "data" in record]
+        self.assertEqual(len(data), 26)
+        self.assertEqual(data[0]["data"]["date"], TARGET_DATE.isoformat())
+        self.assertIn("cursor", records[-1])
+
+    def test_ndjson_file_resumes_after_last_cursor(self):
+        path = os.path.join(self.root, "export.ndjson")
+        chunks = list(self.service.iter_chunks())
+        with open(path, "wb") as partial:
+            partial.write(self.service._ndjson_chunk(chunks[0]))
+            partial.write(self.service._ndjson_chunk(chunks[1]))
+            # 중단된 청크의 불완전한 행
+            partial.write(b'{"table": "heart_rate_readings", "da')
+
+        written = self.service.write_ndjson_file(path)
+
+        self.assertEqual(written, 26 - len(chunks[0].rows) - len(chunks[1].rows))
+        with open(path, "rb") as output:
+            lines = output.read().splitlines(keepends=True)
+        data = [json.loads(line)["data"] for line in lines if b'"data"' in line]
+        self.assertEqual(len(data), 26)
+        self.assertEqual(lines[-1], NDJSON_COMPLETE_LINE)
+        self.assertEqual(self.service.write_ndjson_file(path), 0)
+
+    @requires_pyarrow
+    def test_parquet_page_metadata(self):
+        page = os.path.join(self.root, "page.parquet")
+        with open(page, "wb") as output:
+            for data in self.service.iter_parquet_page(max_rows=1):
+                output.write(data)
+
+        metadata = pq.read_metadata(page).metadata
+        self.assertEqual(metadata[PARQUET_TABLE_KEY.encode()], b"heart_rate_daily")
+        next_cursor = ExportCursor.decode(
+            metadata[PARQUET_NEXT_CURSOR_KEY.encode()].decode()
+        )
+        self.assertEqual(next_cursor.key, (DAYS[1],))
+        table = pq.read_table(page)
+        self.assertEqual(table.column("date").to_pylist(), list(DAYS))
+
+    @requires_pyarrow
+    def test_parquet_directory_is_resumable(self):
+        directory = os.path.join(self.root, "export")
+
+        pages = self.service.write_parquet_directory(directory)
+
+        # 테이블마다 한 페이지 (빈 테이블 포함)
+        self.assertEqual(pages, len(EXPORT_SOURCE_NAMES))
+        with open(os.path.join(directory, PARQUET_STATE_FILE)) as state_file:
+            self.assertTrue(json.load(state_file)["complete"])
+        readings = pq.read_table(
+            os.path.join(directory, "heart_rate_readings", "part-00001.parquet")
+        )
+        self.assertEqual(readings.num_rows, 24)
+        self.assertEqual(self.service.write_parquet_directory(directory), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
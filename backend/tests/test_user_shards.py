@@ -0,0 +1,179 @@
+"""사용자별 샤드 라우팅(jump consistent hash)과 샤드 사용자 복제 테스트"""
+
+import os
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+
+from fake_collectors import TARGET_DATE
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlite_db import TEST_USER_ID, create_test_engine
+
+from app.model import HeartRateDaily, User
+from app.service.shard_service import ShardService
+from core.db import shard
+from core.db.shard import (
+    SHARD_MODE_DATABASE,
+    SHARD_MODE_SCHEMA,
+    SHARD_USER_KEY,
+    build_shard_binds,
+    each_shard_bind,
+    jump_consistent_hash,
+    shard_session_class,
+    use_user_shard,
+)
+
+USER_IDS = range(1, 5001)
+
+
+class JumpConsistentHashTestCase(unittest.TestCase):
+    def test_deterministic_and_in_range(self):
+        for buckets in (1, 2, 7, 16):
+            with self.subTest(buckets=buckets):
+                assigned = [jump_consistent_hash(key, buckets) for key in USER_IDS]
+                self.assertEqual(
+                    assigned, [jump_consistent_hash(key, buckets) for key in USER_IDS]
+                )
+                self.assertTrue(all(0 <= bucket < buckets for bucket in assigned))
+
+    def test_balanced(self):
+        counts = Counter(jump_consistent_hash(key, 4) for key in USER_IDS)
+
+        self.assertEqual(set(counts), {0, 1, 2, 3})
+        self.assertTrue(all(1000 < count < 1500 for count in counts.values()))
+
+    def test_adding_a_shard_only_moves_users_to_it(self):
+        for buckets in (1, 3, 8):
+            with self.subTest(buckets=buckets):
+                moved = [
+                    key
+                    for key in USER_IDS
+                    if jump_consistent_hash(key, buckets)
+                    != jump_consistent_hash(key, buckets + 1)
+                ]
+                self.assertTrue(
+                    all(
+                        jump_consistent_hash(key, buckets + 1) == buckets
+                        for key in moved
+                    )
+                )
+                # 약 1/(N+1)만 이동
+                expected = len(USER_IDS) / (buckets + 1)
+                self.assertLess(abs(len(moved) - expected), expected * 0.2)
+
+    def test_large_keys(self):
+        self.assertEqual(jump_consistent_hash(2**64 + 7, 5), jump_consistent_hash(7, 5))
+
+
+class BuildShardBindsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.primary = create_engine("sqlite://")
+
+    def _build(self, mode: str, urls=()):
+        with mock.patch.multiple(shard, SHARD_MODE=mode, SHARD_SCHEMA_COUNT=3):
+            return build_shard_binds(self.primary, urls, create_engine)
+
+    def test_disabled(self):
+        self.assertEqual(self._build(""), [])
+
+    def test_schema_shards_share_primary_pool(self):
+        binds = self._build(SHARD_MODE_SCHEMA)
+
+        self.assertEqual(
+            [bind.get_execution_options()["schema_translate_map"] for bind in binds],
+            [{None: "shard_00"}, {None: "shard_01"}, {None: "shard_02"}],
+        )
+        self.assertTrue(all(bind.pool is self.primary.pool for bind in binds))
+
+    def test_database_shards(self):
+        binds = self._build(SHARD_MODE_DATABASE, ["sqlite://", "sqlite://"])
+
+        self.assertEqual(len(binds), 2)
+        self.assertIsNot(binds[0].pool, binds[1].pool)
+
+    def test_invalid_settings(self):
+        with self.assertRaises(ValueError):
+            self._build(SHARD_MODE_DATABASE)
+        with self.assertRaises(ValueError):
+            self._build("table")
+
+
+class ShardRoutingSessionTestCase(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.primary, *self.shards = [
+            create_test_engine(f"sqlite:///{os.path.join(temp_dir.name, name)}.db")
+            for name in ("primary", "shard_00", "shard_01")
+        ]
+        for engine in (self.primary, *self.shards):
+            self.addCleanup(engine.dispose)
+        self.session = shard_session_class(self.shards)(bind=self.primary)
+        self.addCleanup(self.session.close)
+        # 샤드별 첫 사용자 (서로 다른 샤드로 가는 두 사용자)
+        self.user_ids = {}
+        for user_id in USER_IDS:
+            self.user_ids.setdefault(jump_consistent_hash(user_id, 2), user_id)
+            if len(self.user_ids) == 2:
+                break
+        self.session.add_all(
+            User(
+                id=user_id,
+                email=f"user{user_id}@example.com",
+                oauth_token="token",
+                oauth_token_secret="secret",
+            )
+            for user_id in self.user_ids.values()
+        )
+        self.session.commit()
+
+    def _daily_count(self, engine) -> int:
+        with Session(engine) as session:
+            return session.execute(
+                select(func.count()).select_from(HeartRateDaily)
+            ).scalar()
+
+    def test_sharded_table_requires_user(self):
+        with self.assertRaises(RuntimeError):
+            self.session.execute(select(HeartRateDaily))
+        # 샤드 테이블이 아니면 primary
+        self.assertEqual(
+            self.session.execute(select(func.count()).select_from(User)).scalar(), 2
+        )
+
+    def test_rows_go_to_user_shard(self):
+        for index, user_id in sorted(self.user_ids.items()):
+            self.assertEqual(use_user_shard(self.session, user_id), index)
+            self.session.add(HeartRateDaily(user_id=user_id, date=TARGET_DATE))
+        self.session.commit()
+
+        self.assertEqual([self._daily_count(engine) for engine in self.shards], [1, 1])
+        self.assertEqual(self.session.info[SHARD_USER_KEY], self.user_ids[1])
+
+    def test_each_shard_bind(self):
+        self.assertEqual(
+            each_shard_bind(self.session), [{"bind": bind} for bind in self.shards]
+        )
+        self.assertEqual(each_shard_bind(Session(self.primary)), [{}])
+        self.assertIsNone(use_user_shard(Session(self.primary), 1))
+
+    def test_ensure_user_copies_user_without_tokens(self):
+        service = ShardService(self.session)
+
+        service.use_user(TEST_USER_ID)
+        self.assertTrue(service.ensure_user(TEST_USER_ID))
+        self.session.commit()
+
+        shard_engine = self.shards[jump_consistent_hash(TEST_USER_ID, 2)]
+        with Session(shard_engine) as shard_session:
+            (copied,) = shard_session.execute(select(User)).scalars().all()
+        self.assertEqual(copied.email, f"user{TEST_USER_ID}@example.com")
+        self.assertEqual((copied.oauth_token, copied.oauth_token_secret), ("", ""))
+        self.assertFalse(service.ensure_user(9999))
+        self.assertFalse(ShardService(Session(self.primary)).ensure_user(TEST_USER_ID))
+
+
+if __name__ == "__main__":
+    unittest.main()
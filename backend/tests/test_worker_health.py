@@ -0,0 +1,110 @@
+"""오래 실행되는 Celery 워커의 DB 연결 풀과 누수 감지 테스트"""
+
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from core.config import WORKER_MAX_OVERFLOW, WORKER_POOL_SIZE
+from core.db import celery_session
+from core.db.celery_session import DatabaseTask
+from core.util import worker_health
+from core.util.worker_health import WorkerLeakDetector, current_rss_kb
+
+
+class WorkerLeakDetectorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.rss_kb = 100_000
+        patch = mock.patch.object(worker_health, "current_rss_kb", lambda: self.rss_kb)
+        patch.start()
+        self.addCleanup(patch.stop)
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.engine = create_engine(
+            f"sqlite:///{os.path.join(temp_dir.name, 'worker.db')}",
+            poolclass=QueuePool,
+        )
+        self.addCleanup(self.engine.dispose)
+        self.detector = WorkerLeakDetector(
+            [self.engine, None], task_rss_warn_kb=1000, rss_growth_warn_kb=5000
+        )
+
+    def _run_task(self, growth_kb: int = 0) -> None:
+        self.detector.before_task()
+        self.rss_kb += growth_kb
+        self.detector.after_task("collect-fit-data")
+
+    def test_current_rss(self):
+        self.assertGreater(current_rss_kb(), 0)
+
+    def test_engines_sharing_a_pool_are_checked_once(self):
+        detector = WorkerLeakDetector([self.engine, self.engine, None])
+
+        self.assertEqual(detector.engines, [self.engine])
+
+    def test_task_memory_growth(self):
+        with self.assertLogs(worker_health.logger, logging.WARNING) as logs:
+            self._run_task()
+            self._run_task(growth_kb=1500)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("태스크 메모리 증가", logs.output[0])
+        self.assertEqual(self.detector.task_count, 2)
+
+    def test_cumulative_growth_is_warned_once(self):
+        self._run_task()
+        with self.assertLogs(worker_health.logger, logging.WARNING) as logs:
+            for _ in range(8):
+                self._run_task(growth_kb=900)
+
+        self.assertEqual(sum("누수 의심" in message for message in logs.output), 1)
+
+    def test_unreturned_connection(self):
+        connection = self.engine.connect()
+        self.addCleanup(connection.close)
+
+        with self.assertLogs(worker_health.logger, logging.WARNING) as logs:
+            self._run_task()
+
+        self.assertIn("반환되지 않은 DB 연결", logs.output[0])
+        self.assertIn("연결 수: 1", logs.output[0])
+
+
+class WorkerSessionTestCase(unittest.TestCase):
+    def test_default_pool_size(self):
+        pool = celery_session.engine.pool
+
+        self.assertEqual(pool.size(), WORKER_POOL_SIZE)
+        self.assertEqual(pool._max_overflow, WORKER_MAX_OVERFLOW)
+        self.assertTrue(pool._pre_ping)
+
+    def test_fork_keeps_parent_connections(self):
+        engines = [mock.Mock(), mock.Mock()]
+        with mock.patch.multiple(
+            celery_session,
+            engine=engines[0],
+            replica_engine=None,
+            shard_engines=[engines[1]],
+        ):
+            celery_session.reset_engines_after_fork()
+
+        for engine in engines:
+            engine.dispose.assert_called_once_with(close=False)
+
+    def test_failed_task_rolls_back(self):
+        task = DatabaseTask()
+        with mock.patch.object(celery_session, "SessionFactory", mock.Mock):
+            session = task.session
+            task.on_failure(Exception("boom"), "task-id", (), {}, None)
+
+        session.rollback.assert_called_once()
+        session.close.assert_called_once()
+        self.assertIsNone(task._session)
+
+
+if __name__ == "__main__":
+    unittest.main()